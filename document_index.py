@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Extracted document text lives in one SQLite file under agent_lab. Each row in
+# `files` is keyed by resolved path and remembers the (size, mtime_ns) it was
+# extracted at, so a search only re-extracts files whose stat changed. The text
+# itself is stored in an FTS5 table with the trigram tokenizer: a quoted query
+# then matches any case-insensitive substring of at least three characters,
+# which keeps search_files' substring semantics while letting SQLite rank and
+# narrow the candidate files.
+SCHEMA_VERSION = 1
+MIN_INDEXED_QUERY_CHARS = 3
+
+FileStat = Tuple[str, int, int]
+
+
+class DocumentIndex:
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+        # path -> (rowid, size, mtime_ns, ok); mirrors `files` so warm syncs need no SQL.
+        self._files: Dict[str, Tuple[int, int, int, bool]] = {
+            str(path): (int(rowid), int(size), int(mtime_ns), bool(ok))
+            for rowid, path, size, mtime_ns, ok in self._conn.execute("SELECT id, path, size, mtime_ns, ok FROM files")
+        }
+        self._paths_by_id = {rowid: path for path, (rowid, _size, _mtime, _ok) in self._files.items()}
+
+    def _create_schema(self) -> None:
+        version = int(self._conn.execute("PRAGMA user_version").fetchone()[0] or 0)
+        if version != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS files")
+            self._conn.execute("DROP TABLE IF EXISTS docs")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, ok INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(body, tokenize='trigram')")
+        self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def sync(
+        self,
+        present: Iterable[FileStat],
+        *,
+        wanted: Iterable[str],
+        roots: Iterable[str],
+        extract: Callable[[str], str],
+    ) -> Dict[str, int]:
+        """Bring the index in line with the files on disk.
+
+        `present` is every file currently under `roots`; rows under a root that
+        are no longer present are dropped. Only paths in `wanted` whose size or
+        mtime changed are extracted again.
+        """
+        stats = {path: (size, mtime_ns) for path, size, mtime_ns in present}
+        wanted_paths = [path for path in wanted if path in stats]
+        root_list = [str(root) for root in roots]
+        extracted = removed = 0
+        with self._lock:
+            for path in [path for path in self._files if _under_any(path, root_list) and path not in stats]:
+                self._delete(path)
+                removed += 1
+            for path in wanted_paths:
+                size, mtime_ns = stats[path]
+                known = self._files.get(path)
+                if known is not None and known[1] == size and known[2] == mtime_ns:
+                    continue
+                try:
+                    text: Optional[str] = extract(path)
+                except Exception:
+                    text = None
+                self._store(path, size, mtime_ns, text)
+                extracted += 1
+            if extracted or removed:
+                self._conn.commit()
+        return {"extracted": extracted, "removed": removed}
+
+    def _delete(self, path: str) -> None:
+        rowid = self._files.pop(path)[0]
+        self._paths_by_id.pop(rowid, None)
+        self._conn.execute("DELETE FROM docs WHERE rowid = ?", (rowid,))
+        self._conn.execute("DELETE FROM files WHERE id = ?", (rowid,))
+
+    def _store(self, path: str, size: int, mtime_ns: int, text: Optional[str]) -> None:
+        ok = text is not None
+        known = self._files.get(path)
+        if known is None:
+            rowid = int(
+                self._conn.execute(
+                    "INSERT INTO files (path, size, mtime_ns, ok) VALUES (?, ?, ?, ?)",
+                    (path, size, mtime_ns, int(ok)),
+                ).lastrowid
+            )
+        else:
+            rowid = known[0]
+            self._conn.execute(
+                "UPDATE files SET size = ?, mtime_ns = ?, ok = ? WHERE id = ?",
+                (size, mtime_ns, int(ok), rowid),
+            )
+            self._conn.execute("DELETE FROM docs WHERE rowid = ?", (rowid,))
+        if ok:
+            self._conn.execute("INSERT INTO docs (rowid, body) VALUES (?, ?)", (rowid, text))
+        self._files[path] = (rowid, size, mtime_ns, ok)
+        self._paths_by_id[rowid] = path
+
+    def is_skipped(self, path: str) -> bool:
+        known = self._files.get(path)
+        return known is not None and not known[3]
+
+    def search(self, query: str, paths: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """Yield (path, text) for indexed `paths` that may contain `query`.
+
+        Queries of three or more characters come back best match first from
+        the trigram index; shorter ones fall back to every cached text in
+        path order.
+        """
+        scope = [path for path in paths if path in self._files and self._files[path][3]]
+        if len(query) >= MIN_INDEXED_QUERY_CHARS:
+            allowed = set(scope)
+            phrase = '"' + query.replace('"', '""') + '"'
+            with self._lock:
+                rows = self._conn.execute("SELECT rowid FROM docs WHERE docs MATCH ? ORDER BY rank", (phrase,)).fetchall()
+            ordered = [self._paths_by_id.get(int(rowid)) for (rowid,) in rows]
+            scope = [path for path in ordered if path in allowed]
+        for path in scope:
+            text = self.text(path)
+            if text is not None:
+                yield path, text
+
+    def text(self, path: str) -> Optional[str]:
+        with self._lock:
+            known = self._files.get(path)
+            if known is None or not known[3]:
+                return None
+            row = self._conn.execute("SELECT body FROM docs WHERE rowid = ?", (known[0],)).fetchone()
+        return str(row[0]) if row else None
+
+
+def _under_any(path: str, roots: List[str]) -> bool:
+    for root in roots:
+        if path == root or path.startswith(root.rstrip("/\\") + "/") or path.startswith(root.rstrip("/\\") + "\\"):
+            return True
+    return False
+
+
+_index_lock = threading.Lock()
+_index: Optional[DocumentIndex] = None
+_unavailable = False
+
+
+def open_document_index(db_path: Path) -> Optional[DocumentIndex]:
+    """The shared index, or None when this SQLite build has no FTS5 trigram
+    tokenizer (remembered for the life of the process)."""
+    global _index, _unavailable
+    with _index_lock:
+        if _unavailable:
+            return None
+        if _index is None or _index.db_path != Path(db_path) or not Path(db_path).exists():
+            if _index is not None:
+                _index.close()
+                _index = None
+            try:
+                _index = DocumentIndex(db_path)
+            except sqlite3.OperationalError:
+                _unavailable = True
+                return None
+        return _index
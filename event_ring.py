@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+
+EventRow = Tuple[int, Dict[str, Any]]
+
+
+class EventRing:
+    """Bounded, sequence-numbered event log with async fan-out.
+
+    Publishers may run on any thread. Each subscriber awaits ``wait_after``
+    on its own event loop and is woken directly by ``publish``/``close``
+    rather than polling. Sequence numbers start at 1 and never repeat, so a
+    reconnecting reader resumes with the last sequence it saw.
+    """
+
+    def __init__(self, *, maxlen: int = 512):
+        self._lock = threading.Lock()
+        self._events: Deque[EventRow] = deque(maxlen=max(1, int(maxlen)))
+        self._seq = 0
+        self._closed = False
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._waiters)
+
+    def _wake_locked(self) -> None:
+        waiters = list(self._waiters)
+        self._waiters.clear()
+        for loop, ready in waiters:
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                # The subscriber's loop is already closed.
+                continue
+
+    def publish(self, event: Dict[str, Any]) -> int:
+        with self._lock:
+            if self._closed:
+                return 0
+            self._seq += 1
+            self._events.append((self._seq, dict(event)))
+            self._wake_locked()
+            return self._seq
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake_locked()
+
+    def _read_after_locked(self, after_seq: int, limit: Optional[int]) -> List[EventRow]:
+        if not self._events or after_seq >= self._seq:
+            return []
+        first_seq = self._events[0][0]
+        start = max(0, int(after_seq) - first_seq + 1)
+        stop = None if limit is None else start + max(0, int(limit))
+        return list(itertools.islice(self._events, start, stop))
+
+    def read_after(self, after_seq: int = 0, *, limit: Optional[int] = None) -> List[EventRow]:
+        """Events newer than ``after_seq``. Events already pushed out of the
+        ring are skipped; the first returned sequence shows the gap."""
+        with self._lock:
+            return self._read_after_locked(after_seq, limit)
+
+    async def wait_after(self, after_seq: int = 0, *, timeout: Optional[float] = None) -> List[EventRow]:
+        """Return events newer than ``after_seq``, waiting for the next publish
+        when there are none. Returns [] on timeout or once the ring is closed
+        and drained."""
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        waiter = (loop, ready)
+        with self._lock:
+            rows = self._read_after_locked(after_seq, None)
+            if rows or self._closed:
+                return rows
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return []
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+        return self.read_after(after_seq)
@@ -36,6 +36,8 @@ try:
 except Exception:  # pragma: no cover - optional dependency guard
     httpx = None
 from redis_runtime import (
+    async_redis_blob_client,
+    async_redis_client,
     decrypt_current_redis_snapshot,
     encrypt_current_redis_snapshot,
     ensure_redis_encryption_key,
@@ -46,6 +48,8 @@ from redis_runtime import (
     redis_blob_client,
     redis_client,
     migrate_current_redis_to_internal,
+    prepare_async_redis_clients,
+    redis_batch,
     save_redis_connection_settings,
     shutdown_internal_redis,
     test_redis_connection_settings,
@@ -76,6 +80,9 @@ _ORIG_HTTPX_CLIENT_REQUEST = None
 _ORIG_HTTPX_ASYNC_CLIENT_REQUEST = None
 _SHARED_ASYNC_HTTP_CLIENTS: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
 _SHARED_ASYNC_HTTP_CLIENTS_LOCK = threading.RLock()
+# Other per-loop HTTP sessions (e.g. web_fetch's aiohttp session), closed
+# together with the shared httpx client.
+_SHARED_ASYNC_LOOP_RESOURCES: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
 
 
 def _text(value: Any) -> str:
@@ -106,6 +113,21 @@ def _shared_async_http_client() -> Any:
         return client
 
 
+def _async_resource_closed(resource: Any) -> bool:
+    return bool(getattr(resource, "is_closed", False) or getattr(resource, "closed", False))
+
+
+def shared_async_loop_resource(name: str, factory: Callable[[], Any]) -> Any:
+    """Per-loop resource built by ``factory``; closed by close_shared_async_http_client."""
+    loop = asyncio.get_running_loop()
+    with _SHARED_ASYNC_HTTP_CLIENTS_LOCK:
+        resources = _SHARED_ASYNC_LOOP_RESOURCES.setdefault(loop, {})
+        resource = resources.get(name)
+        if resource is None or _async_resource_closed(resource):
+            resource = resources[name] = factory()
+        return resource
+
+
 async def close_shared_async_http_client() -> None:
     try:
         loop = asyncio.get_running_loop()
@@ -113,8 +135,16 @@ async def close_shared_async_http_client() -> None:
         return
     with _SHARED_ASYNC_HTTP_CLIENTS_LOCK:
         client = _SHARED_ASYNC_HTTP_CLIENTS.pop(loop, None)
+        resources = list((_SHARED_ASYNC_LOOP_RESOURCES.pop(loop, None) or {}).values())
     if client is not None and not bool(getattr(client, "is_closed", False)):
         await client.aclose()
+    for resource in resources:
+        if _async_resource_closed(resource):
+            continue
+        try:
+            await resource.aclose()
+        except Exception:
+            logger.debug("Shared async resource close failed", exc_info=True)
 
 
 def _boolish(value: Any, default: bool = False) -> bool:
@@ -5155,6 +5185,12 @@ def _gguf_read_metadata_value(handle, value_type: int) -> Any:
         return _gguf_read_u64(handle)
     if value_type == 11:
         return _gguf_read_i64(handle)
+    if value_type == 9:
+        item_type = _gguf_read_u32(handle)
+        count = _gguf_read_u64(handle)
+        if count > 1_000_000:
+            raise ValueError("gguf array too large")
+        return [_gguf_read_metadata_value(handle, item_type) for _ in range(int(count))]
     _gguf_skip_value(handle, value_type)
     return None
 
@@ -53,6 +53,7 @@ from hydra_core_extensions import (
     get_hydra_memory_context_payload,
 )
 from tool_runtime import (
+    _kernel_tool_rows as runtime_kernel_tool_rows,
     execute_plugin_call,
     is_meta_tool,
     kernel_tool_ids as runtime_kernel_tool_ids,
@@ -61,6 +62,8 @@ from tool_runtime import (
     run_meta_tool,
 )
 from notify import notifier_destination_catalog
+from verba_registry import get_verba_registry_generation
+import token_counter
 
 TOOL_NAME_ALIASES = {
     "search_web": "websearch",
@@ -1534,6 +1537,72 @@ def _astraeus_capability_catalog(
     )
 
 
+def _hydra_tool_fragments(
+    *,
+    platform: str,
+    registry: Dict[str, Any],
+    enabled_predicate: Optional[Callable[[str], bool]],
+    origin: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    normalized_platform = normalize_platform(platform) or str(platform or "").strip().lower() or "webui"
+    kernel_tools = sorted(
+        (str(row.get("id") or "").strip(), str(row.get("description") or ""), str(row.get("usage") or ""))
+        for row in runtime_kernel_tool_rows(platform=normalized_platform, origin=origin)
+        if str(row.get("id") or "").strip()
+    )
+    enabled_check = enabled_predicate
+    enabled_key: Any = tool_index_helpers.enabled_map_version(enabled_predicate)
+    if enabled_key is None:
+        # Unversioned predicate: resolve each verba once and key on the answers.
+        enabled_check = tool_index_helpers.memoized_predicate(enabled_predicate)
+        rows = []
+        for plugin_id in registry or {}:
+            raw_plugin_id = str(plugin_id or "").strip()
+            canonical = _canonical_tool_name(raw_plugin_id)
+            rows.append(
+                (
+                    str(plugin_id),
+                    enabled_check(str(plugin_id)),
+                    enabled_check(raw_plugin_id),
+                    bool(canonical) and enabled_check(canonical),
+                )
+            )
+        enabled_key = tuple(sorted(rows))
+    key = tool_index_helpers.tool_fragment_key(
+        platform=platform,
+        registry_key=tool_index_helpers.registry_fingerprint(registry, get_verba_registry_generation()),
+        enabled_key=enabled_key,
+        kernel_tools=kernel_tools,
+    )
+
+    def _build() -> Dict[str, Any]:
+        return {
+            "tool_index": _enabled_tool_mini_index(
+                platform=platform,
+                registry=registry,
+                enabled_predicate=enabled_check,
+                origin=origin,
+            ),
+            "capability_catalog": _astraeus_capability_catalog(
+                platform=platform,
+                registry=registry,
+                enabled_predicate=enabled_check,
+                origin=origin,
+            ),
+            "execution_tool_ids": frozenset(
+                _enabled_execution_tool_ids(
+                    platform=platform,
+                    registry=registry,
+                    enabled_predicate=enabled_check,
+                    origin=origin,
+                )
+            ),
+            "thanatos_system_prompt": _thanatos_system_prompt(platform),
+        }
+
+    return tool_index_helpers.cached_tool_fragments(key, _build)
+
+
 def _tool_contract_row(
     *,
     tool_id: str,
@@ -1797,13 +1866,26 @@ def _thanatos_execution_step_prompt(
 
 
 def _thanatos_system_prompt(platform: str) -> str:
+    # The clock goes in its own message after the platform preamble so this
+    # section stays byte-identical across turns.
     return prompts.thanatos_system_prompt(
         platform=platform,
-        now_text=datetime.now().strftime("%A, %B %d, %Y at %I:%M %p"),
+        now_text="",
         ascii_only_platforms=ASCII_ONLY_PLATFORMS,
     ).strip()
 
 
+def _current_time_prompt() -> str:
+    return prompts.current_time_prompt(now_text=datetime.now().strftime("%A, %B %d, %Y at %I:%M %p"))
+
+
+def _thanatos_prompt_head(*, system_prompt: str, platform_preamble: str) -> List[Dict[str, Any]]:
+    return _with_platform_preamble(
+        [{"role": "system", "content": system_prompt}],
+        platform_preamble=platform_preamble,
+    )
+
+
 def _astraeus_system_prompt(platform: str) -> str:
     return prompts.astraeus_system_prompt(platform=platform)
 
@@ -2610,6 +2692,7 @@ async def _run_astraeus_plan(
             messages=messages,
             dynamic_payload=dynamic_payload,
             static_payload=static_payload,
+            model=_llm_model_token(llm_client),
         )
     try:
         resp = await llm_client.chat(
@@ -2823,7 +2906,7 @@ async def _run_thanatos_step(
     text = ""
     perf_before = _llm_perf_snapshot(llm_client)
     if isinstance(debug_out, dict):
-        _populate_llm_prompt_debug(debug_out, messages=thanatos_messages)
+        _populate_llm_prompt_debug(debug_out, messages=thanatos_messages, model=_llm_model_token(llm_client))
     try:
         thanatos_resp = await llm_client.chat(
             messages=thanatos_messages,
@@ -2851,19 +2934,19 @@ async def _run_thanatos_step(
     return text, elapsed_ms
 
 
-def _estimate_text_tokens_approx(text: Any) -> int:
+def _estimate_text_tokens_approx(text: Any, *, model: str = "") -> int:
     content = _coerce_text(text).strip()
     if not content:
         return 0
-    chars = len(content)
-    words = len(re.findall(r"\S+", content))
-    chars_tokens = max(1, (chars + 3) // 4)
-    words_tokens = max(0, (words * 13 + 9) // 10)
-    return max(chars_tokens, words_tokens)
+    return token_counter.count_tokens(content, model=model)
+
 
+def _estimate_message_tokens_approx(content: Any, *, model: str = "") -> int:
+    return _estimate_text_tokens_approx(content, model=model) + _CHAT_ESTIMATE_MESSAGE_OVERHEAD_TOKENS
 
-def _estimate_message_tokens_approx(content: Any) -> int:
-    return _estimate_text_tokens_approx(content) + _CHAT_ESTIMATE_MESSAGE_OVERHEAD_TOKENS
+
+def _llm_model_token(llm_client: Any) -> str:
+    return str(getattr(llm_client, "model", "") or "").strip()
 
 
 def _llm_perf_snapshot(llm_client: Any) -> Dict[str, Any]:
@@ -2890,6 +2973,7 @@ def _populate_llm_prompt_debug(
     messages: List[Dict[str, Any]],
     dynamic_payload: Optional[Dict[str, Any]] = None,
     static_payload: Optional[Dict[str, Any]] = None,
+    model: str = "",
 ) -> None:
     if not isinstance(debug_out, dict):
         return
@@ -2900,7 +2984,7 @@ def _populate_llm_prompt_debug(
             continue
         content = _coerce_text(msg.get("content")).strip()
         prompt_chars += len(content)
-        prompt_tokens_est += _estimate_message_tokens_approx(content)
+        prompt_tokens_est += _estimate_message_tokens_approx(content, model=model)
     debug_out.update(
         {
             "message_count": int(len(messages or [])),
@@ -3062,9 +3146,11 @@ def estimate_hydra_chat_context_window(
     origin: Optional[Dict[str, Any]] = None,
     platform_preamble: str = "",
     user_text: str = "",
+    model: str = "",
 ) -> Dict[str, Any]:
     r = redis_client or default_redis
     normalized_platform = normalize_platform(platform) or str(platform or "").strip().lower() or "webui"
+    token_model = str(model or "").strip() or token_counter.configured_model(r)
     origin_payload = dict(origin) if isinstance(origin, dict) else {}
     resolved_scope = _resolve_hydra_scope(normalized_platform, scope, origin_payload)
 
@@ -3131,21 +3217,21 @@ def estimate_hydra_chat_context_window(
     for msg in base_messages:
         content = _coerce_text(msg.get("content")).strip()
         prompt_chars += len(content)
-        prompt_tokens += _estimate_message_tokens_approx(content)
+        prompt_tokens += _estimate_message_tokens_approx(content, model=token_model)
 
     history_tokens = 0
     history_chars = 0
     for msg in chat_history:
         content = _coerce_text(msg.get("content")).strip()
         history_chars += len(content)
-        history_tokens += _estimate_message_tokens_approx(content)
+        history_tokens += _estimate_message_tokens_approx(content, model=token_model)
 
-    user_tokens = _estimate_message_tokens_approx(seeded_user_text)
+    user_tokens = _estimate_message_tokens_approx(seeded_user_text, model=token_model)
     user_chars = len(seeded_user_text)
-    system_tokens = _estimate_message_tokens_approx(chat_system_prompt)
-    status_tokens = _estimate_message_tokens_approx(status_prompt) if status_prompt else 0
-    core_context_tokens = _estimate_message_tokens_approx(chat_core_context) if chat_core_context else 0
-    preamble_tokens = _estimate_message_tokens_approx(clean_preamble) if clean_preamble else 0
+    system_tokens = _estimate_message_tokens_approx(chat_system_prompt, model=token_model)
+    status_tokens = _estimate_message_tokens_approx(status_prompt, model=token_model) if status_prompt else 0
+    core_context_tokens = _estimate_message_tokens_approx(chat_core_context, model=token_model) if chat_core_context else 0
+    preamble_tokens = _estimate_message_tokens_approx(clean_preamble, model=token_model) if clean_preamble else 0
 
     completion_cap_tokens = 1400 + min(1000, (burst_reserve_tokens + 2) // 3)
     completion_budget_tokens = max(
@@ -3182,6 +3268,7 @@ def estimate_hydra_chat_context_window(
         "connected_portals": int(connected_portals),
         "running_cores": int(running_cores),
         "seed_source": seed_source,
+        "token_counter": token_counter.token_counter_for_model(token_model).kind,
         "breakdown": {
             "system_tokens": int(max(0, system_tokens)),
             "status_tokens": int(max(0, status_tokens)),
@@ -4826,6 +4913,10 @@ def _write_hydra_metrics(
     total_repairs: int,
     validation_failures: int,
     tool_failures: int,
+    total_ms: int = 0,
+    role_ms: Optional[Dict[str, int]] = None,
+    tool_ms: Optional[List[tuple[str, int]]] = None,
+    role_tokens: Optional[Dict[str, Dict[str, int]]] = None,
 ) -> None:
     return ledger.write_hydra_metrics(
         redis_client=redis_client,
@@ -4835,9 +4926,26 @@ def _write_hydra_metrics(
         validation_failures=validation_failures,
         tool_failures=tool_failures,
         normalize_platform_fn=normalize_platform,
+        total_ms=total_ms,
+        role_ms=role_ms,
+        tool_ms=tool_ms or [],
+        role_tokens=role_tokens,
     )
 
 
+def _debug_token_counts(*debug_rows: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    totals = {"prompt_tokens": 0, "completion_tokens": 0}
+    for row in debug_rows:
+        if not isinstance(row, dict):
+            continue
+        for key in totals:
+            try:
+                totals[key] += max(0, int(row.get(key) or 0))
+            except Exception:
+                continue
+    return totals
+
+
 def _write_hydra_ledger(
     *,
     redis_client: Any,
@@ -5027,11 +5135,14 @@ async def _run_hydra_turn_impl(
     progress_ms_total = 0.0
     state_update_ms_total = 0.0
     tool_ms_total = 0.0
+    tool_ms_by_call: List[tuple[str, int]] = []
     checker_ms_total = 0.0
     hermes_chat_ms_total = 0.0
     hermes_final_ms_total = 0.0
     astraeus_debug: Dict[str, Any] = {}
     thanatos_debug: Dict[str, Any] = {}
+    # thanatos_debug only keeps the latest round; tokens add up across rounds.
+    thanatos_tokens_total = _debug_token_counts()
     hermes_chat_debug: Dict[str, Any] = {}
     hermes_final_debug: Dict[str, Any] = {}
     repairs_used_count = 0
@@ -5083,24 +5194,15 @@ async def _run_hydra_turn_impl(
     turn_request_text = current_user_turn_text or str(user_text or "").strip()
     task_name = _task_name_from_text(turn_request_text or user_text, fallback=task_name)
     _set_active_chat_job_task_name(active_job_id, task_name)
-    tool_index = _enabled_tool_mini_index(
-        platform=platform,
-        registry=registry,
-        enabled_predicate=enabled_predicate,
-        origin=origin_payload,
-    )
-    astraeus_capability_catalog = _astraeus_capability_catalog(
-        platform=platform,
-        registry=registry,
-        enabled_predicate=enabled_predicate,
-        origin=origin_payload,
-    )
-    available_execution_tool_ids = _enabled_execution_tool_ids(
+    tool_fragments = _hydra_tool_fragments(
         platform=platform,
         registry=registry,
         enabled_predicate=enabled_predicate,
         origin=origin_payload,
     )
+    tool_index = tool_fragments["tool_index"]
+    astraeus_capability_catalog = tool_fragments["capability_catalog"]
+    available_execution_tool_ids = set(tool_fragments["execution_tool_ids"])
     prior_state = None
     memory_context_payload = _memory_context_payload(
         redis_client=r,
@@ -5461,6 +5563,19 @@ async def _run_hydra_turn_impl(
             total_repairs=repairs_used_count,
             validation_failures=validation_failures_count,
             tool_failures=tool_failures_count,
+            total_ms=total_ms,
+            role_ms={
+                "astraeus": int(astraeus_ms_total),
+                "thanatos": int(thanatos_ms_total + state_update_ms_total),
+                "minos": int(checker_ms_total),
+                "hermes": int(hermes_chat_ms_total + hermes_final_ms_total),
+            },
+            tool_ms=tool_ms_by_call,
+            role_tokens={
+                "astraeus": _debug_token_counts(astraeus_debug),
+                "thanatos": dict(thanatos_tokens_total),
+                "hermes": _debug_token_counts(hermes_chat_debug, hermes_final_debug),
+            },
         )
         return {
             "text": final_text,
@@ -5547,10 +5662,12 @@ async def _run_hydra_turn_impl(
             agent_state,
             fallback_goal=astraeus_goal or turn_request_text or user_text,
         )
-        thanatos_messages: List[Dict[str, Any]] = [
-            {"role": "system", "content": _thanatos_system_prompt(platform)},
-        ]
+        thanatos_messages: List[Dict[str, Any]] = _thanatos_prompt_head(
+            system_prompt=tool_fragments["thanatos_system_prompt"],
+            platform_preamble=tool_platform_preamble,
+        )
         thanatos_messages.extend([
+            {"role": "system", "content": _current_time_prompt()},
             {
                 "role": "system",
                 "content": _thanatos_focus_prompt(
@@ -5600,10 +5717,6 @@ async def _run_hydra_turn_impl(
             )
             if tool_contract_prompt:
                 thanatos_messages.append({"role": "system", "content": tool_contract_prompt})
-        thanatos_messages = _with_platform_preamble(
-            thanatos_messages,
-            platform_preamble=tool_platform_preamble,
-        )
         thanatos_messages.extend(history)
         thanatos_messages.append({"role": "user", "content": round_request_text})
 
@@ -5618,6 +5731,8 @@ async def _run_hydra_turn_impl(
             debug_out=current_thanatos_debug,
         )
         thanatos_debug = dict(current_thanatos_debug)
+        for key, value in _debug_token_counts(current_thanatos_debug).items():
+            thanatos_tokens_total[key] += value
         thanatos_ms_total += thanatos_ms
 
         if _is_tool_candidate(thanatos_text):
@@ -5891,7 +6006,9 @@ async def _run_hydra_turn_impl(
                 )
         finally:
             _set_active_chat_job_current_tool(active_job_id, "")
-        tool_ms_total += (time.perf_counter() - tool_started) * 1000.0
+        tool_elapsed_ms = (time.perf_counter() - tool_started) * 1000.0
+        tool_ms_total += tool_elapsed_ms
+        tool_ms_by_call.append((str((planned_tool or {}).get("function") or ""), int(tool_elapsed_ms)))
         raw_payload = doer_exec.get("payload")
         raw_tool_payload_out = raw_payload if isinstance(raw_payload, dict) else None
         if isinstance(raw_tool_payload_out, dict) and raw_tool_payload_out:
@@ -1,8 +1,63 @@
+import base64
 import hashlib
 import json
 import time
 import uuid
-from typing import Any, Callable, Dict, Optional, Sequence
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from redis_runtime import redis_batch
+
+from . import hydra_metrics as metrics
+
+# Ledger lists (tater:hydra:ledger:<platform>) hold one small summary row per
+# turn: the fields below, which every dashboard aggregate needs. Everything
+# else (message text, agent state snapshot, stage debug) goes to a separate
+# zlib-compressed payload key per turn that expires well before the summary
+# row is trimmed. Rows written before the split are full entries and are read
+# as-is.
+LEDGER_KEY_PREFIX = "tater:hydra:ledger:"
+LEDGER_PAYLOAD_KEY_PREFIX = "tater:hydra:ledger_payload:"
+LEDGER_PAYLOAD_TTL_SECONDS = 7 * 24 * 3600
+LEDGER_SUMMARY_FIELDS = (
+    "schema_version",
+    "timestamp",
+    "platform",
+    "scope",
+    "turn_id",
+    "planned_tool",
+    "attempted_tool",
+    "validation",
+    "validation_reason",
+    "checker_action",
+    "checker_reason",
+    "planner_kind",
+    "outcome",
+    "outcome_reason",
+    "tool_result_ok",
+    "planner_ms",
+    "astraeus_route_ms",
+    "thanatos_ms",
+    "progress_ms",
+    "state_update_ms",
+    "tool_ms",
+    "checker_ms",
+    "hermes_chat_ms",
+    "hermes_final_ms",
+    "total_ms",
+    "retry_count",
+    "rounds_used",
+    "tool_calls_used",
+)
+_PAYLOAD_PREFIX = "z1:"
+
+_BUCKET_COUNTER_NAMES = {
+    "total_turns": "turns",
+    "total_tools_called": "tools_called",
+    "total_repairs": "repairs",
+    "validation_failures": "validation_failures",
+    "tool_failures": "tool_failures",
+}
 
 
 def hash_tool_args(args: Any) -> str:
@@ -140,6 +195,10 @@ def write_hydra_metrics(
     validation_failures: int,
     tool_failures: int,
     normalize_platform_fn: Callable[[str], str],
+    total_ms: int = 0,
+    role_ms: Optional[Dict[str, int]] = None,
+    tool_ms: Sequence[Tuple[str, int]] = (),
+    role_tokens: Optional[Dict[str, Dict[str, int]]] = None,
 ) -> None:
     if redis_client is None:
         return
@@ -151,18 +210,25 @@ def write_hydra_metrics(
         "validation_failures": max(0, int(validation_failures or 0)),
         "tool_failures": max(0, int(tool_failures or 0)),
     }
+    batch = redis_batch(redis_client)
     for name, amount in counters.items():
         if amount <= 0:
             continue
-        keys = [
-            f"tater:hydra:metrics:{name}",
-            f"tater:hydra:metrics:{name}:{p}",
-        ]
-        for key in keys:
-            try:
-                redis_client.incrby(key, amount)
-            except Exception:
-                continue
+        batch.incrby(f"tater:hydra:metrics:{name}", amount)
+        batch.incrby(f"tater:hydra:metrics:{name}:{p}", amount)
+    fields = metrics.turn_metric_fields(
+        platform=p,
+        counters={_BUCKET_COUNTER_NAMES[name]: amount for name, amount in counters.items()},
+        total_ms=total_ms,
+        role_ms=dict(role_ms or {}),
+        tool_ms=list(tool_ms or ()),
+        role_tokens=dict(role_tokens or {}),
+    )
+    metrics.queue_turn_metrics(batch, fields)
+    try:
+        batch.execute()
+    except Exception:
+        pass
 
 
 def write_hydra_ledger(
@@ -323,13 +389,145 @@ def write_hydra_ledger(
         entry["tool_result_ok"] = result_ok
         if summary:
             entry["tool_result_summary"] = summary
-    payload = json.dumps(entry, ensure_ascii=False)
-
-    keys = [f"tater:hydra:ledger:{platform}"]
+    row = {name: entry[name] for name in LEDGER_SUMMARY_FIELDS if name in entry}
+    details = {name: value for name, value in entry.items() if name not in row}
+    row["has_payload"] = True
+    key = f"{LEDGER_KEY_PREFIX}{platform}"
     max_items = configured_max_ledger_items_fn(redis_client)
+    try:
+        (
+            redis_batch(redis_client)
+            .rpush(key, json.dumps(row, ensure_ascii=False))
+            .ltrim(key, -max_items, -1)
+            .set(ledger_payload_key(entry["turn_id"]), pack_ledger_payload(details), ex=LEDGER_PAYLOAD_TTL_SECONDS)
+            .execute()
+        )
+    except Exception:
+        pass
+
+
+def ledger_payload_key(turn_id: Any) -> str:
+    return f"{LEDGER_PAYLOAD_KEY_PREFIX}{turn_id}"
+
+
+def pack_ledger_payload(details: Dict[str, Any]) -> str:
+    raw = json.dumps(details, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _PAYLOAD_PREFIX + base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+
+
+def unpack_ledger_payload(value: Any) -> Dict[str, Any]:
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("utf-8", errors="ignore")
+    text = str(value or "")
+    if not text.startswith(_PAYLOAD_PREFIX):
+        return {}
+    try:
+        parsed = json.loads(zlib.decompress(base64.b64decode(text[len(_PAYLOAD_PREFIX) :])))
+    except Exception:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def parse_ledger_row(raw: Any) -> Optional[Dict[str, Any]]:
+    try:
+        row = json.loads(raw)
+    except Exception:
+        return None
+    return row if isinstance(row, dict) else None
+
+
+def load_ledger_rows(redis_client: Any, keys: Sequence[str], *, limit: int) -> List[Dict[str, Any]]:
+    """Newest-first summary rows from every key."""
+    rows: List[Dict[str, Any]] = []
+    for key in keys:
+        # Direct LRANGE rather than a pipeline: the encrypted client decrypts
+        # list reads itself, its pipeline proxy does not.
+        try:
+            raw_items = redis_client.lrange(key, -max(1, int(limit)), -1) or []
+        except Exception:
+            raw_items = []
+        for raw in raw_items:
+            row = parse_ledger_row(raw)
+            if row is not None:
+                row["_ledger_key"] = key
+                rows.append(row)
+    rows.sort(key=lambda item: float(item.get("timestamp") or 0.0), reverse=True)
+    return rows
+
+
+def attach_ledger_payloads(redis_client: Any, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge stored payloads into summary rows; only these rows' payloads are read."""
+    wanted = [row for row in rows if row.get("has_payload") and row.get("turn_id")]
+    payloads: Dict[str, Dict[str, Any]] = {}
+    if wanted:
+        try:
+            values = redis_client.mget([ledger_payload_key(row["turn_id"]) for row in wanted]) or []
+        except Exception:
+            values = []
+        for row, value in zip(wanted, values):
+            payloads[str(row["turn_id"])] = unpack_ledger_payload(value)
+    merged: List[Dict[str, Any]] = []
+    for row in rows:
+        details = payloads.get(str(row.get("turn_id") or "")) if row.get("has_payload") else None
+        merged.append({**details, **row} if details else dict(row))
+    return merged
+
+
+def delete_ledger_keys(redis_client: Any, keys: Sequence[str]) -> int:
+    """Delete ledger lists and the payloads their rows point at."""
+    deleted = 0
     for key in keys:
         try:
-            redis_client.rpush(key, payload)
-            redis_client.ltrim(key, -max_items, -1)
+            payload_keys = [
+                ledger_payload_key(row["turn_id"])
+                for row in (parse_ledger_row(raw) for raw in redis_client.lrange(key, 0, -1) or [])
+                if row and row.get("has_payload") and row.get("turn_id")
+            ]
+            deleted += int(redis_client.delete(key) or 0)
+            for start in range(0, len(payload_keys), 500):
+                redis_client.delete(*payload_keys[start : start + 500])
         except Exception:
             continue
+    return deleted
+
+
+def summarize_ledger_rows(rows: Sequence[Dict[str, Any]], *, since: float = 0.0) -> Dict[str, Any]:
+    """Turn counts, outcomes and per-tool failure rates from summary rows alone."""
+    platforms: Dict[str, int] = {}
+    outcomes: Dict[str, int] = {}
+    tools: Dict[str, Dict[str, int]] = {}
+    turns = 0
+    for row in rows:
+        if since and float(row.get("timestamp") or 0.0) < since:
+            continue
+        turns += 1
+        platform = str(row.get("platform") or "unknown")
+        platforms[platform] = platforms.get(platform, 0) + 1
+        outcome = str(row.get("outcome") or "").strip().lower() or "done"
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        planned = row.get("planned_tool") if isinstance(row.get("planned_tool"), dict) else {}
+        name = str(planned.get("function") or "").strip()
+        if not name:
+            continue
+        stats = tools.setdefault(name, {"calls": 0, "failures": 0, "tool_ms": 0})
+        stats["calls"] += 1
+        stats["tool_ms"] += max(0, int(row.get("tool_ms") or 0))
+        if row.get("tool_result_ok") is False or outcome == "failed":
+            stats["failures"] += 1
+    tool_rows = [
+        {
+            "tool": name,
+            "calls": stats["calls"],
+            "failures": stats["failures"],
+            "failure_rate": round(stats["failures"] / stats["calls"], 4),
+            "mean_tool_ms": int(stats["tool_ms"] / stats["calls"]),
+        }
+        for name, stats in tools.items()
+    ]
+    tool_rows.sort(key=lambda item: (-item["calls"], item["tool"]))
+    return {
+        "turns": turns,
+        "platform_turns": dict(sorted(platforms.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "outcomes": outcomes,
+        "tools": tool_rows,
+    }
@@ -0,0 +1,229 @@
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from redis_runtime import redis_batch
+
+# Time-bucketed Hydra metrics. Each turn adds to one minute bucket and one hour
+# bucket; a bucket is a single hash keyed by its start time whose fields are
+# "<platform>|<metric>". Counters are plain HINCRBY fields. Latencies go into
+# fixed-bound histograms ("<platform>|lat|<series>|<bound index>" plus a
+# "|sum" field), so percentiles for any range are a merge of bucket counts.
+# Keys live under tater:hydra:metrics: so they stay plaintext counters and
+# are cleared with the lifetime totals.
+METRICS_KEY_PREFIX = "tater:hydra:metrics:"
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    # name: (bucket seconds, retention seconds)
+    "minute": (60, 2 * 24 * 3600),
+    "hour": (3600, 60 * 24 * 3600),
+}
+MAX_RANGE_BUCKETS = 1440
+LATENCY_BOUNDS_MS: Tuple[int, ...] = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+HYDRA_ROLES = ("astraeus", "thanatos", "minos", "hermes")
+
+
+def bucket_key(resolution: str, bucket_start: int) -> str:
+    return f"{METRICS_KEY_PREFIX}{resolution}:{int(bucket_start)}"
+
+
+def latency_bound_index(ms: float) -> int:
+    for index, bound in enumerate(LATENCY_BOUNDS_MS):
+        if ms <= bound:
+            return index
+    return len(LATENCY_BOUNDS_MS)
+
+
+def _clean_field(value: Any) -> str:
+    return str(value or "").strip().replace("|", "_")[:80]
+
+
+def turn_metric_fields(
+    *,
+    platform: str,
+    counters: Dict[str, int],
+    total_ms: int,
+    role_ms: Dict[str, int],
+    tool_ms: Sequence[Tuple[str, int]],
+    role_tokens: Dict[str, Dict[str, int]],
+) -> Dict[str, int]:
+    p = _clean_field(platform)
+    fields: Dict[str, int] = {}
+
+    def add(field: str, amount: int) -> None:
+        if amount > 0:
+            fields[f"{p}|{field}"] = fields.get(f"{p}|{field}", 0) + int(amount)
+
+    def observe(series: str, ms: int) -> None:
+        ms = max(0, int(ms or 0))
+        add(f"lat|{series}|{latency_bound_index(ms)}", 1)
+        add(f"lat|{series}|sum", ms)
+
+    for name, amount in counters.items():
+        add(name, max(0, int(amount or 0)))
+    observe("turn", total_ms)
+    for role in HYDRA_ROLES:
+        ms = max(0, int(role_ms.get(role) or 0))
+        if ms > 0:
+            observe(f"role:{role}", ms)
+    for tool_name, ms in tool_ms:
+        name = _clean_field(tool_name)
+        if name:
+            observe(f"tool:{name}", ms)
+            add(f"tool_calls:{name}", 1)
+    for role, tokens in role_tokens.items():
+        for kind in ("prompt_tokens", "completion_tokens"):
+            amount = max(0, int((tokens or {}).get(kind) or 0))
+            add(kind, amount)
+            add(f"{kind}:{_clean_field(role)}", amount)
+    return fields
+
+
+def queue_turn_metrics(batch: Any, fields: Dict[str, int], *, now: Optional[float] = None) -> Any:
+    stamp = int(time.time() if now is None else now)
+    for resolution, (width, retention) in RESOLUTIONS.items():
+        key = bucket_key(resolution, stamp - stamp % width)
+        for field, amount in fields.items():
+            batch.hincrby(key, field, amount)
+        batch.expire(key, retention + width)
+    return batch
+
+
+def _bucket_starts(resolution: str, start_ts: float, end_ts: float) -> List[int]:
+    width = RESOLUTIONS[resolution][0]
+    first = int(start_ts) - int(start_ts) % width
+    last = int(end_ts) - int(end_ts) % width
+    count = min(MAX_RANGE_BUCKETS, max(0, (last - first) // width + 1))
+    return [last - width * offset for offset in range(count)][::-1]
+
+
+def _as_text(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", errors="ignore")
+    return str(value)
+
+
+def percentile_ms(counts: Sequence[int], fraction: float) -> Optional[int]:
+    """Upper bound of the bucket holding the percentile.
+
+    None when it lands past the last bound: the overflow bucket has no upper
+    bound, so reporting LATENCY_BOUNDS_MS[-1] would understate it.
+    """
+    total = sum(counts)
+    if total <= 0:
+        return 0
+    rank = max(1, math.ceil(total * fraction))
+    seen = 0
+    for index, count in enumerate(counts):
+        seen += count
+        if seen >= rank:
+            return LATENCY_BOUNDS_MS[index] if index < len(LATENCY_BOUNDS_MS) else None
+    return None
+
+
+def _summarize_histogram(counts: List[int], sum_ms: int) -> Dict[str, Any]:
+    total = sum(counts)
+    return {
+        "count": total,
+        "mean_ms": int(round(sum_ms / total)) if total else 0,
+        "p50_ms": percentile_ms(counts, 0.50),
+        "p95_ms": percentile_ms(counts, 0.95),
+        "p99_ms": percentile_ms(counts, 0.99),
+        "overflow_count": sum(counts[len(LATENCY_BOUNDS_MS):]),
+        "buckets": counts,
+    }
+
+
+def summarize_bucket(raw: Dict[Any, Any], platforms: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    wanted = {str(p) for p in platforms} if platforms is not None else None
+    counters: Dict[str, int] = {}
+    histograms: Dict[str, List[int]] = {}
+    sums: Dict[str, int] = {}
+    for raw_field, raw_value in (raw or {}).items():
+        platform, _, metric = _as_text(raw_field).partition("|")
+        if wanted is not None and platform not in wanted:
+            continue
+        try:
+            amount = int(_as_text(raw_value))
+        except Exception:
+            continue
+        if metric.startswith("lat|"):
+            series, _, slot = metric[4:].rpartition("|")
+            if slot == "sum":
+                sums[series] = sums.get(series, 0) + amount
+                continue
+            try:
+                index = int(slot)
+            except Exception:
+                continue
+            counts = histograms.setdefault(series, [0] * (len(LATENCY_BOUNDS_MS) + 1))
+            if 0 <= index < len(counts):
+                counts[index] += amount
+        else:
+            counters[metric] = counters.get(metric, 0) + amount
+    return {
+        "counters": counters,
+        "latency": {series: _summarize_histogram(counts, sums.get(series, 0)) for series, counts in histograms.items()},
+    }
+
+
+def read_hydra_metric_range(
+    redis_client: Any,
+    *,
+    start_ts: float,
+    end_ts: float,
+    resolution: str = "minute",
+    platforms: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """Read every bucket in [start_ts, end_ts] with one pipelined HGETALL batch."""
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"resolution must be one of: {', '.join(RESOLUTIONS)}")
+    platform_list = list(platforms) if platforms is not None else None
+    starts = _bucket_starts(resolution, min(start_ts, end_ts), max(start_ts, end_ts))
+    batch = redis_batch(redis_client)
+    for start in starts:
+        batch.hgetall(bucket_key(resolution, start))
+    rows = batch.execute() if starts else []
+
+    series: List[Dict[str, Any]] = []
+    merged: Dict[Any, int] = {}
+    for start, raw in zip(starts, rows):
+        if not raw:
+            continue
+        summary = summarize_bucket(raw, platform_list)
+        if not summary["counters"] and not summary["latency"]:
+            continue
+        series.append({"ts": start, **summary})
+        for field, value in raw.items():
+            merged[_as_text(field)] = merged.get(_as_text(field), 0) + int(_as_text(value) or 0)
+    return {
+        "resolution": resolution,
+        "bucket_seconds": RESOLUTIONS[resolution][0],
+        "start_ts": starts[0] if starts else int(start_ts),
+        "end_ts": starts[-1] + RESOLUTIONS[resolution][0] if starts else int(end_ts),
+        "latency_bounds_ms": list(LATENCY_BOUNDS_MS),
+        "buckets": series,
+        "total": summarize_bucket(merged, platform_list),
+    }
+
+
+def clear_hydra_metric_buckets(redis_client: Any, platform: str) -> int:
+    """Drop one platform's fields from every live bucket."""
+    prefix = f"{_clean_field(platform)}|"
+    removed = 0
+    for resolution in RESOLUTIONS:
+        try:
+            keys = [str(k) for k in redis_client.scan_iter(match=f"{METRICS_KEY_PREFIX}{resolution}:*")]
+        except Exception:
+            continue
+        if not keys:
+            continue
+        batch = redis_batch(redis_client)
+        for key in keys:
+            batch.hkeys(key)
+        doomed = redis_batch(redis_client)
+        for key, fields in zip(keys, batch.execute()):
+            stale = [_as_text(field) for field in fields or [] if _as_text(field).startswith(prefix)]
+            if stale:
+                doomed.hdel(key, *stale)
+        removed += sum(int(count or 0) for count in doomed.execute())
+    return removed
@@ -214,10 +214,14 @@ def thanatos_system_prompt(
         "- Never mention internal orchestration roles or codenames.\n"
         "- If outputting a tool call, output only the JSON object and nothing else.\n"
         f"{plain_text_rule}"
-        f"Current Date and Time: {now_text}\n"
+        + (f"Current Date and Time: {now_text}\n" if now_text else "")
     ).strip()
 
 
+def current_time_prompt(*, now_text: str) -> str:
+    return f"Current Date and Time: {now_text}"
+
+
 def hermes_synthesis_system_prompt() -> str:
     return (
         "You are composing the final user-facing answer from tool findings.\n"
@@ -1,4 +1,16 @@
-from typing import Any, Callable, Dict, List, Optional
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Rendered tool catalogs and static prompt sections, keyed by
+# (platform, registry generation, enabled-map version, kernel tool ids). A
+# turn whose key matches reuses the exact same strings, which keeps the
+# Astraeus/Thanatos prompt heads byte-identical for llama.cpp prefix reuse.
+TOOL_FRAGMENT_CACHE_MAX_ENTRIES = 32
+
+_fragment_lock = threading.Lock()
+_fragment_cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
 
 
 def tool_purpose(
@@ -101,3 +113,69 @@ def enabled_tool_mini_index(
         + "\nKernel tools (built-ins; terminal console tools provide full terminal console access to run commands when no Verba can do the task):\n"
         + "\n".join(kernel_rows)
     )
+
+
+def registry_fingerprint(registry: Dict[str, Any], generation: int) -> Tuple[Any, ...]:
+    # Plugin object identity changes on reload, so snapshots of the same
+    # generation share a fingerprint without re-reading plugin metadata.
+    return (int(generation), tuple(sorted((str(plugin_id), id(plugin)) for plugin_id, plugin in (registry or {}).items())))
+
+
+def enabled_map_version(enabled_predicate: Optional[Callable[[str], bool]]) -> Optional[str]:
+    if enabled_predicate is None:
+        return "all"
+    version = getattr(enabled_predicate, "enabled_version", None)
+    return str(version) if version is not None else None
+
+
+def memoized_predicate(enabled_predicate: Optional[Callable[[str], bool]]) -> Callable[[str], bool]:
+    enabled_check = enabled_predicate or (lambda _name: True)
+    seen: Dict[str, bool] = {}
+
+    def check(name: str) -> bool:
+        key = str(name or "")
+        if key not in seen:
+            seen[key] = bool(enabled_check(key))
+        return seen[key]
+
+    return check
+
+
+def tool_fragment_key(
+    *,
+    platform: str,
+    registry_key: Hashable,
+    enabled_key: Hashable,
+    kernel_tools: Sequence[Tuple[str, str, str]],
+) -> Tuple[Hashable, ...]:
+    """Cache key; kernel tools are (id, description, usage) so hint edits rebuild."""
+    return (str(platform or ""), registry_key, enabled_key, tuple(kernel_tools))
+
+
+def cached_tool_fragments(key: Hashable, build_fn: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    with _fragment_lock:
+        hit = _fragment_cache.get(key)
+        if hit is not None:
+            _fragment_cache.move_to_end(key)
+            return hit
+    fragments = build_fn()
+    with _fragment_lock:
+        _fragment_cache[key] = fragments
+        _fragment_cache.move_to_end(key)
+        while len(_fragment_cache) > TOOL_FRAGMENT_CACHE_MAX_ENTRIES:
+            _fragment_cache.popitem(last=False)
+    return fragments
+
+
+def clear_tool_fragment_cache() -> None:
+    with _fragment_lock:
+        _fragment_cache.clear()
+
+
+def shared_prompt_prefix_chars(first: Sequence[Dict[str, Any]], second: Sequence[Dict[str, Any]]) -> int:
+    """Length of the byte-identical head two chat prompts share once rendered."""
+
+    def render(messages: Sequence[Dict[str, Any]]) -> str:
+        return "".join(f"<{m.get('role')}>\n{m.get('content')}\n" for m in messages if isinstance(m, dict))
+
+    return len(os.path.commonprefix([render(first), render(second)]))
@@ -23,7 +23,6 @@ integration_registry_errors: List[str] = []
 INTEGRATION_DEVICE_REGISTRY_CACHE_KEY = "tater:integration_runtime:device_registry"
 INTEGRATION_DEVICE_REGISTRY_GENERATION_KEY = "tater:integration_runtime:device_registry:generation"
 INTEGRATION_ROOM_OVERRIDES_KEY = "tater:integration_runtime:room_overrides"
-INTEGRATION_RUNTIME_STATES_KEY = "tater:integration_runtime:states"
 _DEVICE_REGISTRY_CACHE_VERSION = 4
 _DEVICE_REGISTRY_GENERATION_LOCK = threading.RLock()
 _DEVICE_REGISTRY_VOLATILE_FIELDS = {
@@ -826,17 +825,14 @@ def _runtime_state_index(client: Any = None) -> Dict[Tuple[str, str], Dict[str,
     if not redis_obj:
         return {}
     try:
-        raw = redis_obj.hgetall(INTEGRATION_RUNTIME_STATES_KEY) or {}
+        import integration_runtime_store
+
+        records, _version = integration_runtime_store.state_records(redis_obj)
     except Exception:
         return {}
     index: Dict[Tuple[str, str], Dict[str, Any]] = {}
-    if not isinstance(raw, dict):
-        return index
-    for key, value in raw.items():
-        record = _json_dict_loads(value)
-        if not record:
-            continue
-        provider = _text(record.get("provider") or _text(key).split(":", 1)[0]).lower()
+    for record in records:
+        provider = _text(record.get("provider") or _text(record.get("key")).split(":", 1)[0]).lower()
         payload = record.get("payload") if isinstance(record.get("payload"), dict) else {}
         candidate_tokens = [_text(record.get("id"))]
         candidate_tokens.extend(_state_payload_id_tokens(payload))
@@ -11,16 +11,18 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional
 import aiohttp
 
 from integration_registry import refresh_integration_device_registry_cache as _refresh_integration_device_registry_cache
+from helpers import async_redis_client as shared_async_redis_client
+from helpers import redis_batch
 from helpers import redis_client as shared_redis_client
+import integration_runtime_store as runtime_store
 from runtime_executors import run_background
 from tateros import integration_store as integration_store_module
 
 logger = logging.getLogger("integration_runtime")
 
-INTEGRATION_RUNTIME_EVENTS_KEY = "tater:integration_runtime:events"
-INTEGRATION_RUNTIME_EVENT_SEQ_KEY = "tater:integration_runtime:event_seq"
+INTEGRATION_RUNTIME_EVENTS_KEY = runtime_store.EVENT_STREAM_KEY
+INTEGRATION_RUNTIME_EVENT_SEQ_KEY = runtime_store.EVENT_SEQ_KEY
 INTEGRATION_RUNTIME_STATUS_KEY = "tater:integration_runtime:status"
-INTEGRATION_RUNTIME_STATES_KEY = "tater:integration_runtime:states"
 
 _DEFAULT_EVENT_MAX = 1000
 _DEFAULT_RECONNECT_SECONDS = 5
@@ -35,11 +37,6 @@ _RUNTIME_LOOP: Optional[asyncio.AbstractEventLoop] = None
 _DEVICE_REGISTRY_CACHE_LOOP_ENABLED = True
 _DEVICE_REGISTRY_CHANGE_LOCK = threading.RLock()
 _DEVICE_REGISTRY_CHANGE_LISTENERS: List[Callable[[str, str], Any]] = []
-_EVENT_HISTORY_CACHE_LOCK = threading.RLock()
-_EVENT_HISTORY_CACHE: Dict[str, Any] = {
-    "loaded_at": 0.0,
-    "rows": [],
-}
 _GENERIC_RUNTIME_CURSOR: Dict[str, Any] = {}
 _GENERIC_RUNTIME_NEXT_POLL: Dict[str, float] = {}
 _RUNTIME_PROVIDER_OWNER = {
@@ -204,29 +201,23 @@ def _setting_int(
     return _as_int(_settings(client, settings_key).get(field), default, minimum=minimum, maximum=maximum)
 
 
+def _status_payload(**fields: Any) -> Dict[str, str]:
+    payload = {str(key): _status_value(value) for key, value in fields.items()}
+    payload["updated_at"] = _status_value(time.time())
+    return payload
+
+
 def _status_set(client: Any, **fields: Any) -> None:
     redis_obj = _runtime_client(client)
     if not redis_obj:
         return
-    payload = {str(key): _status_value(value) for key, value in fields.items()}
-    payload["updated_at"] = _status_value(time.time())
+    payload = _status_payload(**fields)
     try:
         redis_obj.hset(INTEGRATION_RUNTIME_STATUS_KEY, mapping=payload)
     except Exception as exc:
         logger.debug("[integrations] runtime status write skipped: %s", exc)
 
 
-def _json_loads(raw: Any) -> Optional[Dict[str, Any]]:
-    text = _text(raw)
-    if not text:
-        return None
-    try:
-        data = json.loads(text)
-    except Exception:
-        return None
-    return data if isinstance(data, dict) else None
-
-
 def _enabled_integration_ids() -> set[str]:
     try:
         return {
@@ -266,82 +257,107 @@ def _state_set(client: Any, provider: str, state_id: Any, payload: Dict[str, Any
     token = _text(state_id)
     if not redis_obj or not token:
         return
-    record = {
-        "provider": _text(provider),
-        "id": token,
-        "updated_at": time.time(),
-        "payload": payload if isinstance(payload, dict) else {},
-    }
-    created = redis_obj.hset(
-        INTEGRATION_RUNTIME_STATES_KEY,
-        f"{_text(provider)}:{token}",
-        json.dumps(record, separators=(",", ":"), default=str),
-    )
-    try:
-        is_new = int(created or 0) > 0
-    except Exception:
-        is_new = False
+    is_new, _version = runtime_store.set_state(redis_obj, provider, token, payload)
     if is_new:
         _notify_device_registry_change("device-discovered", f"{_text(provider)}:{token}")
 
 
-def _publish_event(client: Any, provider: str, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    redis_obj = _runtime_client(client)
-    if not redis_obj:
-        return {}
-    now = time.time()
-    seq = _as_int(redis_obj.incr(INTEGRATION_RUNTIME_EVENT_SEQ_KEY), 0, minimum=0)
-    record = {
+def _event_record(seq: int, provider: str, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
         "seq": seq,
-        "ts": now,
+        "ts": time.time(),
         "provider": _text(provider),
         "kind": _text(kind),
         "payload": payload if isinstance(payload, dict) else {},
     }
-    serialized_record = json.dumps(record, separators=(",", ":"), default=str)
-    redis_obj.lpush(INTEGRATION_RUNTIME_EVENTS_KEY, serialized_record)
-    redis_obj.ltrim(INTEGRATION_RUNTIME_EVENTS_KEY, 0, _event_max() - 1)
-    with _EVENT_HISTORY_CACHE_LOCK:
-        cached_rows = _EVENT_HISTORY_CACHE.get("rows")
-        if isinstance(cached_rows, list) and float(
-            _EVENT_HISTORY_CACHE.get("loaded_at") or 0.0
-        ) > 0.0:
-            _EVENT_HISTORY_CACHE.update(
-                {
-                    "loaded_at": time.monotonic(),
-                    "rows": [serialized_record, *cached_rows][:_event_max()],
-                }
-            )
-    _status_set(
-        redis_obj,
-        last_event_seq=seq,
-        last_event_ts=now,
-        last_event_provider=provider,
-        last_event_kind=kind,
-        **{f"{_text(provider)}_last_event_ts": now},
+
+
+def _queue_event_writes(batch: Any, record: Dict[str, Any], serialized_record: str) -> None:
+    provider = _text(record.get("provider"))
+    runtime_store.queue_event_append(batch, record, serialized_record, max_events=_event_max())
+    batch.hset(
+        INTEGRATION_RUNTIME_STATUS_KEY,
+        mapping=_status_payload(
+            last_event_seq=record.get("seq"),
+            last_event_ts=record.get("ts"),
+            last_event_provider=provider,
+            last_event_kind=record.get("kind"),
+            **{f"{provider}_last_event_ts": record.get("ts")},
+        ),
     )
-    return record
 
 
-def _runtime_state_records(redis_obj: Any, *, enabled_only: bool = True) -> List[Dict[str, Any]]:
+def _publish_event(client: Any, provider: str, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    redis_obj = _runtime_client(client)
+    if not redis_obj:
+        return {}
+    # The sequence number doubles as the stream entry id, so it is allocated
+    # first; the append and status update share one pipeline round trip.
+    for attempt in range(runtime_store._XADD_RETRIES):
+        seq = _as_int(redis_obj.incr(INTEGRATION_RUNTIME_EVENT_SEQ_KEY), 0, minimum=0)
+        record = _event_record(seq, provider, kind, payload)
+        serialized_record = json.dumps(record, separators=(",", ":"), default=str)
+        batch = redis_batch(redis_obj)
+        _queue_event_writes(batch, record, serialized_record)
+        try:
+            batch.execute()
+        except Exception as exc:
+            if not runtime_store.is_stale_event_id_error(exc) or attempt + 1 >= runtime_store._XADD_RETRIES:
+                raise
+            runtime_store.repair_event_seq(redis_obj)
+            continue
+        return record
+    return {}
+
+
+async def _publish_event_async(client: Any, provider: str, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    redis_obj = _runtime_client(client)
+    if not redis_obj:
+        return {}
+    if redis_obj is not shared_redis_client:
+        # Injected clients are sync-only; keep their I/O off the event loop.
+        return await run_background(_publish_event, redis_obj, provider, kind, payload)
+    for attempt in range(runtime_store._XADD_RETRIES):
+        seq = _as_int(await shared_async_redis_client.incr(INTEGRATION_RUNTIME_EVENT_SEQ_KEY), 0, minimum=0)
+        record = _event_record(seq, provider, kind, payload)
+        serialized_record = json.dumps(record, separators=(",", ":"), default=str)
+        batch = redis_batch(shared_async_redis_client)
+        _queue_event_writes(batch, record, serialized_record)
+        try:
+            await batch.execute_async()
+        except Exception as exc:
+            if not runtime_store.is_stale_event_id_error(exc) or attempt + 1 >= runtime_store._XADD_RETRIES:
+                raise
+            await run_background(runtime_store.repair_event_seq, redis_obj)
+            continue
+        return record
+    return {}
+
+
+def _runtime_state_records(
+    redis_obj: Any,
+    *,
+    enabled_only: bool = True,
+    since_version: int = 0,
+) -> List[Dict[str, Any]]:
+    return _runtime_state_snapshot(redis_obj, enabled_only=enabled_only, since_version=since_version)[0]
+
+
+def _runtime_state_snapshot(
+    redis_obj: Any,
+    *,
+    enabled_only: bool = True,
+    since_version: int = 0,
+) -> tuple[List[Dict[str, Any]], int, List[str]]:
     try:
-        raw = redis_obj.hgetall(INTEGRATION_RUNTIME_STATES_KEY) or {} if redis_obj else {}
+        records, version, cleared = runtime_store.state_changes(redis_obj, since_version=since_version)
     except Exception:
-        raw = {}
-    states: List[Dict[str, Any]] = []
-    enabled_ids = _enabled_integration_ids() if enabled_only else set()
-    if isinstance(raw, dict):
-        for key, value in raw.items():
-            record = _json_loads(value)
-            if not record:
-                continue
-            provider = _text(record.get("provider"))
-            if enabled_only and not _runtime_provider_enabled(provider, enabled_ids):
-                continue
-            record.setdefault("key", _text(key))
-            states.append(record)
-    states.sort(key=lambda item: (_text(item.get("provider")).casefold(), _text(item.get("id")).casefold()))
-    return states
+        records, version, cleared = [], 0, []
+    if enabled_only:
+        enabled_ids = _enabled_integration_ids()
+        records = [record for record in records if _runtime_provider_enabled(record.get("provider"), enabled_ids)]
+    records.sort(key=lambda item: (_text(item.get("provider")).casefold(), _text(item.get("id")).casefold()))
+    return records, version, cleared
 
 
 def clear_integration_runtime_provider(integration_id: str, client: Any = None) -> Dict[str, Any]:
@@ -350,22 +366,10 @@ def clear_integration_runtime_provider(integration_id: str, client: Any = None)
     if not redis_obj or not providers:
         return {"providers": providers, "states_deleted": 0, "status_fields_deleted": 0}
 
-    states_deleted = 0
     try:
-        raw_states = redis_obj.hgetall(INTEGRATION_RUNTIME_STATES_KEY) or {}
+        states_deleted = runtime_store.clear_provider_states(redis_obj, providers)
     except Exception:
-        raw_states = {}
-    if isinstance(raw_states, dict):
-        for key, value in raw_states.items():
-            key_text = _text(key)
-            record = _json_loads(value)
-            provider = _text(record.get("provider") if record else key_text.split(":", 1)[0]).lower()
-            if provider in providers:
-                try:
-                    redis_obj.hdel(INTEGRATION_RUNTIME_STATES_KEY, key)
-                    states_deleted += 1
-                except Exception:
-                    pass
+        states_deleted = 0
 
     status_fields: set[str] = set()
     for provider in providers:
@@ -719,7 +723,7 @@ async def _homeassistant_loop(stop_event: asyncio.Event, client: Any) -> None:
                                             "raw": new_state,
                                         },
                                     )
-                                _publish_event(redis_obj, "homeassistant", "state_changed", payload)
+                                await _publish_event_async(redis_obj, "homeassistant", "state_changed", payload)
                             elif data.get("type") == "result" and data.get("id") == 1 and not data.get("success"):
                                 raise RuntimeError(f"Home Assistant subscribe_events failed: {data}")
                         elif msg.type in {aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED}:
@@ -1816,7 +1820,7 @@ def integration_runtime_status(client: Any = None) -> Dict[str, Any]:
     status["running"] = any(task for task in _TASKS if not task.done())
     try:
         status["last_event_seq"] = _as_int(redis_obj.get(INTEGRATION_RUNTIME_EVENT_SEQ_KEY), int(status.get("last_event_seq") or 0), minimum=0)
-        status["event_count"] = _as_int(redis_obj.llen(INTEGRATION_RUNTIME_EVENTS_KEY), 0, minimum=0)
+        status["event_count"] = runtime_store.event_count(redis_obj)
         status["state_count"] = len(_runtime_state_records(redis_obj, enabled_only=True))
     except Exception:
         status.setdefault("last_event_seq", 0)
@@ -1829,42 +1833,43 @@ def integration_runtime_events(client: Any = None, *, after_seq: Any = 0, limit:
     redis_obj = _runtime_client(client)
     after = _as_int(after_seq, 0, minimum=0)
     max_rows = _as_int(limit, 200, minimum=1, maximum=_event_max())
-    rows: List[Any] = []
-    if redis_obj:
-        now = time.monotonic()
-        with _EVENT_HISTORY_CACHE_LOCK:
-            cached_rows = _EVENT_HISTORY_CACHE.get("rows")
-            if isinstance(cached_rows, list) and now - float(
-                _EVENT_HISTORY_CACHE.get("loaded_at") or 0.0
-            ) < 2.0:
-                rows = list(cached_rows)
-            else:
-                rows = list(
-                    redis_obj.lrange(INTEGRATION_RUNTIME_EVENTS_KEY, 0, _event_max() - 1)
-                    or []
-                )
-                _EVENT_HISTORY_CACHE.update(
-                    {"loaded_at": now, "rows": list(rows)}
-                )
-    events: List[Dict[str, Any]] = []
-    for raw in rows or []:
-        event = _json_loads(raw)
-        if not event:
-            continue
-        seq = _as_int(event.get("seq"), 0, minimum=0)
-        if seq <= after:
-            continue
-        event["seq"] = seq
-        events.append(event)
-    events.sort(key=lambda item: _as_int(item.get("seq"), 0, minimum=0))
+    events = runtime_store.read_events(redis_obj, after_seq=after, limit=max_rows) if redis_obj else []
     return {
-        "events": events[:max_rows],
+        "events": events,
         "after_seq": after,
         "last_event_seq": _as_int(redis_obj.get(INTEGRATION_RUNTIME_EVENT_SEQ_KEY), 0, minimum=0) if redis_obj else 0,
     }
 
 
-def integration_runtime_states(client: Any = None) -> Dict[str, Any]:
+def integration_runtime_state_lookup(
+    client: Any,
+    keys: List[tuple[str, str]],
+) -> tuple[Dict[tuple[str, str], Dict[str, Any]], int]:
+    """Enabled providers' records for the given ``(provider, state_id)``
+    pairs, plus the current state version."""
+    redis_obj = _runtime_client(client)
+    try:
+        found, version = runtime_store.lookup_states(redis_obj, keys)
+    except Exception:
+        return {}, 0
+    enabled_ids = _enabled_integration_ids()
+    return {key: record for key, record in found.items() if _runtime_provider_enabled(key[0], enabled_ids)}, version
+
+
+def integration_runtime_states(client: Any = None, *, since_version: Any = 0) -> Dict[str, Any]:
+    """Enabled providers' entity states. With ``since_version`` only states
+    written after that version are returned; pass back ``version`` to poll
+    for the next delta. ``cleared_providers`` lists providers whose states
+    were removed since then: drop what you hold for them before applying
+    ``states``."""
     redis_obj = _runtime_client(client)
-    states = _runtime_state_records(redis_obj, enabled_only=True)
-    return {"states": states, "count": len(states), "enabled_integrations": sorted(_enabled_integration_ids())}
+    since = _as_int(since_version, 0, minimum=0)
+    states, version, cleared = _runtime_state_snapshot(redis_obj, enabled_only=True, since_version=since)
+    return {
+        "states": states,
+        "count": len(states),
+        "version": version,
+        "since_version": since,
+        "cleared_providers": cleared,
+        "enabled_integrations": sorted(_enabled_integration_ids()),
+    }
@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from redis.exceptions import NoScriptError, ResponseError
+
+from redis_runtime import redis_batch, redis_encode_value
+
+# Runtime events are an append-only Redis stream whose entry ids are
+# "<seq>-0", so a reader holding the last seq it saw reads exactly the newer
+# entries with one XRANGE. Entity state is sharded into one hash per
+# provider; every write takes a version from a global counter and records it
+# in the provider's version index (a zset of state id -> version), so readers
+# fetch only the states changed since the version they already hold. Clearing
+# a provider also takes a version and leaves a "cleared:<provider>" marker in
+# the versions hash, so delta readers learn that its states went away.
+EVENT_STREAM_KEY = "tater:integration_runtime:event_stream"
+EVENT_SEQ_KEY = "tater:integration_runtime:event_seq"
+LEGACY_EVENTS_KEY = "tater:integration_runtime:events"
+STATE_KEY_PREFIX = "tater:integration_runtime:states:"
+STATE_INDEX_KEY_PREFIX = "tater:integration_runtime:state_index:"
+STATE_VERSIONS_KEY = "tater:integration_runtime:state_versions"
+STATE_VERSION_KEY = "tater:integration_runtime:state_version"
+LEGACY_STATES_KEY = "tater:integration_runtime:states"
+
+_EVENT_RECORD_FIELD = "record"
+_XADD_RETRIES = 4
+_CLEARED_FIELD_PREFIX = "cleared:"
+
+# One round trip per state write: take the version and record the state, its
+# index entry and the provider version together. The record itself carries no
+# version (it may be encrypted); readers take it from the index score.
+_SET_STATE_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+local created = redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+redis.call('ZADD', KEYS[3], version, ARGV[1])
+redis.call('HSET', KEYS[4], ARGV[3], version)
+return {version, created}
+"""
+_SET_STATE_SHA = hashlib.sha1(_SET_STATE_SCRIPT.encode("utf-8")).hexdigest()
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="ignore")
+    return str(value or "").strip()
+
+
+def _int(value: Any) -> int:
+    try:
+        return max(0, int(float(_text(value) or 0)))
+    except Exception:
+        return 0
+
+
+def _json_dict(raw: Any) -> Optional[Dict[str, Any]]:
+    text = _text(raw)
+    if not text:
+        return None
+    try:
+        data = json.loads(text)
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str)
+
+
+def state_key(provider: Any) -> str:
+    return f"{STATE_KEY_PREFIX}{_text(provider)}"
+
+
+def state_index_key(provider: Any) -> str:
+    return f"{STATE_INDEX_KEY_PREFIX}{_text(provider)}"
+
+
+def event_entry_id(seq: int) -> str:
+    return f"{int(seq)}-0"
+
+
+def _entry_seq(entry_id: Any) -> int:
+    return _int(_text(entry_id).split("-", 1)[0])
+
+
+# --------------------------------------------------------------------------
+# Legacy layout migration
+# --------------------------------------------------------------------------
+
+_MIGRATION_LOCK = threading.Lock()
+_MIGRATED_CLIENTS: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _migrate_legacy(redis_obj: Any) -> None:
+    """Fold the old capped event list and single state hash into the stream
+    and per-provider shards, once per client."""
+    try:
+        if redis_obj in _MIGRATED_CLIENTS:
+            return
+    except TypeError:
+        return
+    with _MIGRATION_LOCK:
+        if redis_obj in _MIGRATED_CLIENTS:
+            return
+        if int(redis_obj.exists(LEGACY_EVENTS_KEY) or 0):
+            top_seq = last_event_seq(redis_obj)
+            rows = [_json_dict(raw) for raw in reversed(redis_obj.lrange(LEGACY_EVENTS_KEY, 0, -1) or [])]
+            batch = redis_batch(redis_obj)
+            for record in rows:
+                seq = _int((record or {}).get("seq"))
+                if not record or seq <= top_seq:
+                    continue
+                batch.xadd(EVENT_STREAM_KEY, {_EVENT_RECORD_FIELD: _dumps(record)}, id=event_entry_id(seq))
+                top_seq = seq
+            batch.delete(LEGACY_EVENTS_KEY)
+            batch.execute()
+        if int(redis_obj.exists(LEGACY_STATES_KEY) or 0):
+            legacy = redis_obj.hgetall(LEGACY_STATES_KEY) or {}
+            for key, raw in (legacy.items() if isinstance(legacy, dict) else []):
+                record = _json_dict(raw)
+                if not record:
+                    continue
+                provider = _text(record.get("provider") or _text(key).split(":", 1)[0])
+                set_state(
+                    redis_obj,
+                    provider,
+                    record.get("id") or _text(key).split(":", 1)[-1],
+                    record.get("payload") if isinstance(record.get("payload"), dict) else {},
+                    updated_at=record.get("updated_at"),
+                    migrate=False,
+                )
+            redis_obj.delete(LEGACY_STATES_KEY)
+        _MIGRATED_CLIENTS.add(redis_obj)
+
+
+# --------------------------------------------------------------------------
+# Event stream
+# --------------------------------------------------------------------------
+
+
+def queue_event_append(batch: Any, record: Dict[str, Any], serialized_record: str, *, max_events: int) -> None:
+    batch.xadd(
+        EVENT_STREAM_KEY,
+        {_EVENT_RECORD_FIELD: serialized_record},
+        id=event_entry_id(_int(record.get("seq"))),
+        maxlen=max(1, int(max_events)),
+        approximate=True,
+    )
+
+
+def is_stale_event_id_error(exc: BaseException) -> bool:
+    # Two publishers can take seq N and N+1 and land in the other order; the
+    # later XADD is rejected and retried with a fresh seq.
+    return isinstance(exc, ResponseError) and "equal or smaller" in str(exc)
+
+
+def repair_event_seq(redis_obj: Any) -> None:
+    """Lift the seq counter past the stream top after a rejected XADD (for
+    example when the counter key was cleared but the stream was not)."""
+    top_seq = last_event_seq(redis_obj)
+    if _int(redis_obj.get(EVENT_SEQ_KEY)) < top_seq:
+        redis_obj.set(EVENT_SEQ_KEY, top_seq)
+
+
+def last_event_seq(redis_obj: Any) -> int:
+    rows = redis_obj.xrevrange(EVENT_STREAM_KEY, count=1) or []
+    return _entry_seq(rows[0][0]) if rows else 0
+
+
+def _event_rows(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+    for entry_id, fields in rows or []:
+        fields = fields if isinstance(fields, dict) else {}
+        record = _json_dict(fields.get(_EVENT_RECORD_FIELD) or fields.get(_EVENT_RECORD_FIELD.encode()))
+        if not record:
+            continue
+        record["seq"] = _entry_seq(entry_id)
+        events.append(record)
+    return events
+
+
+def read_events(redis_obj: Any, *, after_seq: int = 0, limit: int = 200) -> List[Dict[str, Any]]:
+    """Events with seq > ``after_seq``, oldest first."""
+    _migrate_legacy(redis_obj)
+    rows = redis_obj.xrange(
+        EVENT_STREAM_KEY,
+        min=event_entry_id(max(0, int(after_seq)) + 1),
+        max="+",
+        count=max(1, int(limit)),
+    )
+    return _event_rows(rows)
+
+
+def recent_events(redis_obj: Any, *, limit: int) -> List[Dict[str, Any]]:
+    """The newest ``limit`` events, newest first."""
+    _migrate_legacy(redis_obj)
+    return _event_rows(redis_obj.xrevrange(EVENT_STREAM_KEY, count=max(1, int(limit))))
+
+
+def event_count(redis_obj: Any) -> int:
+    _migrate_legacy(redis_obj)
+    return _int(redis_obj.xlen(EVENT_STREAM_KEY))
+
+
+# --------------------------------------------------------------------------
+# Sharded state
+# --------------------------------------------------------------------------
+
+
+def set_state(
+    redis_obj: Any,
+    provider: Any,
+    state_id: Any,
+    payload: Dict[str, Any],
+    *,
+    updated_at: Any = None,
+    migrate: bool = True,
+) -> Tuple[bool, int]:
+    """Write one entity state; returns ``(is_new, version)``."""
+    provider_token = _text(provider)
+    token = _text(state_id)
+    if not provider_token or not token:
+        return False, 0
+    if migrate:
+        _migrate_legacy(redis_obj)
+    record = {
+        "provider": provider_token,
+        "id": token,
+        "updated_at": float(updated_at or time.time()),
+        "payload": payload if isinstance(payload, dict) else {},
+    }
+    if callable(getattr(redis_obj, "evalsha", None)):
+        keys = (STATE_VERSION_KEY, state_key(provider_token), state_index_key(provider_token), STATE_VERSIONS_KEY)
+        args = (token, redis_encode_value(redis_obj, keys[1], _dumps(record)), provider_token)
+        try:
+            version, created = redis_obj.evalsha(_SET_STATE_SHA, len(keys), *keys, *args)
+        except NoScriptError:
+            version, created = redis_obj.eval(_SET_STATE_SCRIPT, len(keys), *keys, *args)
+        return _int(created) > 0, _int(version)
+    # Clients without scripting (test doubles): same writes, two round trips.
+    version = _int(redis_obj.incr(STATE_VERSION_KEY))
+    batch = redis_batch(redis_obj)
+    batch.hset(state_key(provider_token), token, _dumps(record))
+    batch.zadd(state_index_key(provider_token), {token: version})
+    batch.hset(STATE_VERSIONS_KEY, provider_token, version)
+    results = batch.execute()
+    return _int(results[0] if results else 0) > 0, version
+
+
+def clear_provider_states(redis_obj: Any, providers: Iterable[str]) -> int:
+    _migrate_legacy(redis_obj)
+    tokens = [token for token in (_text(provider) for provider in providers) if token]
+    if not tokens:
+        return 0
+    deleted = sum(_int(redis_obj.hlen(state_key(token))) for token in tokens)
+    version = _int(redis_obj.incr(STATE_VERSION_KEY))
+    batch = redis_batch(redis_obj)
+    for token in tokens:
+        batch.delete(state_key(token), state_index_key(token))
+        batch.hdel(STATE_VERSIONS_KEY, token)
+        batch.hset(STATE_VERSIONS_KEY, f"{_CLEARED_FIELD_PREFIX}{token}", version)
+    batch.execute()
+    return deleted
+
+
+class _ProviderShard:
+    __slots__ = ("version", "records")
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.records: Dict[str, Dict[str, Any]] = {}
+
+
+class RuntimeStateCache:
+    """Process-local mirror of the state shards.
+
+    ``refresh`` reads only the small provider -> version hash, then pulls just
+    the states whose version moved since the last refresh.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._shards: Dict[str, _ProviderShard] = {}
+        self._cleared: Dict[str, int] = {}
+
+    @staticmethod
+    def _with_versions(
+        provider: str,
+        raw_records: Iterable[Tuple[Any, Any]],
+        scores: Dict[str, int],
+    ) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        for state_id, raw in raw_records:
+            token = _text(state_id)
+            record = _json_dict(raw)
+            if not record:
+                continue
+            record.setdefault("key", f"{provider}:{token}")
+            if token in scores:
+                record["version"] = scores[token]
+            out[token] = record
+        return out
+
+    def _refresh_provider_locked(self, redis_obj: Any, provider: str, version: int) -> None:
+        shard = self._shards.get(provider)
+        if shard is not None and shard.version == version:
+            return
+        if shard is None or shard.version > version:
+            # New to this process, or the provider was cleared and rewritten.
+            shard = _ProviderShard()
+            raw = redis_obj.hgetall(state_key(provider)) or {}
+            scores = {
+                _text(state_id): _int(score)
+                for state_id, score in redis_obj.zrange(state_index_key(provider), 0, -1, withscores=True) or []
+            }
+            shard.records = self._with_versions(provider, raw.items() if isinstance(raw, dict) else [], scores)
+        else:
+            scores = {
+                _text(state_id): _int(score)
+                for state_id, score in redis_obj.zrangebyscore(
+                    state_index_key(provider), shard.version + 1, "+inf", withscores=True
+                )
+                or []
+            }
+            changed = list(scores)
+            if changed:
+                raw_rows = redis_obj.hmget(state_key(provider), changed) or []
+                shard.records.update(self._with_versions(provider, zip(changed, raw_rows), scores))
+            if len(shard.records) != _int(redis_obj.zcard(state_index_key(provider))):
+                # Cleared and rewritten between two refreshes: start over.
+                shard.version = version + 1
+                self._refresh_provider_locked(redis_obj, provider, version)
+                return
+        shard.version = version
+        self._shards[provider] = shard
+
+    def refresh(self, redis_obj: Any) -> Tuple[Dict[str, int], int]:
+        """Provider versions and the latest version (writes and clears)."""
+        _migrate_legacy(redis_obj)
+        raw_versions = redis_obj.hgetall(STATE_VERSIONS_KEY) or {}
+        versions: Dict[str, int] = {}
+        cleared: Dict[str, int] = {}
+        for field, value in (raw_versions.items() if isinstance(raw_versions, dict) else []):
+            name = _text(field)
+            if name.startswith(_CLEARED_FIELD_PREFIX):
+                cleared[name[len(_CLEARED_FIELD_PREFIX) :]] = _int(value)
+            elif name:
+                versions[name] = _int(value)
+        with self._lock:
+            self._cleared = cleared
+            for provider in list(self._shards):
+                if provider not in versions:
+                    self._shards.pop(provider, None)
+            for provider, version in versions.items():
+                self._refresh_provider_locked(redis_obj, provider, version)
+        return versions, max([*versions.values(), *cleared.values()], default=0)
+
+    def lookup(self, redis_obj: Any, keys: Iterable[Tuple[str, str]]) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], int]:
+        _versions, latest = self.refresh(redis_obj)
+        found: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        with self._lock:
+            for provider, state_id in keys:
+                shard = self._shards.get(_text(provider))
+                record = shard.records.get(_text(state_id)) if shard is not None else None
+                if record is not None:
+                    found[(provider, state_id)] = dict(record)
+        return found, latest
+
+    def changes(
+        self,
+        redis_obj: Any,
+        *,
+        providers: Optional[Iterable[str]] = None,
+        since_version: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int, List[str]]:
+        _versions, latest = self.refresh(redis_obj)
+        wanted = None if providers is None else {_text(provider).lower() for provider in providers}
+        since = max(0, int(since_version or 0))
+        rows: List[Dict[str, Any]] = []
+        with self._lock:
+            cleared = sorted(
+                provider
+                for provider, version in self._cleared.items()
+                if since and version > since and (wanted is None or provider.lower() in wanted)
+            )
+            for provider, shard in self._shards.items():
+                if wanted is not None and provider.lower() not in wanted:
+                    continue
+                if shard.version <= since:
+                    continue
+                for record in shard.records.values():
+                    if _int(record.get("version")) > since:
+                        rows.append(dict(record))
+        return rows, latest, cleared
+
+    def records(
+        self,
+        redis_obj: Any,
+        *,
+        providers: Optional[Iterable[str]] = None,
+        since_version: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        rows, latest, _cleared = self.changes(redis_obj, providers=providers, since_version=since_version)
+        return rows, latest
+
+
+_STATE_CACHES: "weakref.WeakKeyDictionary[Any, RuntimeStateCache]" = weakref.WeakKeyDictionary()
+_STATE_CACHES_LOCK = threading.Lock()
+
+
+def state_cache(redis_obj: Any) -> RuntimeStateCache:
+    with _STATE_CACHES_LOCK:
+        try:
+            cache = _STATE_CACHES.get(redis_obj)
+        except TypeError:
+            return RuntimeStateCache()
+        if cache is None:
+            cache = RuntimeStateCache()
+            _STATE_CACHES[redis_obj] = cache
+        return cache
+
+
+def state_records(
+    redis_obj: Any,
+    *,
+    providers: Optional[Iterable[str]] = None,
+    since_version: int = 0,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """State records (copies) changed after ``since_version`` and the current
+    global state version."""
+    if not redis_obj:
+        return [], 0
+    return state_cache(redis_obj).records(redis_obj, providers=providers, since_version=since_version)
+
+
+def state_changes(
+    redis_obj: Any,
+    *,
+    providers: Optional[Iterable[str]] = None,
+    since_version: int = 0,
+) -> Tuple[List[Dict[str, Any]], int, List[str]]:
+    """Like ``state_records``, plus the providers cleared after
+    ``since_version``: a delta reader drops everything it holds for those
+    providers before applying the returned records."""
+    if not redis_obj:
+        return [], 0, []
+    return state_cache(redis_obj).changes(redis_obj, providers=providers, since_version=since_version)
+
+
+def lookup_states(
+    redis_obj: Any,
+    keys: Iterable[Tuple[str, str]],
+) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], int]:
+    """Records (copies) for the given ``(provider, state_id)`` pairs and the
+    current global state version."""
+    if not redis_obj:
+        return {}, 0
+    return state_cache(redis_obj).lookup(redis_obj, keys)
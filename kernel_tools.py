@@ -11,8 +11,10 @@ import mimetypes
 import os
 import re
 import shutil
+import stat as stat_module
 import subprocess
 import tarfile
+import threading
 import time
 import uuid
 import zipfile
@@ -25,10 +27,11 @@ import urllib.error
 import urllib.parse
 import urllib.request
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
+from document_index import open_document_index
 from helpers import (
     HYDRA_LLM_PROVIDER_LLAMA_CPP_REMOTE,
     HYDRA_LLM_PROVIDER_OPENAI_COMPATIBLE,
@@ -821,6 +824,67 @@ def _webpage_looks_bot_blocked(*, status_code: int, title: str, description: str
     return any(marker in text for marker in WEBPAGE_BOT_BLOCK_MARKERS)
 
 
+_webpage_sessions = threading.local()
+
+
+def _webpage_session() -> requests.Session:
+    # One keep-alive session per thread, shared by every fetch and user-agent retry.
+    session = getattr(_webpage_sessions, "session", None)
+    if session is None:
+        session = requests.Session()
+        _webpage_sessions.session = session
+    return session
+
+
+def _webpage_fetch_row(
+    raw: bytes,
+    *,
+    final_url: str,
+    content_type: str,
+    status_code: int,
+    response_encoding: str,
+    truncated: bool,
+    attempt: Dict[str, Any],
+    attempts: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    if not _webpage_is_textual_content_type(content_type):
+        return {
+            "ok": False,
+            "error": f"Non-text content type ({content_type or 'unknown'}). Use download_file instead.",
+            "url": final_url,
+            "content_type": content_type,
+            "status_code": int(status_code or 0),
+            "bytes": len(raw),
+            "truncated": bool(truncated),
+            "attempts": attempts + [attempt],
+        }
+
+    text = _webpage_decode_text(
+        raw,
+        content_type=content_type,
+        response_encoding=response_encoding,
+    )
+    text_preview = _webpage_preview(text)
+    attempt["blocked"] = bool(
+        _webpage_looks_bot_blocked(
+            status_code=int(status_code or 0),
+            title="",
+            description="",
+            preview=text_preview,
+        )
+    )
+    return {
+        "ok": True,
+        "url": final_url,
+        "content_type": content_type,
+        "status_code": int(status_code or 0),
+        "bytes": len(raw),
+        "truncated": bool(truncated),
+        "raw_text": text,
+        "attempts": attempts + [attempt],
+    }
+
+
 def _fetch_webpage(
     normalized_url: str,
     *,
@@ -833,9 +897,9 @@ def _fetch_webpage(
     attempts: List[Dict[str, Any]] = []
     selected: Optional[Dict[str, Any]] = None
     last_error = ""
+    session = _webpage_session()
 
     for user_agent in WEBPAGE_USER_AGENTS:
-        session = requests.Session()
         response = None
         attempt: Dict[str, Any] = {
             "user_agent": user_agent,
@@ -844,6 +908,8 @@ def _fetch_webpage(
             "error": "",
         }
         try:
+            # Cookies from an earlier page or user-agent retry never ride along.
+            session.cookies.clear()
             response = session.get(
                 normalized_url,
                 headers=_webpage_request_headers(user_agent),
@@ -852,8 +918,6 @@ def _fetch_webpage(
                 stream=True,
             )
             attempt["status_code"] = int(response.status_code or 0)
-            content_type = str(response.headers.get("Content-Type") or "")
-            final_url = str(response.url or normalized_url)
 
             chunks: List[bytes] = []
             total = 0
@@ -871,52 +935,20 @@ def _fetch_webpage(
                     break
                 chunks.append(bytes(chunk))
                 total = next_total
-            raw = b"".join(chunks)
 
-            if not _webpage_is_textual_content_type(content_type):
-                selected = {
-                    "ok": False,
-                    "error": f"Non-text content type ({content_type or 'unknown'}). Use download_file instead.",
-                    "url": final_url,
-                    "content_type": content_type,
-                    "status_code": int(response.status_code or 0),
-                    "bytes": int(total),
-                    "truncated": bool(truncated),
-                    "attempts": attempts + [attempt],
-                }
-                break
-
-            text = _webpage_decode_text(
-                raw,
-                content_type=content_type,
-                response_encoding=str(response.encoding or ""),
-            )
-            text_preview = _webpage_preview(text)
-            blocked = _webpage_looks_bot_blocked(
+            selected = _webpage_fetch_row(
+                b"".join(chunks),
+                final_url=str(response.url or normalized_url),
+                content_type=str(response.headers.get("Content-Type") or ""),
                 status_code=int(response.status_code or 0),
-                title="",
-                description="",
-                preview=text_preview,
+                response_encoding=str(response.encoding or ""),
+                truncated=truncated,
+                attempt=attempt,
+                attempts=attempts,
             )
-            attempt["blocked"] = bool(blocked)
-
-            row = {
-                "ok": True,
-                "url": final_url,
-                "content_type": content_type,
-                "status_code": int(response.status_code or 0),
-                "bytes": int(total),
-                "truncated": bool(truncated),
-                "raw_text": text,
-                "attempts": attempts + [attempt],
-            }
-
-            if blocked:
-                selected = row
+            if attempt["blocked"]:
                 attempts.append(attempt)
                 continue
-
-            selected = row
             break
         except requests.RequestException as exc:
             message = str(exc).strip() or exc.__class__.__name__
@@ -936,10 +968,6 @@ def _fetch_webpage(
                     response.close()
             except Exception:
                 pass
-            try:
-                session.close()
-            except Exception:
-                pass
 
     if selected is None:
         return {
@@ -3831,7 +3859,16 @@ def inspect_webpage(
             max_value=25_000_000,
         ),
     )
+    return _inspect_fetched_webpage(normalized_url, fetch_payload, max_links=max_links, max_images=max_images)
 
+
+def _inspect_fetched_webpage(
+    normalized_url: str,
+    fetch_payload: Dict[str, Any],
+    *,
+    max_links: int,
+    max_images: int,
+) -> Dict[str, Any]:
     fetch_attempts = fetch_payload.get("attempts") if isinstance(fetch_payload, dict) else []
     attempts_out: List[Dict[str, Any]] = []
     for row in fetch_attempts if isinstance(fetch_attempts, list) else []:
@@ -4090,6 +4127,68 @@ def _is_hidden_path(path: Path) -> bool:
     return False
 
 
+def _search_index_path() -> Path:
+    return AGENT_LAB_DIR / ".search" / "documents.sqlite3"
+
+
+def _iter_search_files(base: Path, *, exclude_dir: str = "") -> Iterator[Tuple[str, os.stat_result]]:
+    # exclude_dir (the search index's own directory) is never walked: its
+    # files change on every search and would be re-extracted each time.
+    if exclude_dir and (str(base) == exclude_dir or str(base).startswith(exclude_dir + os.sep)):
+        return
+    if base.is_file():
+        yield str(base), base.stat()
+        return
+    pending = [str(base)]
+    while pending:
+        try:
+            entries = list(os.scandir(pending.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != exclude_dir:
+                        pending.append(entry.path)
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            if stat_module.S_ISREG(st.st_mode):
+                yield (os.path.realpath(entry.path) if entry.is_symlink() else entry.path), st
+
+
+def _search_display_path(file_key: str, lab_root: str) -> str:
+    # file_key is already resolved, so this matches _display_workspace_path without a realpath per hit.
+    if file_key == lab_root:
+        return "/"
+    if file_key.startswith(lab_root.rstrip(os.sep) + os.sep):
+        return "/" + Path(file_key[len(lab_root.rstrip(os.sep)) + 1 :]).as_posix()
+    return file_key
+
+
+def _search_index_text(file_key: str) -> str:
+    text, _meta = _extract_file_content(Path(file_key))
+    return text[:_SEARCH_MAX_FILE_CHARS]
+
+
+class _SearchScan:
+    """(path, text) for every readable file, counting the ones that fail."""
+
+    def __init__(self, paths: List[str]) -> None:
+        self.paths = paths
+        self.skipped = 0
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        for file_key in self.paths:
+            try:
+                text = _search_index_text(file_key)
+            except Exception:
+                self.skipped += 1
+                continue
+            yield file_key, text
+
+
 def _find_query_hits(
     content: str,
     query: str,
@@ -4146,59 +4245,59 @@ def search_files(
         skipped_files = 0
         matched_files = 0
         results: List[Dict[str, Any]] = []
-        seen: set[str] = set()
         per_file_hit_limit = 5
 
-        def _iter_files(base: Path) -> List[Path]:
-            if base.is_file():
-                return [base]
-            out: List[Path] = []
-            for p in base.rglob("*"):
-                if p.is_file():
-                    out.append(p)
-            return out
-
+        present: List[Tuple[str, int, int]] = []
+        wanted: List[str] = []
+        roots: List[str] = []
+        seen: set[str] = set()
+        index_dir = str(_search_index_path().parent.resolve())
         for target in targets:
-            files = _iter_files(target)
-            for file_path in files:
-                file_key = str(file_path.resolve())
+            base = target.resolve()
+            roots.append(str(base))
+            for file_key, st in _iter_search_files(base, exclude_dir=index_dir):
                 if file_key in seen:
                     continue
                 seen.add(file_key)
+                present.append((file_key, int(st.st_size), int(st.st_mtime_ns)))
+                file_path = Path(file_key)
                 if not include_hidden and _is_hidden_path(file_path):
                     continue
                 if file_glob and not fnmatch.fnmatch(file_path.name, str(file_glob)):
                     continue
+                wanted.append(file_key)
+
+        index = open_document_index(_search_index_path())
+        scanned_files = len(wanted)
+        if index is not None:
+            sync = index.sync(present, wanted=wanted, roots=roots, extract=_search_index_text)
+            skipped_files = sum(1 for file_key in wanted if index.is_skipped(file_key))
+            candidates = index.search(needle, wanted)
+        else:
+            # No FTS5 trigram tokenizer in this SQLite build: extract and scan every file.
+            sync = {"extracted": 0, "removed": 0}
+            candidates = _SearchScan(wanted)
+
+        lab_root = str(AGENT_LAB_DIR.resolve())
+        for file_key, text in candidates:
+            hits = _find_query_hits(
+                text,
+                needle,
+                case_sensitive=case_sensitive,
+                max_hits=per_file_hit_limit,
+            )
+            if not hits:
+                continue
 
-                scanned_files += 1
-                try:
-                    text, _meta = _extract_file_content(file_path)
-                except Exception:
-                    skipped_files += 1
-                    continue
-                if len(text) > _SEARCH_MAX_FILE_CHARS:
-                    text = text[:_SEARCH_MAX_FILE_CHARS]
-
-                hits = _find_query_hits(
-                    text,
-                    needle,
-                    case_sensitive=case_sensitive,
-                    max_hits=per_file_hit_limit,
+            matched_files += 1
+            for hit in hits:
+                results.append(
+                    {
+                        "path": _search_display_path(file_key, lab_root),
+                        "line": hit["line"],
+                        "snippet": hit["snippet"],
+                    }
                 )
-                if not hits:
-                    continue
-
-                matched_files += 1
-                for hit in hits:
-                    results.append(
-                        {
-                            "path": _display_workspace_path(file_path),
-                            "line": hit["line"],
-                            "snippet": hit["snippet"],
-                        }
-                    )
-                    if len(results) >= max_results_i:
-                        break
                 if len(results) >= max_results_i:
                     break
             if len(results) >= max_results_i:
@@ -4212,7 +4311,8 @@ def search_files(
             "count": len(results),
             "scanned_files": scanned_files,
             "matched_files": matched_files,
-            "skipped_files": skipped_files,
+            "skipped_files": skipped_files if index is not None else candidates.skipped,
+            "indexed_files": sync["extracted"],
             "paths": [_display_workspace_path(p) for p in targets],
             "max_results": max_results_i,
         }
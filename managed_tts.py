@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import atexit
 import contextlib
+import itertools
 import json
 import logging
 import os
@@ -17,8 +19,9 @@ import uuid
 import wave
 from collections import deque
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
 
+from managed_tts_worker import FRAME_AUDIO, FRAME_JSON, read_frame, write_frame
 from tater_paths import agent_lab_path
 
 
@@ -38,6 +41,8 @@ _ENV_STACK_VERSION = "tater-managed-tts-v1"
 _SYNTHESIS_TIMEOUT_SECONDS = 15 * 60.0
 _INSTALL_TIMEOUT_SECONDS = 30 * 60.0
 _MAX_CLONE_AUDIO_BYTES = 50 * 1024 * 1024
+_WORKER_SCRIPT = Path(__file__).resolve().with_name("managed_tts_worker.py")
+_FINAL_EVENTS = {"done", "error", "cancelled"}
 _CLONE_AUDIO_SUFFIXES = {".wav", ".mp3", ".flac", ".m4a", ".ogg", ".opus", ".aac"}
 
 
@@ -369,13 +374,31 @@ def ensure_managed_tts_environment(backend: Any, acceleration: Any = "auto") ->
     return _environment_python(root)
 
 
+class _LoopInbox:
+    """One async request's frames, handed from the reader thread to its loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue[Optional[Tuple[int, bytes]]] = asyncio.Queue()
+
+    def put(self, item: Optional[Tuple[int, bytes]]) -> None:
+        with contextlib.suppress(RuntimeError):  # the loop already closed
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, item)
+
+
 class _ManagedWorker:
     def __init__(self, backend: str) -> None:
         self.backend = backend
         self.lock = threading.RLock()
-        self.process: Optional[subprocess.Popen[str]] = None
-        self.responses: queue.Queue[Optional[Dict[str, Any]]] = queue.Queue()
+        self.write_lock = threading.Lock()
+        self.process: Optional[subprocess.Popen[bytes]] = None
+        # Frames from the current process, routed by request id to a
+        # queue.Queue (sync callers) or a _LoopInbox (async callers); replaced
+        # on every restart so a dying process only fails its own requests.
+        self.pending: Dict[int, Any] = {}
         self.stderr_tail: deque[str] = deque(maxlen=40)
+        self.last_frame_at = 0.0
+        self._request_ids = itertools.count(1)
         self._reader: Optional[threading.Thread] = None
         self._stderr_reader: Optional[threading.Thread] = None
         self.acceleration = ""
@@ -385,29 +408,49 @@ class _ManagedWorker:
         self.estimated_bytes = 0
         self.loaded_models: Dict[str, Dict[str, Any]] = {}
 
-    def _drain_stdout(self, process: subprocess.Popen[str]) -> None:
+    def _drain_stdout(
+        self,
+        process: subprocess.Popen[bytes],
+        pending: Dict[int, Any],
+    ) -> None:
         stream = process.stdout
-        if stream is None:
-            self.responses.put(None)
-            return
-        for raw in stream:
+        corrupt = False
+        while stream is not None:
             try:
-                row = json.loads(raw)
-            except Exception:
-                self.stderr_tail.append(f"invalid worker response: {raw.rstrip()}")
-                continue
-            self.responses.put(row if isinstance(row, dict) else None)
-        self.responses.put(None)
-
-    def _drain_stderr(self, process: subprocess.Popen[str]) -> None:
+                frame = read_frame(stream)
+            except ValueError as exc:
+                self.stderr_tail.append(f"corrupt worker output: {exc}")
+                corrupt = True
+                break
+            if frame is None:
+                break
+            if self.pending is pending:
+                self.last_frame_at = time.monotonic()
+            kind, request_id, payload = frame
+            inbox = pending.get(request_id)
+            if inbox is not None:
+                inbox.put((kind, payload))
+        for inbox in list(pending.values()):
+            inbox.put(None)
+        if corrupt:
+            # Nothing after a bad header can be trusted; restart on the next request.
+            self._stop_current(pending)
+
+    def _drain_stderr(self, process: subprocess.Popen[bytes]) -> None:
         stream = process.stderr
         if stream is None:
             return
         for raw in stream:
-            line = str(raw or "").rstrip()
+            line = raw.decode("utf-8", errors="replace").rstrip()
             if line:
                 self.stderr_tail.append(line)
 
+    def _send(self, process: subprocess.Popen[bytes], request_id: int, row: Dict[str, Any]) -> None:
+        if process.stdin is None:
+            raise RuntimeError("Managed TTS worker has no input pipe.")
+        with self.write_lock:
+            write_frame(process.stdin, FRAME_JSON, request_id, json.dumps(row, ensure_ascii=False).encode("utf-8"))
+
     def _stop_locked(self) -> None:
         process = self.process
         self.process = None
@@ -421,8 +464,7 @@ class _ManagedWorker:
             return
         if process.poll() is None:
             with contextlib.suppress(Exception):
-                process.stdin.write(json.dumps({"action": "shutdown"}) + "\n") if process.stdin else None
-                process.stdin.flush() if process.stdin else None
+                self._send(process, 0, {"action": "shutdown"})
             with contextlib.suppress(Exception):
                 process.wait(timeout=3.0)
         if process.poll() is None:
@@ -438,17 +480,17 @@ class _ManagedWorker:
         with self.lock:
             self._stop_locked()
 
+    def _stop_current(self, pending: Dict[int, Any]) -> None:
+        # A request from an earlier process must not stop its replacement.
+        with self.lock:
+            if self.pending is pending:
+                self._stop_locked()
+
     def _start_locked(self, acceleration: str) -> None:
         if self.process is not None and self.process.poll() is None and self.acceleration == acceleration:
             return
         self._stop_locked()
-        while True:
-            with contextlib.suppress(queue.Empty):
-                self.responses.get_nowait()
-                continue
-            break
         python_bin = ensure_managed_tts_environment(self.backend, acceleration)
-        worker_path = Path(__file__).resolve().with_name("managed_tts_worker.py")
         env = dict(os.environ)
         cache_root = managed_tts_root(self.backend) / "cache"
         cache_root.mkdir(parents=True, exist_ok=True)
@@ -456,68 +498,223 @@ class _ManagedWorker:
         env["HUGGINGFACE_HUB_CACHE"] = str(cache_root / "hub")
         env["TATER_MANAGED_TTS_ACCELERATION"] = acceleration
         process = subprocess.Popen(
-            [str(python_bin), str(worker_path), "--backend", self.backend],
+            [str(python_bin), str(_WORKER_SCRIPT), "--backend", self.backend],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+            bufsize=0,
             env=env,
         )
         self.process = process
         self.acceleration = acceleration
-        self._reader = threading.Thread(target=self._drain_stdout, args=(process,), daemon=True)
+        self.pending = {}
+        self.last_frame_at = time.monotonic()
+        self._reader = threading.Thread(target=self._drain_stdout, args=(process, self.pending), daemon=True)
         self._stderr_reader = threading.Thread(target=self._drain_stderr, args=(process,), daemon=True)
         self._reader.start()
         self._stderr_reader.start()
 
-    def request(self, payload: Dict[str, Any], *, acceleration: str, timeout: float) -> Dict[str, Any]:
+    def _open(
+        self,
+        payload: Dict[str, Any],
+        *,
+        acceleration: str,
+        inbox: Any = None,
+    ) -> Tuple[int, Any, Dict[int, Any]]:
         with self.lock:
             self._start_locked(acceleration)
             process = self.process
             if process is None or process.stdin is None:
                 raise RuntimeError("Managed TTS worker did not start.")
-            request_id = uuid.uuid4().hex
-            row = {**payload, "id": request_id}
+            request_id = next(self._request_ids)
+            if inbox is None:
+                inbox = queue.Queue()
+            pending = self.pending
+            pending[request_id] = inbox
             try:
-                process.stdin.write(json.dumps(row, ensure_ascii=False) + "\n")
-                process.stdin.flush()
+                self._send(process, request_id, payload)
             except Exception as exc:
+                pending.pop(request_id, None)
                 self._stop_locked()
                 raise RuntimeError(f"Managed TTS worker stopped unexpectedly: {exc}") from exc
+        return request_id, inbox, pending
+
+    def _cancel(self, request_id: int, pending: Dict[int, Any]) -> None:
+        with self.lock:
+            process = self.process
+            if process is None or process.poll() is not None or self.pending is not pending:
+                return
+            with contextlib.suppress(Exception):
+                self._send(process, request_id, {"action": "cancel"})
+
+    def _timeout_error(self, pending: Dict[int, Any], started: float) -> TimeoutError:
+        """A timeout fails only its own request; the worker is restarted only
+        when it has not produced a frame for anyone since the request was sent."""
+        tail = "\n".join(self.stderr_tail)
+        if self.last_frame_at < started:
+            self._stop_current(pending)
+        return TimeoutError(f"Managed TTS synthesis timed out.\n{tail}".strip())
+
+    def _exit_error(self, pending: Dict[int, Any]) -> RuntimeError:
+        tail = "\n".join(self.stderr_tail)
+        self._stop_current(pending)
+        return RuntimeError(f"Managed TTS worker exited unexpectedly.\n{tail}".strip())
+
+    def _next_frame(
+        self,
+        inbox: "queue.Queue[Optional[Tuple[int, bytes]]]",
+        pending: Dict[int, Any],
+        started: float,
+        deadline: float,
+    ) -> Tuple[int, bytes]:
+        try:
+            frame = inbox.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            raise self._timeout_error(pending, started) from None
+        if frame is None:
+            raise self._exit_error(pending)
+        return frame
+
+    async def _anext_frame(
+        self,
+        inbox: _LoopInbox,
+        pending: Dict[int, Any],
+        started: float,
+        deadline: float,
+    ) -> Tuple[int, bytes]:
+        try:
+            frame = await asyncio.wait_for(inbox.queue.get(), max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            raise await asyncio.to_thread(self._timeout_error, pending, started) from None
+        if frame is None:
+            raise await asyncio.to_thread(self._exit_error, pending)
+        return frame
+
+    def _event(self, payload: bytes) -> Dict[str, Any]:
+        try:
+            row = json.loads(payload)
+        except Exception:
+            self.stderr_tail.append(f"invalid worker response: {payload[:200]!r}")
+            return {}
+        return row if isinstance(row, dict) else {}
+
+    def _finish(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        if not response.get("ok"):
+            if response.get("cancelled"):
+                raise RuntimeError("Managed TTS synthesis was cancelled.")
+            raise RuntimeError(str(response.get("error") or "Managed TTS synthesis failed."))
+        if bool(response.get("loaded")):
+            with self.lock:
+                self.loaded_model = str(response.get("model") or "").strip()
+                self.loaded_ts = float(response.get("loaded_ts") or time.time())
+                self.device = str(response.get("device") or "").strip()
+                self.estimated_bytes = max(0, int(response.get("estimated_bytes") or 0))
+                if self.loaded_model:
+                    self.loaded_models[self.loaded_model] = {
+                        "model": self.loaded_model,
+                        "loaded_ts": self.loaded_ts,
+                        "device": self.device,
+                        "estimated_bytes": self.estimated_bytes,
+                    }
+        return response
 
-            deadline = time.monotonic() + max(1.0, timeout)
+    def request(self, payload: Dict[str, Any], *, acceleration: str, timeout: float) -> Dict[str, Any]:
+        started = time.monotonic()
+        request_id, inbox, pending = self._open(payload, acceleration=acceleration)
+        deadline = started + max(1.0, timeout)
+        finished = False
+        try:
             while True:
-                remaining = deadline - time.monotonic()
-                if remaining <= 0:
-                    tail = "\n".join(self.stderr_tail)
-                    self._stop_locked()
-                    raise TimeoutError(f"Managed TTS synthesis timed out.\n{tail}".strip())
-                try:
-                    response = self.responses.get(timeout=remaining)
-                except queue.Empty:
+                kind, data = self._next_frame(inbox, pending, started, deadline)
+                if kind != FRAME_JSON:
                     continue
-                if response is None:
-                    tail = "\n".join(self.stderr_tail)
-                    self._stop_locked()
-                    raise RuntimeError(f"Managed TTS worker exited unexpectedly.\n{tail}".strip())
-                if str(response.get("id") or "") != request_id:
+                response = self._event(data)
+                if response.get("event") in _FINAL_EVENTS:
+                    finished = True
+                    return self._finish(response)
+        finally:
+            pending.pop(request_id, None)
+            if not finished:
+                self._cancel(request_id, pending)
+
+    def stream(
+        self,
+        payload: Dict[str, Any],
+        *,
+        acceleration: str,
+        timeout: float,
+    ) -> Iterator[Tuple[bytes, Dict[str, int]]]:
+        """Yield (pcm, audio_format) chunks as the worker produces them.
+
+        Closing the generator early cancels the request in the worker.
+        """
+        started = time.monotonic()
+        request_id, inbox, pending = self._open(payload, acceleration=acceleration)
+        deadline = started + max(1.0, timeout)
+        audio_format: Dict[str, int] = {}
+        finished = False
+        try:
+            while True:
+                kind, data = self._next_frame(inbox, pending, started, deadline)
+                if kind == FRAME_AUDIO:
+                    if data:
+                        yield data, audio_format
                     continue
-                if not response.get("ok"):
-                    raise RuntimeError(str(response.get("error") or "Managed TTS synthesis failed."))
-                if bool(response.get("loaded")):
-                    self.loaded_model = str(response.get("model") or "").strip()
-                    self.loaded_ts = float(response.get("loaded_ts") or time.time())
-                    self.device = str(response.get("device") or "").strip()
-                    self.estimated_bytes = max(0, int(response.get("estimated_bytes") or 0))
-                    if self.loaded_model:
-                        self.loaded_models[self.loaded_model] = {
-                            "model": self.loaded_model,
-                            "loaded_ts": self.loaded_ts,
-                            "device": self.device,
-                            "estimated_bytes": self.estimated_bytes,
-                        }
-                return response
+                audio_format, finished = self._stream_event(data, audio_format)
+                if finished:
+                    return
+        finally:
+            pending.pop(request_id, None)
+            if not finished:
+                self._cancel(request_id, pending)
+
+    async def astream(
+        self,
+        payload: Dict[str, Any],
+        *,
+        acceleration: str,
+        timeout: float,
+    ) -> AsyncIterator[Tuple[bytes, Dict[str, int]]]:
+        """Async counterpart of stream().
+
+        The reader thread hands frames straight to this loop, so a long
+        synthesis holds no thread, and cancelling the awaiting task cancels
+        the request in the worker.
+        """
+        started = time.monotonic()
+        request_id, inbox, pending = await asyncio.to_thread(
+            self._open, payload, acceleration=acceleration, inbox=_LoopInbox(asyncio.get_running_loop())
+        )
+        deadline = started + max(1.0, timeout)
+        audio_format: Dict[str, int] = {}
+        finished = False
+        try:
+            while True:
+                kind, data = await self._anext_frame(inbox, pending, started, deadline)
+                if kind == FRAME_AUDIO:
+                    if data:
+                        yield data, audio_format
+                    continue
+                audio_format, finished = self._stream_event(data, audio_format)
+                if finished:
+                    return
+        finally:
+            pending.pop(request_id, None)
+            if not finished:
+                asyncio.get_running_loop().run_in_executor(None, self._cancel, request_id, pending)
+
+    def _stream_event(self, data: bytes, audio_format: Dict[str, int]) -> Tuple[Dict[str, int], bool]:
+        response = self._event(data)
+        if response.get("event") == "start":
+            return {
+                "rate": int(response.get("rate") or 0),
+                "width": int(response.get("width") or 2),
+                "channels": int(response.get("channels") or 1),
+            }, False
+        if response.get("event") in _FINAL_EVENTS:
+            self._finish(response)
+            return audio_format, True
+        return audio_format, False
 
 
 _workers: Dict[str, _ManagedWorker] = {
@@ -592,23 +789,23 @@ def warm_managed_tts_model(
     raise RuntimeError(f"Managed TTS worker did not report {selected_model} as loaded.")
 
 
-def synthesize_managed_tts_pcm(
+def _synthesis_request(
     text: str,
     *,
     backend: Any,
-    model: Any = "",
-    clone_audio: Any = "",
-    clone_text: Any = "",
-    language: Any = "",
-    instruct: Any = "",
-    acceleration: Any = "auto",
-) -> Tuple[bytes, Dict[str, int]]:
+    model: Any,
+    clone_audio: Any,
+    clone_text: Any,
+    language: Any,
+    instruct: Any,
+    split: bool = True,
+) -> Tuple[str, Optional[Dict[str, Any]]]:
     token = normalize_managed_tts_backend(backend)
     if token not in MANAGED_TTS_BACKENDS:
         raise ValueError(f"Unsupported managed TTS backend: {token or backend}")
     prompt = str(text or "").strip()
     if not prompt:
-        return b"", {}
+        return token, None
     reference_path = validate_clone_audio_path(token, clone_audio)
     reference_text = str(clone_text or "").strip()
     selected_model = str(model or "").strip() or (
@@ -620,47 +817,123 @@ def synthesize_managed_tts_pcm(
     if token == QWEN_TTS_BACKEND and selected_model == QWEN_TTS_VOICE_DESIGN_MODEL:
         reference_path = ""
         reference_text = ""
+    return token, {
+        "action": "synthesize",
+        "text": prompt,
+        "model": selected_model,
+        "clone_audio": reference_path,
+        "clone_text": reference_text,
+        "language": str(language or "").strip(),
+        "instruct": str(instruct or "").strip(),
+        # Per-sentence chunks only help streaming callers; a whole-clip
+        # synthesis keeps the text together for cross-sentence prosody.
+        "split": bool(split),
+    }
+
+
+def iter_managed_tts_pcm(
+    text: str,
+    *,
+    backend: Any,
+    model: Any = "",
+    clone_audio: Any = "",
+    clone_text: Any = "",
+    language: Any = "",
+    instruct: Any = "",
+    acceleration: Any = "auto",
+) -> Iterator[Tuple[bytes, Dict[str, int]]]:
+    """Stream (pcm, audio_format) chunks sentence by sentence.
+
+    Several streams can share one worker; their sentences are interleaved.
+    Closing the iterator cancels whatever the worker has not synthesized yet.
+    """
+    token, payload = _synthesis_request(
+        text,
+        backend=backend,
+        model=model,
+        clone_audio=clone_audio,
+        clone_text=clone_text,
+        language=language,
+        instruct=instruct,
+    )
+    if payload is None:
+        return
+    yield from _workers[token].stream(
+        payload,
+        acceleration=resolve_managed_tts_acceleration(acceleration),
+        timeout=_SYNTHESIS_TIMEOUT_SECONDS,
+    )
 
-    acceleration_token = resolve_managed_tts_acceleration(acceleration)
-    output_root = managed_tts_root(token) / "output"
-    output_root.mkdir(parents=True, exist_ok=True)
-    output_path = output_root / f"{uuid.uuid4().hex}.wav"
-    try:
-        with _managed_dispatch_lock:
-            response = _workers[token].request(
-                {
-                    "action": "synthesize",
-                    "text": prompt,
-                    "model": selected_model,
-                    "clone_audio": reference_path,
-                    "clone_text": reference_text,
-                    "language": str(language or "").strip(),
-                    "instruct": str(instruct or "").strip(),
-                    "output_path": str(output_path),
-                },
-                acceleration=acceleration_token,
-                timeout=_SYNTHESIS_TIMEOUT_SECONDS,
-            )
-    except Exception:
-        with contextlib.suppress(OSError):
-            output_path.unlink()
-        raise
-    resolved_output = Path(str(response.get("output_path") or output_path)).resolve()
-    try:
-        resolved_output.relative_to(output_root.resolve())
-    except ValueError as exc:
-        raise RuntimeError("Managed TTS worker returned an invalid output path.") from exc
-    try:
-        with wave.open(str(resolved_output), "rb") as wav_file:
-            audio_format = {
-                "rate": int(wav_file.getframerate()),
-                "width": int(wav_file.getsampwidth()),
-                "channels": int(wav_file.getnchannels()),
-            }
-            audio_bytes = wav_file.readframes(wav_file.getnframes())
-    finally:
-        with contextlib.suppress(OSError):
-            resolved_output.unlink()
+
+async def aiter_managed_tts_pcm(
+    text: str,
+    *,
+    backend: Any,
+    model: Any = "",
+    clone_audio: Any = "",
+    clone_text: Any = "",
+    language: Any = "",
+    instruct: Any = "",
+    acceleration: Any = "auto",
+    split: bool = True,
+) -> AsyncIterator[Tuple[bytes, Dict[str, int]]]:
+    """Async form of iter_managed_tts_pcm; cancelling the consumer cancels the request.
+
+    Callers that buffer the whole clip pass split=False so the worker speaks
+    the text in one piece instead of sentence by sentence.
+    """
+    token, payload = _synthesis_request(
+        text,
+        backend=backend,
+        model=model,
+        clone_audio=clone_audio,
+        clone_text=clone_text,
+        language=language,
+        instruct=instruct,
+        split=split,
+    )
+    if payload is None:
+        return
+    async for chunk in _workers[token].astream(
+        payload,
+        acceleration=resolve_managed_tts_acceleration(acceleration),
+        timeout=_SYNTHESIS_TIMEOUT_SECONDS,
+    ):
+        yield chunk
+
+
+def synthesize_managed_tts_pcm(
+    text: str,
+    *,
+    backend: Any,
+    model: Any = "",
+    clone_audio: Any = "",
+    clone_text: Any = "",
+    language: Any = "",
+    instruct: Any = "",
+    acceleration: Any = "auto",
+) -> Tuple[bytes, Dict[str, int]]:
+    token, payload = _synthesis_request(
+        text,
+        backend=backend,
+        model=model,
+        clone_audio=clone_audio,
+        clone_text=clone_text,
+        language=language,
+        instruct=instruct,
+        split=False,
+    )
+    if payload is None:
+        return b"", {}
+    chunks = []
+    audio_format: Dict[str, int] = {}
+    for chunk, audio_format in _workers[token].stream(
+        payload,
+        acceleration=resolve_managed_tts_acceleration(acceleration),
+        timeout=_SYNTHESIS_TIMEOUT_SECONDS,
+    ):
+        chunks.append(chunk)
+    audio_bytes = b"".join(chunks)
     if not audio_bytes:
         raise RuntimeError("Managed TTS produced no audio.")
     return audio_bytes, audio_format
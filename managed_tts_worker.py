@@ -6,11 +6,15 @@ import contextlib
 import json
 import os
 import platform
+import re
+import struct
 import sys
+import threading
 import time
 import traceback
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
 
 QWEN_TTS_BACKEND = "qwen3_tts"
@@ -19,6 +23,22 @@ DEFAULT_QWEN_TTS_MODEL = "Qwen/Qwen3-TTS-12Hz-0.6B-Base"
 QWEN_TTS_VOICE_DESIGN_MODEL = "Qwen/Qwen3-TTS-12Hz-1.7B-VoiceDesign"
 DEFAULT_OMNIVOICE_TTS_MODEL = "k2-fsa/OmniVoice"
 
+# Parent <-> worker frames: (kind, request id, payload length) header, then
+# the payload. JSON frames carry requests and request events; audio frames
+# carry 16-bit little-endian PCM for the request named in the header. Several
+# requests can be in flight; the worker synthesizes them a sentence at a time
+# in round-robin order and streams each sentence's audio as soon as it exists.
+# Frames go out on a private copy of stdout; fd 1 itself is pointed at stderr
+# so stray prints from model libraries cannot corrupt the stream.
+FRAME_JSON = 1
+FRAME_AUDIO = 2
+FRAME_KINDS = (FRAME_JSON, FRAME_AUDIO)
+FRAME_HEADER = struct.Struct(">BII")
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+AUDIO_CHUNK_BYTES = 32 * 1024
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")
+_MIN_SENTENCE_CHARS = 24
+
 _models: Dict[Tuple[str, str], Any] = {}
 _clone_prompts: Dict[Tuple[str, str, str, int, int], Any] = {}
 
@@ -238,80 +258,224 @@ def _generate_omnivoice(row: Dict[str, Any]) -> tuple[Any, int]:
     return _result_audio(wavs), int(getattr(model, "sampling_rate", 0) or 24000)
 
 
-def _write_wav(path: str, audio: Any, sample_rate: int) -> None:
+def write_frame(stream: BinaryIO, kind: int, request_id: int, payload: bytes) -> None:
+    stream.write(FRAME_HEADER.pack(kind, request_id, len(payload)) + payload)
+    stream.flush()
+
+
+def _read_exact(stream: BinaryIO, size: int) -> Optional[bytes]:
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def read_frame(stream: BinaryIO) -> Optional[Tuple[int, int, bytes]]:
+    header = _read_exact(stream, FRAME_HEADER.size)
+    if header is None:
+        return None
+    kind, request_id, length = FRAME_HEADER.unpack(header)
+    if kind not in FRAME_KINDS or length > MAX_FRAME_BYTES:
+        raise ValueError(f"Corrupt frame header: {header.hex()}")
+    payload = _read_exact(stream, length) if length else b""
+    if payload is None:
+        return None
+    return kind, request_id, payload
+
+
+def split_sentences(text: str) -> List[str]:
+    parts = [part.strip() for part in _SENTENCE_END.split(str(text or "")) if part.strip()]
+    merged: List[str] = []
+    pending = ""
+    for part in parts:
+        pending = f"{pending} {part}".strip()
+        if len(pending) >= _MIN_SENTENCE_CHARS:
+            merged.append(pending)
+            pending = ""
+    if pending:
+        if merged:
+            merged[-1] = f"{merged[-1]} {pending}"
+        else:
+            merged.append(pending)
+    return merged
+
+
+def _pcm16_bytes(audio: Any) -> bytes:
+    if isinstance(audio, (bytes, bytearray)):
+        return bytes(audio)
     import numpy as np
-    import soundfile as sf
 
     if hasattr(audio, "detach"):
         audio = audio.detach().float().cpu().numpy()
-    array = np.asarray(audio, dtype=np.float32).squeeze()
-    if array.ndim != 1:
-        array = array.reshape(-1)
-    target = Path(path)
-    target.parent.mkdir(parents=True, exist_ok=True)
-    sf.write(str(target), array, int(sample_rate), subtype="PCM_16", format="WAV")
+    array = np.asarray(audio, dtype=np.float32).reshape(-1)
+    return (np.clip(array, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+
+
+class _Job:
+    def __init__(self, request_id: int, row: Dict[str, Any]) -> None:
+        self.request_id = request_id
+        self.row = row
+        self.action = str(row.get("action") or "")
+        text = str(row.get("text") or "").strip()
+        self.sentences = split_sentences(text) if row.get("split", True) else [text]
+        self.started = False
+        self.cancelled = False
+
+
+class _Worker:
+    def __init__(
+        self,
+        backend: str,
+        generate: Callable[[str, Dict[str, Any]], Tuple[Any, int]],
+        output: Optional[BinaryIO] = None,
+    ) -> None:
+        self.backend = backend
+        self.generate = generate
+        self.output = output if output is not None else sys.stdout.buffer
+        self.output_lock = threading.Lock()
+        # Runnable jobs in round-robin order, and every unfinished job by id so a
+        # cancel also reaches the one currently being synthesized.
+        self.jobs: "OrderedDict[int, _Job]" = OrderedDict()
+        self.live: Dict[int, _Job] = {}
+        self.changed = threading.Condition()
+        self.closing = False
+
+    def send(self, request_id: int, row: Dict[str, Any]) -> None:
+        payload = json.dumps(row, ensure_ascii=False).encode("utf-8")
+        with self.output_lock:
+            write_frame(self.output, FRAME_JSON, request_id, payload)
+
+    def send_audio(self, request_id: int, pcm: bytes) -> None:
+        with self.output_lock:
+            for start in range(0, len(pcm), AUDIO_CHUNK_BYTES):
+                write_frame(self.output, FRAME_AUDIO, request_id, pcm[start : start + AUDIO_CHUNK_BYTES])
+
+    def read_requests(self, stream: BinaryIO) -> None:
+        while True:
+            try:
+                frame = read_frame(stream)
+            except ValueError:
+                traceback.print_exc(file=sys.stderr)
+                frame = None
+            row: Dict[str, Any] = {}
+            if frame is not None:
+                with contextlib.suppress(Exception):
+                    parsed = json.loads(frame[2])
+                    row = parsed if isinstance(parsed, dict) else {}
+            with self.changed:
+                action = str(row.get("action") or "")
+                if frame is None or action == "shutdown":
+                    self.closing = True
+                elif action == "cancel":
+                    job = self.live.get(frame[1])
+                    if job is not None:
+                        job.cancelled = True
+                else:
+                    job = self.live[frame[1]] = self.jobs[frame[1]] = _Job(frame[1], row)
+                self.changed.notify()
+            if self.closing:
+                return
+
+    def next_job(self) -> Optional[_Job]:
+        with self.changed:
+            while not self.jobs and not self.closing:
+                self.changed.wait()
+            if self.closing:
+                return None
+            return self.jobs.popitem(last=False)[1]
+
+    def requeue(self, job: _Job) -> None:
+        with self.changed:
+            self.jobs[job.request_id] = job
+
+    def run_job(self, job: _Job) -> None:
+        if job.cancelled:
+            self.send(job.request_id, {"event": "cancelled", "ok": False, "cancelled": True})
+            return
+        if job.action == "ping":
+            loaded_info: Dict[str, Any] = {}
+            if _models:
+                (loaded_backend, loaded_model), model_obj = next(iter(_models.items()))
+                loaded_info = _loaded_model_info(loaded_backend, loaded_model, model_obj)
+            self.send(job.request_id, {"event": "done", "ok": True, **loaded_info})
+            return
+        model_id = str(
+            job.row.get("model")
+            or (DEFAULT_QWEN_TTS_MODEL if self.backend == QWEN_TTS_BACKEND else DEFAULT_OMNIVOICE_TTS_MODEL)
+        ).strip()
+        if job.action == "load":
+            model_obj = _qwen_model(model_id) if self.backend == QWEN_TTS_BACKEND else _omnivoice_model(model_id)
+            self.send(job.request_id, {"event": "done", "ok": True, **_loaded_model_info(self.backend, model_id, model_obj)})
+            return
+        if job.action != "synthesize":
+            raise ValueError(f"Unsupported worker action: {job.action}")
+        sentence = job.sentences.pop(0) if job.sentences else ""
+        audio, sample_rate = self.generate(self.backend, {**job.row, "text": sentence})
+        pcm = _pcm16_bytes(audio)
+        if job.cancelled:
+            self.send(job.request_id, {"event": "cancelled", "ok": False, "cancelled": True})
+            return
+        if not job.started:
+            job.started = True
+            self.send(job.request_id, {"event": "start", "rate": int(sample_rate), "width": 2, "channels": 1})
+        self.send_audio(job.request_id, pcm)
+        if job.sentences:
+            self.requeue(job)
+            return
+        model_obj = _models.get((self.backend, model_id))
+        self.send(
+            job.request_id,
+            {
+                "event": "done",
+                "ok": True,
+                "sample_rate": int(sample_rate),
+                **(_loaded_model_info(self.backend, model_id, model_obj) if model_obj is not None else {}),
+            },
+        )
+
+    def serve(self, stream: BinaryIO) -> int:
+        threading.Thread(target=self.read_requests, args=(stream,), daemon=True).start()
+        while True:
+            job = self.next_job()
+            if job is None:
+                return 0
+            try:
+                self.run_job(job)
+            except Exception as exc:
+                traceback.print_exc(file=sys.stderr)
+                job.sentences = []
+                self.send(job.request_id, {"event": "error", "ok": False, "error": str(exc) or exc.__class__.__name__})
+            if job.request_id not in self.jobs:
+                with self.changed:
+                    self.live.pop(job.request_id, None)
+
 
+def _generate(backend: str, row: Dict[str, Any]) -> Tuple[Any, int]:
+    if backend == QWEN_TTS_BACKEND:
+        return _generate_qwen(row)
+    return _generate_omnivoice(row)
 
-def _respond(row: Dict[str, Any]) -> None:
-    sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+def _claim_stdout() -> BinaryIO:
     sys.stdout.flush()
+    frames = os.fdopen(os.dup(1), "wb", buffering=0)
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return frames
+
+
+def serve(backend: str, *, generate: Callable[[str, Dict[str, Any]], Tuple[Any, int]] = _generate) -> int:
+    return _Worker(backend, generate, _claim_stdout()).serve(sys.stdin.buffer)
 
 
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--backend", choices=(QWEN_TTS_BACKEND, OMNIVOICE_TTS_BACKEND), required=True)
     args = parser.parse_args()
-    for raw in sys.stdin:
-        request_id = ""
-        try:
-            row = json.loads(raw)
-            request_id = str(row.get("id") or "")
-            action = str(row.get("action") or "")
-            if action == "shutdown":
-                return 0
-            if action == "ping":
-                loaded_info: Dict[str, Any] = {}
-                if _models:
-                    (loaded_backend, loaded_model), model_obj = next(iter(_models.items()))
-                    loaded_info = _loaded_model_info(loaded_backend, loaded_model, model_obj)
-                _respond({"id": request_id, "ok": True, **loaded_info})
-                continue
-            if action == "load":
-                model_id = str(
-                    row.get("model")
-                    or (DEFAULT_QWEN_TTS_MODEL if args.backend == QWEN_TTS_BACKEND else DEFAULT_OMNIVOICE_TTS_MODEL)
-                ).strip()
-                model_obj = _qwen_model(model_id) if args.backend == QWEN_TTS_BACKEND else _omnivoice_model(model_id)
-                _respond({"id": request_id, "ok": True, **_loaded_model_info(args.backend, model_id, model_obj)})
-                continue
-            if action != "synthesize":
-                raise ValueError(f"Unsupported worker action: {action}")
-            if args.backend == QWEN_TTS_BACKEND:
-                audio, sample_rate = _generate_qwen(row)
-            else:
-                audio, sample_rate = _generate_omnivoice(row)
-            model_id = str(
-                row.get("model")
-                or (DEFAULT_QWEN_TTS_MODEL if args.backend == QWEN_TTS_BACKEND else DEFAULT_OMNIVOICE_TTS_MODEL)
-            ).strip()
-            model_obj = _models.get((args.backend, model_id))
-            output_path = str(row.get("output_path") or "").strip()
-            if not output_path:
-                raise ValueError("Worker output path is required.")
-            _write_wav(output_path, audio, sample_rate)
-            _respond(
-                {
-                    "id": request_id,
-                    "ok": True,
-                    "output_path": output_path,
-                    "sample_rate": int(sample_rate),
-                    **(_loaded_model_info(args.backend, model_id, model_obj) if model_obj is not None else {}),
-                }
-            )
-        except Exception as exc:
-            traceback.print_exc(file=sys.stderr)
-            _respond({"id": request_id, "ok": False, "error": str(exc) or exc.__class__.__name__})
-    return 0
+    return serve(args.backend)
 
 
 if __name__ == "__main__":
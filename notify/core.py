@@ -12,6 +12,7 @@ from urllib.parse import parse_qs, urlparse, urlunparse
 import requests
 
 from helpers import redis_client
+from notify import inbox as little_spud_inbox
 from notify.media import store_queue_attachments
 from notify.queue import (
     build_queue_item,
@@ -507,13 +508,20 @@ def _enqueue_queue_notification(
     if payload_attachments and platform in _ATTACHMENT_PLATFORMS:
         store_queue_attachments(redis_client, item.get("id"), payload_attachments)
 
+    if platform == "little_spud":
+        # A notification with no node/scope/device/user target matches no
+        # client. The old shared list kept it until it expired; now it is
+        # rejected up front.
+        if not little_spud_inbox.deliver(redis_client, item):
+            return "Cannot queue: missing target Little Spud"
+        _schedule_little_spud_push(item)
+        return f"Queued notification for {platform}"
+
     key = queue_key(platform)
     if not key:
         return "Cannot queue: missing destination queue"
 
     redis_client.rpush(key, json.dumps(item))
-    if platform == "little_spud":
-        _schedule_little_spud_push(item)
     return f"Queued notification for {platform}"
 
 
@@ -3,6 +3,7 @@ import json
 import time
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from notify import inbox as little_spud_inbox
 from notify.queue import load_default_targets, normalize_platform, queue_key
 
 _PLATFORM_ORDER: Tuple[str, ...] = (
@@ -540,19 +541,25 @@ def _recent_queue_targets_for_platform(platform: str, redis_client: Any, *, max_
         return []
     limit = max(1, min(_MAX_RECENT_QUEUE_ITEMS, int(max_items)))
     try:
-        raw_rows = redis_client.lrange(key, -limit, -1) or []
+        if platform == "little_spud":
+            raw_rows = little_spud_inbox.pending_items(redis_client, limit=limit)
+        else:
+            raw_rows = redis_client.lrange(key, -limit, -1) or []
     except Exception:
         return []
     out: List[Dict[str, str]] = []
     active_little_spud_keys = _active_little_spud_target_keys(redis_client) if platform == "little_spud" else set()
     for raw in reversed(raw_rows):
-        text = _to_text(raw)
-        if not text:
-            continue
-        try:
-            parsed = json.loads(text)
-        except Exception:
-            continue
+        if isinstance(raw, dict):
+            parsed = raw
+        else:
+            text = _to_text(raw)
+            if not text:
+                continue
+            try:
+                parsed = json.loads(text)
+            except Exception:
+                continue
         if not isinstance(parsed, dict):
             continue
         targets = _normalize_targets_for_platform(platform, parsed.get("targets"))
@@ -0,0 +1,336 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from notify.queue import is_expired, queue_key
+
+# Little Spud notifications are stored once in ITEMS_KEY and their ids are
+# pushed onto one inbox list per identity token the targets name, so a client
+# only ever looks at the heads of its own few inboxes. Consuming an item is
+# the HDEL; copies of its id left in other inboxes are dropped lazily when
+# they reach the head, and a periodic sweep drops expired or orphaned items
+# and caps every inbox at INBOX_MAX_ITEMS.
+ITEMS_KEY = "notifyq:little_spud:items"
+INBOX_PREFIX = "notifyq:little_spud:inbox:"
+WILDCARD_TOKEN = "*"
+RECHECK_SECONDS = 5.0
+INBOX_MAX_ITEMS = 500
+SWEEP_SECONDS = 60.0
+# Items no inbox references any more are only swept once they are this old,
+# so a delivery racing the sweep is never dropped.
+ORPHAN_GRACE_SECONDS = 60.0
+
+_TARGET_KINDS: Tuple[Tuple[str, str], ...] = (
+    ("node_id", "node"),
+    ("destination", "node"),
+    ("scope", "scope"),
+    ("device_id", "device"),
+    ("device_name", "device"),
+    ("user", "user"),
+    ("user_name", "user"),
+)
+_WILDCARD_VALUES = {"*", "all", "any"}
+
+_legacy_lock = threading.Lock()
+_legacy_migrated = False
+_sweep_lock = threading.Lock()
+_swept_at = 0.0
+
+
+def _to_text(value: Any) -> str:
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="ignore")
+    return str(value or "").strip()
+
+
+def inbox_key(token: str) -> str:
+    return f"{INBOX_PREFIX}{token}"
+
+
+def target_tokens(targets: Any) -> List[str]:
+    target_map = targets if isinstance(targets, dict) else {}
+    out: List[str] = []
+    for field, kind in _TARGET_KINDS:
+        wanted = _to_text(target_map.get(field))
+        if not wanted:
+            continue
+        token = WILDCARD_TOKEN if wanted.lower() in _WILDCARD_VALUES else f"{kind}:{wanted}"
+        if token not in out:
+            out.append(token)
+    return out
+
+
+def identity_tokens(identity: Dict[str, Any], node: Dict[str, Any]) -> List[str]:
+    values = (
+        ("node", _to_text((node or {}).get("id"))),
+        ("scope", _to_text((identity or {}).get("scope"))),
+        ("device", _to_text((identity or {}).get("device_name"))),
+        ("user", _to_text((identity or {}).get("user_name"))),
+    )
+    out = [f"{kind}:{value}" for kind, value in values if value]
+    out.append(WILDCARD_TOKEN)
+    return out
+
+
+class InboxWaiters:
+    """Process-local registry of long-polls waiting on inbox tokens."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+    def register(self, tokens: Iterable[str]) -> Tuple[asyncio.AbstractEventLoop, asyncio.Event]:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            for token in tokens:
+                self._waiters.setdefault(token, set()).add(waiter)
+        return waiter
+
+    def unregister(self, tokens: Iterable[str], waiter: Tuple[asyncio.AbstractEventLoop, asyncio.Event]) -> None:
+        with self._lock:
+            for token in tokens:
+                rows = self._waiters.get(token)
+                if rows is None:
+                    continue
+                rows.discard(waiter)
+                if not rows:
+                    self._waiters.pop(token, None)
+
+    def notify(self, tokens: Iterable[str]) -> int:
+        with self._lock:
+            waiters = set()
+            for token in tokens:
+                waiters.update(self._waiters.get(token) or ())
+        for loop, ready in waiters:
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                continue
+        return len(waiters)
+
+    def count(self) -> int:
+        with self._lock:
+            return len({waiter for rows in self._waiters.values() for waiter in rows})
+
+
+waiters = InboxWaiters()
+
+
+def _decode_item(raw: Any) -> Optional[Dict[str, Any]]:
+    try:
+        item = json.loads(_to_text(raw) or "{}")
+    except Exception:
+        return None
+    return item if isinstance(item, dict) else None
+
+
+def deliver(redis_client: Any, item: Dict[str, Any]) -> List[str]:
+    item_id = _to_text(item.get("id"))
+    tokens = target_tokens(item.get("targets"))
+    if not item_id or not tokens:
+        return []
+    pipe = redis_client.pipeline()
+    pipe.hset(ITEMS_KEY, item_id, json.dumps(item))
+    for token in tokens:
+        pipe.rpush(inbox_key(token), item_id)
+        pipe.ltrim(inbox_key(token), -INBOX_MAX_ITEMS, -1)
+    pipe.execute()
+    waiters.notify(tokens)
+    return tokens
+
+
+def migrate_legacy_queue(redis_client: Any) -> int:
+    """Move items left in the old shared list into per-identity inboxes."""
+    global _legacy_migrated
+    if _legacy_migrated:
+        return 0
+    legacy_key = queue_key("little_spud")
+    moved = 0
+    with _legacy_lock:
+        if _legacy_migrated:
+            return 0
+        while legacy_key:
+            raw = redis_client.lpop(legacy_key)
+            if raw is None:
+                break
+            item = _decode_item(raw)
+            if item is None or is_expired(item):
+                continue
+            if deliver(redis_client, item):
+                moved += 1
+        _legacy_migrated = True
+    return moved
+
+
+def sweep(redis_client: Any, *, now: Optional[float] = None) -> int:
+    """Drop expired, unreadable and orphaned items and the ids pointing at them."""
+    now_ts = time.time() if now is None else float(now)
+    keys = sorted({_to_text(key) for key in redis_client.scan_iter(match=f"{INBOX_PREFIX}*")})
+    # Lists are read before the hash: delivery writes the item before its ids,
+    # so an id missing from the later hash read really is gone. Reads go
+    # through the client, not a pipeline, so encrypted values are decoded.
+    lists = {key: {_to_text(raw_id) for raw_id in redis_client.lrange(key, 0, -1) or ()} for key in keys}
+    items = redis_client.hgetall(ITEMS_KEY) or {}
+    referenced = set().union(*lists.values()) if lists else set()
+
+    dead: Set[str] = set()
+    for raw_id, raw in items.items():
+        item_id = _to_text(raw_id)
+        item = _decode_item(raw)
+        if item is None or is_expired(item, now=now_ts):
+            dead.add(item_id)
+        elif item_id not in referenced:
+            try:
+                created_at = float(item.get("created_at") or 0.0)
+            except Exception:
+                created_at = 0.0
+            if now_ts - created_at > ORPHAN_GRACE_SECONDS:
+                dead.add(item_id)
+    live = {_to_text(raw_id) for raw_id in items} - dead
+
+    if dead:
+        redis_client.hdel(ITEMS_KEY, *sorted(dead))
+    for key, ids in lists.items():
+        for item_id in ids - live:
+            redis_client.lrem(key, 0, item_id)
+        redis_client.ltrim(key, -INBOX_MAX_ITEMS, -1)
+    return len(dead)
+
+
+def _maybe_sweep(redis_client: Any) -> None:
+    global _swept_at
+    now = time.monotonic()
+    if now - _swept_at < SWEEP_SECONDS or not _sweep_lock.acquire(blocking=False):
+        return
+    try:
+        _swept_at = now
+        sweep(redis_client)
+    except Exception:
+        pass
+    finally:
+        _sweep_lock.release()
+
+
+def _load_live_item(redis_client: Any, item_id: str) -> Optional[Dict[str, Any]]:
+    raw = redis_client.hget(ITEMS_KEY, item_id)
+    if raw is None:
+        return None
+    item = _decode_item(raw)
+    if item is None or is_expired(item):
+        redis_client.hdel(ITEMS_KEY, item_id)
+        return None
+    return item
+
+
+def _inbox_head(redis_client: Any, token: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    key = inbox_key(token)
+    while True:
+        item_id = _to_text(redis_client.lindex(key, 0))
+        if not item_id:
+            return None
+        item = _load_live_item(redis_client, item_id)
+        if item is not None:
+            return item_id, item
+        # Consumed through another inbox, expired, or unreadable.
+        redis_client.lrem(key, 1, item_id)
+
+
+def _claim(redis_client: Any, item_id: str) -> bool:
+    return int(redis_client.hdel(ITEMS_KEY, item_id) or 0) > 0
+
+
+def pop(redis_client: Any, tokens: List[str], *, consume: bool = True) -> Optional[Dict[str, Any]]:
+    """Oldest live notification across ``tokens``' inboxes."""
+    migrate_legacy_queue(redis_client)
+    _maybe_sweep(redis_client)
+    while True:
+        best: Optional[Tuple[float, str, str, Dict[str, Any]]] = None
+        for token in tokens:
+            head = _inbox_head(redis_client, token)
+            if head is None:
+                continue
+            item_id, item = head
+            created_at = float(item.get("created_at") or 0.0)
+            if best is None or created_at < best[0]:
+                best = (created_at, token, item_id, item)
+        if best is None:
+            return None
+        _created_at, token, item_id, item = best
+        if not consume:
+            return item
+        if _claim(redis_client, item_id):
+            redis_client.lrem(inbox_key(token), 1, item_id)
+            return item
+
+
+def pop_by_id(redis_client: Any, event_id: str, tokens: List[str], *, consume: bool = True) -> Optional[Dict[str, Any]]:
+    migrate_legacy_queue(redis_client)
+    item_id = _to_text(event_id)
+    if not item_id:
+        return None
+    item = _load_live_item(redis_client, item_id)
+    if item is None or not set(target_tokens(item.get("targets"))) & set(tokens):
+        return None
+    if not consume:
+        return item
+    return item if _claim(redis_client, item_id) else None
+
+
+async def wait_next(
+    redis_client: Any,
+    tokens: List[str],
+    *,
+    wait_seconds: float,
+    consume: bool = True,
+    event_id: str = "",
+) -> Optional[Dict[str, Any]]:
+    """Long-poll for the next notification without holding a thread.
+
+    ``deliver`` in this process wakes the waiter immediately; deliveries from
+    other processes are picked up by the periodic recheck. The Redis reads run
+    on worker threads so a slow round trip never stalls the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max(0.0, float(wait_seconds or 0))
+    while True:
+        waiter = waiters.register(tokens)
+        try:
+            if event_id:
+                item = await asyncio.to_thread(pop_by_id, redis_client, event_id, tokens, consume=consume)
+            else:
+                item = await asyncio.to_thread(pop, redis_client, tokens, consume=consume)
+            remaining = deadline - loop.time()
+            if item is not None or remaining <= 0:
+                return item
+            try:
+                await asyncio.wait_for(waiter[1].wait(), timeout=min(remaining, RECHECK_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            waiters.unregister(tokens, waiter)
+
+
+def forget(redis_client: Any, tokens: List[str]) -> int:
+    migrate_legacy_queue(redis_client)
+    deleted = 0
+    for token in tokens:
+        key = inbox_key(token)
+        for raw_id in redis_client.lrange(key, 0, -1) or []:
+            item_id = _to_text(raw_id)
+            if item_id and _claim(redis_client, item_id):
+                deleted += 1
+        redis_client.delete(key)
+    return deleted
+
+
+def pending_items(redis_client: Any, *, limit: int = 200) -> List[Dict[str, Any]]:
+    migrate_legacy_queue(redis_client)
+    rows = []
+    for raw in (redis_client.hgetall(ITEMS_KEY) or {}).values():
+        item = _decode_item(raw)
+        if item is not None and not is_expired(item):
+            rows.append(item)
+    rows.sort(key=lambda item: float(item.get("created_at") or 0.0))
+    return rows[-max(1, int(limit)) :]
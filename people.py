@@ -3,20 +3,22 @@ from __future__ import annotations
 import contextlib
 import json
 import re
+import threading
 import time
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from redis_runtime import redis_batch
 from verba_kernel import normalize_platform
 
 
 PEOPLE_STORE_KEY = "tater:people:v1"
+PEOPLE_VERSION_KEY = "tater:people:version:v1"
 DISCOVERY_MAX_KEYS = 200
 DISCOVERY_MAX_ROWS_PER_KEY = 200
 PERSON_INSTRUCTIONS_MAX_CHARS = 2000
 FACE_IDENTITIES_KEY = "awareness:face_identities"
-INTEGRATION_RUNTIME_EVENTS_KEY = "tater:integration_runtime:events"
 PEOPLE_FACE_EVENT_SCAN_LIMIT = 1000
 PORTAL_HISTORY_PATTERNS_BY_PLATFORM = {
     "discord": (
@@ -212,9 +214,56 @@ def save_store(data: Dict[str, Any], redis_client: Any = None) -> Dict[str, Any]
     client = _client(redis_client)
     normalized = _normalize_store(data)
     client.set(PEOPLE_STORE_KEY, json.dumps(normalized, ensure_ascii=False))
+    client.incr(PEOPLE_VERSION_KEY)
     return normalized
 
 
+class PeopleIndex:
+    """Lookup maps over one version of the people store."""
+
+    def __init__(self, store: Dict[str, Any], version: str = "") -> None:
+        self.version = version
+        self.people: Dict[str, Dict[str, Any]] = {}
+        self.aliases: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        # History key -> ((length, newest row), alias candidates), filled in
+        # by discovery and carried across rebuilds.
+        self.discovered: Dict[str, Tuple[Tuple[int, str], List[Dict[str, str]]]] = {}
+        for person in list(store.get("people") or []):
+            self.people[_text(person.get("id"))] = person
+            for alias in list(person.get("aliases") or []):
+                self.aliases[_alias_key(alias.get("platform"), alias.get("external_id"))] = (person, alias)
+
+    def alias_match(self, platform: Any, external_id: Any) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        return self.aliases.get(_alias_key(platform, external_id))
+
+
+_INDEX_LOCK = threading.Lock()
+_INDEX_CACHE: List[Any] = [None, None]
+
+
+def people_index(redis_client: Any = None) -> PeopleIndex:
+    """The index for the current store version; rebuilt only after a write
+    bumps ``PEOPLE_VERSION_KEY``."""
+    client = _client(redis_client)
+    version = ""
+    with contextlib.suppress(Exception):
+        version = _text(client.get(PEOPLE_VERSION_KEY))
+        if not version:
+            # Store written before the counter existed.
+            version = _text(client.incr(PEOPLE_VERSION_KEY))
+    with _INDEX_LOCK:
+        cached_client, cached_index = _INDEX_CACHE
+        if version and cached_client is client and cached_index.version == version:
+            return cached_index
+    index = PeopleIndex(load_store(client), version)
+    if cached_client is client and cached_index is not None:
+        index.discovered = cached_index.discovered
+    if version:
+        with _INDEX_LOCK:
+            _INDEX_CACHE[:] = [client, index]
+    return index
+
+
 def settings(redis_client: Any = None) -> Dict[str, Any]:
     return dict(load_store(redis_client).get("settings") or {})
 
@@ -286,15 +335,10 @@ def resolve_person(
     origin: Optional[Dict[str, Any]],
     redis_client: Any = None,
 ) -> Dict[str, Any]:
-    store = load_store(redis_client)
+    index = people_index(redis_client)
     candidates = alias_candidates_from_origin(platform, origin)
-    alias_index: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
-    for person in list(store.get("people") or []):
-        for alias in list(person.get("aliases") or []):
-            alias_index[_alias_key(alias.get("platform"), alias.get("external_id"))] = (person, alias)
-
     for candidate in candidates:
-        match = alias_index.get(_alias_key(candidate.get("platform"), candidate.get("external_id")))
+        match = index.alias_match(candidate.get("platform"), candidate.get("external_id"))
         if match:
             person, alias = match
             return {
@@ -409,16 +453,13 @@ def person_is_admin(person_id: str, redis_client: Any = None) -> bool:
     wanted = _text(person_id)
     if not wanted:
         return False
-    store = load_store(redis_client)
-    for person in list(store.get("people") or []):
-        if _text(person.get("id")) == wanted:
-            return _as_bool(person.get("is_admin"), False)
-    return False
+    person = people_index(redis_client).people.get(wanted)
+    return _as_bool(person.get("is_admin"), False) if person else False
 
 
 def admin_people(redis_client: Any = None) -> List[Dict[str, Any]]:
-    store = load_store(redis_client)
-    return [dict(person) for person in list(store.get("people") or []) if _as_bool(person.get("is_admin"), False)]
+    people = people_index(redis_client).people.values()
+    return [dict(person) for person in people if _as_bool(person.get("is_admin"), False)]
 
 
 def delete_person(person_id: str, redis_client: Any = None) -> Dict[str, Any]:
@@ -682,31 +723,70 @@ def _portal_aliases_from_history_row(platform: str, row: Dict[str, Any], history
     ]
 
 
+def _history_key_aliases(
+    redis_client: Any,
+    key: Any,
+    platform: str,
+    index: PeopleIndex,
+    marker: Tuple[int, str],
+) -> List[Dict[str, str]]:
+    """Alias candidates in one history list, re-parsed only when the list's
+    length or newest row (``marker``) changed since the last discovery pass."""
+    key_text = _text(key)
+    cached = index.discovered.get(key_text)
+    if cached is not None and marker[0] >= 0 and cached[0] == marker:
+        return cached[1]
+    aliases: List[Dict[str, str]] = []
+    raw_rows = []
+    with contextlib.suppress(Exception):
+        raw_rows = redis_client.lrange(key, -DISCOVERY_MAX_ROWS_PER_KEY, -1) or []
+    for raw in raw_rows:
+        with contextlib.suppress(Exception):
+            row = json.loads(raw)
+            if not isinstance(row, dict):
+                continue
+            for alias in _portal_aliases_from_history_row(platform, row, key):
+                alias["source"] = _portal_label(platform)
+                alias["forgettable"] = True
+                aliases.append(alias)
+    if marker[0] >= 0:
+        index.discovered[key_text] = (marker, aliases)
+    return aliases
+
+
+def _history_markers(redis_client: Any, keys: List[Any]) -> List[Tuple[int, str]]:
+    # Length and newest row of every list in one round trip. The rows are
+    # only compared, never parsed, so stored (possibly encrypted) bytes do.
+    if not keys:
+        return []
+    batch = redis_batch(redis_client)
+    for key in keys:
+        batch.llen(key)
+        batch.lindex(key, -1)
+    try:
+        results = batch.execute()
+    except Exception:
+        return [(-1, "")] * len(keys)
+    return [(int(results[pos] or 0), _text(results[pos + 1])) for pos in range(0, 2 * len(keys), 2)]
+
+
 def _discover_portal_history_aliases(out: Dict[str, Dict[str, Any]], linked: Dict[str, Dict[str, str]], redis_client: Any) -> None:
-    seen_keys = 0
+    index = people_index(redis_client)
+    histories: List[Tuple[Any, str]] = []
     for pattern in _portal_history_patterns():
         keys = []
         with contextlib.suppress(Exception):
             keys = list(redis_client.scan_iter(match=pattern, count=100))
         for key in keys:
-            if seen_keys >= DISCOVERY_MAX_KEYS:
-                return
-            seen_keys += 1
+            if len(histories) >= DISCOVERY_MAX_KEYS:
+                break
             platform = _platform_from_history_key(key)
-            if not platform:
-                continue
-            raw_rows = []
-            with contextlib.suppress(Exception):
-                raw_rows = redis_client.lrange(key, -DISCOVERY_MAX_ROWS_PER_KEY, -1) or []
-            for raw in raw_rows:
-                with contextlib.suppress(Exception):
-                    row = json.loads(raw)
-                    if not isinstance(row, dict):
-                        continue
-                    for alias in _portal_aliases_from_history_row(platform, row, key):
-                        alias["source"] = _portal_label(platform)
-                        alias["forgettable"] = True
-                        _add_discovered_alias(out, linked, alias)
+            if platform:
+                histories.append((key, platform))
+    markers = _history_markers(redis_client, [key for key, _platform_name in histories])
+    for (key, platform), marker in zip(histories, markers):
+        for alias in _history_key_aliases(redis_client, key, platform, index, marker):
+            _add_discovered_alias(out, linked, alias)
 
 
 def _memory_core_user_label(redis_client: Any, platform: str, user_id: str) -> str:
@@ -845,12 +925,13 @@ def _face_identities_by_person(redis_client: Any) -> Dict[str, List[Dict[str, An
 
 
 def _recognized_person_events(redis_client: Any) -> Dict[str, Dict[str, Any]]:
-    raw_rows: List[Any] = []
+    events: List[Dict[str, Any]] = []
     with contextlib.suppress(Exception):
-        raw_rows = list(redis_client.lrange(INTEGRATION_RUNTIME_EVENTS_KEY, 0, PEOPLE_FACE_EVENT_SCAN_LIMIT - 1) or [])
+        import integration_runtime_store
+
+        events = integration_runtime_store.recent_events(redis_client, limit=PEOPLE_FACE_EVENT_SCAN_LIMIT)
     latest: Dict[str, Dict[str, Any]] = {}
-    for raw in raw_rows:
-        event = _json_object(raw)
+    for event in events:
         if _text(event.get("provider")) != "awareness" or _text(event.get("kind")) != "recognized_person":
             continue
         payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
@@ -1,3 +1,4 @@
+import asyncio
 import atexit
 import hashlib
 import json
@@ -10,11 +11,15 @@ import ssl
 import subprocess
 import threading
 import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import redis
+import redis.asyncio as redis_async
+from redis.asyncio import connection as redis_async_connection
 from redis.exceptions import RedisError
 
 from tater_paths import agent_lab_dir, runtime_dir
@@ -44,16 +49,53 @@ _REDIS_LIVE_ENCRYPTION_STATE_PATH = (_RUNTIME_DIR / "redis_live_encryption.json"
 _REDIS_ENCRYPTED_SNAPSHOT_PATH = (_RUNTIME_DIR / "redis_snapshot.enc").resolve()  # legacy artifact path
 
 _LIVE_ENCRYPTION_STATE_CACHE: Optional[Dict[str, Any]] = None
+# Hot-path caches read without taking _LOCK. Both are reset together by
+# _invalidate_encryption_cache_locked() whenever the key or live state changes.
+_LIVE_ENCRYPTION_ENABLED_CACHE: Optional[bool] = None
+_FERNET_CIPHER_CACHE: Any = None
+# Bumped whenever the underlying redis.Redis clients are closed/replaced so
+# RedisClientProxy can keep one facade per connection generation.
+_CLIENT_GENERATION = 0
+# redis.asyncio connections are bound to the loop that opened them, so async
+# clients are pooled per event loop and rebuilt when the generation changes.
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, Tuple[int, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Guards _ASYNC_CLIENTS only and is never held across I/O, so the event loop
+# can take it while a sync caller holds _LOCK through a connect.
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+# Connection kwargs the sync clients were last built with, per decode mode, so
+# the event loop can open its async pool without config reads or server startup.
+_ASYNC_CLIENT_KWARGS: Dict[bool, Tuple[int, Dict[str, Any]]] = {}
+_DEFAULT_ASYNC_MAX_CONNECTIONS = 32
+_DEFAULT_ASYNC_POOL_TIMEOUT_SECONDS = 10.0
 
 _REDIS_ENCRYPTION_PREFIX_TEXT = "enc:v1:"
 _REDIS_ENCRYPTION_PREFIX_BYTES = _REDIS_ENCRYPTION_PREFIX_TEXT.encode("ascii")
 _REDIS_MODE_INTERNAL = "internal"
 _REDIS_MODE_EXTERNAL = "external"
 
+# Bookkeeping for the legacy encrypted set/zset member migration. These keys are
+# written through the raw client and skipped by live encrypt/decrypt passes.
+_REDIS_ENCRYPTION_INTERNAL_KEY_PREFIX = "tater:redis_encryption:"
+_MEMBER_MIGRATION_STATE_KEY = "tater:redis_encryption:member_migration"
+_MEMBER_CLEAN_KEYS_KEY = "tater:redis_encryption:member_clean_keys"
+_MEMBER_MIGRATION_SCAN_COUNT = 500
+_MEMBER_MIGRATION_COMPLETE = False
+_MEMBER_CLEAN_KEYS_LOCAL_MAX = 4096
+# LRU of keys known to hold no legacy members; it has its own lock so the
+# async facade can check it without touching _LOCK.
+_MEMBER_CLEAN_KEYS_LOCAL: "OrderedDict[str, None]" = OrderedDict()
+_MEMBER_CLEAN_KEYS_LOCAL_LOCK = threading.Lock()
+_MEMBER_MIGRATION_THREAD: Optional[threading.Thread] = None
+
 # Counter keys must remain plaintext for atomic INCR/INCRBY operations.
 _NUMERIC_PLAINTEXT_KEY_PREFIXES = (
     "tater:hydra:metrics:",
     "tater:conversation_artifact_seq:",
+    "tater:integration_runtime:event_seq",
+    "tater:integration_runtime:state_version",
+    "tater:verba_enabled_version",
 )
 
 
@@ -106,6 +148,26 @@ def _read_redis_encryption_key(*, create_if_missing: bool = False) -> Tuple[byte
     return key_bytes, True
 
 
+def _invalidate_encryption_cache_locked() -> None:
+    global _LIVE_ENCRYPTION_STATE_CACHE, _LIVE_ENCRYPTION_ENABLED_CACHE, _FERNET_CIPHER_CACHE
+    _LIVE_ENCRYPTION_STATE_CACHE = None
+    _LIVE_ENCRYPTION_ENABLED_CACHE = None
+    _FERNET_CIPHER_CACHE = None
+
+
+def _redis_cipher(*, create_if_missing: bool = False) -> Any:
+    global _FERNET_CIPHER_CACHE
+    cipher = _FERNET_CIPHER_CACHE
+    if cipher is not None:
+        return cipher
+    with _LOCK:
+        if _FERNET_CIPHER_CACHE is None:
+            Fernet, _InvalidToken = _load_fernet_primitives()
+            key_bytes, _created = _read_redis_encryption_key(create_if_missing=create_if_missing)
+            _FERNET_CIPHER_CACHE = Fernet(key_bytes)
+        return _FERNET_CIPHER_CACHE
+
+
 def _live_encryption_state_path() -> Path:
     raw = str(os.getenv("TATER_REDIS_LIVE_ENCRYPTION_STATE_PATH", "") or "").strip()
     if raw:
@@ -147,6 +209,7 @@ def _load_live_encryption_state_locked() -> Dict[str, Any]:
 
 def _save_live_encryption_state_locked(enabled: bool) -> Dict[str, Any]:
     global _LIVE_ENCRYPTION_STATE_CACHE
+    _invalidate_encryption_cache_locked()
     now_epoch = int(time.time())
     state = {
         "enabled": bool(enabled),
@@ -165,16 +228,25 @@ def _save_live_encryption_state_locked(enabled: bool) -> Dict[str, Any]:
 
 
 def _live_encryption_enabled() -> bool:
+    global _LIVE_ENCRYPTION_ENABLED_CACHE
+    enabled = _LIVE_ENCRYPTION_ENABLED_CACHE
+    if enabled is not None:
+        return enabled
     with _LOCK:
         state = _load_live_encryption_state_locked()
-    return bool(state.get("enabled"))
+        enabled = bool(state.get("enabled"))
+        _LIVE_ENCRYPTION_ENABLED_CACHE = enabled
+    return enabled
 
 
-def _key_requires_plaintext_counter(key: Any) -> bool:
+def _key_text(key: Any) -> str:
     if isinstance(key, (bytes, bytearray, memoryview)):
-        key_text = bytes(key).decode("utf-8", errors="ignore")
-    else:
-        key_text = str(key or "")
+        return bytes(key).decode("utf-8", errors="ignore")
+    return str(key or "")
+
+
+def _key_requires_plaintext_counter(key: Any) -> bool:
+    key_text = _key_text(key)
     for prefix in _NUMERIC_PLAINTEXT_KEY_PREFIXES:
         if key_text.startswith(prefix):
             return True
@@ -207,9 +279,7 @@ def _encrypt_value(value: Any, *, decode_responses: bool) -> Any:
     if _is_encrypted_value(value):
         return value
 
-    Fernet, _InvalidToken = _load_fernet_primitives()
-    key_bytes, _created = _read_redis_encryption_key(create_if_missing=True)
-    token = Fernet(key_bytes).encrypt(_value_bytes(value))
+    token = _redis_cipher(create_if_missing=True).encrypt(_value_bytes(value))
     payload = _REDIS_ENCRYPTION_PREFIX_BYTES + token
     if decode_responses:
         return payload.decode("ascii")
@@ -234,9 +304,7 @@ def _decrypt_value(value: Any, *, decode_responses: bool) -> Any:
         return value
 
     try:
-        Fernet, _InvalidToken = _load_fernet_primitives()
-        key_bytes, _created = _read_redis_encryption_key(create_if_missing=False)
-        decoded = Fernet(key_bytes).decrypt(token_bytes)
+        decoded = _redis_cipher(create_if_missing=False).decrypt(token_bytes)
     except Exception:
         return value
 
@@ -260,8 +328,41 @@ def _apply_key_ttl_ms(client: redis.Redis, key: bytes, ttl_ms: int) -> None:
         client.pexpire(key, ttl_value)
 
 
+def _normalize_legacy_members(client: redis.Redis, key: bytes, key_type: str) -> int:
+    # Swap each legacy encrypted member for its plaintext form in its own MULTI so
+    # concurrent writers never see the key disappear. An existing plaintext ZSET
+    # member keeps its own score.
+    if key_type == "set":
+        members = list(client.smembers(key) or set())
+    elif key_type == "zset":
+        members = list(client.zrange(key, 0, -1, withscores=True) or [])
+    else:
+        return 0
+
+    changed = 0
+    for row in members:
+        raw_member, score = row if key_type == "zset" else (row, None)
+        if not _is_encrypted_value(raw_member):
+            continue
+        plain_member = _decrypt_value(raw_member, decode_responses=False)
+        if plain_member == raw_member:
+            continue
+        pipe = client.pipeline(transaction=True)
+        if key_type == "set":
+            pipe.srem(key, raw_member)
+            pipe.sadd(key, plain_member)
+        else:
+            pipe.zrem(key, raw_member)
+            pipe.zadd(key, {bytes(plain_member): float(score)}, nx=True)
+        pipe.execute()
+        changed += 1
+    return changed
+
+
 def _transform_key_values(client: redis.Redis, key: bytes, *, encrypt_mode: bool) -> Dict[str, int]:
     summary = {"values_changed": 0, "key_changed": 0}
+    if _key_text(key).startswith(_REDIS_ENCRYPTION_INTERNAL_KEY_PREFIX):
+        return summary
     key_type = _redis_type_token(client.type(key))
 
     if key_type == "string":
@@ -312,48 +413,11 @@ def _transform_key_values(client: redis.Redis, key: bytes, *, encrypt_mode: bool
             summary["key_changed"] = 1
         return summary
 
-    if key_type == "set":
-        members = list(client.smembers(key) or set())
-        if not members:
-            return summary
-        rebuilt = []
-        changed = 0
-        for raw_value in members:
-            # Set members are identity values; keep them plaintext so membership/removal
-            # operations remain stable (legacy encrypted members are normalized here).
-            next_value = _decrypt_value(raw_value, decode_responses=False)
-            rebuilt.append(next_value)
-            if next_value != raw_value:
-                changed += 1
-        if changed:
-            ttl_ms = int(client.pttl(key))
-            client.delete(key)
-            if rebuilt:
-                client.sadd(key, *rebuilt)
-            _apply_key_ttl_ms(client, key, ttl_ms)
-            summary["values_changed"] = changed
-            summary["key_changed"] = 1
-        return summary
-
-    if key_type == "zset":
-        rows = list(client.zrange(key, 0, -1, withscores=True) or [])
-        if not rows:
-            return summary
-        rebuilt: Dict[bytes, float] = {}
-        changed = 0
-        for raw_member, score in rows:
-            # ZSET members are identity values; keep them plaintext so zadd/zrem/zscore/
-            # zincrby stay deterministic (legacy encrypted members are normalized here).
-            next_member = _decrypt_value(raw_member, decode_responses=False)
-            if next_member != raw_member:
-                changed += 1
-            rebuilt[bytes(next_member)] = float(score)
+    if key_type in {"set", "zset"}:
+        # Set/ZSET members are identity values; keep them plaintext so membership/
+        # removal operations remain stable (legacy encrypted members are normalized here).
+        changed = _normalize_legacy_members(client, key, key_type)
         if changed:
-            ttl_ms = int(client.pttl(key))
-            client.delete(key)
-            if rebuilt:
-                client.zadd(key, rebuilt)
-            _apply_key_ttl_ms(client, key, ttl_ms)
             summary["values_changed"] = changed
             summary["key_changed"] = 1
         return summary
@@ -385,6 +449,170 @@ def _transform_live_redis_values(*, encrypt_mode: bool) -> Dict[str, int]:
     }
 
 
+def _member_migration_state(client: redis.Redis) -> Dict[str, Any]:
+    raw = client.hgetall(_MEMBER_MIGRATION_STATE_KEY) or {}
+    state = {_key_text(field): _key_text(value) for field, value in raw.items()}
+    return {
+        "status": state.get("status") or "pending",
+        "cursor": _to_int(state.get("cursor"), default=0, min_value=0),
+        "keys_scanned": _to_int(state.get("keys_scanned"), default=0, min_value=0),
+        "keys_normalized": _to_int(state.get("keys_normalized"), default=0, min_value=0),
+        "members_normalized": _to_int(state.get("members_normalized"), default=0, min_value=0),
+        "started_at_epoch": _to_int(state.get("started_at_epoch"), default=0, min_value=0),
+        "updated_at_epoch": _to_int(state.get("updated_at_epoch"), default=0, min_value=0),
+        "finished_at_epoch": _to_int(state.get("finished_at_epoch"), default=0, min_value=0),
+        "error": state.get("error") or "",
+    }
+
+
+def _save_member_migration_state(client: redis.Redis, state: Dict[str, Any]) -> None:
+    row = dict(state)
+    row["updated_at_epoch"] = int(time.time())
+    client.hset(_MEMBER_MIGRATION_STATE_KEY, mapping={field: str(value) for field, value in row.items()})
+
+
+def _mark_member_migration_complete(client: redis.Redis, summary: Optional[Dict[str, Any]] = None) -> None:
+    global _MEMBER_MIGRATION_COMPLETE
+    state = _member_migration_state(client)
+    state.update(summary or {})
+    now_epoch = int(time.time())
+    state.update({"status": "complete", "cursor": 0, "error": "", "finished_at_epoch": now_epoch})
+    if not state.get("started_at_epoch"):
+        state["started_at_epoch"] = now_epoch
+    _save_member_migration_state(client, state)
+    client.delete(_MEMBER_CLEAN_KEYS_KEY)
+    with _LOCK:
+        _MEMBER_MIGRATION_COMPLETE = True
+        _forget_member_clean_keys()
+
+
+def _member_migration_complete(client: redis.Redis) -> bool:
+    global _MEMBER_MIGRATION_COMPLETE
+    if _MEMBER_MIGRATION_COMPLETE:
+        return True
+    status = _key_text(client.hget(_MEMBER_MIGRATION_STATE_KEY, "status"))
+    if status == "complete":
+        _MEMBER_MIGRATION_COMPLETE = True
+        return True
+    return False
+
+
+def _member_migration_worker() -> None:
+    client = get_redis_client(decode_responses=False)
+    state = _member_migration_state(client)
+    if state["status"] == "complete":
+        _mark_member_migration_complete(client)
+        return
+    if not state["started_at_epoch"]:
+        state["started_at_epoch"] = int(time.time())
+    state["status"] = "running"
+    state["error"] = ""
+    try:
+        cursor = int(state["cursor"])
+        while True:
+            cursor, keys = client.scan(cursor=cursor, count=_MEMBER_MIGRATION_SCAN_COUNT)
+            clean_keys: List[bytes] = []
+            for raw_key in keys or []:
+                key = bytes(raw_key)
+                if _key_text(key).startswith(_REDIS_ENCRYPTION_INTERNAL_KEY_PREFIX):
+                    continue
+                state["keys_scanned"] += 1
+                key_type = _redis_type_token(client.type(key))
+                if key_type not in {"set", "zset"}:
+                    continue
+                changed = _normalize_legacy_members(client, key, key_type)
+                if changed:
+                    state["keys_normalized"] += 1
+                    state["members_normalized"] += changed
+                clean_keys.append(key)
+            if clean_keys:
+                client.sadd(_MEMBER_CLEAN_KEYS_KEY, *clean_keys)
+            state["cursor"] = int(cursor)
+            if int(cursor) == 0:
+                break
+            # Persist the SCAN cursor after each batch so a restart resumes here.
+            _save_member_migration_state(client, state)
+        _mark_member_migration_complete(client, state)
+        logger.info(
+            "[redis] legacy member migration complete: keys=%d normalized=%d members=%d",
+            state["keys_scanned"],
+            state["keys_normalized"],
+            state["members_normalized"],
+        )
+    except Exception as exc:
+        state["status"] = "failed"
+        state["error"] = str(exc)
+        try:
+            _save_member_migration_state(client, state)
+        except Exception:
+            pass
+        logger.warning("[redis] legacy member migration failed: %s", exc)
+
+
+def start_redis_member_migration() -> Dict[str, Any]:
+    global _MEMBER_MIGRATION_THREAD
+    with _LOCK:
+        thread = _MEMBER_MIGRATION_THREAD
+        if thread is not None and thread.is_alive():
+            return {"started": False, "running": True}
+        if _MEMBER_MIGRATION_COMPLETE:
+            return {"started": False, "running": False}
+        thread = threading.Thread(
+            target=_member_migration_worker,
+            daemon=True,
+            name="tater-redis-member-migration",
+        )
+        _MEMBER_MIGRATION_THREAD = thread
+    thread.start()
+    return {"started": True, "running": True}
+
+
+def _member_key_known_clean(key_text: str) -> bool:
+    with _MEMBER_CLEAN_KEYS_LOCAL_LOCK:
+        if key_text not in _MEMBER_CLEAN_KEYS_LOCAL:
+            return False
+        _MEMBER_CLEAN_KEYS_LOCAL.move_to_end(key_text)
+        return True
+
+
+def _remember_member_key_clean(key_text: str) -> None:
+    with _MEMBER_CLEAN_KEYS_LOCAL_LOCK:
+        _MEMBER_CLEAN_KEYS_LOCAL[key_text] = None
+        _MEMBER_CLEAN_KEYS_LOCAL.move_to_end(key_text)
+        while len(_MEMBER_CLEAN_KEYS_LOCAL) > _MEMBER_CLEAN_KEYS_LOCAL_MAX:
+            _MEMBER_CLEAN_KEYS_LOCAL.popitem(last=False)
+
+
+def _forget_member_clean_keys() -> None:
+    with _MEMBER_CLEAN_KEYS_LOCAL_LOCK:
+        _MEMBER_CLEAN_KEYS_LOCAL.clear()
+
+
+def _ensure_member_key_clean(name: Any) -> bool:
+    # Returns True when `name` was just normalized (so a retry may now hit) and
+    # False when the key was already known clean and a miss is authoritative.
+    key_text = _key_text(name)
+    if _member_key_known_clean(key_text):
+        return False
+    client = get_redis_client(decode_responses=False)
+    if _member_migration_complete(client):
+        return False
+    if client.sismember(_MEMBER_CLEAN_KEYS_KEY, key_text):
+        _remember_member_key_clean(key_text)
+        return False
+
+    start_redis_member_migration()
+    key = key_text.encode("utf-8")
+    key_type = _redis_type_token(client.type(key))
+    if key_type in {"", "none"}:
+        # Missing keys are not marked clean; one restored from a legacy dump must still be checked.
+        return False
+    changed = _normalize_legacy_members(client, key, key_type)
+    client.sadd(_MEMBER_CLEAN_KEYS_KEY, key)
+    _remember_member_key_clean(key_text)
+    return changed > 0
+
+
 def ensure_redis_encryption_key() -> Dict[str, Any]:
     key_bytes, key_created = _read_redis_encryption_key(create_if_missing=True)
     return {
@@ -430,6 +658,14 @@ def get_redis_encryption_status() -> Dict[str, Any]:
     except Exception as exc:
         status["error"] = str(exc)
 
+    try:
+        status["member_migration"] = _member_migration_state(get_redis_client(decode_responses=False))
+        status["member_migration"]["running"] = bool(
+            _MEMBER_MIGRATION_THREAD is not None and _MEMBER_MIGRATION_THREAD.is_alive()
+        )
+    except Exception as exc:
+        status["member_migration"] = {"status": "unknown", "error": str(exc)}
+
     return status
 
 
@@ -438,6 +674,8 @@ def encrypt_current_redis_snapshot() -> Dict[str, Any]:
     # in-place live-value encryption and enables live encryption mode.
     key_bytes, key_created = _read_redis_encryption_key(create_if_missing=True)
     transform_summary = _transform_live_redis_values(encrypt_mode=True)
+    # The full pass above already normalized every set/zset member.
+    _mark_member_migration_complete(get_redis_client(decode_responses=False))
     with _LOCK:
         _save_live_encryption_state_locked(True)
     return {
@@ -459,6 +697,7 @@ def decrypt_current_redis_snapshot(*, flush_before_restore: bool = True) -> Dict
     _ = bool(flush_before_restore)  # retained for API compatibility
     key_bytes, _created = _read_redis_encryption_key(create_if_missing=False)
     transform_summary = _transform_live_redis_values(encrypt_mode=False)
+    _mark_member_migration_complete(get_redis_client(decode_responses=False))
     with _LOCK:
         _save_live_encryption_state_locked(False)
     return {
@@ -729,11 +968,30 @@ def _close_client(client: Optional[redis.Redis]) -> None:
 
 
 def _reset_clients_locked() -> None:
-    global _TEXT_CLIENT, _BLOB_CLIENT
+    global _TEXT_CLIENT, _BLOB_CLIENT, _CLIENT_GENERATION, _MEMBER_MIGRATION_COMPLETE
     _close_client(_TEXT_CLIENT)
     _close_client(_BLOB_CLIENT)
     _TEXT_CLIENT = None
     _BLOB_CLIENT = None
+    _CLIENT_GENERATION += 1
+    _close_async_clients_locked()
+    # The next connection may point at a different server.
+    _MEMBER_MIGRATION_COMPLETE = False
+    _forget_member_clean_keys()
+
+
+def _close_async_clients_locked() -> None:
+    with _ASYNC_CLIENTS_LOCK:
+        rows = list(_ASYNC_CLIENTS.items())
+        _ASYNC_CLIENTS.clear()
+    for loop, clients in rows:
+        for _generation, facade in list(clients.values()):
+            if loop.is_closed() or not loop.is_running():
+                continue
+            try:
+                asyncio.run_coroutine_threadsafe(facade._client.connection_pool.disconnect(), loop)
+            except Exception:
+                pass
 
 
 def _quote_redis_conf_value(value: Any) -> str:
@@ -968,6 +1226,8 @@ def _internal_redis_config_text(paths: Dict[str, Path], *, port: int, use_unix_s
             "save 900 1",
             "save 300 10",
             "save 60 10000",
+            # Hash keyspace events let settings caches invalidate on write.
+            "notify-keyspace-events Kh",
             "",
         ]
     )
@@ -1375,6 +1635,7 @@ def reload_redis_connection_config() -> Dict[str, Any]:
     global _CONFIG_CACHE
     with _LOCK:
         _CONFIG_CACHE = None
+        _invalidate_encryption_cache_locked()
         _reset_clients_locked()
         _stop_internal_redis_locked()
         config = _load_config_locked()
@@ -1743,8 +2004,10 @@ def get_redis_client(*, decode_responses: bool = True) -> redis.Redis:
                         _close_client(candidate)
                         config = _switch_to_internal_config_locked(exc)
                         mode = _REDIS_MODE_INTERNAL
-                        candidate = redis.Redis(**_internal_client_kwargs(config, decode_responses=True))
+                        kwargs = _internal_client_kwargs(config, decode_responses=True)
+                        candidate = redis.Redis(**kwargs)
                 _TEXT_CLIENT = candidate
+                _ASYNC_CLIENT_KWARGS[True] = (_CLIENT_GENERATION, kwargs)
             return _TEXT_CLIENT
         if _BLOB_CLIENT is None:
             kwargs = (
@@ -1760,11 +2023,137 @@ def get_redis_client(*, decode_responses: bool = True) -> redis.Redis:
                     _close_client(candidate)
                     config = _switch_to_internal_config_locked(exc)
                     mode = _REDIS_MODE_INTERNAL
-                    candidate = redis.Redis(**_internal_client_kwargs(config, decode_responses=False))
+                    kwargs = _internal_client_kwargs(config, decode_responses=False)
+                    candidate = redis.Redis(**kwargs)
             _BLOB_CLIENT = candidate
+            _ASYNC_CLIENT_KWARGS[False] = (_CLIENT_GENERATION, kwargs)
         return _BLOB_CLIENT
 
 
+def _async_max_connections() -> int:
+    return _to_int(
+        os.getenv("TATER_REDIS_ASYNC_MAX_CONNECTIONS"),
+        default=_DEFAULT_ASYNC_MAX_CONNECTIONS,
+        min_value=2,
+        max_value=512,
+    )
+
+
+def _async_connection_pool(kwargs: Dict[str, Any]) -> Any:
+    pool_kwargs = dict(kwargs)
+    connection_class: Any = redis_async_connection.Connection
+    unix_socket_path = str(pool_kwargs.pop("unix_socket_path", "") or "")
+    if unix_socket_path:
+        connection_class = redis_async_connection.UnixDomainSocketConnection
+        pool_kwargs["path"] = unix_socket_path
+        pool_kwargs.pop("host", None)
+        pool_kwargs.pop("port", None)
+    elif pool_kwargs.pop("ssl", False):
+        connection_class = redis_async_connection.SSLConnection
+    return redis_async.BlockingConnectionPool(
+        connection_class=connection_class,
+        max_connections=_async_max_connections(),
+        timeout=_DEFAULT_ASYNC_POOL_TIMEOUT_SECONDS,
+        **pool_kwargs,
+    )
+
+
+def _async_client_kwargs(decode: bool, generation: int) -> Dict[str, Any]:
+    resolved = _ASYNC_CLIENT_KWARGS.get(decode)
+    if resolved is None or resolved[0] != generation:
+        # Only before any sync client exists for this generation: resolve through
+        # the sync path so internal-server startup and the external->internal
+        # fallback behave exactly as they do for sync callers.
+        get_redis_client(decode_responses=decode)
+        resolved = _ASYNC_CLIENT_KWARGS.get(decode)
+    return dict(resolved[1]) if resolved is not None else {}
+
+
+def _async_client_facade(decode_responses: bool) -> "AsyncEncryptedRedisClientFacade":
+    # Runs on the event loop, so it never takes _LOCK once the sync clients
+    # exist: building from the recorded kwargs does no I/O (the pool connects
+    # lazily), and a sync caller holding _LOCK across a connect cannot stall it.
+    loop = asyncio.get_running_loop()
+    decode = bool(decode_responses)
+    generation = _CLIENT_GENERATION
+    with _ASYNC_CLIENTS_LOCK:
+        cached = (_ASYNC_CLIENTS.get(loop) or {}).get(decode)
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+    raw = redis_async.Redis(connection_pool=_async_connection_pool(_async_client_kwargs(decode, generation)))
+    facade = AsyncEncryptedRedisClientFacade(raw, decode_responses=decode)
+    with _ASYNC_CLIENTS_LOCK:
+        cached = (_ASYNC_CLIENTS.get(loop) or {}).get(decode)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        _ASYNC_CLIENTS.setdefault(loop, {})[decode] = (generation, facade)
+    return facade
+
+
+def prepare_async_redis_clients() -> None:
+    """Build both sync clients from a worker thread so the loop's async pools open without I/O."""
+    get_redis_client(decode_responses=True)
+    get_redis_client(decode_responses=False)
+
+
+def get_async_redis_client(*, decode_responses: bool = True) -> Any:
+    return _async_client_facade(decode_responses)._client
+
+
+class RedisBatch:
+    # Queues commands and sends them as one pipeline (one round trip). Clients
+    # without pipeline support (test doubles, bare facades) run them in order.
+    def __init__(self, client: Any, *, transaction: bool = False):
+        self._client = client
+        self._transaction = bool(transaction)
+        self._commands: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def _queue(*args: Any, **kwargs: Any) -> "RedisBatch":
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def execute(self) -> List[Any]:
+        commands, self._commands = self._commands, []
+        if not commands:
+            return []
+        pipeline_factory = getattr(self._client, "pipeline", None)
+        if callable(pipeline_factory):
+            pipe = pipeline_factory(transaction=self._transaction)
+            for name, args, kwargs in commands:
+                getattr(pipe, name)(*args, **kwargs)
+            return list(pipe.execute() or [])
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+    async def execute_async(self) -> List[Any]:
+        commands, self._commands = self._commands, []
+        if not commands:
+            return []
+        pipe = self._client.pipeline(transaction=self._transaction)
+        for name, args, kwargs in commands:
+            getattr(pipe, name)(*args, **kwargs)
+        return list(await pipe.execute() or [])
+
+
+def redis_batch(client: Any, *, transaction: bool = False) -> RedisBatch:
+    return RedisBatch(client, transaction=transaction)
+
+
+def redis_encode_value(client: Any, key: Any, value: Any) -> Any:
+    # A value as the client would store it under `key` (encrypted under live
+    # encryption), for writes that bypass the facade such as Lua scripts.
+    encode = getattr(client, "encode_value", None)
+    return encode(key, value) if callable(encode) else value
+
+
 class EncryptedRedisPipelineProxy:
     def __init__(self, pipeline: Any, *, decode_responses: bool):
         self._pipeline = pipeline
@@ -1809,6 +2198,11 @@ class EncryptedRedisPipelineProxy:
         self._pipeline.zadd(name, dict(mapping or {}), *args, **kwargs)
         return self
 
+    def xadd(self, name: Any, fields: Dict[Any, Any], *args, **kwargs):
+        encoded = {field: self._encode(raw_value, name) for field, raw_value in dict(fields or {}).items()}
+        self._pipeline.xadd(name, encoded, *args, **kwargs)
+        return self
+
     def sadd(self, name: Any, *values: Any):
         # Keep SET members plaintext (identity semantics for sadd/srem/sismember).
         self._pipeline.sadd(name, *values)
@@ -1840,37 +2234,12 @@ class EncryptedRedisClientFacade:
     def _decoded_identity_bytes(self, value: Any) -> bytes:
         return _value_bytes(_decrypt_value(value, decode_responses=self._decode_responses))
 
-    def _find_legacy_zset_members(self, name: Any, members: List[Any]) -> List[Any]:
-        if not members:
-            return []
-        rows = self._client.zrange(name, 0, -1) or []
-        if not isinstance(rows, list):
-            return []
-        target_bytes = [_value_bytes(member) for member in members]
-        out: List[Any] = []
-        for raw_member in rows:
-            decoded_bytes = self._decoded_identity_bytes(raw_member)
-            for token in target_bytes:
-                if decoded_bytes == token and _value_bytes(raw_member) != token:
-                    out.append(raw_member)
-                    break
-        return out
-
-    def _find_legacy_set_members(self, name: Any, members: List[Any]) -> List[Any]:
-        if not members:
-            return []
-        rows = self._client.smembers(name) or set()
-        if not isinstance(rows, set):
-            return []
-        target_bytes = [_value_bytes(member) for member in members]
-        out: List[Any] = []
-        for raw_member in rows:
-            decoded_bytes = self._decoded_identity_bytes(raw_member)
-            for token in target_bytes:
-                if decoded_bytes == token and _value_bytes(raw_member) != token:
-                    out.append(raw_member)
-                    break
-        return out
+    def _legacy_members_normalized(self, name: Any) -> bool:
+        # A miss is authoritative once the key is known to hold only plaintext
+        # members; otherwise normalize it once and report whether a retry can hit.
+        if not self._should_encrypt(name):
+            return False
+        return _ensure_member_key_clean(name)
 
     def set(self, name: Any, value: Any, *args, **kwargs):
         return self._client.set(name, self._encode(value, name), *args, **kwargs)
@@ -1902,6 +2271,12 @@ class EncryptedRedisClientFacade:
             return raw
         return {field: self._decode(value) for field, value in raw.items()}
 
+    def hmget(self, name: Any, keys: Any, *args):
+        rows = self._client.hmget(name, keys, *args)
+        if not isinstance(rows, list):
+            return rows
+        return [self._decode(value) for value in rows]
+
     def rpush(self, name: Any, *values: Any):
         encoded = [self._encode(value, name) for value in values]
         return self._client.rpush(name, *encoded)
@@ -1925,7 +2300,9 @@ class EncryptedRedisClientFacade:
         return [self._decode(value) for value in rows]
 
     def lrem(self, name: Any, count: int, value: Any):
-        removed = self._client.lrem(name, count, self._encode(value, name))
+        # Fernet tokens are randomized, so an encrypted copy of `value` can never
+        # match a stored element; try the plaintext form, then scan and decrypt.
+        removed = self._client.lrem(name, count, value)
         if int(removed or 0) > 0 or not self._should_encrypt(name):
             return removed
         rows = self._client.lrange(name, 0, -1) or []
@@ -1969,33 +2346,21 @@ class EncryptedRedisClientFacade:
 
     def srem(self, name: Any, *values: Any):
         removed = self._client.srem(name, *values)
-        if int(removed or 0) > 0 or not self._should_encrypt(name):
-            return removed
-        legacy = self._find_legacy_set_members(name, list(values))
-        if not legacy:
+        if int(removed or 0) > 0 or not self._legacy_members_normalized(name):
             return removed
-        return int(removed or 0) + int(self._client.srem(name, *legacy) or 0)
+        return self._client.srem(name, *values)
 
     def sismember(self, name: Any, value: Any):
         if self._client.sismember(name, value):
             return True
-        if not self._should_encrypt(name):
+        if not self._legacy_members_normalized(name):
             return False
-        rows = self._client.smembers(name) or set()
-        if not isinstance(rows, set):
-            return False
-        target = _value_bytes(value)
-        for raw_member in rows:
-            if self._decoded_identity_bytes(raw_member) == target:
-                return True
-        return False
+        return bool(self._client.sismember(name, value))
 
     def zadd(self, name: Any, mapping: Dict[Any, Any], *args, **kwargs):
         normalized = dict(mapping or {})
-        if self._should_encrypt(name) and normalized:
-            legacy = self._find_legacy_zset_members(name, list(normalized.keys()))
-            if legacy:
-                self._client.zrem(name, *legacy)
+        if normalized:
+            self._legacy_members_normalized(name)
         return self._client.zadd(name, normalized, *args, **kwargs)
 
     def zrange(self, name: Any, start: int, end: int, *args, **kwargs):
@@ -2011,36 +2376,19 @@ class EncryptedRedisClientFacade:
 
     def zrem(self, name: Any, *members: Any):
         removed = self._client.zrem(name, *members)
-        if int(removed or 0) > 0 or not self._should_encrypt(name):
+        if int(removed or 0) > 0 or not self._legacy_members_normalized(name):
             return removed
-        legacy = self._find_legacy_zset_members(name, list(members))
-        if not legacy:
-            return removed
-        return int(removed or 0) + int(self._client.zrem(name, *legacy) or 0)
+        return self._client.zrem(name, *members)
 
     def zscore(self, name: Any, value: Any):
         score = self._client.zscore(name, value)
-        if score is not None or not self._should_encrypt(name):
+        if score is not None or not self._legacy_members_normalized(name):
             return score
-        rows = self._client.zrange(name, 0, -1, withscores=True) or []
-        if not isinstance(rows, list):
-            return None
-        target = _value_bytes(value)
-        for row in rows:
-            if not (isinstance(row, tuple) and len(row) == 2):
-                continue
-            raw_member, raw_score = row
-            if self._decoded_identity_bytes(raw_member) == target:
-                return raw_score
-        return None
+        return self._client.zscore(name, value)
 
     def zincrby(self, name: Any, amount: Any, value: Any):
-        if not self._should_encrypt(name):
-            return self._client.zincrby(name, amount, value)
-        legacy = self._find_legacy_zset_members(name, [value])
-        if legacy:
-            # If legacy encrypted members exist for this logical value, normalize first.
-            self._client.zrem(name, *legacy)
+        # Fold any legacy encrypted copy of `value` into its plaintext member first.
+        self._legacy_members_normalized(name)
         return self._client.zincrby(name, amount, value)
 
     def zrevrange(self, name: Any, start: int, end: int, *args, **kwargs):
@@ -2065,10 +2413,31 @@ class EncryptedRedisClientFacade:
             return out
         return [self._decode(member) for member in rows]
 
+    def xadd(self, name: Any, fields: Dict[Any, Any], *args, **kwargs):
+        encoded = {field: self._encode(raw_value, name) for field, raw_value in dict(fields or {}).items()}
+        return self._client.xadd(name, encoded, *args, **kwargs)
+
+    def _decode_stream_rows(self, rows: Any) -> Any:
+        if not isinstance(rows, list):
+            return rows
+        return [
+            (entry_id, {field: self._decode(value) for field, value in dict(fields or {}).items()})
+            for entry_id, fields in rows
+        ]
+
+    def xrange(self, name: Any, *args, **kwargs):
+        return self._decode_stream_rows(self._client.xrange(name, *args, **kwargs))
+
+    def xrevrange(self, name: Any, *args, **kwargs):
+        return self._decode_stream_rows(self._client.xrevrange(name, *args, **kwargs))
+
     def pipeline(self, *args, **kwargs):
         raw_pipeline = self._client.pipeline(*args, **kwargs)
         return EncryptedRedisPipelineProxy(raw_pipeline, decode_responses=self._decode_responses)
 
+    def encode_value(self, name: Any, value: Any) -> Any:
+        return self._encode(value, name)
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self._client, name)
 
@@ -2076,10 +2445,19 @@ class EncryptedRedisClientFacade:
 class RedisClientProxy:
     def __init__(self, *, decode_responses: bool):
         self._decode_responses = bool(decode_responses)
+        self._cached: Optional[Tuple[int, EncryptedRedisClientFacade]] = None
 
     def _client(self) -> EncryptedRedisClientFacade:
+        cached = self._cached
+        if cached is not None and cached[0] == _CLIENT_GENERATION:
+            return cached[1]
+        # Read the generation before resolving the client: if a reset races us,
+        # the stored generation is already stale and the next call rebuilds.
+        generation = _CLIENT_GENERATION
         raw = get_redis_client(decode_responses=self._decode_responses)
-        return EncryptedRedisClientFacade(raw, decode_responses=self._decode_responses)
+        facade = EncryptedRedisClientFacade(raw, decode_responses=self._decode_responses)
+        self._cached = (generation, facade)
+        return facade
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._client(), name)
@@ -2089,5 +2467,170 @@ class RedisClientProxy:
         return f"<RedisClientProxy mode={mode}>"
 
 
+class AsyncEncryptedRedisClientFacade:
+    # redis.asyncio twin of EncryptedRedisClientFacade with the same encryption
+    # rules: values encrypted under live encryption, set/zset members plaintext,
+    # counter keys plaintext.
+    def __init__(self, client: Any, *, decode_responses: bool):
+        self._client = client
+        self._decode_responses = bool(decode_responses)
+
+    def _should_encrypt(self, key: Any) -> bool:
+        return _live_encryption_enabled() and not _key_requires_plaintext_counter(key)
+
+    def _encode(self, value: Any, key: Any) -> Any:
+        if not self._should_encrypt(key):
+            return value
+        return _encrypt_value(value, decode_responses=self._decode_responses)
+
+    def _decode(self, value: Any) -> Any:
+        return _decrypt_value(value, decode_responses=self._decode_responses)
+
+    def _decode_rows(self, rows: Any) -> Any:
+        if not isinstance(rows, list):
+            return rows
+        if rows and isinstance(rows[0], tuple):
+            return [(self._decode(member), score) for member, score in rows]
+        return [self._decode(value) for value in rows]
+
+    async def _legacy_members_normalized(self, name: Any) -> bool:
+        if not self._should_encrypt(name) or _MEMBER_MIGRATION_COMPLETE:
+            return False
+        if _member_key_known_clean(_key_text(name)):
+            return False
+        return await asyncio.to_thread(_ensure_member_key_clean, name)
+
+    async def set(self, name: Any, value: Any, *args, **kwargs):
+        return await self._client.set(name, self._encode(value, name), *args, **kwargs)
+
+    async def get(self, name: Any):
+        return self._decode(await self._client.get(name))
+
+    async def mget(self, keys: Any, *args, **kwargs):
+        return self._decode_rows(await self._client.mget(keys, *args, **kwargs))
+
+    async def hset(self, name: Any, key: Any = None, value: Any = None, mapping: Optional[Dict[Any, Any]] = None, items: Any = None):
+        if mapping is not None or items is not None:
+            encoded = {field: self._encode(raw_value, name) for field, raw_value in dict(mapping or items).items()}
+            return await self._client.hset(name, mapping=encoded)
+        return await self._client.hset(name, key, self._encode(value, name))
+
+    async def hget(self, name: Any, key: Any):
+        return self._decode(await self._client.hget(name, key))
+
+    async def hgetall(self, name: Any):
+        raw = await self._client.hgetall(name)
+        if not isinstance(raw, dict):
+            return raw
+        return {field: self._decode(value) for field, value in raw.items()}
+
+    async def hmget(self, name: Any, keys: Any, *args):
+        return self._decode_rows(await self._client.hmget(name, keys, *args))
+
+    async def rpush(self, name: Any, *values: Any):
+        return await self._client.rpush(name, *[self._encode(value, name) for value in values])
+
+    async def lpush(self, name: Any, *values: Any):
+        return await self._client.lpush(name, *[self._encode(value, name) for value in values])
+
+    async def lrange(self, name: Any, start: int, end: int):
+        return self._decode_rows(await self._client.lrange(name, start, end))
+
+    async def lpop(self, name: Any, count: Any = None):
+        if count is None:
+            return self._decode(await self._client.lpop(name))
+        return self._decode_rows(await self._client.lpop(name, count))
+
+    async def rpop(self, name: Any, count: Any = None):
+        if count is None:
+            return self._decode(await self._client.rpop(name))
+        return self._decode_rows(await self._client.rpop(name, count))
+
+    async def smembers(self, name: Any):
+        rows = await self._client.smembers(name)
+        if not isinstance(rows, set):
+            return rows
+        return {self._decode(value) for value in rows}
+
+    async def sismember(self, name: Any, value: Any):
+        if await self._client.sismember(name, value):
+            return True
+        if not await self._legacy_members_normalized(name):
+            return False
+        return bool(await self._client.sismember(name, value))
+
+    async def srem(self, name: Any, *values: Any):
+        removed = await self._client.srem(name, *values)
+        if int(removed or 0) > 0 or not await self._legacy_members_normalized(name):
+            return removed
+        return await self._client.srem(name, *values)
+
+    async def zadd(self, name: Any, mapping: Dict[Any, Any], *args, **kwargs):
+        normalized = dict(mapping or {})
+        if normalized:
+            await self._legacy_members_normalized(name)
+        return await self._client.zadd(name, normalized, *args, **kwargs)
+
+    async def zscore(self, name: Any, value: Any):
+        score = await self._client.zscore(name, value)
+        if score is not None or not await self._legacy_members_normalized(name):
+            return score
+        return await self._client.zscore(name, value)
+
+    async def zrem(self, name: Any, *members: Any):
+        removed = await self._client.zrem(name, *members)
+        if int(removed or 0) > 0 or not await self._legacy_members_normalized(name):
+            return removed
+        return await self._client.zrem(name, *members)
+
+    async def zrange(self, name: Any, start: int, end: int, *args, **kwargs):
+        return self._decode_rows(await self._client.zrange(name, start, end, *args, **kwargs))
+
+    async def zrevrange(self, name: Any, start: int, end: int, *args, **kwargs):
+        return self._decode_rows(await self._client.zrevrange(name, start, end, *args, **kwargs))
+
+    async def xadd(self, name: Any, fields: Dict[Any, Any], *args, **kwargs):
+        encoded = {field: self._encode(raw_value, name) for field, raw_value in dict(fields or {}).items()}
+        return await self._client.xadd(name, encoded, *args, **kwargs)
+
+    def _decode_stream_rows(self, rows: Any) -> Any:
+        if not isinstance(rows, list):
+            return rows
+        return [
+            (entry_id, {field: self._decode(value) for field, value in dict(fields or {}).items()})
+            for entry_id, fields in rows
+        ]
+
+    async def xrange(self, name: Any, *args, **kwargs):
+        return self._decode_stream_rows(await self._client.xrange(name, *args, **kwargs))
+
+    async def xrevrange(self, name: Any, *args, **kwargs):
+        return self._decode_stream_rows(await self._client.xrevrange(name, *args, **kwargs))
+
+    def pipeline(self, *args, **kwargs):
+        raw_pipeline = self._client.pipeline(*args, **kwargs)
+        return EncryptedRedisPipelineProxy(raw_pipeline, decode_responses=self._decode_responses)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+class AsyncRedisClientProxy:
+    def __init__(self, *, decode_responses: bool):
+        self._decode_responses = bool(decode_responses)
+
+    def _client(self) -> AsyncEncryptedRedisClientFacade:
+        return _async_client_facade(self._decode_responses)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client(), name)
+
+    def __repr__(self) -> str:
+        mode = "text" if self._decode_responses else "binary"
+        return f"<AsyncRedisClientProxy mode={mode}>"
+
+
 redis_client = RedisClientProxy(decode_responses=True)
 redis_blob_client = RedisClientProxy(decode_responses=False)
+async_redis_client = AsyncRedisClientProxy(decode_responses=True)
+async_redis_blob_client = AsyncRedisClientProxy(decode_responses=False)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import heapq
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Response
+
+
+DEFAULT_RUNTIME_ASSET_MAX_BYTES = 512 * 1024 * 1024
+
+_BYTE_RANGE_RE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class RuntimeAsset:
+    asset_id: str
+    body: memoryview
+    meta: Dict[str, Any]
+    expires_ts: float
+
+
+@dataclass
+class _AssetEntry:
+    body: bytes
+    meta: Dict[str, Any]
+    expires_ts: float
+
+
+class RuntimeAssetStore:
+    """Short-lived audio/media payloads served to speakers and satellites.
+
+    Entries live in an LRU ordered dict under one global byte budget, and
+    expiry is driven by a heap so a store or fetch only touches the entries
+    that actually expired. Fetches hand out read-only views, never copies.
+    """
+
+    def __init__(self, *, max_bytes: int, clock: Callable[[], float] = time.time):
+        self.max_bytes = max(0, int(max_bytes))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _AssetEntry]" = OrderedDict()
+        self._expiry: List[Tuple[float, str]] = []
+        self._bytes = 0
+        self._stats = {"stores": 0, "hits": 0, "misses": 0, "expired": 0, "evicted": 0, "rejected": 0}
+
+    def _drop_locked(self, asset_id: str) -> Optional[_AssetEntry]:
+        entry = self._entries.pop(asset_id, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+        return entry
+
+    def _prune_locked(self, now: float) -> int:
+        removed = 0
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            expires_ts, asset_id = heapq.heappop(expiry)
+            entry = self._entries.get(asset_id)
+            # Heap rows for evicted or replaced entries are skipped lazily.
+            if entry is None or entry.expires_ts != expires_ts:
+                continue
+            self._drop_locked(asset_id)
+            removed += 1
+        self._stats["expired"] += removed
+        return removed
+
+    def put(
+        self,
+        body: Any = b"",
+        *,
+        ttl_s: float,
+        meta: Optional[Dict[str, Any]] = None,
+        asset_id: str = "",
+    ) -> str:
+        data = bytes(body or b"")
+        token = str(asset_id or "").strip() or uuid.uuid4().hex
+        now = self._clock()
+        expires_ts = now + max(0.0, float(ttl_s))
+        with self._lock:
+            self._prune_locked(now)
+            if len(data) > self.max_bytes:
+                self._stats["rejected"] += 1
+                return ""
+            self._drop_locked(token)
+            while self._entries and self._bytes + len(data) > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop_locked(oldest)
+                self._stats["evicted"] += 1
+            self._entries[token] = _AssetEntry(body=data, meta=dict(meta or {}), expires_ts=expires_ts)
+            self._bytes += len(data)
+            heapq.heappush(self._expiry, (expires_ts, token))
+            self._stats["stores"] += 1
+        return token
+
+    def get(self, asset_id: Any) -> Optional[RuntimeAsset]:
+        token = str(asset_id or "").strip()
+        if not token:
+            return None
+        with self._lock:
+            self._prune_locked(self._clock())
+            entry = self._entries.get(token)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(token)
+            self._stats["hits"] += 1
+            return RuntimeAsset(
+                asset_id=token,
+                body=memoryview(entry.body),
+                meta=dict(entry.meta),
+                expires_ts=entry.expires_ts,
+            )
+
+    def discard(self, asset_id: Any) -> bool:
+        with self._lock:
+            return self._drop_locked(str(asset_id or "").strip()) is not None
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._expiry.clear()
+            self._bytes = 0
+        return removed
+
+    def prune(self) -> int:
+        with self._lock:
+            return self._prune_locked(self._clock())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._prune_locked(self._clock())
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                **self._stats,
+            }
+
+
+def parse_byte_range(range_header: Any, size: int) -> Optional[Tuple[int, int]]:
+    """Inclusive ``(start, end)`` for a single ``bytes=`` range.
+
+    Returns None when there is no usable Range header (serve the whole body)
+    and raises ValueError when the range cannot be satisfied.
+    """
+    match = _BYTE_RANGE_RE.match(str(range_header or ""))
+    if match is None:
+        return None
+    first, last = match.group(1), match.group(2)
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length <= 0 or size <= 0:
+            raise ValueError("unsatisfiable range")
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("unsatisfiable range")
+    return start, end
+
+
+def byte_range_response(
+    body: Any,
+    *,
+    media_type: str,
+    range_header: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    view = memoryview(body if body is not None else b"").cast("B")
+    size = len(view)
+    out_headers = {"Accept-Ranges": "bytes", **dict(headers or {})}
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        out_headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=416, headers=out_headers)
+    if byte_range is None:
+        return Response(content=view, media_type=media_type, headers=out_headers)
+    start, end = byte_range
+    out_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return Response(content=view[start : end + 1], status_code=206, media_type=media_type, headers=out_headers)
+
+
+def _env_max_bytes() -> int:
+    raw = str(os.getenv("TATER_RUNTIME_ASSET_MAX_BYTES", "") or "").strip()
+    try:
+        return max(1, int(float(raw))) if raw else DEFAULT_RUNTIME_ASSET_MAX_BYTES
+    except Exception:
+        return DEFAULT_RUNTIME_ASSET_MAX_BYTES
+
+
+_STORE_LOCK = threading.Lock()
+_STORE: Optional[RuntimeAssetStore] = None
+
+
+def runtime_asset_store() -> RuntimeAssetStore:
+    global _STORE
+    store = _STORE
+    if store is not None:
+        return store
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = RuntimeAssetStore(max_bytes=_env_max_bytes())
+        return _STORE
+
+
+def runtime_asset_snapshot() -> Dict[str, Any]:
+    return runtime_asset_store().snapshot()
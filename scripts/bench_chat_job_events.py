@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Compare chat-job SSE delivery: 1 s queue polling vs the EventRing bus.
+
+Starts N idle subscribers on one event loop (like N open browser tabs), lets
+them sit for a while to measure idle CPU, then publishes one event from a
+worker thread and reports how long each subscriber took to see it. "old"
+mirrors the previous handler: get_nowait() on a queue.Queue, otherwise
+sleep 1 s and re-check the job snapshot. "new" awaits EventRing.wait_after.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import queue
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from event_ring import EventRing  # noqa: E402
+
+
+async def _old_subscriber(event_queue: "queue.Queue", snapshot: dict, published: list, latencies: list) -> None:
+    while True:
+        try:
+            event_queue.get_nowait()
+        except queue.Empty:
+            await asyncio.sleep(1.0)
+            dict(snapshot)
+            continue
+        latencies.append(time.perf_counter() - published[0])
+        return
+
+
+async def _new_subscriber(ring: EventRing, published: list, latencies: list) -> None:
+    while True:
+        rows = await ring.wait_after(0, timeout=15.0)
+        if rows:
+            latencies.append(time.perf_counter() - published[0])
+            return
+
+
+async def _run(mode: str, subscribers: int, idle_s: float) -> dict:
+    published = [0.0]
+    latencies: list = []
+    if mode == "old":
+        # The old handler drained one queue per job; give each tab its own so
+        # every subscriber sees the event.
+        queues = [queue.Queue(maxsize=512) for _ in range(subscribers)]
+        snapshot = {"status": "running"}
+        tasks = [asyncio.create_task(_old_subscriber(q, snapshot, published, latencies)) for q in queues]
+
+        def publish() -> None:
+            published[0] = time.perf_counter()
+            for q in queues:
+                q.put_nowait({"type": "status"})
+    else:
+        ring = EventRing()
+        tasks = [asyncio.create_task(_new_subscriber(ring, published, latencies)) for _ in range(subscribers)]
+
+        def publish() -> None:
+            published[0] = time.perf_counter()
+            ring.publish({"type": "status"})
+
+    await asyncio.sleep(0.05)
+    cpu_started = time.process_time()
+    await asyncio.sleep(idle_s)
+    idle_cpu = time.process_time() - cpu_started
+    # Publish at a random point inside the poll interval, like a real token.
+    await asyncio.sleep(0.37)
+    threading.Thread(target=publish).start()
+    await asyncio.gather(*tasks)
+    return {
+        "idle_cpu_ms_per_s": idle_cpu * 1000.0 / idle_s,
+        "first_ms": min(latencies) * 1000.0,
+        "median_ms": statistics.median(latencies) * 1000.0,
+        "max_ms": max(latencies) * 1000.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=200)
+    parser.add_argument("--idle-seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{args.subscribers} subscribers, {args.idle_seconds:.1f} s idle")
+    for mode in ("old", "new"):
+        row = asyncio.run(_run(mode, args.subscribers, args.idle_seconds))
+        print(
+            f"{mode:>4}: idle cpu {row['idle_cpu_ms_per_s']:7.2f} ms/s   "
+            f"time-to-event first {row['first_ms']:8.2f} ms  "
+            f"median {row['median_ms']:8.2f} ms  max {row['max_ms']:8.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Compare integration runtime event/state storage: capped list vs stream.
+
+Starts a throwaway redis-server on a unix socket and replays a Home Assistant
+style burst of state_changed events. "old" mirrors the previous layout: LPUSH
++ LTRIM onto one list and HSET into one shared state hash, with readers that
+LRANGE the whole buffer and parse every row to find seq > cursor. "new" uses
+integration_runtime_store: XADD with seq entry ids, per-provider state shards
+and cursor reads via XRANGE. Reports publish throughput, the cost of one
+cursor poll that has fallen 50 events behind, and of a state delta read.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import redis
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import integration_runtime_store as store  # noqa: E402
+
+OLD_EVENTS_KEY = "bench:old:events"
+OLD_STATES_KEY = "bench:old:states"
+MAX_EVENTS = 1000
+
+
+def _start_server(workdir: str) -> tuple:
+    socket_path = str(Path(workdir) / "redis.sock")
+    proc = subprocess.Popen(
+        [
+            shutil.which("redis-server") or "redis-server",
+            "--port", "0",
+            "--unixsocket", socket_path,
+            "--save", "",
+            "--appendonly", "no",
+            "--dir", workdir,
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    client = redis.Redis(unix_socket_path=socket_path, decode_responses=True)
+    deadline = time.monotonic() + 10.0
+    while True:
+        try:
+            client.ping()
+            return proc, client
+        except redis.exceptions.ConnectionError:
+            if time.monotonic() > deadline:
+                proc.kill()
+                raise
+            time.sleep(0.05)
+
+
+def _event(seq: int, entities: int) -> tuple:
+    entity = f"sensor.bench_{seq % entities}"
+    payload = {"entity_id": entity, "new_state": {"state": str(seq), "attributes": {"unit": "W"}}}
+    record = {"seq": seq, "ts": time.time(), "provider": "homeassistant", "kind": "state_changed", "payload": payload}
+    return entity, payload, record
+
+
+def _publish_old(client: redis.Redis, events: int, entities: int) -> float:
+    started = time.perf_counter()
+    for seq in range(1, events + 1):
+        entity, payload, record = _event(seq, entities)
+        state = {"provider": "homeassistant", "id": entity, "updated_at": time.time(), "payload": payload}
+        client.hset(OLD_STATES_KEY, f"homeassistant:{entity}", json.dumps(state))
+        pipe = client.pipeline(transaction=False)
+        pipe.lpush(OLD_EVENTS_KEY, json.dumps(record))
+        pipe.ltrim(OLD_EVENTS_KEY, 0, MAX_EVENTS - 1)
+        pipe.execute()
+    return time.perf_counter() - started
+
+
+def _publish_new(client: redis.Redis, events: int, entities: int) -> float:
+    started = time.perf_counter()
+    for seq in range(1, events + 1):
+        entity, payload, record = _event(seq, entities)
+        store.set_state(client, "homeassistant", entity, payload)
+        pipe = client.pipeline(transaction=False)
+        store.queue_event_append(pipe, record, json.dumps(record), max_events=MAX_EVENTS)
+        pipe.execute()
+    return time.perf_counter() - started
+
+
+def _poll_old(client: redis.Redis, after_seq: int) -> int:
+    rows = [json.loads(raw) for raw in client.lrange(OLD_EVENTS_KEY, 0, MAX_EVENTS - 1)]
+    return len([row for row in rows if int(row.get("seq") or 0) > after_seq])
+
+
+def _poll_new(client: redis.Redis, after_seq: int) -> int:
+    return len(store.read_events(client, after_seq=after_seq, limit=MAX_EVENTS))
+
+
+def _states_old(client: redis.Redis) -> int:
+    return len([json.loads(raw) for raw in client.hgetall(OLD_STATES_KEY).values()])
+
+
+def _states_new(client: redis.Redis, since_version: int) -> int:
+    return len(store.state_records(client, since_version=since_version)[0])
+
+
+def _time_ms(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) * 1000.0 / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--entities", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="tater-bench-redis-")
+    proc, client = _start_server(workdir)
+    try:
+        old_s = _publish_old(client, args.events, args.entities)
+        new_s = _publish_new(client, args.events, args.entities)
+        cursor = args.events - 50
+        store.state_records(client)
+        _entity, payload, _record = _event(args.events + 1, args.entities)
+        _is_new, version = store.set_state(client, "homeassistant", "sensor.bench_0", payload)
+
+        print(f"{args.events} events over {args.entities} entities, buffer {MAX_EVENTS}")
+        print(f"publish  old {args.events / old_s:9.0f} ev/s   new {args.events / new_s:9.0f} ev/s")
+        print(
+            f"poll 50 behind   old {_time_ms(lambda: _poll_old(client, cursor), args.repeat):7.3f} ms   "
+            f"new {_time_ms(lambda: _poll_new(client, cursor), args.repeat):7.3f} ms"
+        )
+        print(
+            f"state read       old {_time_ms(lambda: _states_old(client), args.repeat):7.3f} ms   "
+            f"new {_time_ms(lambda: _states_new(client, version - 1), args.repeat):7.3f} ms (delta)"
+        )
+    finally:
+        client.close()
+        proc.terminate()
+        proc.wait(timeout=10)
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
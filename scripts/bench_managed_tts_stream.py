@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Time-to-first-audio for managed TTS, whole-utterance vs streamed.
+
+Runs scripts/fake_managed_tts_worker.py (real frame protocol, synthetic audio
+with a fixed per-sentence delay). "whole" is synthesize_managed_tts_pcm, which
+like the previous one-WAV-per-request protocol hands back audio only when the
+utterance is done; "stream" is iter_managed_tts_pcm. With --concurrent N,
+N satellites speak at once through the one worker.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import managed_tts  # noqa: E402
+
+SENTENCE = "This is sentence number {index} of a fairly long spoken reply."
+
+
+def _first_audio_s(text: str) -> float:
+    started = time.perf_counter()
+    first = 0.0
+    for _chunk, _format in managed_tts.iter_managed_tts_pcm(text, backend="omnivoice", acceleration="cpu"):
+        first = first or time.perf_counter() - started
+    return first
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=8)
+    parser.add_argument("--sentence-s", type=float, default=0.25)
+    parser.add_argument("--concurrent", type=int, default=3)
+    args = parser.parse_args()
+
+    text = " ".join(SENTENCE.format(index=index) for index in range(args.sentences))
+    os.environ["TATER_FAKE_TTS_SENTENCE_S"] = str(args.sentence_s)
+    with tempfile.TemporaryDirectory() as tmp:
+        managed_tts.agent_lab_path = lambda *parts: Path(tmp).joinpath(*parts)
+        managed_tts.ensure_managed_tts_environment = lambda *_args: Path(sys.executable)
+        managed_tts._WORKER_SCRIPT = ROOT / "scripts" / "fake_managed_tts_worker.py"
+        managed_tts._workers["omnivoice"].request({"action": "ping"}, acceleration="cpu", timeout=30)
+
+        started = time.perf_counter()
+        managed_tts.synthesize_managed_tts_pcm(text, backend="omnivoice", acceleration="cpu")
+        whole_s = time.perf_counter() - started
+        stream_s = _first_audio_s(text)
+
+        firsts = []
+        threads = [threading.Thread(target=lambda: firsts.append(_first_audio_s(text))) for _ in range(args.concurrent)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        managed_tts.clear_managed_tts_workers()
+
+    print(f"{args.sentences} sentences, {args.sentence_s * 1000:.0f} ms synthesis each")
+    print(f"whole utterance   first audio {whole_s * 1000:8.1f} ms")
+    print(f"streamed          first audio {stream_s * 1000:8.1f} ms")
+    print(f"{args.concurrent} concurrent      worst first audio {max(firsts) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
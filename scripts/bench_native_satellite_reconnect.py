@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Reconnect storm: N paired satellites say hello at once after a restart.
+
+Every hello is authorized on the event loop, so handshakes queue behind each
+other. "old" mirrors the previous check: read and parse the credentials
+file, scan every row for the token hash, and write the file back with the
+new last-seen time. "new" is native_satellite._valid_device_credential with
+the token-hash index and coalesced last-seen flush. Reports the time from
+the storm start until each satellite's handshake finished.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hmac
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tater_voice import native_satellite  # noqa: E402
+
+
+def _old_valid_device_credential(token: str, selector: str, payload: dict):
+    supplied_hash = native_satellite._token_hash(token)
+    with native_satellite._pairing_lock:
+        data = native_satellite._load_credentials_unlocked()
+        devices = data.get("devices") if isinstance(data.get("devices"), dict) else {}
+        for key, row in list(devices.items()):
+            if isinstance(row, dict) and hmac.compare_digest(str(row.get("token_hash") or ""), supplied_hash):
+                row["last_seen_ts"] = time.time()
+                row["device_name"] = payload.get("device_name") or row.get("device_name")
+                native_satellite._save_credentials_unlocked(data)
+                return dict(row)
+    return None
+
+
+async def _storm(check, satellites: int) -> list:
+    started = time.perf_counter()
+    done: list = []
+
+    async def hello(index: int) -> None:
+        await asyncio.sleep(0)
+        row = check(f"token-{index}", f"native:sat-{index}", {"device_id": f"sat-{index}", "device_name": f"Sat {index}"})
+        assert row is not None
+        done.append((time.perf_counter() - started) * 1000.0)
+
+    await asyncio.gather(*(hello(index) for index in range(satellites)))
+    return done
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--satellites", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TATER_NATIVE_SATELLITE_CREDENTIALS_PATH"] = str(Path(tmp) / "credentials.json")
+        for index in range(args.satellites):
+            native_satellite._save_device_credential(
+                f"native:sat-{index}",
+                {"device_id": f"sat-{index}", "device_name": f"Sat {index}"},
+                f"token-{index}",
+            )
+        print(f"{args.satellites} satellites reconnecting")
+        for label, check in (("old", _old_valid_device_credential), ("new", native_satellite._valid_device_credential)):
+            native_satellite._credential_index = None
+            samples = sorted(asyncio.run(_storm(check, args.satellites)))
+            print(
+                f"{label:>4}: handshake done median {statistics.median(samples):8.2f} ms   "
+                f"p99 {samples[int(len(samples) * 0.99) - 1]:8.2f} ms   last {samples[-1]:8.2f} ms"
+            )
+        native_satellite._flush_credential_last_seen()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
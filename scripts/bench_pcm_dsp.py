@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Per-chunk PCM throughput for 10/50/100 concurrent satellites.
+
+Each satellite pushes 20 ms chunks; every chunk goes through the ingest
+kernels (dBFS, input gain, high-pass noise filter, conversion to 16 kHz mono
+PCM16). Modes:
+
+  python   pure-Python fallbacks (no audioop, no numpy)
+  audioop  audioop where the pipeline uses it, Python high-pass (Python <=3.12)
+  numpy    tater_voice.dsp kernels (what Python 3.13+ runs without audioop)
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import warnings
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+warnings.simplefilter("ignore", DeprecationWarning)
+
+from tater_voice import dsp  # noqa: E402
+from tater_voice import voice_pipeline as vp  # noqa: E402
+
+CHUNK_S = 0.02
+
+
+def _chunk(audio_format: dict, seed: int) -> bytes:
+    rng = random.Random(seed)
+    frames = int(int(audio_format["rate"]) * CHUNK_S) * int(audio_format["channels"])
+    return b"".join(rng.randint(-12000, 12000).to_bytes(2, "little", signed=True) for _ in range(frames))
+
+
+def _process(session: SimpleNamespace, chunk: bytes, audio_format: dict) -> None:
+    vp._pcm_dbfs(chunk, sample_width=2)
+    boosted = vp._pcm_apply_gain(chunk, sample_width=2, gain=1.6)
+    filtered = vp._pcm_high_pass_filter_session(session, boosted, sample_width=2)
+    _pcm, session.ratecv_state = vp._pcm_to_pcm16_mono_16k(filtered, audio_format, ratecv_state=session.ratecv_state)
+
+
+def _patches(mode: str) -> list:
+    patches = [mock.patch.object(vp, "_get_float_setting", return_value=vp.DEFAULT_NOISE_SUPPRESSION_HIGH_PASS_ALPHA)]
+    if mode in {"python", "numpy"}:
+        patches.append(mock.patch.object(vp, "_audioop", None))
+    if mode in {"python", "audioop"}:
+        patches.append(mock.patch.object(dsp, "_numpy", return_value=None))
+    return patches
+
+
+def _run(mode: str, satellites: int, seconds: float, audio_format: dict) -> float:
+    sessions = [
+        SimpleNamespace(noise_highpass_prev_input=0.0, noise_highpass_prev_output=0.0, ratecv_state=None)
+        for _ in range(satellites)
+    ]
+    chunks = [_chunk(audio_format, seed) for seed in range(satellites)]
+    rounds = max(1, int(seconds / CHUNK_S))
+    patches = _patches(mode)
+    for patcher in patches:
+        patcher.start()
+    try:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for session, chunk in zip(sessions, chunks):
+                _process(session, chunk, audio_format)
+        elapsed = time.perf_counter() - started
+    finally:
+        for patcher in reversed(patches):
+            patcher.stop()
+    return elapsed * 1_000_000 / float(rounds * satellites)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="audio seconds per satellite")
+    parser.add_argument("--rate", type=int, default=16000)
+    parser.add_argument("--channels", type=int, default=1)
+    args = parser.parse_args()
+    audio_format = {"rate": int(args.rate), "width": 2, "channels": int(args.channels)}
+
+    modes = ["python", "numpy"]
+    if vp._audioop is not None:
+        modes.insert(1, "audioop")
+    if not dsp.available():
+        modes.remove("numpy")
+    print(f"format={args.rate}Hz/{args.channels}ch chunk={int(CHUNK_S * 1000)}ms audio={args.seconds:.1f}s per satellite")
+    print(f"{'satellites':>10}{'mode':>9}{'us/chunk':>11}{'core %':>9}")
+    for satellites in (10, 50, 100):
+        for mode in modes:
+            per_chunk_us = _run(mode, satellites, float(args.seconds), audio_format)
+            # Share of one core needed to keep up in real time.
+            core_pct = per_chunk_us * satellites / (CHUNK_S * 1_000_000) * 100.0
+            print(f"{satellites:>10}{mode:>9}{per_chunk_us:>11.1f}{core_pct:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Time people.resolve_person against a large people store.
+
+Starts a throwaway redis-server on a unix socket, saves N people with M
+aliases each, then resolves random aliases. "old" mirrors the previous
+resolver: GET the store, parse and normalize it, and rebuild the alias map on
+every call. "new" is people.resolve_person with the versioned PeopleIndex.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import redis
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import people  # noqa: E402
+
+
+def _start_server(workdir: str) -> tuple:
+    socket_path = str(Path(workdir) / "redis.sock")
+    proc = subprocess.Popen(
+        [
+            shutil.which("redis-server") or "redis-server",
+            "--port", "0",
+            "--unixsocket", socket_path,
+            "--save", "",
+            "--appendonly", "no",
+            "--dir", workdir,
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    client = redis.Redis(unix_socket_path=socket_path, decode_responses=True)
+    deadline = time.monotonic() + 10.0
+    while True:
+        try:
+            client.ping()
+            return proc, client
+        except redis.exceptions.ConnectionError:
+            if time.monotonic() > deadline:
+                proc.kill()
+                raise
+            time.sleep(0.05)
+
+
+def _old_resolve(client: redis.Redis, platform: str, origin: dict) -> dict:
+    store = people.load_store(client)
+    candidates = people.alias_candidates_from_origin(platform, origin)
+    alias_index = {}
+    for person in list(store.get("people") or []):
+        for alias in list(person.get("aliases") or []):
+            alias_index[people._alias_key(alias.get("platform"), alias.get("external_id"))] = (person, alias)
+    for candidate in candidates:
+        if alias_index.get(people._alias_key(candidate.get("platform"), candidate.get("external_id"))):
+            return {"matched": True}
+    return {"matched": False}
+
+
+def _time_calls(fn, origins: list) -> list:
+    samples = []
+    for origin in origins:
+        started = time.perf_counter()
+        result = fn(origin)
+        samples.append((time.perf_counter() - started) * 1000.0)
+        assert result["matched"]
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, default=500)
+    parser.add_argument("--aliases", type=int, default=10, help="aliases per person")
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="tater-bench-redis-")
+    proc, client = _start_server(workdir)
+    try:
+        store = {
+            "people": [
+                {
+                    "id": f"person_{index:06d}",
+                    "display_name": f"Person {index}",
+                    "aliases": [
+                        {"platform": "discord", "external_id": f"{index}-{alias}", "label": f"user {index}.{alias}"}
+                        for alias in range(args.aliases)
+                    ],
+                }
+                for index in range(args.people)
+            ]
+        }
+        people.save_store(store, client)
+        rng = random.Random(7)
+        origins = [
+            {"user_id": f"{rng.randrange(args.people)}-{rng.randrange(args.aliases)}"} for _ in range(args.calls)
+        ]
+        old = _time_calls(lambda origin: _old_resolve(client, "discord", origin), origins[: max(1, args.calls // 10)])
+        people.resolve_person(platform="discord", origin=origins[0], redis_client=client)
+        new = _time_calls(lambda origin: people.resolve_person(platform="discord", origin=origin, redis_client=client), origins)
+
+        print(f"{args.people} people, {args.people * args.aliases} aliases")
+        for label, samples in (("old", old), ("new", new)):
+            ordered = sorted(samples)
+            print(
+                f"{label:>4}: median {statistics.median(ordered):8.3f} ms   "
+                f"p99 {ordered[int(len(ordered) * 0.99) - 1]:8.3f} ms   ({len(ordered)} calls)"
+            )
+    finally:
+        client.close()
+        proc.terminate()
+        proc.wait(timeout=10)
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
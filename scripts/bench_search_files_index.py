@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Time kernel_tools.search_files over a generated mixed-format corpus.
+
+Writes N documents (txt, md, csv, docx, xlsx, pptx, pdf) into a throwaway
+agent_lab. "old" mirrors the previous search: walk the tree and extract
+every file's text on each query. "new" is search_files with the persistent
+document index. Reports a cold query (empty index), a warm query, and a query
+after a handful of files changed.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import kernel_tools  # noqa: E402
+
+WORDS = "invoice quarterly budget sprinkler garage thermostat kitchen roadmap vendor renewal".split()
+
+
+def _sentence(rng: random.Random, index: int) -> str:
+    return f"doc {index} " + " ".join(rng.choice(WORDS) for _ in range(12))
+
+
+def _write_pdf(path: Path, lines: list) -> None:
+    text = " ".join(f"({line}) Tj T*" for line in lines)
+    stream = f"BT /F1 10 Tf 14 TL 40 780 Td {text} ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+def _write_doc(path: Path, lines: list) -> None:
+    ext = path.suffix
+    if ext == ".docx":
+        import docx
+
+        document = docx.Document()
+        for line in lines:
+            document.add_paragraph(line)
+        document.save(str(path))
+    elif ext == ".xlsx":
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        for line in lines:
+            workbook.active.append(line.split()[:6])
+        workbook.save(str(path))
+    elif ext == ".pptx":
+        from pptx import Presentation
+
+        deck = Presentation()
+        for line in lines:
+            slide = deck.slides.add_slide(deck.slide_layouts[1])
+            slide.shapes.title.text = line
+        deck.save(str(path))
+    elif ext == ".pdf":
+        _write_pdf(path, lines)
+    elif ext == ".csv":
+        path.write_text("\n".join(",".join(line.split()) for line in lines), encoding="utf-8")
+    else:
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _old_search(query: str) -> int:
+    hits = 0
+    for base in (kernel_tools.AGENT_DOCUMENTS_DIR, kernel_tools.AGENT_DOWNLOADS_DIR, kernel_tools.AGENT_WORKSPACE_DIR):
+        for file_path in base.rglob("*"):
+            if not file_path.is_file():
+                continue
+            try:
+                text, _meta = kernel_tools._extract_file_content(file_path)
+            except Exception:
+                continue
+            hits += len(kernel_tools._find_query_hits(text[: kernel_tools._SEARCH_MAX_FILE_CHARS], query, max_hits=5))
+    return hits
+
+
+def _time_ms(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=300)
+    parser.add_argument("--changed", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    extensions = [".txt", ".md", ".csv", ".docx", ".xlsx", ".pptx", ".pdf"]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        kernel_tools.AGENT_LAB_DIR = root
+        kernel_tools.AGENT_DOCUMENTS_DIR = root / "documents"
+        kernel_tools.AGENT_DOWNLOADS_DIR = root / "downloads"
+        kernel_tools.AGENT_WORKSPACE_DIR = root / "workspace"
+        for folder in (kernel_tools.AGENT_DOCUMENTS_DIR, kernel_tools.AGENT_DOWNLOADS_DIR, kernel_tools.AGENT_WORKSPACE_DIR):
+            folder.mkdir(parents=True)
+        paths = []
+        for index in range(args.documents):
+            path = kernel_tools.AGENT_DOCUMENTS_DIR / f"doc_{index:04d}{extensions[index % len(extensions)]}"
+            _write_doc(path, [_sentence(rng, index) for _ in range(8)])
+            paths.append(path)
+
+        query = "thermostat kitchen"
+        old_ms = _time_ms(lambda: _old_search(query))
+        cold_ms = _time_ms(lambda: kernel_tools.search_files(query))
+        warm_ms = min(_time_ms(lambda: kernel_tools.search_files(query)) for _ in range(5))
+        for path in rng.sample(paths, args.changed):
+            _write_doc(path, [_sentence(rng, 9999) for _ in range(8)])
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        incremental_ms = _time_ms(lambda: kernel_tools.search_files(query))
+        result = kernel_tools.search_files(query)
+
+        print(f"{args.documents} documents ({', '.join(extensions)}), {result['matched_files']} matching")
+        print(f"old scan          {old_ms:10.1f} ms per query")
+        print(f"new cold index    {cold_ms:10.1f} ms")
+        print(f"new warm          {warm_ms:10.1f} ms")
+        print(f"new {args.changed} changed     {incremental_ms:10.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
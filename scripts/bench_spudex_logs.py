@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Time Spudex log appends and cursor reads as a session log grows.
+
+"old" mirrors the previous store: every append re-reads and rewrites the
+session meta JSON, and every cursor read scans the JSONL file from the top.
+"new" is spudex.runner with the offset-indexed session_store and coalesced
+meta flushes. Reports append throughput and the cost of a UI poll that asks
+for the last 50 lines of the log.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from spudex import runner  # noqa: E402
+
+
+def _old_append(session_id: str, text: str) -> None:
+    meta = runner._read_meta_file(runner._paths(session_id)[0])
+    seq = int(meta.get("log_seq") or 0) + 1
+    entry = {"seq": seq, "ts": time.time(), "stream": "stdout", "level": "info", "text": text}
+    with runner._paths(session_id)[1].open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    meta["log_seq"] = seq
+    meta["updated_ts"] = entry["ts"]
+    runner._paths(session_id)[0].write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _old_read(session_id: str, after_seq: int, limit: int) -> int:
+    entries = []
+    with runner._paths(session_id)[1].open("r", encoding="utf-8") as handle:
+        for line in handle:
+            entry = json.loads(line)
+            if int(entry.get("seq") or 0) <= after_seq:
+                continue
+            entries.append(entry)
+            if len(entries) >= limit:
+                break
+    return len(entries)
+
+
+def _time_ms(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) * 1000.0 / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    text = "compiling module " + "x" * 160
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TATER_SPUDEX_LOG_META_FLUSH_S"] = "2"
+        runner.SPUDEX_DIR = Path(tmp) / "spudex"
+        runner.SESSIONS_DIR = runner.SPUDEX_DIR / "sessions"
+        old_id = runner.create_spudex_session(label="old", source="bench")["id"]
+        new_id = runner.create_spudex_session(label="new", source="bench")["id"]
+
+        started = time.perf_counter()
+        for _ in range(args.lines):
+            _old_append(old_id, text)
+        old_s = time.perf_counter() - started
+        started = time.perf_counter()
+        for _ in range(args.lines):
+            runner.append_session_log(new_id, stream="stdout", text=text)
+        new_s = time.perf_counter() - started
+        runner.flush_spudex_log_meta()
+
+        cursor = args.lines - 50
+        print(f"{args.lines} log lines")
+        print(f"append          old {args.lines / old_s:9.0f} lines/s   new {args.lines / new_s:9.0f} lines/s")
+        print(
+            f"poll 50 behind  old {_time_ms(lambda: _old_read(old_id, cursor, 500), args.repeat):8.3f} ms   "
+            f"new {_time_ms(lambda: runner.read_spudex_logs(new_id, after_seq=cursor, limit=500), args.repeat):8.3f} ms"
+        )
+        print(f"tail 160        new {_time_ms(lambda: runner.read_spudex_logs(new_id, limit=160, tail=True), args.repeat):8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Compare STT CPU-seconds for full-buffer vs LocalAgreement streaming partials.
+
+Feeds a synthetic utterance through a fake local STT whose cost is linear in
+the audio it is given (one pure-Python pass over every sample, like a model's
+front end). "old" re-transcribes the whole buffer on every partial tick and
+again at end-of-utterance; "new" uses LocalAgreementStream, which only sends
+the current window and re-runs just the tail for the final transcript.
+"""
+from __future__ import annotations
+
+import argparse
+import array
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tater_voice.voice_pipeline.backends import LocalAgreementStream  # noqa: E402
+
+RATE = 16000
+WORD_S = 0.45
+
+
+def _utterance(seconds: float) -> bytes:
+    samples = array.array("h")
+    per_word = int(RATE * WORD_S)
+    for index in range(int(seconds / WORD_S)):
+        samples.extend([index % 30000 + 1] * per_word)
+    return samples.tobytes()
+
+
+class _FakeSTT:
+    # Each constant run of samples is one word; a run shorter than 0.3 s at the
+    # end of the clip is still "being spoken" and comes back truncated.
+    def __init__(self) -> None:
+        self.cpu_s = 0.0
+        self.audio_s = 0.0
+
+    def __call__(self, data: bytes) -> str:
+        started = time.process_time()
+        samples = array.array("h")
+        samples.frombytes(data)
+        words = []
+        run_value, run_len = None, 0
+        for value in samples:
+            if value == run_value:
+                run_len += 1
+                continue
+            if run_value is not None:
+                words.append(f"w{run_value}")
+            run_value, run_len = value, 1
+        if run_value is not None:
+            words.append(f"w{run_value}" if run_len >= int(RATE * 0.3) else f"w{run_value}-")
+        self.cpu_s += time.process_time() - started
+        self.audio_s += len(data) / (RATE * 2)
+        return " ".join(words)
+
+
+def _run_old(audio: bytes, tick_bytes: int) -> tuple[str, _FakeSTT]:
+    stt = _FakeSTT()
+    for end in range(tick_bytes, len(audio) + 1, tick_bytes):
+        stt(audio[:end])
+    return stt(audio), stt
+
+
+def _run_new(audio: bytes, tick_bytes: int) -> tuple[str, _FakeSTT]:
+    stt = _FakeSTT()
+    stream = LocalAgreementStream(RATE * 2, 2)
+    for end in range(tick_bytes, len(audio) + 1, tick_bytes):
+        stream.feed(end, stt(audio[stream.window_start:end]))
+    return stream.finalize(stt(audio[stream.window_start:])), stt
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--interval", type=float, default=0.5, help="partial STT tick in seconds of audio")
+    args = parser.parse_args()
+
+    audio = _utterance(max(1.0, float(args.seconds)))
+    tick_bytes = max(2, int(RATE * float(args.interval)) * 2)
+    old_text, old_stt = _run_old(audio, tick_bytes)
+    new_text, new_stt = _run_new(audio, tick_bytes)
+
+    print(f"utterance={len(audio) / (RATE * 2):.1f}s tick={args.interval:.2f}s")
+    print(f"{'mode':<8}{'stt cpu s':>12}{'audio fed s':>14}")
+    print(f"{'old':<8}{old_stt.cpu_s:>12.3f}{old_stt.audio_s:>14.1f}")
+    print(f"{'new':<8}{new_stt.cpu_s:>12.3f}{new_stt.audio_s:>14.1f}")
+    print(f"final transcripts match: {old_text == new_text}")
+    return 0 if old_text == new_text else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
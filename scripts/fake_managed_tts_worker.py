@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Stand-in for managed_tts_worker.py that speaks the real frame protocol.
+
+Each sentence takes TATER_FAKE_TTS_SENTENCE_S seconds to "synthesize" and
+produces TATER_FAKE_TTS_AUDIO_S seconds of a 24 kHz sine tone; an unsplit
+request costs the same per sentence, in one piece. When TATER_FAKE_TTS_LOG is
+set, every synthesized text is appended to it.
+TATER_FAKE_TTS_NOISE makes each sentence print to stdout the way chatty model
+libraries do.
+"""
+from __future__ import annotations
+
+import array
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import managed_tts_worker  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def _generate(_backend: str, row: Dict[str, Any]) -> Tuple[bytes, int]:
+    sentences = max(1, len(managed_tts_worker.split_sentences(str(row.get("text") or ""))))
+    time.sleep(sentences * float(os.getenv("TATER_FAKE_TTS_SENTENCE_S", "0.1")))
+    if os.getenv("TATER_FAKE_TTS_NOISE"):
+        print(f"generating: {row.get('text')}", flush=True)
+        os.write(1, b"progress 50%\n")
+    log_path = os.getenv("TATER_FAKE_TTS_LOG", "")
+    if log_path:
+        with open(log_path, "a", encoding="utf-8") as handle:
+            handle.write(str(row.get("text") or "") + "\n")
+    frames = int(SAMPLE_RATE * float(os.getenv("TATER_FAKE_TTS_AUDIO_S", "0.5")))
+    tone = array.array("h", (int(8000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)) for i in range(frames)))
+    if sys.byteorder != "little":
+        tone.byteswap()
+    return tone.tobytes() * sentences, SAMPLE_RATE
+
+
+if __name__ == "__main__":
+    backend = sys.argv[sys.argv.index("--backend") + 1] if "--backend" in sys.argv else "qwen3_tts"
+    raise SystemExit(managed_tts_worker.serve(backend, generate=_generate))
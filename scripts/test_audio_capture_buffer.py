@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tater_voice import voice_pipeline as vp
+from tater_voice.voice_pipeline.conversation import AudioCaptureBuffer
+
+
+def _session(**kwargs) -> vp.VoiceSessionRuntime:
+    return vp.VoiceSessionRuntime(
+        selector="sat",
+        session_id="s1",
+        conversation_id="c1",
+        wake_word="tater",
+        audio_format={"rate": 16000, "width": 2, "channels": 1},
+        started_ts=0.0,
+        startup_gate_until_ts=0.0,
+        **kwargs,
+    )
+
+
+class AudioCaptureBufferTests(unittest.TestCase):
+    def test_views_are_read_only_windows_over_one_copy(self) -> None:
+        buffer = AudioCaptureBuffer(64)
+        buffer.extend(b"abcd")
+        buffer.extend(bytearray(b"efgh"))
+
+        first = buffer.view()
+        second = buffer.tail(3)
+        self.assertEqual(bytes(first), b"abcdefgh")
+        self.assertEqual(bytes(second), b"fgh")
+        self.assertEqual(bytes(buffer.head(2)), b"ab")
+        self.assertEqual(buffer[2:4], b"cd")
+        self.assertTrue(first.readonly)
+        self.assertIs(first.obj, second.obj)
+
+    def test_growth_past_capacity_keeps_existing_views_valid(self) -> None:
+        buffer = AudioCaptureBuffer(16)
+        buffer.extend(b"x" * 10)
+        early = buffer.view()
+
+        buffer.extend(b"y" * 10000)
+
+        self.assertEqual(bytes(early), b"x" * 10)
+        self.assertEqual(len(buffer), 10010)
+        self.assertEqual(bytes(buffer.tail(2)), b"yy")
+
+    def test_preroll_region_is_tracked(self) -> None:
+        session = _session(max_audio_bytes=4096)
+        session.audio_buffer.extend(b"\x01\x00" * 10)
+        session.startup_preroll_buffer.extend(b"\x02\x00" * 4)
+        session.startup_preroll_max_bytes = 64
+
+        self.assertEqual(session.audio_buffer.capacity, 4096)
+        self.assertEqual(vp._apply_startup_preroll(session), 8)
+        self.assertEqual(bytes(session.audio_buffer.preroll()), b"\x02\x00" * 4)
+
+    def test_stt_window_trims_silence_without_copying(self) -> None:
+        session = _session()
+        session.audio_buffer.extend(b"\x00\x01" * 32000)
+        session.silence_duration_s = 1.5
+
+        with mock.patch.object(vp, "_get_float_setting", return_value=0.5):
+            window = vp._stt_audio_bytes_for_transcription(session)
+
+        self.assertIsInstance(window, memoryview)
+        self.assertEqual(len(window), 64000 - 32000)
+        self.assertIs(window.obj, session.audio_buffer.view().obj)
+
+
+if __name__ == "__main__":
+    unittest.main()
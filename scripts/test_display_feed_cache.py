@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import integration_runtime
+import integration_runtime_store
+from tater_voice import display_bus, display_feed
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.strings: dict = {}
+        self.hashes: dict = {}
+        self.zsets: dict = {}
+        self.lists: dict = {}
+        self.calls: list = []
+
+    def __getattribute__(self, name):
+        attr = object.__getattribute__(self, name)
+        if callable(attr) and not name.startswith("_"):
+            object.__getattribute__(self, "calls").append(name)
+        return attr
+
+    def exists(self, key):
+        return int(key in self.strings or key in self.hashes or key in self.lists)
+
+    def get(self, key):
+        return self.strings.get(key)
+
+    def mget(self, keys):
+        return [self.strings.get(key) for key in keys]
+
+    def incr(self, key):
+        self.strings[key] = str(int(self.strings.get(key) or 0) + 1)
+        return int(self.strings[key])
+
+    def hset(self, key, field, value):
+        target = self.hashes.setdefault(key, {})
+        created = field not in target
+        target[field] = str(value)
+        return int(created)
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hmget(self, key, fields):
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zrange(self, key, start, end, withscores=False):
+        rows = sorted(self.zsets.get(key, {}).items(), key=lambda row: row[1])
+        rows = rows[start : None if end == -1 else end + 1]
+        return rows if withscores else [member for member, _score in rows]
+
+    def zrangebyscore(self, key, low, high, withscores=False):
+        rows = [(member, score) for member, score in self.zsets.get(key, {}).items() if score >= low]
+        return rows if withscores else [member for member, _score in rows]
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+
+    def ltrim(self, key, start, end):
+        rows = self.lists.get(key) or []
+        self.lists[key] = rows[start:] if end == -1 else rows[start : end + 1]
+
+    def lrange(self, key, start, end):
+        rows = self.lists.get(key) or []
+        return rows[start : None if end == -1 else end + 1]
+
+
+class DisplayFeedCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.redis = _FakeRedis()
+        patcher = mock.patch.object(integration_runtime, "_enabled_integration_ids", return_value={"homeassistant"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        clock = mock.patch.object(
+            display_feed,
+            "_local_clock",
+            return_value={"epoch": 0.0, "iso": "", "date": "Friday Oct 16", "time": "9:41", "ampm": "AM"},
+        )
+        clock.start()
+        self.addCleanup(clock.stop)
+        nudge = mock.patch.object(display_bus, "_schedule_display_refresh_nudge")
+        nudge.start()
+        self.addCleanup(nudge.stop)
+        for entity_id, state in (("sensor.outdoor", "71"), ("sensor.garage", "60")):
+            self._set_state(entity_id, state)
+
+    def _set_state(self, entity_id: str, state: str) -> None:
+        integration_runtime_store.set_state(
+            self.redis,
+            "homeassistant",
+            entity_id,
+            {"entity_id": entity_id, "state": state, "attributes": {"unit_of_measurement": "°F"}},
+        )
+
+    def _compose(self, etag: str = "", **query):
+        return display_feed.compose_display_feed(query or {"temp_out": "sensor.outdoor"}, client=self.redis, if_none_match=etag)
+
+    def test_unchanged_poll_returns_no_body_until_a_referenced_entity_changes(self) -> None:
+        etag, feed = self._compose()
+        self.assertEqual(feed["values"], {"temp_out": 71.0})
+
+        self._set_state("sensor.garage", "61")
+        self.assertEqual(self._compose(etag), (etag, None))
+        self.assertEqual(self._compose(f'W/{etag}'), (etag, None))
+
+        self._set_state("sensor.outdoor", "72")
+        next_etag, feed = self._compose(etag)
+        self.assertNotEqual(next_etag, etag)
+        self.assertEqual(feed["text"], {"temp_out": "72 °F"})
+
+    def test_display_events_change_the_etag_and_idle_polls_skip_the_list_read(self) -> None:
+        etag, feed = self._compose()
+        self.assertEqual(feed["events"], [])
+        display_bus.publish_display_event({"title": "Doorbell", "kind": "doorbell"}, client=self.redis)
+
+        etag_with_event, feed = self._compose(etag)
+        self.assertEqual([event["title"] for event in feed["events"]], ["Doorbell"])
+        self.redis.calls.clear()
+        self.assertEqual(self._compose(etag_with_event), (etag_with_event, None))
+        self.assertNotIn("lrange", self.redis.calls)
+        self.assertEqual(display_bus.list_display_events(after_seq=1, client=self.redis)["events"], [])
+
+    def test_saved_profile_slot_map_is_reused_until_profiles_change(self) -> None:
+        profile = {"target": "kitchen", "template": "s3box_display", "slots": {"temp_out": "sensor.outdoor"}}
+        self.redis.hset(display_feed._DISPLAY_PROFILE_HASH_KEY, "kitchen", json.dumps(profile))
+        _etag, feed = self._compose(target="kitchen")
+        self.assertEqual(list(feed["slots"]), ["temp_out"])
+
+        profile["slots"] = {"garage": "sensor.garage"}
+        self.redis.hset(display_feed._DISPLAY_PROFILE_HASH_KEY, "kitchen", json.dumps(profile))
+        self.redis.calls.clear()
+        _etag, feed = self._compose(target="kitchen")
+        self.assertEqual(list(feed["slots"]), ["temp_out"])
+        self.assertNotIn("hget", self.redis.calls)
+
+        self.redis.incr(display_feed._DISPLAY_PROFILE_VERSION_KEY)
+        _etag, feed = self._compose(target="kitchen")
+        self.assertEqual(feed["values"], {"garage": 60.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import tateros_app
+from event_ring import EventRing
+
+
+class EventRingTests(unittest.TestCase):
+    def test_publish_from_another_thread_wakes_every_subscriber(self) -> None:
+        ring = EventRing(maxlen=8)
+
+        async def run():
+            waiters = [asyncio.create_task(ring.wait_after(0, timeout=5.0)) for _ in range(3)]
+            while ring.subscriber_count() < 3:
+                await asyncio.sleep(0)
+            started = time.monotonic()
+            threading.Thread(target=ring.publish, args=({"type": "status"},)).start()
+            results = await asyncio.gather(*waiters)
+            return results, time.monotonic() - started
+
+        results, elapsed = asyncio.run(run())
+        self.assertEqual(results, [[(1, {"type": "status"})]] * 3)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(ring.subscriber_count(), 0)
+
+    def test_resume_after_sequence_and_bounded_history(self) -> None:
+        ring = EventRing(maxlen=3)
+        for index in range(5):
+            ring.publish({"n": index})
+
+        self.assertEqual([seq for seq, _event in ring.read_after(0)], [3, 4, 5])
+        self.assertEqual(ring.read_after(4), [(5, {"n": 4})])
+        self.assertEqual(ring.read_after(5), [])
+
+    def test_close_releases_waiters_and_rejects_publish(self) -> None:
+        ring = EventRing()
+
+        async def run():
+            waiter = asyncio.create_task(ring.wait_after(0, timeout=5.0))
+            await asyncio.sleep(0)
+            ring.close()
+            return await waiter
+
+        self.assertEqual(asyncio.run(run()), [])
+        self.assertEqual(ring.publish({"type": "late"}), 0)
+
+
+class _FakeRequest:
+    def __init__(self, headers: dict) -> None:
+        self.headers = headers
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+class ChatJobEventStreamTests(unittest.TestCase):
+    def test_last_event_id_resumes_without_replaying_events(self) -> None:
+        manager = tateros_app.ChatJobManager()
+        ring = EventRing()
+        manager.jobs["job"] = {"id": "job", "status": "running", "events": ring}
+        manager.order.append("job")
+        ring.publish({"type": "status", "status": "queued"})
+        ring.publish({"type": "response_chunk", "chunk": "hel"})
+        ring.publish({"type": "response_chunk", "chunk": "lo"})
+        ring.publish({"type": "done", "status": "done"})
+        ring.close()
+
+        async def collect():
+            with mock.patch.object(tateros_app, "chat_jobs", manager):
+                response = await tateros_app.chat_job_events("job", _FakeRequest({"last-event-id": "2"}))
+                return [chunk async for chunk in response.body_iterator]
+
+        frames = asyncio.run(collect())
+        self.assertTrue(frames[0].startswith("event: status"))
+        self.assertEqual([frame.split("\n", 1)[0] for frame in frames[1:]], ["id: 3", "id: 4"])
+        self.assertIn('"chunk": "lo"', frames[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
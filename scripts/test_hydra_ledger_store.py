@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from hydra import hydra_ledger as ledger  # noqa: E402
+
+
+class _MemoryRedis:
+    def __init__(self) -> None:
+        self.lists: dict = {}
+        self.values: dict = {}
+        self.ttls: dict = {}
+        self.mget_keys: list = []
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    def ltrim(self, key, start, end):
+        items = self.lists.get(key, [])
+        self.lists[key] = items[start:] if end == -1 else items[start : end + 1]
+        return True
+
+    def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+        if ex:
+            self.ttls[key] = ex
+        return True
+
+    def mget(self, keys):
+        self.mget_keys.extend(keys)
+        return [self.values.get(key) for key in keys]
+
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += int(self.lists.pop(key, None) is not None) + int(self.values.pop(key, None) is not None)
+        return removed
+
+
+def _write(redis, turn_id, *, tool="", ok=True, outcome="done", platform="webui", timestamp_offset=0):
+    ledger.write_hydra_ledger(
+        redis_client=redis,
+        platform=platform,
+        scope="session:test",
+        turn_id=turn_id,
+        llm="test-model",
+        user_message="turn on the porch lights " * 20,
+        planned_tool={"function": tool, "arguments": {"room": "porch"}} if tool else None,
+        validation_status={},
+        tool_result={"ok": ok, "summary_for_user": "Porch lights are on."} if tool else None,
+        checker_action="FINAL_ANSWER",
+        assistant_response="Done, the porch lights are on.",
+        outcome=outcome,
+        tool_ms=250,
+        total_ms=900,
+        agent_state={"goal": "lights"},
+        compact_tool_ref_fn=ledger.compact_tool_ref,
+        validation_status_for_ledger_fn=lambda **_kwargs: {"status": "ok", "reason": "ok"},
+        short_text_fn=lambda value, limit=0: str(value or "")[:limit or None],
+        compact_agent_state_json_fn=lambda *_args, **_kwargs: json.dumps({"goal": "lights", "notes": "x" * 3000}),
+        agent_state_hash_fn=lambda *_args, **_kwargs: "state-hash",
+        configured_max_ledger_items_fn=lambda _redis: 50,
+        schema_version="2",
+        agent_state_ledger_max_chars=4000,
+        allowed_planner_kinds=("answer", "tool"),
+    )
+
+
+class HydraLedgerStoreTests(unittest.TestCase):
+    def test_summary_row_is_small_and_payload_is_compressed_with_shorter_retention(self) -> None:
+        redis = _MemoryRedis()
+        _write(redis, "turn-1", tool="lights_on")
+
+        raw_row = redis.lists["tater:hydra:ledger:webui"][0]
+        row = json.loads(raw_row)
+        self.assertEqual(row["planned_tool"]["function"], "lights_on")
+        self.assertEqual((row["tool_ms"], row["total_ms"], row["tool_result_ok"]), (250, 900, True))
+        self.assertNotIn("state_snapshot", row)
+        self.assertNotIn("user_message", row)
+        self.assertLess(len(raw_row), 800)
+
+        payload_key = ledger.ledger_payload_key("turn-1")
+        self.assertEqual(redis.ttls[payload_key], ledger.LEDGER_PAYLOAD_TTL_SECONDS)
+        self.assertLess(len(redis.values[payload_key]), len(json.dumps(ledger.unpack_ledger_payload(redis.values[payload_key]))))
+
+        full = ledger.attach_ledger_payloads(redis, [row])[0]
+        self.assertEqual(full["assistant_response"], "Done, the porch lights are on.")
+        self.assertIn("notes", full["state_snapshot"])
+        self.assertEqual(full["tool_result"]["summary"], "Porch lights are on.")
+
+    def test_aggregates_need_no_payloads_and_legacy_rows_still_read(self) -> None:
+        redis = _MemoryRedis()
+        redis.rpush(
+            "tater:hydra:ledger:discord",
+            json.dumps({"timestamp": 1.0, "platform": "discord", "turn_id": "old", "outcome": "done", "user_message": "hi"}),
+        )
+        _write(redis, "a", tool="weather")
+        _write(redis, "b", tool="weather", ok=False, outcome="failed")
+        _write(redis, "c", tool="lights_on")
+        _write(redis, "d")
+
+        rows = ledger.load_ledger_rows(redis, ["tater:hydra:ledger:webui", "tater:hydra:ledger:discord"], limit=100)
+        summary = ledger.summarize_ledger_rows(rows)
+
+        self.assertEqual(redis.mget_keys, [])
+        self.assertEqual(summary["turns"], 5)
+        self.assertEqual(summary["platform_turns"], {"webui": 4, "discord": 1})
+        self.assertEqual(summary["outcomes"], {"done": 4, "failed": 1})
+        self.assertEqual(
+            [(row["tool"], row["calls"], row["failure_rate"]) for row in summary["tools"]],
+            [("weather", 2, 0.5), ("lights_on", 1, 0.0)],
+        )
+        self.assertEqual(ledger.summarize_ledger_rows(rows, since=10.0)["turns"], 4)
+
+        legacy = ledger.attach_ledger_payloads(redis, [rows[-1]])[0]
+        self.assertEqual(legacy["user_message"], "hi")
+        self.assertEqual(redis.mget_keys, [])
+
+    def test_clearing_a_ledger_drops_its_payloads(self) -> None:
+        redis = _MemoryRedis()
+        _write(redis, "a", tool="weather")
+        _write(redis, "b", platform="discord")
+
+        self.assertEqual(ledger.delete_ledger_keys(redis, ["tater:hydra:ledger:webui"]), 1)
+        self.assertNotIn(ledger.ledger_payload_key("a"), redis.values)
+        self.assertIn(ledger.ledger_payload_key("b"), redis.values)
+
+
+if __name__ == "__main__":
+    unittest.main()
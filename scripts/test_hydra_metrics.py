@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import hydra  # noqa: E402
+from hydra import hydra_ledger as ledger  # noqa: E402
+from hydra import hydra_metrics as metrics  # noqa: E402
+
+
+class _MemoryRedis:
+    def __init__(self) -> None:
+        self.strings: dict = {}
+        self.hashes: dict = {}
+        self.ttls: dict = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=False):
+        client = self
+
+        class _Pipe:
+            def __init__(self) -> None:
+                self.ops = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+            def execute(self):
+                client.round_trips += 1
+                return [getattr(client, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+        return _Pipe()
+
+    def incrby(self, key, amount):
+        self.strings[key] = int(self.strings.get(key, 0)) + int(amount)
+        return self.strings[key]
+
+    def hincrby(self, key, field, amount):
+        row = self.hashes.setdefault(key, {})
+        row[field] = int(row.get(field, 0)) + int(amount)
+        return row[field]
+
+    def expire(self, key, seconds):
+        self.ttls[key] = int(seconds)
+        return True
+
+    def hgetall(self, key):
+        return {field: str(value) for field, value in self.hashes.get(key, {}).items()}
+
+    def hkeys(self, key):
+        return list(self.hashes.get(key, {}))
+
+    def hdel(self, key, *fields):
+        row = self.hashes.get(key, {})
+        return sum(1 for field in fields if row.pop(field, None) is not None)
+
+    def scan_iter(self, match="*"):
+        return [key for key in list(self.strings) + list(self.hashes) if fnmatch.fnmatch(key, match)]
+
+
+def _write_turn(redis, platform, *, total_ms, role_ms=None, tool_ms=(), role_tokens=None, tools=0, failures=0):
+    ledger.write_hydra_metrics(
+        redis_client=redis,
+        platform=platform,
+        total_tools_called=tools,
+        total_repairs=0,
+        validation_failures=0,
+        tool_failures=failures,
+        normalize_platform_fn=lambda value: value,
+        total_ms=total_ms,
+        role_ms=role_ms or {},
+        tool_ms=tool_ms,
+        role_tokens=role_tokens or {},
+    )
+
+
+class HydraMetricsTests(unittest.TestCase):
+    def test_turn_is_written_in_one_pipeline_with_lifetime_totals_and_buckets(self) -> None:
+        redis = _MemoryRedis()
+        _write_turn(
+            redis,
+            "discord",
+            total_ms=4200,
+            role_ms={"astraeus": 900, "thanatos": 300, "hermes": 1800},
+            tool_ms=[("weather_forecast", 1200), ("weather_forecast", 80)],
+            role_tokens={"astraeus": {"prompt_tokens": 1500, "completion_tokens": 40}, "hermes": {"prompt_tokens": 900}},
+            tools=2,
+            failures=1,
+        )
+
+        self.assertEqual(redis.round_trips, 1)
+        self.assertEqual(redis.strings["tater:hydra:metrics:total_turns"], 1)
+        self.assertEqual(redis.strings["tater:hydra:metrics:tool_failures:discord"], 1)
+        self.assertEqual(len([key for key in redis.hashes if ":minute:" in key or ":hour:" in key]), 2)
+        self.assertTrue(all(ttl > 0 for ttl in redis.ttls.values()))
+
+        now = max(int(key.rsplit(":", 1)[-1]) for key in redis.hashes if ":minute:" in key)
+        result = metrics.read_hydra_metric_range(redis, start_ts=now - 600, end_ts=now + 59)
+        total = result["total"]
+        self.assertEqual(total["counters"]["turns"], 1)
+        self.assertEqual(total["counters"]["tool_calls:weather_forecast"], 2)
+        self.assertEqual(total["counters"]["prompt_tokens"], 2400)
+        self.assertEqual(total["counters"]["prompt_tokens:astraeus"], 1500)
+        self.assertEqual(total["latency"]["turn"]["p95_ms"], 5000)
+        self.assertEqual(total["latency"]["role:hermes"]["p50_ms"], 2500)
+        self.assertNotIn("role:minos", total["latency"])
+        self.assertEqual(total["latency"]["tool:weather_forecast"]["count"], 2)
+        self.assertEqual(total["latency"]["tool:weather_forecast"]["mean_ms"], 640)
+
+    def test_percentiles_past_the_last_bound_are_reported_as_overflow(self) -> None:
+        counts = [0] * (len(metrics.LATENCY_BOUNDS_MS) + 1)
+        counts[0], counts[-1] = 90, 10
+
+        self.assertEqual(metrics.percentile_ms(counts, 0.50), 50)
+        self.assertIsNone(metrics.percentile_ms(counts, 0.95))
+        summary = metrics._summarize_histogram(counts, sum_ms=90 * 40 + 10 * 120_000)
+        self.assertEqual((summary["p99_ms"], summary["overflow_count"]), (None, 10))
+
+    def test_range_read_is_one_round_trip_and_filters_platforms(self) -> None:
+        redis = _MemoryRedis()
+        fields_fast = metrics.turn_metric_fields(
+            platform="webui", counters={"turns": 1}, total_ms=90, role_ms={}, tool_ms=[], role_tokens={}
+        )
+        fields_slow = metrics.turn_metric_fields(
+            platform="voice_core", counters={"turns": 1}, total_ms=12000, role_ms={}, tool_ms=[], role_tokens={}
+        )
+        start = 1_700_000_000 - 1_700_000_000 % 3600
+        batch = redis.pipeline()
+        for minute in range(30):
+            metrics.queue_turn_metrics(batch, fields_fast, now=start + minute * 60)
+            metrics.queue_turn_metrics(batch, fields_slow if minute % 10 == 0 else fields_fast, now=start + minute * 60)
+        batch.execute()
+
+        redis.round_trips = 0
+        minutes = metrics.read_hydra_metric_range(redis, start_ts=start, end_ts=start + 3599)
+        self.assertEqual(redis.round_trips, 1)
+        self.assertEqual(len(minutes["buckets"]), 30)
+        self.assertEqual(minutes["total"]["counters"]["turns"], 60)
+        self.assertEqual(minutes["total"]["latency"]["turn"]["p95_ms"], 100)
+        self.assertEqual(minutes["total"]["latency"]["turn"]["p99_ms"], 30000)
+
+        hours = metrics.read_hydra_metric_range(redis, start_ts=start, end_ts=start, resolution="hour", platforms=["webui"])
+        self.assertEqual(len(hours["buckets"]), 1)
+        self.assertEqual(hours["total"]["counters"]["turns"], 57)
+        self.assertEqual(hours["total"]["latency"]["turn"]["p99_ms"], 100)
+
+        self.assertGreater(metrics.clear_hydra_metric_buckets(redis, "voice_core"), 0)
+        cleared = metrics.read_hydra_metric_range(redis, start_ts=start, end_ts=start, resolution="hour")
+        self.assertEqual(cleared["total"]["counters"]["turns"], 57)
+
+
+class _NullRedis:
+    """Accepts any command; reads come back empty."""
+
+    def __getattr__(self, name):
+        def command(*_args, **_kwargs):
+            if name == "hgetall":
+                return {}
+            if name in {"lrange", "keys", "scan_iter", "smembers", "hkeys", "mget", "hmget", "execute"}:
+                return []
+            if name == "pipeline":
+                return self
+            return None
+
+        return command
+
+
+class _TwoToolRoundsClient:
+    """Plans two list_tools steps; every Thanatos round costs 100 prompt tokens."""
+
+    def __init__(self) -> None:
+        self.prompt_tokens = 0
+        self.thanatos_rounds = 0
+
+    def get_perf_stats(self, reset=False):
+        return {"prompt_tokens": self.prompt_tokens, "completion_tokens": self.prompt_tokens // 10}
+
+    async def chat(self, messages=None, **kwargs):
+        namespace = kwargs.get("cache_namespace")
+        if namespace == "hydra:astraeus":
+            steps = [
+                {"id": "s1", "intent": "list the tools", "tool": "list_tools"},
+                {"id": "s2", "intent": "list them again", "tool": "list_tools"},
+            ]
+            return {"message": {"content": json.dumps({"mode": "execute", "goal": "list tools", "steps": steps})}}
+        if namespace == "hydra:thanatos":
+            self.thanatos_rounds += 1
+            self.prompt_tokens += 100
+            if self.thanatos_rounds <= 2:
+                return {"message": {"content": '{"function":"list_tools","arguments":{}}'}}
+        return {"message": {"content": "Here are the tools."}}
+
+
+class HydraTurnMetricsTests(unittest.TestCase):
+    def test_thanatos_tokens_add_up_across_rounds(self) -> None:
+        client = _TwoToolRoundsClient()
+        with mock.patch.object(hydra, "_write_hydra_metrics") as write_metrics:
+            asyncio.run(
+                hydra._run_hydra_turn_impl(
+                    llm_client=client,
+                    platform="webui",
+                    history_messages=[],
+                    registry={},
+                    user_text="what tools do you have",
+                    scope="session:test",
+                    redis_client=_NullRedis(),
+                )
+            )
+
+        self.assertEqual(client.thanatos_rounds, 2)
+        role_tokens = write_metrics.call_args.kwargs["role_tokens"]
+        self.assertEqual(role_tokens["thanatos"], {"prompt_tokens": 200, "completion_tokens": 20})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1154,6 +1154,148 @@ class PromptCacheLayoutTests(unittest.TestCase):
         )
         self.assertGreater(prompt.index(marker), prompt.index("Execution role"))
 
+    def test_tool_fragments_are_reused_until_the_enabled_map_changes(self):
+        import hydra
+
+        registry = {
+            f"verba_{index}": SimpleNamespace(name=f"verba_{index}", description=f"Tool {index}", platforms=["webui"])
+            for index in range(6)
+        }
+        calls = []
+
+        def enabled(name):
+            calls.append(name)
+            return name != "verba_3"
+
+        enabled.enabled_version = "v1"
+        hydra.tool_index_helpers.clear_tool_fragment_cache()
+        first = hydra._hydra_tool_fragments(platform="webui", registry=registry, enabled_predicate=enabled)
+        built_calls = len(calls)
+        second = hydra._hydra_tool_fragments(platform="webui", registry=dict(registry), enabled_predicate=enabled)
+
+        self.assertIs(second["tool_index"], first["tool_index"])
+        self.assertEqual(len(calls), built_calls)
+        self.assertNotIn("verba_3", first["execution_tool_ids"])
+        self.assertIn("verba_5", first["capability_catalog"])
+
+        enabled.enabled_version = "v2"
+        third = hydra._hydra_tool_fragments(platform="webui", registry=registry, enabled_predicate=enabled)
+        self.assertIsNot(third["tool_index"], first["tool_index"])
+        self.assertGreater(len(calls), built_calls)
+
+        rows = hydra.runtime_kernel_tool_rows(platform="webui")
+        edited = [dict(row, description="Edited hint") if index == 0 else row for index, row in enumerate(rows)]
+        with mock.patch.object(hydra, "runtime_kernel_tool_rows", return_value=edited):
+            reworded = hydra._hydra_tool_fragments(platform="webui", registry=registry, enabled_predicate=enabled)
+        self.assertIsNot(reworded["tool_index"], third["tool_index"])
+
+        unversioned = hydra._hydra_tool_fragments(
+            platform="webui",
+            registry=registry,
+            enabled_predicate=lambda name: name != "verba_3",
+        )
+        self.assertEqual(unversioned["tool_index"], first["tool_index"])
+
+    def test_astraeus_and_thanatos_heads_stay_byte_identical_across_turns(self):
+        import hydra
+
+        fragments = hydra._hydra_tool_fragments(
+            platform="webui",
+            registry={"weather": SimpleNamespace(name="weather", description="Forecasts", platforms=["webui"])},
+            enabled_predicate=None,
+        )
+        preamble = "Platform: Web UI chat."
+
+        class Client:
+            def __init__(self):
+                self.prompts = []
+
+            async def chat(self, messages, **_kwargs):
+                self.prompts.append(messages)
+                return {"message": {"content": '{"mode":"chat","goal":"reply","steps":[]}'}}
+
+        client = Client()
+        for text in ("what is the weather", "and tomorrow?"):
+            asyncio.run(
+                hydra._run_astraeus_plan(
+                    llm_client=client,
+                    platform="webui",
+                    current_user_text=text,
+                    turn_request_text=text,
+                    topic_seed="",
+                    topic_shift_seed=False,
+                    history=[{"role": "user", "content": "hi"}],
+                    prior_state=None,
+                    memory_context=None,
+                    capability_catalog=fragments["capability_catalog"],
+                    available_tool_ids=set(fragments["execution_tool_ids"]),
+                    platform_preamble=preamble,
+                    max_tokens=None,
+                )
+            )
+        astraeus_head = client.prompts[0][:3]
+        self.assertIn("stable execution catalog", astraeus_head[-1]["content"])
+        self.assertGreaterEqual(
+            hydra.tool_index_helpers.shared_prompt_prefix_chars(*client.prompts),
+            hydra.tool_index_helpers.shared_prompt_prefix_chars(astraeus_head, astraeus_head),
+        )
+
+        class NullRedis:
+            def __getattr__(self, name):
+                def command(*_args, **_kwargs):
+                    if name == "hgetall":
+                        return {}
+                    if name in {"lrange", "keys", "scan_iter", "smembers", "hkeys", "mget", "hmget", "execute"}:
+                        return []
+                    return self if name == "pipeline" else None
+
+                return command
+
+        class TurnClient:
+            def __init__(self):
+                self.thanatos_prompts = []
+
+            async def chat(self, messages, **kwargs):
+                namespace = kwargs.get("cache_namespace")
+                if namespace == "hydra:astraeus":
+                    plan = (
+                        '{"mode":"execute","goal":"check the weather",'
+                        '"steps":[{"id":"s1","intent":"check the weather","tool":"weather"}]}'
+                    )
+                    return {"message": {"content": plan}}
+                if namespace == "hydra:thanatos":
+                    self.thanatos_prompts.append(messages)
+                return {"message": {"content": "Sunny all day."}}
+
+        turn_client = TurnClient()
+        turns = (
+            ("what is the weather", "Friday, July 17, 2026 at 10:30 PM"),
+            ("and tomorrow?", "Saturday, July 18, 2026 at 08:05 AM"),
+        )
+        for text, now_text in turns:
+            with mock.patch.object(hydra, "_current_time_prompt", return_value=f"Current Date and Time: {now_text}"):
+                asyncio.run(
+                    hydra._run_hydra_turn_impl(
+                        llm_client=turn_client,
+                        platform="webui",
+                        history_messages=[],
+                        registry={"weather": SimpleNamespace(name="weather", description="Forecasts", platforms=["webui"])},
+                        user_text=text,
+                        scope="session:test",
+                        redis_client=NullRedis(),
+                        platform_preamble=preamble,
+                    )
+                )
+        self.assertEqual(len(turn_client.thanatos_prompts), 2)
+        thanatos_head = turn_client.thanatos_prompts[0][:2]
+        self.assertIn(preamble, thanatos_head[-1]["content"])
+        self.assertTrue(
+            any("Current Date and Time" in str(row.get("content")) for row in turn_client.thanatos_prompts[0][2:])
+        )
+        reused = hydra.tool_index_helpers.shared_prompt_prefix_chars(*turn_client.thanatos_prompts)
+        self.assertGreaterEqual(reused, hydra.tool_index_helpers.shared_prompt_prefix_chars(thanatos_head, thanatos_head))
+        self.assertNotIn("Current Date and Time", fragments["thanatos_system_prompt"])
+
 
 class TelemetryTests(unittest.TestCase):
     def test_ledger_keeps_parallel_stage_timings_separate(self):
@@ -1314,9 +1456,8 @@ class ChatRuntimeReuseTests(unittest.TestCase):
                 with manager.lock:
                     event_types = []
                     for job_id in job_ids:
-                        event_queue = manager.jobs[job_id]["events"]
-                        while not event_queue.empty():
-                            event_types.append(event_queue.get_nowait()["type"])
+                        event_ring = manager.jobs[job_id]["events"]
+                        event_types.extend(event["type"] for _seq, event in event_ring.read_after(0))
 
             self.assertEqual(len(set(loop_ids)), 1)
             self.assertIn("response_chunk", event_types)
@@ -1359,10 +1500,8 @@ class ChatRuntimeReuseTests(unittest.TestCase):
                 future.result(timeout=3)
 
                 with manager.lock:
-                    event_queue = manager.jobs[job_id]["events"]
-                    event_types = []
-                    while not event_queue.empty():
-                        event_types.append(event_queue.get_nowait()["type"])
+                    event_ring = manager.jobs[job_id]["events"]
+                    event_types = [event["type"] for _seq, event in event_ring.read_after(0)]
 
             self.assertNotIn("response_chunk", event_types)
             self.assertIn("done", event_types)
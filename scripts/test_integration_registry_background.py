@@ -13,6 +13,7 @@ REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
 class _FakeRedis:
     def __init__(self) -> None:
         self.hashes: dict[str, dict[str, str]] = {}
+        self.counter = 0
 
     def hset(self, name: str, key: str = "", value: str = "", mapping=None) -> int:
         target = self.hashes.setdefault(name, {})
@@ -27,6 +28,16 @@ class _FakeRedis:
         target[key] = value
         return 1 if created else 0
 
+    def exists(self, name: str) -> int:
+        return 1 if name in self.hashes else 0
+
+    def incr(self, name: str) -> int:
+        self.counter += 1
+        return self.counter
+
+    def zadd(self, name: str, mapping: dict) -> int:
+        return 0
+
 
 class IntegrationRegistryBackgroundTests(unittest.TestCase):
     def test_new_runtime_device_emits_one_registry_refresh_event(self) -> None:
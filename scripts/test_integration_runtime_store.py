@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+from redis.exceptions import ResponseError
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import integration_runtime_store as store
+
+
+def _seq(entry_id: str) -> int:
+    return int(str(entry_id).split("-", 1)[0])
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.strings: dict = {}
+        self.hashes: dict = {}
+        self.zsets: dict = {}
+        self.lists: dict = {}
+        self.streams: dict = {}
+        self.calls: list = []
+
+    def __getattribute__(self, name):
+        attr = object.__getattribute__(self, name)
+        if callable(attr) and not name.startswith("_"):
+            object.__getattribute__(self, "calls").append(name)
+        return attr
+
+    def exists(self, key):
+        return int(any(key in store for store in (self.strings, self.hashes, self.zsets, self.lists, self.streams)))
+
+    def delete(self, *keys):
+        for key in keys:
+            for rows in (self.strings, self.hashes, self.zsets, self.lists, self.streams):
+                rows.pop(key, None)
+
+    def get(self, key):
+        return self.strings.get(key)
+
+    def set(self, key, value):
+        self.strings[key] = str(value)
+
+    def incr(self, key):
+        self.strings[key] = str(int(self.strings.get(key) or 0) + 1)
+        return int(self.strings[key])
+
+    def hset(self, key, field, value):
+        target = self.hashes.setdefault(key, {})
+        created = field not in target
+        target[field] = str(value)
+        return int(created)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hmget(self, key, fields):
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    def hdel(self, key, field):
+        return int(self.hashes.get(key, {}).pop(field, None) is not None)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zrange(self, key, start, end, withscores=False):
+        rows = sorted(self.zsets.get(key, {}).items(), key=lambda row: row[1])
+        rows = rows[start : None if end == -1 else end + 1]
+        return rows if withscores else [member for member, _score in rows]
+
+    def zrangebyscore(self, key, low, high, withscores=False):
+        rows = [(member, score) for member, score in self.zsets.get(key, {}).items() if score >= low]
+        return rows if withscores else [member for member, _score in rows]
+
+    def lrange(self, key, start, end):
+        rows = self.lists.get(key) or []
+        return rows[start : None if end == -1 else end + 1]
+
+    def xadd(self, key, fields, id, maxlen=None, approximate=False):
+        rows = self.streams.setdefault(key, [])
+        if rows and _seq(id) <= _seq(rows[-1][0]):
+            raise ResponseError("The ID specified in XADD is equal or smaller than the target stream top item")
+        rows.append((id, dict(fields)))
+        if maxlen is not None:
+            del rows[:-maxlen]
+        return id
+
+    def xrange(self, key, min="-", max="+", count=None):
+        rows = [row for row in self.streams.get(key, []) if min == "-" or _seq(row[0]) >= _seq(min)]
+        return rows[:count] if count else rows
+
+    def xrevrange(self, key, max="+", min="-", count=None):
+        rows = list(reversed(self.streams.get(key, [])))
+        return rows[:count] if count else rows
+
+    def xlen(self, key):
+        return len(self.streams.get(key, []))
+
+
+def _append(redis, seq: int, kind: str = "state_changed") -> None:
+    record = {"seq": seq, "provider": "homeassistant", "kind": kind, "payload": {"n": seq}}
+    batch = store.redis_batch(redis)
+    store.queue_event_append(batch, record, json.dumps(record), max_events=3)
+    batch.execute()
+
+
+class IntegrationRuntimeStoreTests(unittest.TestCase):
+    def test_cursor_reads_return_only_newer_events_from_a_capped_stream(self) -> None:
+        redis = _FakeRedis()
+        for seq in range(1, 6):
+            _append(redis, seq)
+
+        self.assertEqual([row["seq"] for row in store.read_events(redis, after_seq=0)], [3, 4, 5])
+        self.assertEqual([row["seq"] for row in store.read_events(redis, after_seq=4)], [5])
+        self.assertEqual(store.read_events(redis, after_seq=5), [])
+        self.assertEqual([row["seq"] for row in store.recent_events(redis, limit=2)], [5, 4])
+        with self.assertRaises(ResponseError) as caught:
+            _append(redis, 4)
+        self.assertTrue(store.is_stale_event_id_error(caught.exception))
+        store.repair_event_seq(redis)
+        self.assertEqual(redis.get(store.EVENT_SEQ_KEY), "5")
+
+    def test_state_reads_pull_only_changed_records(self) -> None:
+        redis = _FakeRedis()
+        for index in range(20):
+            store.set_state(redis, "homeassistant", f"light.{index}", {"state": "off"})
+        store.set_state(redis, "unifi", "cam.door", {"state": "idle"})
+        records, version = store.state_records(redis)
+        self.assertEqual((len(records), version), (21, 21))
+
+        is_new, changed_version = store.set_state(redis, "homeassistant", "light.3", {"state": "on"})
+        redis.calls.clear()
+        changed, latest = store.state_records(redis, since_version=version)
+
+        self.assertFalse(is_new)
+        self.assertEqual(latest, changed_version)
+        self.assertEqual([(row["key"], row["payload"]) for row in changed], [("homeassistant:light.3", {"state": "on"})])
+        self.assertEqual(redis.calls.count("hgetall"), 1)
+        self.assertEqual(redis.calls.count("hmget"), 1)
+
+    def test_cleared_provider_drops_out_of_cached_records(self) -> None:
+        redis = _FakeRedis()
+        store.set_state(redis, "homeassistant", "light.a", {})
+        store.set_state(redis, "homeassistant", "light.b", {})
+        store.state_records(redis)
+
+        self.assertEqual(store.clear_provider_states(redis, ["homeassistant"]), 2)
+        self.assertEqual(store.state_records(redis)[0], [])
+        store.set_state(redis, "homeassistant", "light.c", {})
+        store.state_records(redis)
+        store.clear_provider_states(redis, ["homeassistant"])
+        store.set_state(redis, "homeassistant", "light.d", {})
+        self.assertEqual([row["id"] for row in store.state_records(redis)[0]], ["light.d"])
+
+    def test_delta_readers_see_cleared_providers(self) -> None:
+        redis = _FakeRedis()
+        store.set_state(redis, "homeassistant", "light.a", {})
+        store.set_state(redis, "unifi", "cam.door", {})
+        _records, version = store.state_records(redis)
+
+        store.clear_provider_states(redis, ["homeassistant"])
+        rows, latest, cleared = store.state_changes(redis, since_version=version)
+        self.assertEqual((rows, cleared), ([], ["homeassistant"]))
+        self.assertGreater(latest, version)
+
+        store.set_state(redis, "homeassistant", "light.b", {})
+        rows, newest, cleared = store.state_changes(redis, since_version=version)
+        self.assertEqual(([row["id"] for row in rows], cleared), (["light.b"], ["homeassistant"]))
+        self.assertEqual(store.state_changes(redis, since_version=newest)[1:], (newest, []))
+
+    def test_legacy_list_and_hash_are_migrated_once(self) -> None:
+        redis = _FakeRedis()
+        redis.lists[store.LEGACY_EVENTS_KEY] = [json.dumps({"seq": seq, "kind": "old"}) for seq in (3, 2, 1)]
+        redis.hashes[store.LEGACY_STATES_KEY] = {
+            "homeassistant:light.a": json.dumps({"provider": "homeassistant", "id": "light.a", "payload": {"state": "on"}})
+        }
+
+        self.assertEqual([row["seq"] for row in store.read_events(redis, after_seq=1)], [2, 3])
+        records, _version = store.state_records(redis)
+        self.assertEqual([(row["key"], row["payload"]) for row in records], [("homeassistant:light.a", {"state": "on"})])
+        self.assertFalse(redis.exists(store.LEGACY_EVENTS_KEY))
+        self.assertFalse(redis.exists(store.LEGACY_STATES_KEY))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from notify import inbox
+
+
+class _FakePipeline:
+    def __init__(self, client: "_FakeRedis") -> None:
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def _queue(*args):
+            self.calls.append((name, args))
+            return self
+
+        return _queue
+
+    def execute(self):
+        return [getattr(self.client, name)(*args) for name, args in self.calls]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict = {}
+        self.lists: dict = {}
+        self.lock = threading.Lock()
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def hset(self, key, field, value):
+        with self.lock:
+            self.hashes.setdefault(key, {})[field] = value
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hdel(self, key, *fields):
+        with self.lock:
+            return sum(1 for field in fields if self.hashes.get(key, {}).pop(field, None) is not None)
+
+    def rpush(self, key, value):
+        with self.lock:
+            self.lists.setdefault(key, []).append(value)
+
+    def lpop(self, key):
+        with self.lock:
+            rows = self.lists.get(key) or []
+            return rows.pop(0) if rows else None
+
+    def lindex(self, key, index):
+        rows = self.lists.get(key) or []
+        return rows[index] if -len(rows) <= index < len(rows) else None
+
+    def lrange(self, key, start, end):
+        rows = self.lists.get(key) or []
+        return rows[start : None if end == -1 else end + 1]
+
+    def lrem(self, key, count, value):
+        with self.lock:
+            rows = self.lists.get(key) or []
+            removed = 0
+            while value in rows and (count == 0 or removed < count):
+                rows.remove(value)
+                removed += 1
+            return removed
+
+    def ltrim(self, key, start, end):
+        with self.lock:
+            rows = self.lists.get(key) or []
+            self.lists[key] = rows[start:] if end == -1 else rows[start : end + 1]
+
+    def scan_iter(self, match=""):
+        prefix = match.rstrip("*")
+        return [key for key in list(self.lists) if key.startswith(prefix)]
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+
+
+def _item(item_id: str, targets: dict, created_at: float) -> dict:
+    return {"id": item_id, "created_at": created_at, "targets": targets, "message": item_id, "meta": {}}
+
+
+class LittleSpudInboxTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.redis = _FakeRedis()
+        patcher = mock.patch.object(inbox, "_legacy_migrated", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.phone = inbox.identity_tokens({"user_name": "alice", "device_name": "phone", "scope": ""}, {"id": "n1"})
+        self.tablet = inbox.identity_tokens({"user_name": "bob", "device_name": "tablet", "scope": ""}, {"id": "n2"})
+
+    def test_pop_reads_only_own_inboxes_oldest_first_and_consumes_once(self) -> None:
+        inbox.deliver(self.redis, _item("late", {"node_id": "n1"}, 20.0))
+        inbox.deliver(self.redis, _item("early", {"user": "alice"}, 10.0))
+        inbox.deliver(self.redis, _item("bob", {"device_id": "tablet"}, 5.0))
+        inbox.deliver(self.redis, _item("all", {"scope": "all"}, 30.0))
+
+        self.assertEqual(inbox.pop(self.redis, self.phone, consume=False)["id"], "early")
+        self.assertEqual([inbox.pop(self.redis, self.phone)["id"] for _ in range(3)], ["early", "late", "all"])
+        self.assertIsNone(inbox.pop(self.redis, self.phone))
+        self.assertEqual(inbox.pop(self.redis, self.tablet)["id"], "bob")
+        self.assertIsNone(inbox.pop(self.redis, self.tablet))
+
+    def test_pop_by_id_checks_targets_and_leaves_stale_ids_for_lazy_cleanup(self) -> None:
+        inbox.deliver(self.redis, _item("x", {"node_id": "n1", "user": "alice"}, 1.0))
+
+        self.assertIsNone(inbox.pop_by_id(self.redis, "x", self.tablet))
+        self.assertEqual(inbox.pop_by_id(self.redis, "x", self.phone)["id"], "x")
+        self.assertIsNone(inbox.pop(self.redis, self.phone))
+        self.assertEqual(self.redis.lists[inbox.inbox_key("user:alice")], [])
+
+    def test_legacy_shared_queue_is_migrated(self) -> None:
+        self.redis.rpush("notifyq:little_spud", json.dumps(_item("old", {"node_id": "n1"}, 1.0)))
+        self.redis.rpush("notifyq:little_spud", json.dumps({**_item("gone", {"node_id": "n1"}, 1.0), "meta": {"ttl_sec": 5}}))
+
+        self.assertEqual(inbox.pop(self.redis, self.phone)["id"], "old")
+        self.assertIsNone(inbox.pop(self.redis, self.phone))
+        self.assertEqual(self.redis.lists["notifyq:little_spud"], [])
+
+    def test_sweep_drops_expired_and_orphaned_items_and_caps_inboxes(self) -> None:
+        now = time.time()
+        inbox.deliver(self.redis, {**_item("expired", {"node_id": "n1"}, now - 100), "meta": {"ttl_sec": 10}})
+        inbox.deliver(self.redis, _item("live", {"node_id": "n1", "user": "bob"}, now - 100))
+        inbox.deliver(self.redis, _item("fresh", {"node_id": "n1"}, now))
+        self.redis.hset(inbox.ITEMS_KEY, "orphan", json.dumps(_item("orphan", {"node_id": "n9"}, now - 3600)))
+        self.redis.hset(inbox.ITEMS_KEY, "racing", json.dumps(_item("racing", {"node_id": "n9"}, now)))
+        self.redis.rpush(inbox.inbox_key("user:bob"), "consumed")
+
+        self.assertEqual(inbox.sweep(self.redis, now=now), 2)
+        self.assertEqual(sorted(self.redis.hashes[inbox.ITEMS_KEY]), ["fresh", "live", "racing"])
+        self.assertEqual(self.redis.lists[inbox.inbox_key("node:n1")], ["live", "fresh"])
+        self.assertEqual(self.redis.lists[inbox.inbox_key("user:bob")], ["live"])
+
+        with mock.patch.object(inbox, "INBOX_MAX_ITEMS", 3):
+            for index in range(5):
+                inbox.deliver(self.redis, _item(f"bulk{index}", {"device_id": "tablet"}, now + index))
+        self.assertEqual(self.redis.lists[inbox.inbox_key("device:tablet")], ["bulk2", "bulk3", "bulk4"])
+
+    def test_delivery_wakes_only_the_matching_long_poll(self) -> None:
+        fleet = [
+            inbox.identity_tokens({"user_name": f"user{index}", "device_name": f"dev{index}"}, {"id": f"node{index}"})
+            for index in range(30)
+        ]
+
+        async def run():
+            polls = [
+                asyncio.create_task(inbox.wait_next(self.redis, tokens, wait_seconds=0.5)) for tokens in fleet
+            ]
+            while inbox.waiters.count() < len(fleet):
+                await asyncio.sleep(0)
+            started = time.monotonic()
+            threading.Thread(
+                target=inbox.deliver, args=(self.redis, _item("ping", {"device_id": "dev7"}, time.time()))
+            ).start()
+            first = await polls[7]
+            latency = time.monotonic() - started
+            others = await asyncio.gather(*polls[:7], *polls[8:])
+            return first, latency, others
+
+        first, latency, others = asyncio.run(run())
+        self.assertEqual(first["id"], "ping")
+        self.assertLess(latency, 0.25)
+        self.assertEqual(others, [None] * 29)
+        self.assertEqual(inbox.waiters.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -71,17 +71,11 @@ class ManagedTtsTests(unittest.TestCase):
         worker = managed_tts._workers[managed_tts.QWEN_TTS_BACKEND]
         sent = {}
 
-        def fake_request(payload, *, acceleration, timeout):
+        def fake_stream(payload, *, acceleration, timeout):
             sent.update(payload)
-            output = Path(payload["output_path"])
-            with wave.open(str(output), "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(24000)
-                wav_file.writeframes(b"\x01\x00")
-            return {"ok": True, "output_path": str(output), "sample_rate": 24000}
+            yield b"\x01\x00", {"rate": 24000, "width": 2, "channels": 1}
 
-        with mock.patch.object(worker, "request", side_effect=fake_request):
+        with mock.patch.object(worker, "stream", side_effect=fake_stream):
             pcm, _audio_format = managed_tts.synthesize_managed_tts_pcm(
                 "Hello",
                 backend="qwen3_tts",
@@ -109,7 +103,7 @@ class ManagedTtsTests(unittest.TestCase):
         self.assertEqual(pcm, b"\x01\x00\x02\x00")
         self.assertEqual(audio_format, {"rate": 16000, "width": 2, "channels": 1})
 
-    def test_worker_wav_is_returned_as_pcm_and_removed(self) -> None:
+    def test_worker_stream_chunks_are_joined_as_pcm(self) -> None:
         clone_path = managed_tts.store_clone_audio(
             "qwen3_tts",
             filename="voice.wav",
@@ -117,16 +111,12 @@ class ManagedTtsTests(unittest.TestCase):
         )
         worker = managed_tts._workers[managed_tts.QWEN_TTS_BACKEND]
 
-        def fake_request(payload, *, acceleration, timeout):
-            output = Path(payload["output_path"])
-            with wave.open(str(output), "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(24000)
-                wav_file.writeframes(b"\x01\x00\x02\x00")
-            return {"ok": True, "output_path": str(output), "sample_rate": 24000}
+        def fake_stream(payload, *, acceleration, timeout):
+            audio_format = {"rate": 24000, "width": 2, "channels": 1}
+            yield b"\x01\x00", audio_format
+            yield b"\x02\x00", audio_format
 
-        with mock.patch.object(worker, "request", side_effect=fake_request):
+        with mock.patch.object(worker, "stream", side_effect=fake_stream):
             pcm, audio_format = managed_tts.synthesize_managed_tts_pcm(
                 "Hello",
                 backend="qwen3_tts",
@@ -138,7 +128,6 @@ class ManagedTtsTests(unittest.TestCase):
 
         self.assertEqual(pcm, b"\x01\x00\x02\x00")
         self.assertEqual(audio_format, {"rate": 24000, "width": 2, "channels": 1})
-        self.assertEqual(list((managed_tts.managed_tts_root("qwen3_tts") / "output").glob("*.wav")), [])
 
     def test_snapshot_only_reports_models_loaded_in_live_workers(self) -> None:
         worker = managed_tts._workers[managed_tts.QWEN_TTS_BACKEND]
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import managed_tts  # noqa: E402
+import managed_tts_worker  # noqa: E402
+from tater_voice import voice_pipeline  # noqa: E402
+
+SENTENCE_S = 0.2
+AUDIO_S = 0.25
+SPEECH = (
+    "The garage door has been open for twenty minutes. "
+    "Nobody is home right now, so I can close it for you. "
+    "The porch lights will also turn on at sunset tonight. "
+    "Let me know if you want the back door locked as well."
+)
+
+
+class ManagedTtsStreamingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.log_path = self.root / "sentences.log"
+        self.patchers = [
+            mock.patch.object(managed_tts, "agent_lab_path", side_effect=lambda *parts: self.root.joinpath(*parts)),
+            mock.patch.object(managed_tts, "ensure_managed_tts_environment", return_value=Path(sys.executable)),
+            mock.patch.object(managed_tts, "_WORKER_SCRIPT", REPO_ROOT / "scripts" / "fake_managed_tts_worker.py"),
+            mock.patch.dict(
+                os.environ,
+                {
+                    "TATER_FAKE_TTS_SENTENCE_S": str(SENTENCE_S),
+                    "TATER_FAKE_TTS_AUDIO_S": str(AUDIO_S),
+                    "TATER_FAKE_TTS_LOG": str(self.log_path),
+                },
+            ),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        managed_tts.clear_managed_tts_workers()
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+        self.temp_dir.cleanup()
+
+    def _kwargs(self):
+        return {"backend": "omnivoice", "acceleration": "cpu"}
+
+    def _synthesized(self):
+        return self.log_path.read_text(encoding="utf-8").splitlines() if self.log_path.exists() else []
+
+    def test_first_audio_arrives_before_the_whole_utterance(self) -> None:
+        managed_tts._workers["omnivoice"].request({"action": "ping"}, acceleration="cpu", timeout=30)
+
+        started = time.perf_counter()
+        pcm, audio_format = managed_tts.synthesize_managed_tts_pcm(SPEECH, **self._kwargs())
+        whole_utterance_s = time.perf_counter() - started
+        # The whole-clip path keeps the utterance together for prosody.
+        self.assertEqual(self._synthesized(), [SPEECH])
+
+        started = time.perf_counter()
+        stream = managed_tts.iter_managed_tts_pcm(SPEECH, **self._kwargs())
+        first_chunk, first_format = next(stream)
+        first_audio_s = time.perf_counter() - started
+        streamed = first_chunk + b"".join(chunk for chunk, _format in stream)
+
+        self.assertEqual(audio_format, {"rate": 24000, "width": 2, "channels": 1})
+        self.assertEqual(first_format, audio_format)
+        self.assertEqual(streamed, pcm)
+        self.assertEqual(len(self._synthesized()), 1 + 4)
+        self.assertEqual(len(pcm), 4 * int(24000 * AUDIO_S) * 2)
+        self.assertGreaterEqual(whole_utterance_s, 4 * SENTENCE_S)
+        self.assertLess(first_audio_s, whole_utterance_s / 2)
+
+    def test_concurrent_requests_interleave_sentences(self) -> None:
+        managed_tts._workers["omnivoice"].request({"action": "ping"}, acceleration="cpu", timeout=30)
+        first_audio = {}
+        results = {}
+
+        def speak(name: str) -> None:
+            started = time.perf_counter()
+            chunks = []
+            for chunk, _format in managed_tts.iter_managed_tts_pcm(SPEECH, **self._kwargs()):
+                first_audio.setdefault(name, time.perf_counter() - started)
+                chunks.append(chunk)
+            results[name] = b"".join(chunks)
+
+        threads = [threading.Thread(target=speak, args=(name,)) for name in ("kitchen", "office")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertEqual(results["kitchen"], results["office"])
+        self.assertEqual(len(self._synthesized()), 8)
+        # Neither request waits for the other's whole utterance before starting.
+        self.assertLess(max(first_audio.values()), 4 * SENTENCE_S)
+
+    def test_closing_a_stream_cancels_remaining_sentences(self) -> None:
+        stream = managed_tts.iter_managed_tts_pcm(SPEECH, **self._kwargs())
+        next(stream)
+        stream.close()
+
+        worker = managed_tts._workers["omnivoice"]
+        self.assertTrue(worker.request({"action": "ping"}, acceleration="cpu", timeout=30)["ok"])
+        self.assertLessEqual(len(self._synthesized()), 2)
+        self.assertEqual(worker.pending, {})
+
+        pcm, _audio_format = managed_tts.synthesize_managed_tts_pcm("Still working after a cancel.", **self._kwargs())
+        self.assertEqual(len(pcm), int(24000 * AUDIO_S) * 2)
+
+    def test_stray_worker_stdout_does_not_corrupt_frames(self) -> None:
+        with mock.patch.dict(os.environ, {"TATER_FAKE_TTS_NOISE": "1"}):
+            pcm, _audio_format = managed_tts.synthesize_managed_tts_pcm(SPEECH, **self._kwargs())
+        self.assertEqual(len(pcm), 4 * int(24000 * AUDIO_S) * 2)
+        self.assertIn("progress 50%", managed_tts._workers["omnivoice"].stderr_tail)
+
+    def test_garbage_frame_headers_are_rejected(self) -> None:
+        for header in (b"\x07\x00\x00\x00\x01\x00\x00\x00\x00", b"\x02\x00\x00\x00\x01\x7f\xff\xff\xff"):
+            with self.assertRaises(ValueError):
+                managed_tts_worker.read_frame(io.BytesIO(header + b"payload"))
+
+    def test_a_timed_out_request_leaves_the_others_running(self) -> None:
+        worker = managed_tts._workers["omnivoice"]
+        worker.request({"action": "ping"}, acceleration="cpu", timeout=30)
+        process = worker.process
+        results = {}
+
+        def speak() -> None:
+            stream = managed_tts.iter_managed_tts_pcm(SPEECH, **self._kwargs())
+            results["office"] = b"".join(chunk for chunk, _format in stream)
+
+        thread = threading.Thread(target=speak)
+        thread.start()
+        payload = {"action": "synthesize", "text": SPEECH}
+        with self.assertRaises(TimeoutError):
+            for _chunk in worker.stream(payload, acceleration="cpu", timeout=1.0):
+                pass
+        thread.join(timeout=30)
+
+        self.assertIs(worker.process, process)
+        self.assertEqual(len(results["office"]), 4 * int(24000 * AUDIO_S) * 2)
+
+    def test_async_stream_cancellation_cancels_the_worker_request(self) -> None:
+        async def speak_then_cancel() -> bytes:
+            chunks = []
+
+            async def consume() -> None:
+                async for chunk, _format in managed_tts.aiter_managed_tts_pcm(SPEECH, **self._kwargs()):
+                    chunks.append(chunk)
+                    task.cancel()
+
+            task = asyncio.ensure_future(consume())
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            full = b""
+            async for chunk, _format in managed_tts.aiter_managed_tts_pcm("Still working after a cancel.", **self._kwargs()):
+                full += chunk
+            return full
+
+        pcm = asyncio.run(speak_then_cancel())
+        self.assertEqual(len(pcm), int(24000 * AUDIO_S) * 2)
+        self.assertLessEqual(len(self._synthesized()), 3)
+        self.assertEqual(managed_tts._workers["omnivoice"].pending, {})
+
+    def test_async_stream_awaits_frames_on_the_loop(self) -> None:
+        async def speak() -> list:
+            return [chunk async for chunk, _format in managed_tts.aiter_managed_tts_pcm(SPEECH, **self._kwargs())]
+
+        with mock.patch.object(managed_tts.asyncio, "to_thread", wraps=asyncio.to_thread) as to_thread:
+            chunks = asyncio.run(speak())
+
+        self.assertEqual(len(chunks), 4)
+        # Only opening the request leaves the loop; frames arrive via the reader thread.
+        self.assertEqual(to_thread.call_count, 1)
+
+    def test_satellite_stream_sends_the_first_sentence_before_the_rest_is_synthesized(self) -> None:
+        managed_tts._workers["omnivoice"].request({"action": "ping"}, acceleration="cpu", timeout=30)
+        row = {"id": "stream", "text": SPEECH, "managed_kwargs": self._kwargs()}
+
+        async def fetch() -> tuple:
+            started = time.perf_counter()
+            body = b""
+            first_audio_s = 0.0
+            async for piece in voice_pipeline._iter_managed_tts_stream_response(row):
+                body += piece
+                if not first_audio_s and len(body) > 44:
+                    first_audio_s = time.perf_counter() - started
+            return body, first_audio_s, time.perf_counter() - started
+
+        body, first_audio_s, total_s = asyncio.run(fetch())
+
+        self.assertEqual(body[:4] + body[8:16], b"RIFFWAVEfmt ")
+        self.assertEqual(int.from_bytes(body[24:28], "little"), 24000)
+        self.assertEqual(len(body) - 44, 4 * int(24000 * AUDIO_S) * 2)
+        self.assertLess(first_audio_s, total_s / 2)
+        self.assertEqual(len(self._synthesized()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
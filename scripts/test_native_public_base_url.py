@@ -19,12 +19,10 @@ from tater_voice import voice_pipeline as vp  # noqa: E402
 
 class NativePublicBaseUrlTests(unittest.TestCase):
     def setUp(self) -> None:
-        with vp._tts_url_store_lock:
-            vp._tts_url_store.clear()
+        vp._tts_url_store.clear()
 
     def tearDown(self) -> None:
-        with vp._tts_url_store_lock:
-            vp._tts_url_store.clear()
+        vp._tts_url_store.clear()
 
     def test_public_base_url_takes_precedence_and_preserves_path(self) -> None:
         env = {
@@ -204,8 +202,7 @@ class NativePublicBaseUrlTests(unittest.TestCase):
             )
 
         stream_id = url.rsplit("/", 1)[-1]
-        with vp._tts_url_store_lock:
-            stored = bytes(vp._tts_url_store[stream_id]["body_bytes"])
+        stored = bytes(vp._fetch_tts_url(stream_id)["body"])
         self.assertNotEqual(stored, original)
         self.assertIn(picture, original)
         self.assertTrue(stored.endswith(audio_frames))
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tater_voice import native_satellite
+
+
+class NativeSatelliteCredentialIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "credentials.json"
+        env = mock.patch.dict(
+            os.environ,
+            {
+                "TATER_NATIVE_SATELLITE_CREDENTIALS_PATH": str(self.path),
+                "TATER_NATIVE_SATELLITE_LAST_SEEN_FLUSH_S": "3600",
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(self._reset_index)
+        self._reset_index()
+        for index in range(100):
+            native_satellite._save_device_credential(
+                f"native:sat-{index}",
+                {"device_id": f"sat-{index}", "device_name": f"Sat {index}", "board": "satellite1"},
+                f"token-{index}",
+            )
+
+    def _reset_index(self) -> None:
+        if native_satellite._credential_flush_timer is not None:
+            native_satellite._credential_flush_timer.cancel()
+        native_satellite._credential_flush_timer = None
+        native_satellite._credential_index = None
+
+    def _hello(self, index: int):
+        return native_satellite._valid_device_credential(
+            f"token-{index}",
+            f"native:sat-{index}",
+            {"device_id": f"sat-{index}", "device_name": f"Sat {index}", "board": "satellite1"},
+        )
+
+    def test_reconnect_storm_reads_the_file_once_and_coalesces_last_seen(self) -> None:
+        native_satellite._credential_index = None
+        before = json.loads(self.path.read_text(encoding="utf-8"))["devices"]["native:sat-7"]["last_seen_ts"]
+        with mock.patch.object(
+            native_satellite, "_load_credentials_unlocked", wraps=native_satellite._load_credentials_unlocked
+        ) as load, mock.patch.object(
+            native_satellite, "_save_credentials_unlocked", wraps=native_satellite._save_credentials_unlocked
+        ) as save, mock.patch.object(native_satellite, "_now", return_value=before + 60.0):
+            matched = [self._hello(index) for index in range(100)]
+            self.assertEqual(load.call_count, 1)
+            self.assertEqual(save.call_count, 0)
+            self.assertIsNotNone(native_satellite._credential_flush_timer)
+            native_satellite._flush_credential_last_seen()
+            self.assertEqual(save.call_count, 1)
+
+        self.assertTrue(all(row and row["selector"] == f"native:sat-{index}" for index, row in enumerate(matched)))
+        self.assertIsNone(self._hello(100))
+        saved = json.loads(self.path.read_text(encoding="utf-8"))["devices"]["native:sat-7"]
+        self.assertEqual(saved["last_seen_ts"], before + 60.0)
+
+    def test_external_edit_and_forget_invalidate_the_index(self) -> None:
+        self.assertIsNotNone(self._hello(1))
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        data["devices"].pop("native:sat-1")
+        self.path.write_text(json.dumps(data) + "\n", encoding="utf-8")
+        self.assertIsNone(self._hello(1))
+
+        self.assertEqual(native_satellite._remove_device_credentials("native:sat-2"), 1)
+        self.assertIsNone(self._hello(2))
+        self.assertIsNotNone(self._hello(3))
+
+    def test_failed_writes_do_not_leave_unsaved_credentials_in_memory(self) -> None:
+        self.assertIsNotNone(self._hello(4))
+        with mock.patch.object(native_satellite, "_save_credentials_unlocked", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                native_satellite._save_device_credential(
+                    "native:sat-new", {"device_id": "sat-new"}, "token-new"
+                )
+            with self.assertRaises(OSError):
+                native_satellite._remove_device_credentials("native:sat-4")
+
+        self.assertIsNone(
+            native_satellite._valid_device_credential("token-new", "native:sat-new", {"device_id": "sat-new"})
+        )
+        self.assertIsNotNone(self._hello(4))
+
+
+if __name__ == "__main__":
+    unittest.main()
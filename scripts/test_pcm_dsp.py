@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+import warnings
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np
+
+from tater_voice import dsp
+from tater_voice import voice_pipeline as vp
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except Exception:  # Python 3.13+
+        audioop = None
+
+
+def _pcm(count: int, seed: int = 1) -> bytes:
+    rng = random.Random(seed)
+    return np.array([rng.randint(-32768, 32767) for _ in range(count)], dtype="<i2").tobytes()
+
+
+class _PurePython:
+    # Runs the voice_pipeline functions on their pure-Python fallback path.
+    def __enter__(self):
+        self._patches = [
+            mock.patch.object(vp, "_audioop", None),
+            mock.patch.object(dsp, "_numpy", return_value=None),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+        return self
+
+    def __exit__(self, *exc):
+        for patcher in reversed(self._patches):
+            patcher.stop()
+
+
+class PcmDspEquivalenceTests(unittest.TestCase):
+    def test_rms_and_dbfs_match_pure_python(self) -> None:
+        chunk = _pcm(321)
+        with _PurePython():
+            expected_rms = vp._pcm_rms(chunk, 2)
+            expected_dbfs = vp._pcm_dbfs(chunk, sample_width=2)
+        self.assertAlmostEqual(dsp.pcm_rms(memoryview(chunk), 2), expected_rms, places=6)
+        self.assertAlmostEqual(dsp.pcm_dbfs(chunk, 2), expected_dbfs, places=6)
+        self.assertEqual(dsp.pcm_dbfs(b"\x00" * 640, 2), -120.0)
+
+    def test_gain_saturates_like_pure_python(self) -> None:
+        chunk = _pcm(640, seed=2)
+        for gain in (0.37, 1.8, 6.0):
+            with _PurePython():
+                expected = vp._pcm_apply_gain(chunk, sample_width=2, gain=gain)
+            self.assertEqual(dsp.pcm_apply_gain(bytearray(chunk), 2, gain), expected)
+        self.assertEqual(dsp.pcm_apply_gain(chunk + b"\x01", 2, 1.8)[-1:], b"\x01")
+
+    def test_high_pass_matches_pure_python_across_chunks(self) -> None:
+        fast = SimpleNamespace(noise_highpass_prev_input=0.0, noise_highpass_prev_output=0.0)
+        slow = SimpleNamespace(noise_highpass_prev_input=0.0, noise_highpass_prev_output=0.0)
+        for index in range(6):
+            chunk = _pcm(320 + index * 37, seed=10 + index)
+            with _PurePython():
+                expected = vp._pcm_high_pass_filter_session(slow, chunk, sample_width=2)
+            actual = vp._pcm_high_pass_filter_session(fast, chunk, sample_width=2)
+            diff = np.abs(np.frombuffer(actual, "<i2").astype(int) - np.frombuffer(expected, "<i2").astype(int))
+            self.assertLessEqual(int(diff.max()), 1)
+            self.assertEqual(fast.noise_highpass_prev_input, slow.noise_highpass_prev_input)
+            self.assertAlmostEqual(fast.noise_highpass_prev_output, slow.noise_highpass_prev_output, places=5)
+
+    @unittest.skipIf(audioop is None, "audioop unavailable")
+    def test_downmix_and_ratecv_match_audioop_including_state(self) -> None:
+        stereo = _pcm(1920, seed=3)
+        self.assertEqual(dsp.pcm_downmix(stereo, 2, 2), audioop.tomono(stereo, 2, 0.5, 0.5))
+        for rate in (48000, 44100, 22050, 8000):
+            expected_state = actual_state = None
+            for index in range(5):
+                chunk = _pcm(97 + index * 211, seed=rate + index)
+                expected, expected_state = audioop.ratecv(chunk, 2, 1, rate, 16000, expected_state)
+                actual, actual_state = dsp.pcm_ratecv(chunk, rate, 16000, actual_state)
+                self.assertEqual(actual, expected)
+                self.assertEqual(actual_state, expected_state)
+
+    @unittest.skipIf(audioop is None, "audioop unavailable")
+    def test_pcm16_mono_16k_fallback_matches_audioop_path(self) -> None:
+        stereo_48k = _pcm(3840, seed=4)
+        audio_format = {"rate": 48000, "width": 2, "channels": 2}
+        expected = vp._pcm_to_pcm16_mono_16k(stereo_48k, audio_format)
+        with mock.patch.object(vp, "_audioop", None):
+            actual = vp._pcm_to_pcm16_mono_16k(stereo_48k, audio_format)
+        self.assertEqual(actual, expected)
+
+    def test_deinterleave_is_a_view(self) -> None:
+        data = bytearray(_pcm(8))
+        frames = dsp.pcm_deinterleave(data, 2, 2)
+        self.assertEqual(frames.shape, (4, 2))
+        self.assertFalse(frames.flags.owndata)
+
+
+if __name__ == "__main__":
+    unittest.main()
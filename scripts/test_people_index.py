@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import people
+
+
+class _FakePipeline:
+    def __init__(self, client) -> None:
+        self.client = client
+        self.queued = []
+
+    def __getattr__(self, name):
+        def _queue(*args):
+            self.queued.append((name, args))
+            return self
+
+        return _queue
+
+    def execute(self):
+        self.client.calls.append(("execute", None))
+        return [getattr(self.client, name)(*args) for name, args in self.queued]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.strings: dict = {}
+        self.lists: dict = {}
+        self.calls: list = []
+
+    def get(self, key):
+        self.calls.append(("get", key))
+        return self.strings.get(key)
+
+    def set(self, key, value):
+        self.strings[key] = value
+
+    def incr(self, key):
+        self.strings[key] = str(int(self.strings.get(key) or 0) + 1)
+        return int(self.strings[key])
+
+    def scan_iter(self, match="*", count=None):
+        prefix = match.split("*", 1)[0]
+        return [key for key in self.lists if key.startswith(prefix) and key.endswith(":history")]
+
+    def llen(self, key):
+        self.calls.append(("llen", key))
+        return len(self.lists.get(key) or [])
+
+    def lindex(self, key, index):
+        self.calls.append(("lindex", key))
+        rows = self.lists.get(key) or []
+        return rows[index] if rows else None
+
+    def pipeline(self, transaction=False):
+        self.calls.append(("pipeline", None))
+        return _FakePipeline(self)
+
+    def lrange(self, key, start, end):
+        self.calls.append(("lrange", key))
+        rows = self.lists.get(key) or []
+        return rows[max(0, len(rows) + start) if start < 0 else start :]
+
+
+class PeopleIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.redis = _FakeRedis()
+        self.alice = people.create_person("Alice Smith", self.redis)
+        people.attach_alias(person_id=self.alice["id"], platform="discord", external_id="111", label="Ally", redis_client=self.redis)
+
+    def test_resolution_reuses_the_index_until_a_write(self) -> None:
+        first = people.resolve_person(platform="discord", origin={"user_id": "111"}, redis_client=self.redis)
+        self.redis.calls.clear()
+        second = people.resolve_person(platform="discord", origin={"user_id": "111"}, redis_client=self.redis)
+
+        self.assertEqual(first["person_id"], self.alice["id"])
+        self.assertEqual(second["person_id"], self.alice["id"])
+        self.assertEqual(self.redis.calls, [("get", people.PEOPLE_VERSION_KEY)])
+
+        people.update_person(self.alice["id"], {"display_name": "Alice Jones"}, self.redis)
+        renamed = people.resolve_person(platform="discord", origin={"user_id": "111"}, redis_client=self.redis)
+        self.assertEqual(renamed["display_name"], "Alice Jones")
+        people.detach_alias(person_id=self.alice["id"], platform="discord", external_id="111", redis_client=self.redis)
+        self.assertFalse(people.resolve_person(platform="discord", origin={"user_id": "111"}, redis_client=self.redis)["matched"])
+
+    def test_store_written_before_the_counter_is_still_indexed(self) -> None:
+        self.redis.strings.pop(people.PEOPLE_VERSION_KEY)
+        self.assertTrue(people.resolve_person(platform="discord", origin={"user_id": "111"}, redis_client=self.redis)["matched"])
+        self.assertEqual(self.redis.strings[people.PEOPLE_VERSION_KEY], "1")
+
+    def test_discovery_reparses_only_changed_history_lists(self) -> None:
+        key = "tater:telegram:42:history"
+        self.redis.lists[key] = [json.dumps({"role": "user", "user_id": "t1", "username": "tee"})]
+        rows = people.discovered_identities(self.redis)
+        self.assertIn(("telegram", "t1"), {(row["platform"], row["external_id"]) for row in rows})
+
+        self.redis.lists["tater:discord:7:history"] = [json.dumps({"role": "user", "user_id": "d1"})]
+        people.discovered_identities(self.redis)
+        self.redis.calls.clear()
+        people.discovered_identities(self.redis)
+        self.assertNotIn(("lrange", key), self.redis.calls)
+        # Both lists' markers are read in one pipeline round trip.
+        self.assertEqual(self.redis.calls.count(("execute", None)), 1)
+
+        self.redis.lists[key].append(json.dumps({"role": "user", "user_id": "t2", "username": "two"}))
+        rows = people.discovered_identities(self.redis)
+        self.assertIn(("telegram", "t2"), {(row["platform"], row["external_id"]) for row in rows})
+
+
+if __name__ == "__main__":
+    unittest.main()
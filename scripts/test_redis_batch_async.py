@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import integration_runtime
+import redis_runtime
+from redis.asyncio import connection as redis_async_connection
+
+
+class _RecordingRedis:
+    def __init__(self):
+        self.calls: list[tuple] = []
+        self.pipelines = 0
+
+    def pipeline(self, transaction=False):
+        self.pipelines += 1
+        client = self
+
+        class _Pipe:
+            def __init__(self):
+                self.ops = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+            def execute(self):
+                client.calls.extend(("pipeline", name, args) for name, args, _kwargs in self.ops)
+                return [1] * len(self.ops)
+
+        return _Pipe()
+
+    def incr(self, key):
+        self.calls.append(("direct", "incr", (key,)))
+        return 7
+
+
+class _AsyncMemoryRedis:
+    def __init__(self):
+        self.values: dict = {}
+
+    async def set(self, key, value, *args, **kwargs):
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+
+class RedisBatchTests(unittest.TestCase):
+    def test_batch_without_pipeline_support_runs_commands_in_order(self) -> None:
+        class Plain:
+            def __init__(self):
+                self.rows = []
+
+            def rpush(self, key, value):
+                self.rows.append(("rpush", key, value))
+                return 1
+
+            def ltrim(self, key, start, end):
+                self.rows.append(("ltrim", key, start, end))
+                return True
+
+        client = Plain()
+        result = redis_runtime.redis_batch(client).rpush("k", "v").ltrim("k", -5, -1).execute()
+
+        self.assertEqual(result, [1, True])
+        self.assertEqual(client.rows, [("rpush", "k", "v"), ("ltrim", "k", -5, -1)])
+
+    def test_publish_event_costs_one_counter_call_and_one_pipeline(self) -> None:
+        client = _RecordingRedis()
+        record = integration_runtime._publish_event(client, "homeassistant", "state_changed", {"entity_id": "light.a"})
+
+        self.assertEqual(record["seq"], 7)
+        self.assertEqual(client.pipelines, 1)
+        self.assertEqual(
+            [(kind, name) for kind, name, _args in client.calls],
+            [("direct", "incr"), ("pipeline", "xadd"), ("pipeline", "hset")],
+        )
+        self.assertEqual(json.loads(client.calls[1][2][1]["record"])["payload"], {"entity_id": "light.a"})
+
+    def test_async_pool_uses_unix_socket_connection_when_configured(self) -> None:
+        pool = redis_runtime._async_connection_pool(
+            {"unix_socket_path": "/tmp/redis.sock", "db": 0, "decode_responses": True}
+        )
+        self.assertIs(pool.connection_class, redis_async_connection.UnixDomainSocketConnection)
+        self.assertEqual(pool.max_connections, redis_runtime._async_max_connections())
+
+
+class AsyncFacadeTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for patcher in (
+            mock.patch.object(redis_runtime, "_REDIS_ENCRYPTION_KEY_PATH", Path(tmp.name) / "redis_encryption.key"),
+            mock.patch.dict("os.environ", {"TATER_REDIS_LIVE_ENCRYPTION_STATE_PATH": str(Path(tmp.name) / "live.json")}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        with redis_runtime._LOCK:
+            redis_runtime._save_live_encryption_state_locked(True)
+        self.addCleanup(self._reset)
+
+    def _reset(self) -> None:
+        with redis_runtime._LOCK:
+            redis_runtime._invalidate_encryption_cache_locked()
+
+    async def test_async_facade_encrypts_and_decrypts_like_the_sync_facade(self) -> None:
+        raw = _AsyncMemoryRedis()
+        facade = redis_runtime.AsyncEncryptedRedisClientFacade(raw, decode_responses=True)
+
+        await facade.set("tater:test", "secret")
+        await facade.set("tater:hydra:metrics:total_turns", "3")
+
+        self.assertTrue(raw.values["tater:test"].startswith(redis_runtime._REDIS_ENCRYPTION_PREFIX_TEXT))
+        self.assertEqual(raw.values["tater:hydra:metrics:total_turns"], "3")
+        self.assertEqual(await facade.get("tater:test"), "secret")
+
+    async def test_facade_builds_from_recorded_kwargs_without_waiting_on_the_sync_lock(self) -> None:
+        kwargs = {"unix_socket_path": "/tmp/tater-test.sock", "db": 0, "decode_responses": True}
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_lock() -> None:
+            with redis_runtime._LOCK:
+                held.set()
+                release.wait(5)
+
+        recorded = {True: (redis_runtime._CLIENT_GENERATION, kwargs)}
+        with mock.patch.dict(redis_runtime._ASYNC_CLIENT_KWARGS, recorded), mock.patch.object(
+            redis_runtime, "get_redis_client"
+        ) as sync_client:
+            thread = threading.Thread(target=hold_lock)
+            thread.start()
+            held.wait(5)
+            started = time.monotonic()
+            try:
+                facade = redis_runtime._async_client_facade(True)
+                elapsed = time.monotonic() - started
+            finally:
+                release.set()
+                thread.join()
+            self.assertIs(redis_runtime._async_client_facade(True), facade)
+
+        sync_client.assert_not_called()
+        self.assertLess(elapsed, 1.0)
+        self.assertIs(facade._client.connection_pool.connection_class, redis_async_connection.UnixDomainSocketConnection)
+
+
+if __name__ == "__main__":
+    unittest.main()
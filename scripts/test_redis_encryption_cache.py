@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import redis_runtime
+
+
+class _MemoryRedis:
+    def __init__(self):
+        self.values: dict = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, *args, **kwargs):
+        self.values[key] = value
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class RedisEncryptionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        tmp = Path(self._tmp.name)
+        patches = [
+            mock.patch.object(redis_runtime, "_REDIS_ENCRYPTION_KEY_PATH", tmp / "redis_encryption.key"),
+            mock.patch.dict("os.environ", {"TATER_REDIS_LIVE_ENCRYPTION_STATE_PATH": str(tmp / "live.json")}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        with redis_runtime._LOCK:
+            redis_runtime._invalidate_encryption_cache_locked()
+        self.addCleanup(self._reset_runtime_caches)
+        self.raw = _MemoryRedis()
+        self.proxy = redis_runtime.RedisClientProxy(decode_responses=True)
+
+    def _reset_runtime_caches(self) -> None:
+        with redis_runtime._LOCK:
+            redis_runtime._invalidate_encryption_cache_locked()
+        self._tmp.cleanup()
+
+    def test_proxy_reuses_facade_until_clients_are_reset(self) -> None:
+        with mock.patch.object(redis_runtime, "get_redis_client", return_value=self.raw) as get_client:
+            first = self.proxy._client()
+            second = self.proxy._client()
+            self.assertIs(first, second)
+            self.assertEqual(get_client.call_count, 1)
+
+            with redis_runtime._LOCK:
+                redis_runtime._reset_clients_locked()
+            third = self.proxy._client()
+
+        self.assertIsNot(first, third)
+        self.assertEqual(get_client.call_count, 2)
+
+    def test_cipher_is_built_once_and_dropped_when_live_state_changes(self) -> None:
+        with redis_runtime._LOCK:
+            redis_runtime._save_live_encryption_state_locked(True)
+
+        real_read_key = redis_runtime._read_redis_encryption_key
+        with mock.patch.object(redis_runtime, "get_redis_client", return_value=self.raw), mock.patch.object(
+            redis_runtime, "_read_redis_encryption_key", side_effect=real_read_key
+        ) as read_key:
+            for index in range(5):
+                self.proxy.set(f"k{index}", f"value-{index}")
+            self.assertTrue(str(self.raw.values["k0"]).startswith(redis_runtime._REDIS_ENCRYPTION_PREFIX_TEXT))
+            self.assertEqual([self.proxy.get(f"k{index}") for index in range(5)], [f"value-{index}" for index in range(5)])
+            self.assertEqual(read_key.call_count, 1)
+
+            with redis_runtime._LOCK:
+                redis_runtime._save_live_encryption_state_locked(False)
+            self.assertIsNone(redis_runtime._FERNET_CIPHER_CACHE)
+            self.proxy.set("plain", "value")
+
+        self.assertEqual(self.raw.values["plain"], "value")
+
+    def test_live_flag_is_served_without_rereading_state_file(self) -> None:
+        with redis_runtime._LOCK:
+            redis_runtime._save_live_encryption_state_locked(True)
+        self.assertTrue(redis_runtime._live_encryption_enabled())
+        with mock.patch.object(redis_runtime, "_load_live_encryption_state_locked") as load_state:
+            self.assertTrue(redis_runtime._live_encryption_enabled())
+        load_state.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import redis_runtime
+
+
+def _b(value) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
+
+
+class _Pipeline:
+    def __init__(self, client: "_MemberRedis"):
+        self._client = client
+        self._ops: list = []
+
+    def __getattr__(self, name: str):
+        def _queue(*args, **kwargs):
+            self._ops.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self):
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._ops]
+
+
+class _MemberRedis:
+    def __init__(self):
+        self.sets: dict[bytes, set] = {}
+        self.zsets: dict[bytes, dict] = {}
+        self.hashes: dict[bytes, dict] = {}
+        self.smembers_calls = 0
+        self.scan_cursors: list[int] = []
+
+    def type(self, key):
+        key = _b(key)
+        if key in self.sets:
+            return b"set"
+        if key in self.zsets:
+            return b"zset"
+        if key in self.hashes:
+            return b"hash"
+        return b"none"
+
+    def scan(self, cursor=0, count=None):
+        self.scan_cursors.append(int(cursor))
+        keys = sorted(set(self.sets) | set(self.zsets) | set(self.hashes))
+        page = keys[int(cursor) : int(cursor) + 2]
+        next_cursor = int(cursor) + 2
+        return (0 if next_cursor >= len(keys) else next_cursor), page
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    def delete(self, *keys):
+        for key in keys:
+            key = _b(key)
+            self.sets.pop(key, None)
+            self.zsets.pop(key, None)
+            self.hashes.pop(key, None)
+
+    def sadd(self, key, *values):
+        bucket = self.sets.setdefault(_b(key), set())
+        before = len(bucket)
+        bucket.update(_b(value) for value in values)
+        return len(bucket) - before
+
+    def srem(self, key, *values):
+        bucket = self.sets.get(_b(key), set())
+        removed = len([value for value in values if _b(value) in bucket])
+        bucket.difference_update(_b(value) for value in values)
+        return removed
+
+    def smembers(self, key):
+        self.smembers_calls += 1
+        return set(self.sets.get(_b(key), set()))
+
+    def sismember(self, key, value):
+        return _b(value) in self.sets.get(_b(key), set())
+
+    def zadd(self, key, mapping, nx=False):
+        bucket = self.zsets.setdefault(_b(key), {})
+        added = 0
+        for member, score in mapping.items():
+            member = _b(member)
+            if nx and member in bucket:
+                continue
+            added += member not in bucket
+            bucket[member] = float(score)
+        return added
+
+    def zrem(self, key, *members):
+        bucket = self.zsets.get(_b(key), {})
+        return len([bucket.pop(_b(member)) for member in members if _b(member) in bucket])
+
+    def zrange(self, key, start, end, withscores=False):
+        rows = sorted(self.zsets.get(_b(key), {}).items(), key=lambda row: row[1])
+        return rows if withscores else [member for member, _score in rows]
+
+    def zscore(self, key, member):
+        return self.zsets.get(_b(key), {}).get(_b(member))
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(_b(key), {}))
+
+    def hget(self, key, field):
+        return self.hashes.get(_b(key), {}).get(_b(field))
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        bucket = self.hashes.setdefault(_b(key), {})
+        for item_field, item_value in dict(mapping or {field: value}).items():
+            bucket[_b(item_field)] = _b(item_value)
+        return 1
+
+    def close(self) -> None:
+        pass
+
+
+class RedisMemberMigrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patches = [
+            mock.patch.object(redis_runtime, "_REDIS_ENCRYPTION_KEY_PATH", Path(tmp.name) / "redis_encryption.key"),
+            mock.patch.dict("os.environ", {"TATER_REDIS_LIVE_ENCRYPTION_STATE_PATH": str(Path(tmp.name) / "live.json")}),
+            mock.patch.object(redis_runtime, "start_redis_member_migration"),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.raw = _MemberRedis()
+        client_patch = mock.patch.object(redis_runtime, "get_redis_client", return_value=self.raw)
+        client_patch.start()
+        self.addCleanup(client_patch.stop)
+        with redis_runtime._LOCK:
+            redis_runtime._reset_clients_locked()
+            redis_runtime._save_live_encryption_state_locked(True)
+        self.addCleanup(self._reset)
+        self.facade = redis_runtime.EncryptedRedisClientFacade(self.raw, decode_responses=False)
+
+    def _reset(self) -> None:
+        with redis_runtime._LOCK:
+            redis_runtime._reset_clients_locked()
+            redis_runtime._invalidate_encryption_cache_locked()
+
+    def _legacy(self, value: str) -> bytes:
+        return redis_runtime._encrypt_value(value, decode_responses=False)
+
+    def test_miss_normalizes_key_once_then_returns_without_scanning(self) -> None:
+        self.raw.sets[b"people:aliases"] = {self._legacy("dad"), b"mom"}
+
+        self.assertTrue(self.facade.sismember("people:aliases", "dad"))
+        self.assertEqual(self.raw.sets[b"people:aliases"], {b"dad", b"mom"})
+        scans = self.raw.smembers_calls
+
+        for _ in range(5):
+            self.assertFalse(self.facade.sismember("people:aliases", "nobody"))
+        self.assertEqual(self.raw.smembers_calls, scans)
+
+    def test_missing_keys_are_not_marked_clean_and_the_local_cache_is_capped(self) -> None:
+        self.assertFalse(self.facade.sismember("people:later", "dad"))
+        self.assertNotIn(b"people:later", self.raw.sets.get(redis_runtime._MEMBER_CLEAN_KEYS_KEY.encode(), set()))
+
+        self.raw.sets[b"people:later"] = {self._legacy("dad")}
+        self.assertTrue(self.facade.sismember("people:later", "dad"))
+
+        with mock.patch.object(redis_runtime, "_MEMBER_CLEAN_KEYS_LOCAL_MAX", 3):
+            for index in range(5):
+                self.raw.sets[f"k{index}".encode()] = {b"plain"}
+                self.facade.sismember(f"k{index}", "missing")
+            self.assertEqual(list(redis_runtime._MEMBER_CLEAN_KEYS_LOCAL), ["k2", "k3", "k4"])
+
+    def test_zset_legacy_member_keeps_score_and_existing_plaintext_wins(self) -> None:
+        self.raw.zsets[b"ledger"] = {self._legacy("a"): 3.0, self._legacy("b"): 1.0, b"b": 7.0}
+
+        self.assertEqual(self.facade.zscore("ledger", "a"), 3.0)
+        self.assertEqual(self.raw.zsets[b"ledger"], {b"a": 3.0, b"b": 7.0})
+
+    def test_background_migration_resumes_from_cursor_and_reports_progress(self) -> None:
+        self.raw.sets[b"a"] = {self._legacy("x")}
+        self.raw.sets[b"b"] = {self._legacy("y")}
+        self.raw.zsets[b"c"] = {self._legacy("z"): 2.0}
+        self.raw.zsets[b"d"] = {b"plain": 1.0}
+        self.raw.hset(redis_runtime._MEMBER_MIGRATION_STATE_KEY, mapping={"status": "running", "cursor": "2"})
+
+        redis_runtime._member_migration_worker()
+
+        self.assertEqual(self.raw.scan_cursors[0], 2)
+        status = redis_runtime.get_redis_encryption_status()["member_migration"]
+        self.assertEqual(status["status"], "complete")
+        self.assertEqual(status["members_normalized"], 1)
+        self.assertEqual(self.raw.zsets[b"c"], {b"z": 2.0})
+        self.assertNotIn(redis_runtime._MEMBER_CLEAN_KEYS_KEY.encode(), self.raw.sets)
+
+        self.raw.smembers_calls = 0
+        self.assertFalse(self.facade.sismember("a", "missing"))
+        self.assertIsNone(self.facade.zscore("c", "missing"))
+        self.assertEqual(self.raw.smembers_calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
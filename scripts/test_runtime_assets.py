@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import runtime_assets
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RuntimeAssetStoreTests(unittest.TestCase):
+    def test_entries_expire_without_touching_live_ones(self) -> None:
+        clock = _Clock()
+        store = runtime_assets.RuntimeAssetStore(max_bytes=1024, clock=clock)
+        short = store.put(b"short", ttl_s=10, meta={"kind": "tts"})
+        long = store.put(b"long", ttl_s=100)
+
+        clock.now += 50
+        self.assertIsNone(store.get(short))
+        asset = store.get(long)
+        self.assertEqual(bytes(asset.body), b"long")
+        self.assertEqual(store.snapshot()["expired"], 1)
+
+    def test_byte_budget_evicts_least_recently_used(self) -> None:
+        store = runtime_assets.RuntimeAssetStore(max_bytes=10)
+        first = store.put(b"aaaa", ttl_s=60)
+        second = store.put(b"bbbb", ttl_s=60)
+        store.get(first)
+        third = store.put(b"cccc", ttl_s=60)
+
+        self.assertIsNone(store.get(second))
+        self.assertIsNotNone(store.get(first))
+        self.assertIsNotNone(store.get(third))
+        self.assertEqual(store.put(b"x" * 11, ttl_s=60), "")
+        self.assertEqual(store.snapshot()["bytes"], 8)
+
+    def test_fetch_returns_read_only_view_of_stored_bytes(self) -> None:
+        store = runtime_assets.RuntimeAssetStore(max_bytes=64)
+        asset_id = store.put(b"payload", ttl_s=60, meta={"content_type": "audio/wav"})
+
+        first = store.get(asset_id)
+        second = store.get(asset_id)
+        self.assertIs(first.body.obj, second.body.obj)
+        self.assertTrue(first.body.readonly)
+        self.assertEqual(first.meta, {"content_type": "audio/wav"})
+
+
+class ByteRangeTests(unittest.TestCase):
+    def test_parse_byte_range(self) -> None:
+        self.assertIsNone(runtime_assets.parse_byte_range(None, 10))
+        self.assertIsNone(runtime_assets.parse_byte_range("bytes=0-1,4-5", 10))
+        self.assertEqual(runtime_assets.parse_byte_range("bytes=2-", 10), (2, 9))
+        self.assertEqual(runtime_assets.parse_byte_range("bytes=2-100", 10), (2, 9))
+        self.assertEqual(runtime_assets.parse_byte_range("bytes=-3", 10), (7, 9))
+        with self.assertRaises(ValueError):
+            runtime_assets.parse_byte_range("bytes=10-", 10)
+
+    def test_range_response(self) -> None:
+        body = memoryview(b"0123456789")
+        full = runtime_assets.byte_range_response(body, media_type="audio/wav")
+        partial = runtime_assets.byte_range_response(body, media_type="audio/wav", range_header="bytes=2-5")
+        invalid = runtime_assets.byte_range_response(body, media_type="audio/wav", range_header="bytes=20-")
+
+        self.assertEqual(full.status_code, 200)
+        self.assertEqual(full.headers["accept-ranges"], "bytes")
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(bytes(partial.body), b"2345")
+        self.assertEqual(partial.headers["content-range"], "bytes 2-5/10")
+        self.assertEqual(partial.headers["content-length"], "4")
+        self.assertEqual(invalid.status_code, 416)
+        self.assertEqual(invalid.headers["content-range"], "bytes */10")
+
+
+if __name__ == "__main__":
+    unittest.main()
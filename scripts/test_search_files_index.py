@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import kernel_tools  # noqa: E402
+
+
+class SearchFilesIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+        self.documents = self.root / "documents"
+        self.patchers = [
+            mock.patch.object(kernel_tools, "AGENT_LAB_DIR", self.root),
+            mock.patch.object(kernel_tools, "AGENT_DOCUMENTS_DIR", self.documents),
+            mock.patch.object(kernel_tools, "AGENT_DOWNLOADS_DIR", self.root / "downloads"),
+            mock.patch.object(kernel_tools, "AGENT_WORKSPACE_DIR", self.root / "workspace"),
+            mock.patch.object(kernel_tools, "AGENT_REQUIREMENTS", self.root / "requirements.txt"),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.extract = mock.patch.object(kernel_tools, "_extract_file_content", wraps=kernel_tools._extract_file_content)
+        self.extracted = self.extract.start()
+        self.documents.mkdir(parents=True)
+
+    def tearDown(self) -> None:
+        self.extract.stop()
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, text: str) -> pathlib.Path:
+        path = self.documents / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_repeat_searches_only_extract_changed_files(self) -> None:
+        self._write("a.txt", "alpha\nthe Quarterly report\n")
+        notes = self._write("b.md", "nothing here\n")
+        self._write(".hidden.txt", "quarterly secret\n")
+
+        first = kernel_tools.search_files("quarterly")
+        self.assertEqual([(row["path"], row["line"]) for row in first["results"]], [("/documents/a.txt", 2)])
+        self.assertEqual((first["scanned_files"], first["indexed_files"]), (2, 2))
+
+        self.extracted.reset_mock()
+        self.assertEqual(kernel_tools.search_files("QUARTERLY")["count"], 1)
+        self.extracted.assert_not_called()
+
+        notes.write_text("quarterly notes, updated\n", encoding="utf-8")
+        os.utime(notes, ns=(notes.stat().st_atime_ns, notes.stat().st_mtime_ns + 1_000_000))
+        updated = kernel_tools.search_files("quarterly")
+        self.assertEqual(updated["indexed_files"], 1)
+        self.assertEqual(sorted(row["path"] for row in updated["results"]), ["/documents/a.txt", "/documents/b.md"])
+        self.assertEqual(self.extracted.call_count, 1)
+
+        hidden = kernel_tools.search_files("quarterly", include_hidden=True)
+        self.assertIn("/documents/.hidden.txt", [row["path"] for row in hidden["results"]])
+
+    def test_results_are_ranked_and_keep_substring_and_case_semantics(self) -> None:
+        self._write("one.txt", "Deploy once\n")
+        self._write("many.txt", "deploy\ndeploy again\ndeployment plan\n")
+
+        ranked = kernel_tools.search_files("deploy")
+        self.assertEqual(ranked["results"][0]["path"], "/documents/many.txt")
+        self.assertEqual(ranked["matched_files"], 2)
+        self.assertEqual(kernel_tools.search_files("ployme")["results"][0]["snippet"], "deployment plan")
+        self.assertEqual(kernel_tools.search_files("Deploy", case_sensitive=True)["matched_files"], 1)
+        self.assertEqual(kernel_tools.search_files("ce")["results"][0]["path"], "/documents/one.txt")
+
+    def test_deleted_files_drop_out_of_the_index(self) -> None:
+        gone = self._write("gone.txt", "needle\n")
+        self.assertEqual(kernel_tools.search_files("needle")["count"], 1)
+
+        gone.unlink()
+        self.assertEqual(kernel_tools.search_files("needle")["count"], 0)
+        self._write("gone.txt", "needle\n")
+        self.assertEqual(kernel_tools.search_files("needle", file_glob="*.md")["count"], 0)
+        self.assertEqual(kernel_tools.search_files("needle", path="/documents/gone.txt")["count"], 1)
+
+    def test_searching_the_lab_root_skips_the_index_database(self) -> None:
+        self._write("a.txt", "needle\n")
+        kernel_tools.search_files("needle", path="/", include_hidden=True)
+        again = kernel_tools.search_files("needle", path="/", include_hidden=True)
+
+        # a.txt and requirements.txt; nothing under .search is read back in.
+        self.assertEqual((again["indexed_files"], again["scanned_files"], again["count"]), (0, 2, 1))
+        self.assertTrue((self.root / ".search").is_dir())
+
+    def test_sqlite_without_trigram_falls_back_to_scanning(self) -> None:
+        self._write("a.txt", "the needle\n")
+        with mock.patch.object(kernel_tools, "open_document_index", return_value=None):
+            result = kernel_tools.search_files("needle")
+
+        self.assertTrue(result["ok"])
+        self.assertEqual([(row["path"], row["line"]) for row in result["results"]], [("/documents/a.txt", 1)])
+        self.assertEqual(result["indexed_files"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
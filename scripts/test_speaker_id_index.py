@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tater_voice import speaker_id
+
+
+def _vector(rng: random.Random, dim: int = 16) -> list[float]:
+    return [rng.uniform(-1.0, 1.0) for _ in range(dim)]
+
+
+class SpeakerIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        for patcher in (
+            mock.patch.object(speaker_id, "SPEAKER_ID_AGENT_LABS_ROOT", root),
+            mock.patch.object(speaker_id, "SPEAKER_ID_MODEL_ROOT", root / "models"),
+            mock.patch.object(speaker_id, "SPEAKER_ID_PROFILES_PATH", root / "profiles.json"),
+            mock.patch.object(speaker_id, "SPEAKER_ID_EMBEDDINGS_PATH", root / "profiles.embeddings.npy"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        speaker_id._invalidate_speaker_index()
+        self.addCleanup(speaker_id._invalidate_speaker_index)
+        self.rng = random.Random(7)
+
+    def _save(self, speakers: list[dict]) -> None:
+        speaker_id._save_profiles({"version": 1, "speakers": speakers})
+
+    def _speaker(self, name: str, samples: int, dim: int = 16) -> dict:
+        return {
+            "id": name.lower(),
+            "name": name,
+            "samples": [{"embedding": _vector(self.rng, dim), "created_ts": 1.0} for _ in range(samples)],
+        }
+
+    def test_scores_match_average_plus_cosine_loop(self) -> None:
+        self._save([self._speaker(f"Speaker{index}", 1 + index % 4) for index in range(12)])
+        query = _vector(self.rng)
+
+        expected = sorted(
+            (
+                (speaker["id"], speaker_id._cosine_similarity(query, speaker_id._speaker_average_embedding(speaker)))
+                for speaker in speaker_id._all_speakers()
+            ),
+            key=lambda row: row[1],
+            reverse=True,
+        )
+        scored = speaker_id._speaker_index().score(query)
+
+        self.assertEqual([row["speaker_id"] for row in scored], [row[0] for row in expected])
+        for row, (_speaker, score) in zip(scored, expected):
+            self.assertAlmostEqual(row["score"], score, places=5)
+        self.assertEqual(len(speaker_id._speaker_index().top_samples(query, 3)), 3)
+
+    def test_embeddings_round_trip_through_npy_sidecar(self) -> None:
+        speakers = [self._speaker("Alice", 2), self._speaker("Bob", 1)]
+        self._save(speakers)
+
+        stored = json.loads(speaker_id.SPEAKER_ID_PROFILES_PATH.read_text(encoding="utf-8"))
+        self.assertTrue(speaker_id.SPEAKER_ID_EMBEDDINGS_PATH.is_file())
+        self.assertNotIn("embedding", stored["speakers"][0]["samples"][0])
+        self.assertEqual(stored["speakers"][1]["samples"][0]["embedding_row"], 2)
+
+        loaded = speaker_id._all_speakers()
+        for original, row in zip(speakers, loaded):
+            for sample, loaded_sample in zip(original["samples"], row["samples"]):
+                for a, b in zip(sample["embedding"], loaded_sample["embedding"]):
+                    self.assertAlmostEqual(a, b, places=5)
+
+    def test_sidecar_from_an_interrupted_save_is_not_paired_with_old_profiles(self) -> None:
+        self._save([self._speaker("Alice", 1)])
+        old_profiles = speaker_id.SPEAKER_ID_PROFILES_PATH.read_text(encoding="utf-8")
+        self._save([self._speaker("Bob", 1)])
+        # Crash after the sidecar was replaced but before profiles.json was.
+        speaker_id.SPEAKER_ID_PROFILES_PATH.write_text(old_profiles, encoding="utf-8")
+
+        loaded = speaker_id._all_speakers()
+        self.assertEqual([row["id"] for row in loaded], ["alice"])
+        self.assertEqual(loaded[0]["samples"], [])
+
+    def test_mixed_embedding_sizes_stay_inline_and_score_zero(self) -> None:
+        self._save([self._speaker("Old", 1, dim=8), self._speaker("New", 1, dim=16)])
+
+        self.assertFalse(speaker_id.SPEAKER_ID_EMBEDDINGS_PATH.exists())
+        scored = speaker_id._speaker_index().score(_vector(self.rng, 16))
+        self.assertEqual([row["speaker_id"] for row in scored][-1], "old")
+        self.assertEqual(scored[-1]["score"], 0.0)
+
+    def test_index_is_reused_until_profiles_change(self) -> None:
+        self._save([self._speaker("Alice", 1)])
+        first = speaker_id._speaker_index()
+        with mock.patch.object(speaker_id, "_all_speakers") as all_speakers:
+            self.assertIs(speaker_id._speaker_index(), first)
+        all_speakers.assert_not_called()
+
+        self._save([self._speaker("Alice", 1), self._speaker("Bob", 1)])
+        self.assertEqual(len(speaker_id._speaker_index()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
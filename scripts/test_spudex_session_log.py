@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from spudex import runner, session_store  # noqa: E402
+
+
+class SpudexSessionLogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.temp_dir.name)
+        self.sessions_dir = self.root / "spudex" / "sessions"
+        self.patchers = [
+            mock.patch.object(runner, "SPUDEX_DIR", self.root / "spudex"),
+            mock.patch.object(runner, "SESSIONS_DIR", self.sessions_dir),
+            mock.patch.dict(runner.os.environ, {"TATER_SPUDEX_LOG_META_FLUSH_S": "60"}),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        runner.flush_spudex_log_meta()
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+        self.temp_dir.cleanup()
+
+    def _session(self, label: str = "test") -> str:
+        return str(runner.create_spudex_session(label=label, source="test")["id"])
+
+    def _meta_on_disk(self, session_id: str) -> dict:
+        meta_path, _ = runner._paths(session_id)
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+
+    def test_appends_coalesce_meta_writes_until_flush_or_state_change(self) -> None:
+        session_id = self._session()
+        for index in range(300):
+            runner.append_session_log(session_id, stream="stdout", text=f"line {index}")
+
+        self.assertEqual(self._meta_on_disk(session_id)["log_seq"], 0)
+        self.assertEqual(runner.get_spudex_session(session_id)["log_seq"], 300)
+
+        runner.update_spudex_session(session_id, status="running")
+        self.assertEqual(self._meta_on_disk(session_id)["log_seq"], 300)
+
+        runner.append_session_log(session_id, stream="stdout", text="more")
+        runner.flush_spudex_log_meta()
+        self.assertEqual(self._meta_on_disk(session_id)["log_seq"], 301)
+
+    def test_flush_merges_only_log_fields_into_the_latest_meta(self) -> None:
+        session_id = self._session()
+        stale = runner.get_spudex_session(session_id)
+        runner.append_session_log(session_id, stream="stdout", text="one")
+
+        write_meta_file = runner._write_meta_file
+
+        def locked_write(*args):
+            self.assertTrue(runner._meta_file_lock.locked())
+            write_meta_file(*args)
+
+        with mock.patch.object(runner, "_write_meta_file", locked_write):
+            runner.update_spudex_session(session_id, status="done")
+            runner.flush_spudex_log_meta()
+        self.assertEqual(self._meta_on_disk(session_id)["status"], "done")
+
+        # A save holding a copy read before the append keeps the newer log_seq.
+        runner._save_meta(stale)
+        self.assertEqual(self._meta_on_disk(session_id)["log_seq"], 1)
+
+    def test_a_session_named_index_does_not_touch_the_summary_index(self) -> None:
+        other = self._session("other")
+        runner.update_spudex_session("index", label="named index")
+        runner.asyncio.run(runner.close_spudex_session("index"))
+
+        self.assertEqual([row["id"] for row in runner.list_spudex_sessions()], [other])
+        self.assertTrue(session_store._index_path(self.sessions_dir).is_file())
+
+    def test_after_seq_and_tail_reads_seek_from_the_sparse_index(self) -> None:
+        session_id = self._session()
+        for index in range(300):
+            runner.append_session_log(session_id, stream="stdout", text=f"line {index}")
+        _, log_path = runner._paths(session_id)
+        session_store.forget_log(log_path)
+
+        payload = runner.read_spudex_logs(session_id, after_seq=250, limit=5)
+        self.assertEqual([entry["seq"] for entry in payload["entries"]], [251, 252, 253, 254, 255])
+        self.assertEqual(payload["last_seq"], 255)
+        tail = runner.read_spudex_logs(session_id, limit=3, tail=True)
+        self.assertEqual([entry["text"] for entry in tail["entries"]], ["line 297", "line 298", "line 299"])
+
+        seen_offsets: list[int] = []
+        real_iter = session_store._iter_entries
+        with mock.patch.object(session_store, "_iter_entries", side_effect=lambda path, offset: seen_offsets.append(offset) or real_iter(path, offset)):
+            runner.read_spudex_logs(session_id, after_seq=250, limit=5)
+        self.assertGreater(seen_offsets[0], log_path.stat().st_size // 2)
+
+    def test_log_written_elsewhere_is_reindexed_before_the_next_append(self) -> None:
+        session_id = self._session()
+        runner.append_session_log(session_id, stream="stdout", text="first")
+        _, log_path = runner._paths(session_id)
+        with log_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps({"seq": 7, "stream": "stdout", "text": "outside"}) + "\n")
+
+        entry = runner.append_session_log(session_id, stream="stdout", text="after")
+        self.assertEqual(entry["seq"], 8)
+        self.assertEqual([row["seq"] for row in runner.read_spudex_logs(session_id, after_seq=1)["entries"]], [7, 8])
+
+    def test_session_list_reads_the_summary_index_and_only_returned_metas(self) -> None:
+        ids = [self._session(f"s{index}") for index in range(5)]
+        runner.append_session_log(ids[1], stream="stdout", text="newest")
+
+        with mock.patch.object(runner, "_read_meta_file", wraps=runner._read_meta_file) as read_meta:
+            rows = runner.list_spudex_sessions(limit=2)
+        self.assertEqual([row["id"] for row in rows], [ids[1], ids[4]])
+        self.assertEqual(read_meta.call_count, 2)
+
+        session_store._index_path(self.sessions_dir).unlink()
+        self.assertEqual(len(runner.list_spudex_sessions(limit=10)), 5)
+
+    def test_closing_a_session_removes_it_from_the_summary_index(self) -> None:
+        keep, closed = self._session("keep"), self._session("closed")
+        runner.append_session_log(closed, stream="stdout", text="bye")
+
+        result = runner.asyncio.run(runner.close_spudex_session(closed))
+
+        self.assertTrue(result["closed"])
+        self.assertEqual([row["id"] for row in runner.list_spudex_sessions()], [keep])
+        index = json.loads(session_store._index_path(self.sessions_dir).read_text(encoding="utf-8"))
+        self.assertEqual(list(index), [keep])
+
+
+if __name__ == "__main__":
+    unittest.main()
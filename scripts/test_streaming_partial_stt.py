@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tater_voice import voice_pipeline as vp
+from tater_voice.voice_pipeline import backends
+from tater_voice.voice_pipeline.backends import LocalAgreementStream
+
+BYTES_PER_SECOND = 32000
+WORD_BYTES = 12800  # 0.4 s per word
+
+
+def _hypothesis(start: int, end: int) -> str:
+    # Words are laid out every WORD_BYTES; the word still being spoken comes
+    # back truncated, as a real recognizer's unstable tail does.
+    first = start // WORD_BYTES
+    words = [f"w{index}" for index in range(first, end // WORD_BYTES)]
+    if end % WORD_BYTES:
+        words.append(f"w{end // WORD_BYTES}-")
+    return " ".join(words)
+
+
+class LocalAgreementStreamTests(unittest.TestCase):
+    def test_commits_only_words_two_hypotheses_agree_on(self) -> None:
+        stream = LocalAgreementStream(BYTES_PER_SECOND)
+
+        self.assertEqual(stream.feed(16000, "turn on"), "turn on")
+        self.assertEqual(stream.committed, [])
+        self.assertEqual(stream.feed(32000, "turn on the kitch"), "turn on the kitch")
+        self.assertEqual(stream.committed, ["turn", "on"])
+        self.assertEqual(stream.tail, ["the", "kitch"])
+
+    def test_window_slides_and_final_matches_full_transcript(self) -> None:
+        stream = LocalAgreementStream(BYTES_PER_SECOND)
+        total = BYTES_PER_SECOND * 20
+        fed = 0
+        for end in range(16000, total + 1, 16000):
+            fed += end - stream.window_start
+            stream.feed(end, _hypothesis(stream.window_start, end))
+
+        self.assertGreater(stream.window_start, 0)
+        self.assertLess(fed, sum(range(16000, total + 1, 16000)) // 2)
+        final = stream.finalize(_hypothesis(stream.window_start, total))
+        self.assertEqual(final, _hypothesis(0, total))
+
+
+class StreamingFinalTranscriptTests(unittest.IsolatedAsyncioTestCase):
+    async def test_final_pass_only_transcribes_the_last_window(self) -> None:
+        session = vp.VoiceSessionRuntime(
+            selector="sat",
+            session_id="s1",
+            conversation_id="c1",
+            wake_word="tater",
+            audio_format={"rate": 16000, "width": 2, "channels": 1},
+            started_ts=0.0,
+            startup_gate_until_ts=0.0,
+            stt_backend="faster_whisper",
+            stt_backend_effective="faster_whisper",
+        )
+        session.audio_buffer.extend(b"\x00" * BYTES_PER_SECOND * 8)
+        stream = LocalAgreementStream(BYTES_PER_SECOND)
+        stream.committed = ["turn", "on", "the"]
+        stream.anchor = ["turn", "on", "the"]
+        stream.window_start = BYTES_PER_SECOND * 7
+        session.partial_stt_stream = stream
+
+        transcribe = mock.AsyncMock(return_value="the kitchen lights")
+        with mock.patch.object(backends, "_native_transcribe_local_audio_bytes", transcribe):
+            text = await backends._native_transcribe_session_audio(session)
+
+        self.assertEqual(text, "turn on the kitchen lights")
+        self.assertEqual(len(transcribe.call_args.kwargs["audio_bytes"]), BYTES_PER_SECOND)
+        self.assertIsNone(session.partial_stt_stream)
+
+
+if __name__ == "__main__":
+    unittest.main()
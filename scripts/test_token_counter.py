@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import token_counter  # noqa: E402
+
+
+def _gguf_string(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return struct.pack("<Q", len(raw)) + raw
+
+
+def _write_gguf(path: Path, *, model: str, tokens: list) -> None:
+    body = _gguf_string("tokenizer.ggml.model") + struct.pack("<I", 8) + _gguf_string(model)
+    body += _gguf_string("tokenizer.ggml.tokens") + struct.pack("<IIQ", 9, 8, len(tokens))
+    body += b"".join(_gguf_string(token) for token in tokens)
+    path.write_bytes(b"GGUF" + struct.pack("<IQQ", 3, 0, 2) + body)
+
+
+class TokenCounterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.root = Path(self.folder.name)
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def test_gguf_vocab_counts_byte_level_tokens(self) -> None:
+        path = self.root / "tiny.gguf"
+        _write_gguf(path, model="gpt2", tokens=["hello", "Ġworld", "Ġwor", "!", "h", "e", "l", "o", "Ġ"])
+
+        counter = token_counter.token_counter_for_model(str(path), wait=True)
+
+        self.assertEqual(counter.kind, "vocab")
+        self.assertEqual(counter.count("hello world!"), 3)
+        self.assertEqual(counter.count("hello hello"), 3)
+        self.assertEqual(token_counter.count_tokens("hello world!", model=str(path)), 3)
+
+    def test_hf_tokenizer_json_falls_back_to_vocab_matching(self) -> None:
+        (self.root / "tokenizer.json").write_text(
+            json.dumps({"model": {"type": "Unigram", "vocab": [["▁Hola", 0.0], ["▁mundo", 0.0], ["▁", 0.0]]}}),
+            encoding="utf-8",
+        )
+        with mock.patch.dict(sys.modules, {"tokenizers": None}):
+            counter = token_counter.token_counter_for_model(str(self.root), wait=True)
+
+        self.assertEqual(counter.kind, "vocab")
+        self.assertEqual(counter.count("Hola mundo"), 2)
+        # Unknown characters fall back to one token per UTF-8 byte.
+        self.assertEqual(counter.count("Hola ñ"), 1 + 1 + 2)
+
+    def test_unknown_models_use_the_estimator_and_counts_are_memoized(self) -> None:
+        counter = token_counter.token_counter_for_model("remote-model-without-local-files")
+        self.assertEqual(counter.kind, "estimate")
+        self.assertGreaterEqual(token_counter.estimate_tokens("今日は天気がいいですね"), 10)
+        self.assertGreater(token_counter.estimate_tokens('{"ok":true,"items":[1,2,3]}'), 8)
+
+        history = [f"message number {index} about the porch lights" for index in range(20)]
+        counter = token_counter.TokenCounter()
+        with mock.patch.object(counter, "_count", wraps=counter._count) as raw_count:
+            for size in range(1, len(history) + 1):
+                sum(counter.count(text) for text in history[:size])
+        self.assertEqual(raw_count.call_count, len(history))
+
+
+if __name__ == "__main__":
+    unittest.main()
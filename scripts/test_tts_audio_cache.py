@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import tts_audio_cache
+from tater_voice.voice_pipeline import backends
+
+
+class TtsAudioCacheTests(unittest.TestCase):
+    def test_key_normalizes_whitespace_and_skips_long_text(self) -> None:
+        first = tts_audio_cache.tts_audio_cache_key(backend="kokoro", voice="af", text="Timer  done.\n")
+        second = tts_audio_cache.tts_audio_cache_key(backend="kokoro", voice="af", text=" Timer done.")
+        other_voice = tts_audio_cache.tts_audio_cache_key(backend="kokoro", voice="bf", text="Timer done.")
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other_voice)
+        self.assertEqual(tts_audio_cache.tts_audio_cache_key(backend="kokoro", text="x" * 1000), "")
+
+    def test_lru_respects_byte_budget(self) -> None:
+        cache = tts_audio_cache.TtsAudioCache(max_bytes=10)
+        cache.put("a", b"aaaa", {"rate": 1})
+        cache.put("b", b"bbbb", {"rate": 2})
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", b"cccc", {"rate": 3})
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), (b"aaaa", {"rate": 1}))
+        snapshot = cache.snapshot()
+        self.assertEqual(snapshot["bytes"], 8)
+        self.assertEqual(snapshot["evictions"], 1)
+        self.assertEqual(snapshot["misses"], 1)
+
+    def test_evictions_spill_to_disk_and_promote_back(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = tts_audio_cache.TtsAudioCache(max_bytes=4, disk_max_bytes=1024, disk_dir=Path(tmp))
+            cache.put("a", b"aaaa", {"rate": 16000})
+            cache.put("b", b"bbbb", {"rate": 22050})
+
+            self.assertEqual(cache.get("a"), (b"aaaa", {"rate": 16000}))
+            self.assertEqual(cache.snapshot()["disk_hits"], 1)
+
+            reopened = tts_audio_cache.TtsAudioCache(max_bytes=4, disk_max_bytes=1024, disk_dir=Path(tmp))
+            self.assertEqual(reopened.get("b"), (b"bbbb", {"rate": 22050}))
+
+
+class NativeSynthesisCacheTests(unittest.TestCase):
+    def test_repeated_phrase_skips_the_backend(self) -> None:
+        calls = []
+
+        async def synthesize(prompt, **kwargs):
+            calls.append(prompt)
+            return b"pcm", {"rate": 16000, "width": 2, "channels": 1}, kwargs["effective_backend"], ""
+
+        cache = tts_audio_cache.TtsAudioCache(max_bytes=1024)
+        selection = {"backend": "piper", "model": "en_US", "voice": ""}
+        with (
+            mock.patch.object(tts_audio_cache, "_CACHE", cache),
+            mock.patch.object(backends, "_tts_selection_from_values", return_value=selection),
+            mock.patch.object(backends, "_resolve_tts_backend", return_value=("piper", "")),
+            mock.patch.object(backends, "_native_synthesize_selection", side_effect=synthesize),
+        ):
+            first = asyncio.run(backends._native_synthesize_text("No text recognized."))
+            second = asyncio.run(backends._native_synthesize_text("No text  recognized."))
+
+        self.assertEqual(calls, ["No text recognized."])
+        self.assertEqual(first[:3], second[:3])
+        self.assertEqual(cache.snapshot()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import tool_runtime  # noqa: E402
+import verba_settings  # noqa: E402
+
+
+class _CountingRedis:
+    def __init__(self) -> None:
+        self.hashes: dict = {}
+        self.strings: dict = {}
+        self.calls: list = []
+
+    def get(self, key):
+        self.calls.append("get")
+        return self.strings.get(key)
+
+    def incr(self, key):
+        self.calls.append("incr")
+        self.strings[key] = str(int(self.strings.get(key) or 0) + 1)
+        return int(self.strings[key])
+
+    def hgetall(self, key):
+        self.calls.append("hgetall")
+        return dict(self.hashes.get(key, {}))
+
+    def hget(self, key, field):
+        self.calls.append("hget")
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        self.calls.append("hset")
+        row = self.hashes.setdefault(key, {})
+        if mapping:
+            row.update(mapping)
+        else:
+            row[field] = value
+        return 1
+
+
+class VerbaEnabledMapTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.redis = _CountingRedis()
+        self.patcher = mock.patch.object(verba_settings, "redis_client", self.redis)
+        self.patcher.start()
+        verba_settings.invalidate_verba_enabled_cache()
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+        verba_settings.invalidate_verba_enabled_cache()
+
+    def test_list_tools_reads_the_enabled_map_once_regardless_of_verba_count(self) -> None:
+        registry = {
+            f"verba_{index:02d}": SimpleNamespace(name=f"verba_{index:02d}", description="tool", platforms=["webui"])
+            for index in range(64)
+        }
+        self.redis.hashes["verba_enabled"] = {"verba_03": "false", "verba_10": "true"}
+
+        first = tool_runtime.list_tools(platform="webui", registry=registry)
+        second = tool_runtime.list_tools(platform="webui", registry=registry)
+
+        self.assertEqual(self.redis.calls, ["get", "hgetall"])
+        self.assertEqual(len(first["verba_tools"]), 63)
+        self.assertEqual(second["verba_tools"], first["verba_tools"])
+
+    def test_saves_bump_the_version_and_other_writers_are_seen_after_the_check_window(self) -> None:
+        before = verba_settings.verba_enabled_map()
+        self.assertFalse(before("weather"))
+        self.assertTrue(verba_settings.verba_enabled_map(default=True)("weather"))
+
+        verba_settings.set_verba_enabled("weather", True)
+        after = verba_settings.verba_enabled_map()
+        self.assertTrue(after("weather"))
+        self.assertNotEqual(after.enabled_version, before.enabled_version)
+        self.assertTrue(verba_settings.get_verba_enabled("weather"))
+
+        self.redis.hashes["verba_enabled"]["weather"] = "false"
+        self.redis.incr(verba_settings.VERBA_ENABLED_VERSION_KEY)
+        self.assertTrue(verba_settings.get_verba_enabled("weather"))
+        with mock.patch.object(verba_settings, "VERBA_ENABLED_CHECK_SECONDS", 0.0):
+            self.assertFalse(verba_settings.get_verba_enabled("weather"))
+            reads = self.redis.calls.count("hgetall")
+            verba_settings.get_verba_enabled("weather")
+            self.assertEqual(self.redis.calls.count("hgetall"), reads)
+        self.assertNotIn("hget", self.redis.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tater_voice import voice_pipeline as vp
+
+
+class _FakeRedis:
+    def __init__(self, row: dict) -> None:
+        self.row = dict(row)
+        self.hgetall_calls = 0
+        self.on_hgetall = None
+
+    def hgetall(self, name: str) -> dict:
+        self.hgetall_calls += 1
+        if self.on_hgetall is not None:
+            self.on_hgetall()
+        return dict(self.row)
+
+
+class VoiceSettingsSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fake = _FakeRedis({"VOICE_INPUT_GAIN": "3.5", "VOICE_NATIVE_DEBUG": "true"})
+        patches = [
+            mock.patch.object(vp, "redis_client", self.fake),
+            mock.patch.object(vp, "_ensure_voice_settings_watch"),
+            mock.patch.object(vp, "_voice_settings_watch_connected", True),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        vp._invalidate_voice_config_cache()
+        self.addCleanup(vp._invalidate_voice_config_cache)
+
+    def test_hot_path_reads_share_one_published_snapshot(self) -> None:
+        self.assertEqual(vp._get_float_setting("VOICE_INPUT_GAIN", 1.0, minimum=0.5, maximum=16.0), 3.5)
+        self.assertEqual(vp._get_float_setting("VOICE_INPUT_GAIN", 1.0, minimum=0.5, maximum=2.0), 2.0)
+        self.assertTrue(vp._get_bool_setting("VOICE_NATIVE_DEBUG", False))
+        self.assertEqual(vp._get_int_setting("VOICE_MISSING", 7), 7)
+
+        self.assertEqual(self.fake.hgetall_calls, 1)
+        snapshot = vp._current_voice_settings()
+        self.assertIs(snapshot, vp._current_voice_settings())
+        with self.assertRaises(TypeError):
+            snapshot.values["VOICE_INPUT_GAIN"] = "9"
+
+    def test_invalidation_publishes_a_new_version(self) -> None:
+        first = vp._current_voice_settings()
+        self.fake.row["VOICE_INPUT_GAIN"] = "5"
+
+        vp._invalidate_voice_config_cache()
+        second = vp._current_voice_settings()
+
+        self.assertGreater(second.version, first.version)
+        self.assertEqual(vp._get_float_setting("VOICE_INPUT_GAIN", 1.0), 5.0)
+        self.assertEqual(first.get_float("VOICE_INPUT_GAIN", 1.0), 3.5)
+
+    def test_reload_raced_by_invalidation_is_not_published(self) -> None:
+        self.fake.on_hgetall = vp._invalidate_voice_config_cache
+
+        vp._current_voice_settings()
+        self.fake.on_hgetall = None
+        vp._current_voice_settings()
+
+        self.assertEqual(self.fake.hgetall_calls, 2)
+
+    def test_snapshot_expires_on_ttl_while_watch_is_down(self) -> None:
+        with mock.patch.object(vp, "_voice_settings_watch_connected", False):
+            vp._current_voice_settings()
+            with mock.patch.object(vp.time, "monotonic", return_value=vp.time.monotonic() + 60.0):
+                vp._current_voice_settings()
+
+        self.assertEqual(self.fake.hgetall_calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
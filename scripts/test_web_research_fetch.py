@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import http.server
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import kernel_tools  # noqa: E402
+import web_fetch  # noqa: E402
+import web_research  # noqa: E402
+
+# Some test modules stub sys.modules["helpers"]; close through the real module
+# that web_fetch registered its session with.
+close_shared_async_http_client = web_fetch.shared_async_loop_resource.__globals__["close_shared_async_http_client"]
+
+PAGE_DELAY_S = 0.4
+
+
+class _DelayedPages(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _PageHandler)
+        self.lock = threading.Lock()
+        self.bodies_served = 0
+        self.not_modified = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cookies: list = []
+
+
+class _PageHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.cookies.append(self.headers.get("Cookie") or "")
+        try:
+            time.sleep(PAGE_DELAY_S)
+            etag = f'"{self.path.strip("/")}-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                with server.lock:
+                    server.not_modified += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            name = self.path.strip("/")
+            body = (
+                f"<html><head><title>{name}</title></head><body><p>The {name} page explains sprinkler zones "
+                f"in enough detail to answer the question.</p></body></html>"
+            ).encode("utf-8")
+            with server.lock:
+                server.bodies_served += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", etag)
+            self.send_header("Set-Cookie", f"visit={name}; Path=/")
+            if name.startswith("private"):
+                self.send_header("Cache-Control", "no-store")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+class _NeverEnoughLlm:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def chat(self, **_kwargs):
+        self.calls += 1
+        return {"message": {"content": json.dumps({"enough": False, "reason": "keep looking"})}}
+
+
+class WebResearchFetchTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = _DelayedPages()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.patchers = [
+            mock.patch.dict(web_fetch.os.environ, {"TATER_WEB_CACHE_DIR": self.cache_dir.name}),
+            mock.patch.object(kernel_tools, "_validate_url", return_value=None),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    async def asyncTearDown(self) -> None:
+        await close_shared_async_http_client()
+
+    def tearDown(self) -> None:
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache_dir.cleanup()
+
+    def _search(self, count: int):
+        results = [{"title": f"page {index}", "url": f"{self.base}/page{index}", "snippet": ""} for index in range(count)]
+        return mock.patch.object(web_research, "search_web", return_value={"ok": True, "results": results})
+
+    async def test_research_fetches_candidate_pages_concurrently(self) -> None:
+        llm = _NeverEnoughLlm()
+        with self._search(4):
+            started = time.perf_counter()
+            result = await web_research.research_web(query="sprinkler zones", llm_client=llm, max_results=4, max_pages=4)
+            elapsed = time.perf_counter() - started
+
+        pages = result["data"]["inspected_pages"]
+        self.assertEqual([page["title"] for page in pages], ["page0", "page1", "page2", "page3"])
+        self.assertTrue(all(page["ok"] for page in pages))
+        self.assertEqual(llm.calls, 4)
+        self.assertLess(elapsed, PAGE_DELAY_S * 2.5)
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    async def test_repeat_fetch_revalidates_with_etag_and_reuses_extracted_text(self) -> None:
+        first = await web_fetch.inspect_webpage_async(f"{self.base}/guide", max_links=8, max_images=2)
+        with mock.patch.object(kernel_tools, "_inspect_fetched_webpage") as inspect:
+            second = await web_fetch.inspect_webpage_async(f"{self.base}/guide", max_links=8, max_images=2)
+
+        inspect.assert_not_called()
+        self.assertEqual((self.server.bodies_served, self.server.not_modified), (1, 1))
+        self.assertEqual(second["cache"], "revalidated")
+        self.assertEqual(second["content"], first["content"])
+        self.assertIn("sprinkler zones", second["content"])
+
+    async def test_no_store_pages_are_refetched_and_cookies_are_not_carried(self) -> None:
+        await web_fetch.inspect_webpage_async(f"{self.base}/private")
+        again = await web_fetch.inspect_webpage_async(f"{self.base}/private")
+
+        self.assertNotIn("cache", again)
+        self.assertEqual((self.server.bodies_served, self.server.not_modified), (2, 0))
+        self.assertEqual(list(Path(self.cache_dir.name).glob("*.json")), [])
+        self.assertEqual(self.server.cookies, ["", ""])
+
+        kernel_tools._fetch_webpage(f"{self.base}/first", timeout_sec=5, max_bytes=65_536)
+        kernel_tools._fetch_webpage(f"{self.base}/second", timeout_sec=5, max_bytes=65_536)
+        self.assertEqual(self.server.cookies[2:], ["", ""])
+
+    async def test_shared_http_shutdown_closes_the_fetch_session(self) -> None:
+        await web_fetch.inspect_webpage_async(f"{self.base}/guide")
+        session = web_fetch._client().session
+        self.assertIs(web_fetch._client().session, session)
+
+        await close_shared_async_http_client()
+        self.assertTrue(session.closed)
+        self.assertIsNot(web_fetch._client().session, session)
+
+    async def test_per_host_limit_bounds_parallel_requests(self) -> None:
+        with mock.patch.dict(web_fetch.os.environ, {"TATER_WEB_FETCH_PER_HOST": "1"}):
+            pages = await web_research.asyncio.gather(
+                *(web_fetch.inspect_webpage_async(f"{self.base}/serial{index}") for index in range(3))
+            )
+        self.assertTrue(all(page["ok"] for page in pages))
+        self.assertEqual(self.server.max_in_flight, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
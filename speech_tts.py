@@ -11,7 +11,6 @@ import os
 import re
 import socket
 import threading
-import time
 import uuid
 import wave
 from pathlib import Path
@@ -22,9 +21,11 @@ import requests
 
 from announcement_targets import split_announcement_targets
 from helpers import redis_client
+from runtime_assets import runtime_asset_store
 from runtime_executors import run_background, run_tts
 from tater_paths import agent_lab_path
-from managed_tts import clear_managed_tts_workers, is_managed_tts_backend, synthesize_managed_tts_pcm
+from tts_audio_cache import get_cached_tts_audio, store_cached_tts_audio, tts_audio_cache_key
+from managed_tts import aiter_managed_tts_pcm, clear_managed_tts_workers, is_managed_tts_backend
 from tateros import integration_store as integration_store_module
 from speech_settings import (
     DEFAULT_ANNOUNCEMENT_TTS_BACKEND,
@@ -195,8 +196,6 @@ _POCKET_TTS_VOICE_STATE_CACHE_LIMIT = 8
 _piper_voice_cache: Dict[str, Any] = {}
 _piper_voice_lock = threading.Lock()
 _kokoro_ssmd_patch_applied = False
-_runtime_tts_assets: Dict[str, Dict[str, Any]] = {}
-_runtime_tts_assets_lock = threading.Lock()
 logger = logging.getLogger("speech_tts")
 RUNTIME_TTS_ASSET_TTL_SECONDS = 15 * 60.0
 
@@ -362,58 +361,30 @@ def _main_app_port() -> int:
     return int(port)
 
 
-def _cleanup_runtime_tts_assets_locked(*, now_ts: Optional[float] = None) -> int:
-    now = float(now_ts if isinstance(now_ts, (int, float)) else time.time())
-    removed = 0
-    for asset_id, row in list(_runtime_tts_assets.items()):
-        if not isinstance(row, dict):
-            _runtime_tts_assets.pop(asset_id, None)
-            removed += 1
-            continue
-        expires_ts = _as_float(row.get("expires_ts"), 0.0)
-        if expires_ts > 0 and now >= expires_ts:
-            _runtime_tts_assets.pop(asset_id, None)
-            removed += 1
-    return removed
-
-
 def store_runtime_tts_wav(
     wav_bytes: bytes,
     *,
     content_type: str = "audio/wav",
     ttl_s: float = RUNTIME_TTS_ASSET_TTL_SECONDS,
 ) -> str:
-    payload = bytes(wav_bytes or b"")
-    if not payload:
+    if not wav_bytes:
         return ""
-
-    asset_id = uuid.uuid4().hex
-    expires_ts = time.time() + max(30.0, float(ttl_s))
-    with _runtime_tts_assets_lock:
-        _cleanup_runtime_tts_assets_locked()
-        _runtime_tts_assets[asset_id] = {
-            "bytes": payload,
-            "content_type": _text(content_type) or "audio/wav",
-            "expires_ts": expires_ts,
-        }
-    return asset_id
+    return runtime_asset_store().put(
+        wav_bytes,
+        ttl_s=max(30.0, float(ttl_s)),
+        meta={"content_type": _text(content_type) or "audio/wav"},
+    )
 
 
 def get_runtime_tts_wav(asset_id: Any) -> Optional[Dict[str, Any]]:
-    token = _text(asset_id)
-    if not token:
+    asset = runtime_asset_store().get(_text(asset_id))
+    if asset is None:
         return None
-
-    with _runtime_tts_assets_lock:
-        _cleanup_runtime_tts_assets_locked()
-        row = _runtime_tts_assets.get(token)
-        if not isinstance(row, dict):
-            return None
-        return {
-            "bytes": bytes(row.get("bytes") or b""),
-            "content_type": _text(row.get("content_type") or "audio/wav"),
-            "expires_ts": _as_float(row.get("expires_ts"), 0.0),
-        }
+    return {
+        "bytes": asset.body,
+        "content_type": _text(asset.meta.get("content_type") or "audio/wav"),
+        "expires_ts": asset.expires_ts,
+    }
 
 
 def _service_base_url_for_peer(peer_base: Any = "") -> str:
@@ -2280,6 +2251,89 @@ async def synthesize_tts_wav(
     if not prompt:
         raise RuntimeError("Preview text is required.")
 
+    options = {
+        "wyoming_host": wyoming_host,
+        "wyoming_port": wyoming_port,
+        "wyoming_voice": wyoming_voice,
+        "openai_base_url": openai_base_url,
+        "openai_api_key": openai_api_key,
+        "chatterbox_base_url": chatterbox_base_url,
+        "chatterbox_voice_mode": chatterbox_voice_mode,
+        "chatterbox_chunk_size": chatterbox_chunk_size,
+        "chatterbox_temperature": chatterbox_temperature,
+        "chatterbox_exaggeration": chatterbox_exaggeration,
+        "chatterbox_cfg_weight": chatterbox_cfg_weight,
+        "chatterbox_seed": chatterbox_seed,
+        "chatterbox_speed_factor": chatterbox_speed_factor,
+        "chatterbox_language": chatterbox_language,
+        "acceleration": acceleration,
+        "clone_audio": clone_audio,
+        "clone_text": clone_text,
+        "managed_language": managed_language,
+        "managed_instruct": managed_instruct,
+    }
+    gain = None
+    if selected_backend == "kokoro":
+        gain = _kokoro_output_gain(kokoro_output_gain)
+    elif selected_backend == "pocket_tts":
+        gain = _pocket_tts_output_gain(pocket_tts_output_gain)
+    extra: Dict[str, Any] = {"container": "wav", **options}
+    if selected_backend in {"openai_compatible", "chatterbox"} or is_managed_tts_backend(selected_backend):
+        # Unset options fall back to the shared speech settings inside the backend.
+        extra["speech_settings"] = get_speech_settings()
+    cache_key = tts_audio_cache_key(
+        backend=selected_backend,
+        model=model,
+        voice=voice,
+        gain=gain,
+        text=prompt,
+        extra=extra,
+    )
+    cached = get_cached_tts_audio(cache_key)
+    if cached is not None:
+        return cached[0]
+
+    wav_bytes = await _synthesize_tts_wav_uncached(
+        prompt,
+        selected_backend=selected_backend,
+        model=model,
+        voice=voice,
+        kokoro_output_gain=kokoro_output_gain,
+        pocket_tts_output_gain=pocket_tts_output_gain,
+        **options,
+    )
+    store_cached_tts_audio(cache_key, wav_bytes, {"container": "wav"})
+    return wav_bytes
+
+
+async def _synthesize_tts_wav_uncached(
+    prompt: str,
+    *,
+    selected_backend: str,
+    model: str,
+    voice: str,
+    wyoming_host: str,
+    wyoming_port: Any,
+    wyoming_voice: str,
+    openai_base_url: Optional[str],
+    openai_api_key: Optional[str],
+    chatterbox_base_url: Optional[str],
+    chatterbox_voice_mode: Any,
+    chatterbox_chunk_size: Any,
+    chatterbox_temperature: Any,
+    chatterbox_exaggeration: Any,
+    chatterbox_cfg_weight: Any,
+    chatterbox_seed: Any,
+    chatterbox_speed_factor: Any,
+    chatterbox_language: Any,
+    acceleration: Any,
+    kokoro_output_gain: Any,
+    pocket_tts_output_gain: Any,
+    clone_audio: Any,
+    clone_text: Any,
+    managed_language: Any,
+    managed_instruct: Any,
+) -> bytes:
     if selected_backend == "kokoro":
         audio_bytes, audio_format = await run_tts(
             _synthesize_kokoro_sync,
@@ -2312,8 +2366,10 @@ async def synthesize_tts_wav(
     if is_managed_tts_backend(selected_backend):
         speech_settings = get_speech_settings()
         prefix = "qwen_tts" if selected_backend == "qwen3_tts" else "omnivoice_tts"
-        audio_bytes, audio_format = await run_tts(
-            synthesize_managed_tts_pcm,
+        # Streamed so a cancelled caller also cancels the worker request.
+        chunks: List[bytes] = []
+        audio_format: Dict[str, int] = {}
+        async for chunk, audio_format in aiter_managed_tts_pcm(
             prompt,
             backend=selected_backend,
             model=_text(model),
@@ -2326,8 +2382,12 @@ async def synthesize_tts_wav(
                 managed_instruct if managed_instruct is not None else speech_settings.get(f"{prefix}_instruct")
             ),
             acceleration=acceleration if acceleration is not None else speech_settings.get("acceleration"),
-        )
-        return pcm_to_wav(audio_bytes, audio_format)
+            split=False,
+        ):
+            chunks.append(chunk)
+        if not chunks:
+            raise RuntimeError("Managed TTS produced no audio.")
+        return pcm_to_wav(b"".join(chunks), audio_format)
 
     if selected_backend == "openai_compatible":
         resolved_base_url, resolved_api_key = _resolve_openai_compatible_tts_settings(
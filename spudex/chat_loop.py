@@ -134,7 +134,7 @@ def _int_default(value: Any, default: int) -> int:
 
 
 def _recent_session_context(session_id: str) -> List[Dict[str, Any]]:
-    rows = read_spudex_logs(session_id, after_seq=0, limit=350).get("entries") or []
+    rows = read_spudex_logs(session_id, limit=160, tail=True).get("entries") or []
     context: List[Dict[str, Any]] = []
     total_chars = 0
     for entry in rows[-160:]:
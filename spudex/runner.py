@@ -1,4 +1,5 @@
 import asyncio
+import atexit
 import difflib
 import json
 import os
@@ -7,6 +8,7 @@ import re
 import shutil
 import signal
 import subprocess
+import threading
 import time
 import uuid
 from pathlib import Path
@@ -14,6 +16,7 @@ from typing import Any, Dict, List
 
 from kernel_tools import AGENT_LAB_DIR
 
+from . import session_store
 from .policy import display_agent_path, explain_policy_block, normalize_argv, resolve_spudex_cwd, resolve_spudex_file_path, validate_spudex_command
 from .settings import get_spudex_settings
 
@@ -25,6 +28,18 @@ _ACTIVE_PROCESSES: dict[str, asyncio.subprocess.Process] = {}
 _ACTIVE_TASKS: dict[str, asyncio.Task[Any]] = {}
 _SESSION_LOCK = asyncio.Lock()
 _DEFAULT_SUBPROCESS_PATH = "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"
+LOG_META_FLUSH_S = 2.0
+
+# Newest log seq/ts per meta file, kept until the session is deleted so a save
+# holding an older copy of the meta can never move log_seq backwards. Paths in
+# _dirty_log_meta still need a flush.
+_log_meta: dict[str, tuple[int, float]] = {}
+_dirty_log_meta: dict[str, Path] = {}
+_log_meta_lock = threading.Lock()
+_log_meta_flush_timer: threading.Timer | None = None
+# Serializes every meta file write, from the event loop and the flush timer
+# thread alike, so a flush never writes back a stale status.
+_meta_file_lock = threading.Lock()
 
 
 def _now() -> float:
@@ -186,8 +201,7 @@ def _paths(session_id: str) -> tuple[Path, Path]:
     return SESSIONS_DIR / f"{safe_id}.json", SESSIONS_DIR / f"{safe_id}.jsonl"
 
 
-def _load_meta(session_id: str) -> Dict[str, Any]:
-    meta_path, _ = _paths(session_id)
+def _read_meta_file(meta_path: Path) -> Dict[str, Any]:
     if not meta_path.exists():
         return {}
     try:
@@ -197,6 +211,21 @@ def _load_meta(session_id: str) -> Dict[str, Any]:
     return parsed if isinstance(parsed, dict) else {}
 
 
+def _apply_log_meta(meta_path: Path, meta: Dict[str, Any]) -> Dict[str, Any]:
+    with _log_meta_lock:
+        latest = _log_meta.get(str(meta_path))
+    if meta and latest is not None:
+        seq, ts = latest
+        meta["log_seq"] = max(int(meta.get("log_seq") or 0), seq)
+        meta["updated_ts"] = max(float(meta.get("updated_ts") or 0), ts)
+    return meta
+
+
+def _load_meta(session_id: str) -> Dict[str, Any]:
+    meta_path, _ = _paths(session_id)
+    return _apply_log_meta(meta_path, _read_meta_file(meta_path))
+
+
 def get_spudex_session(session_id: str) -> Dict[str, Any]:
     return _load_meta(session_id)
 
@@ -214,10 +243,66 @@ def _save_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
     session_id = str(meta.get("id") or uuid.uuid4().hex)
     meta["id"] = session_id
     meta_path, _ = _paths(session_id)
-    meta_path.write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
+    with _meta_file_lock:
+        _write_meta_file(meta_path, _apply_log_meta(meta_path, meta))
     return meta
 
 
+def _write_meta_file(meta_path: Path, meta: Dict[str, Any]) -> None:
+    # Caller holds _meta_file_lock.
+    with _log_meta_lock:
+        latest = _log_meta.get(str(meta_path))
+        if latest is not None and latest[0] <= int(meta.get("log_seq") or 0):
+            _dirty_log_meta.pop(str(meta_path), None)
+    meta_path.write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
+    session_store.record_session_summary(meta_path.parent, meta)
+
+
+def _log_meta_flush_s() -> float:
+    try:
+        return max(0.05, float(os.getenv("TATER_SPUDEX_LOG_META_FLUSH_S", LOG_META_FLUSH_S)))
+    except Exception:
+        return LOG_META_FLUSH_S
+
+
+def flush_spudex_log_meta() -> None:
+    global _log_meta_flush_timer
+    with _log_meta_lock:
+        _log_meta_flush_timer = None
+        dirty = list(_dirty_log_meta.values())
+    for meta_path in dirty:
+        # Re-read under the file lock: only the log fields are merged into
+        # whatever status the session last saved.
+        with _meta_file_lock:
+            meta = _read_meta_file(meta_path) if meta_path.parent.exists() else {}
+            if meta:
+                _write_meta_file(meta_path, _apply_log_meta(meta_path, meta))
+                continue
+        with _log_meta_lock:
+            _dirty_log_meta.pop(str(meta_path), None)
+
+
+def _forget_log_meta(meta_path: Path) -> None:
+    with _log_meta_lock:
+        _log_meta.pop(str(meta_path), None)
+        _dirty_log_meta.pop(str(meta_path), None)
+
+
+def _schedule_log_meta_flush(meta_path: Path, seq: int, ts: float) -> None:
+    global _log_meta_flush_timer
+    with _log_meta_lock:
+        previous = _log_meta.get(str(meta_path), (0, 0.0))
+        _log_meta[str(meta_path)] = (max(previous[0], seq), max(previous[1], ts))
+        _dirty_log_meta[str(meta_path)] = meta_path
+        if _log_meta_flush_timer is None:
+            _log_meta_flush_timer = threading.Timer(_log_meta_flush_s(), flush_spudex_log_meta)
+            _log_meta_flush_timer.daemon = True
+            _log_meta_flush_timer.start()
+
+
+atexit.register(flush_spudex_log_meta)
+
+
 def _clip_text(value: Any, limit: int = 24000) -> str:
     text = str(value if value is not None else "")
     if len(text) <= limit:
@@ -430,43 +515,26 @@ def _git_status_for(path: Path) -> Dict[str, Any]:
 
 def append_session_log(session_id: str, *, stream: str, text: str, level: str = "info") -> Dict[str, Any]:
     _ensure_dirs()
-    meta = _load_meta(session_id)
-    seq = int(meta.get("log_seq") or 0) + 1
-    entry = {
-        "seq": seq,
-        "ts": _now(),
-        "stream": str(stream or "log"),
-        "level": str(level or "info"),
-        "text": str(text or ""),
-    }
-    _, log_path = _paths(session_id)
-    with log_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
-    meta["log_seq"] = seq
-    meta["updated_ts"] = entry["ts"]
-    _save_meta(meta)
+    meta_path, log_path = _paths(session_id)
+    entry = session_store.append_log_entry(
+        log_path,
+        {
+            "ts": _now(),
+            "stream": str(stream or "log"),
+            "level": str(level or "info"),
+            "text": str(text or ""),
+        },
+        seq_floor=lambda: int(_read_meta_file(meta_path).get("log_seq") or 0),
+    )
+    # log_seq/updated_ts reach the meta file on the next flush or meta save.
+    _schedule_log_meta_flush(meta_path, int(entry["seq"]), float(entry["ts"]))
     return entry
 
 
-def read_spudex_logs(session_id: str, *, after_seq: int = 0, limit: int = 200) -> Dict[str, Any]:
+def read_spudex_logs(session_id: str, *, after_seq: int = 0, limit: int = 200, tail: bool = False) -> Dict[str, Any]:
     _, log_path = _paths(session_id)
-    entries: list[Dict[str, Any]] = []
     max_limit = max(1, min(1000, int(limit or 200)))
-    if log_path.exists():
-        with log_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                try:
-                    entry = json.loads(line)
-                except Exception:
-                    continue
-                if not isinstance(entry, dict):
-                    continue
-                seq = int(entry.get("seq") or 0)
-                if seq <= int(after_seq or 0):
-                    continue
-                entries.append(entry)
-                if len(entries) >= max_limit:
-                    break
+    entries = session_store.read_log_entries(log_path, after_seq=int(after_seq or 0), limit=max_limit, tail=bool(tail))
     last_seq = int(entries[-1].get("seq") or after_seq or 0) if entries else int(after_seq or 0)
     return {"ok": True, "session_id": session_id, "entries": entries, "last_seq": last_seq}
 
@@ -517,18 +585,23 @@ def update_spudex_session(session_id: str, **updates: Any) -> Dict[str, Any]:
 
 def list_spudex_sessions(*, limit: int = 80) -> list[Dict[str, Any]]:
     _ensure_dirs()
+    summaries = session_store.session_summaries(SESSIONS_DIR)
+    for summary in summaries:
+        _apply_log_meta(_paths(str(summary.get("id") or ""))[0], summary)
+    summaries.sort(key=lambda item: float(item.get("updated_ts") or item.get("created_ts") or 0), reverse=True)
     rows: list[Dict[str, Any]] = []
-    for meta_path in SESSIONS_DIR.glob("*.json"):
-        try:
-            parsed = json.loads(meta_path.read_text(encoding="utf-8"))
-        except Exception:
+    max_rows = max(1, int(limit or 80))
+    for summary in summaries:
+        session_id = str(summary.get("id") or "")
+        meta = _load_meta(session_id)
+        if not meta:
+            session_store.drop_session_summary(SESSIONS_DIR, session_id)
             continue
-        if isinstance(parsed, dict):
-            session_id = str(parsed.get("id") or "")
-            parsed["active"] = session_id in _ACTIVE_PROCESSES or session_id in _ACTIVE_TASKS
-            rows.append(parsed)
-    rows.sort(key=lambda item: float(item.get("updated_ts") or item.get("created_ts") or 0), reverse=True)
-    return rows[: max(1, int(limit or 80))]
+        meta["active"] = session_id in _ACTIVE_PROCESSES or session_id in _ACTIVE_TASKS
+        rows.append(meta)
+        if len(rows) >= max_rows:
+            break
+    return rows
 
 
 def list_spudex_processes(*, model_only: bool = False) -> list[Dict[str, Any]]:
@@ -1141,11 +1214,14 @@ async def close_spudex_session(session_id: str) -> Dict[str, Any]:
 
     _ACTIVE_PROCESSES.pop(clean_id, None)
     _ACTIVE_TASKS.pop(clean_id, None)
+    _forget_log_meta(meta_path)
     for path in (meta_path, log_path):
         try:
             path.unlink(missing_ok=True)
         except FileNotFoundError:
             pass
+    session_store.forget_log(log_path)
+    session_store.drop_session_summary(meta_path.parent, clean_id)
 
     return {"ok": True, "session_id": clean_id, "closed": True}
 
@@ -0,0 +1,240 @@
+import bisect
+import json
+import os
+import threading
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable
+
+LOG_INDEX_STRIDE = 64
+MAX_OPEN_LOGS = 64
+# The summary index lives in its own directory so no session id (each maps
+# to "<id>.json" in the sessions dir) can name the same file.
+SUMMARY_INDEX_DIR = "_index"
+SUMMARY_INDEX_NAME = "summary.json"
+SUMMARY_FIELDS = ("id", "label", "status", "source", "platform", "created_ts", "updated_ts")
+
+_LOCK = threading.RLock()
+_LOGS: "OrderedDict[str, _SessionLog]" = OrderedDict()
+_SUMMARIES: dict[str, tuple[Any, Dict[str, Dict[str, Any]]]] = {}
+
+
+class _SessionLog:
+    __slots__ = ("path", "seq", "size", "count", "seqs", "offsets")
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.seq = 0
+        self.size = 0
+        self.count = 0
+        # Sparse seq -> byte offset index: one point every LOG_INDEX_STRIDE entries.
+        self.seqs: list[int] = []
+        self.offsets: list[int] = []
+
+    def note(self, seq: int, offset: int, end: int) -> None:
+        if self.count % LOG_INDEX_STRIDE == 0:
+            self.seqs.append(seq)
+            self.offsets.append(offset)
+        self.count += 1
+        self.seq = max(self.seq, seq)
+        self.size = end
+
+    def scan(self) -> None:
+        self.seq = self.size = self.count = 0
+        self.seqs, self.offsets = [], []
+        try:
+            handle = self.path.open("rb")
+        except FileNotFoundError:
+            return
+        with handle:
+            offset = 0
+            for line in handle:
+                end = offset + len(line)
+                entry = _parse_line(line)
+                if entry is not None:
+                    self.note(int(entry.get("seq") or 0), offset, end)
+                offset = end
+            self.size = offset
+
+
+def _parse_line(line: bytes) -> Dict[str, Any] | None:
+    try:
+        entry = json.loads(line)
+    except Exception:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _iter_entries(path: Path, offset: int) -> Iterable[Dict[str, Any]]:
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return
+    with handle:
+        handle.seek(offset)
+        for line in handle:
+            entry = _parse_line(line)
+            if entry is not None:
+                yield entry
+
+
+def _log_for(path: Path) -> _SessionLog:
+    key = str(path)
+    log = _LOGS.get(key)
+    if log is None:
+        log = _SessionLog(path)
+        log.scan()
+        _LOGS[key] = log
+        while len(_LOGS) > MAX_OPEN_LOGS:
+            _LOGS.popitem(last=False)
+    else:
+        _LOGS.move_to_end(key)
+    return log
+
+
+def append_log_entry(path: Path, entry: Dict[str, Any], *, seq_floor: Callable[[], int]) -> Dict[str, Any]:
+    with _LOCK:
+        log = _log_for(path)
+        with path.open("ab") as handle:
+            offset = handle.tell()
+            if offset != log.size:
+                # Someone else touched the file; rebuild the index from disk.
+                log.scan()
+                offset = log.size
+            if log.count == 0:
+                log.seq = max(log.seq, int(seq_floor() or 0))
+            seq = log.seq + 1
+            row = {"seq": seq, **entry}
+            line = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+            handle.write(line)
+        log.note(seq, offset, offset + len(line))
+        return row
+
+
+def read_log_entries(path: Path, *, after_seq: int = 0, limit: int = 200, tail: bool = False) -> list[Dict[str, Any]]:
+    with _LOCK:
+        log = _log_for(path)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size != log.size:
+            log.scan()
+        if tail:
+            # Start at the index point just before the last `limit` entries.
+            point = max(0, (log.count - limit) // LOG_INDEX_STRIDE)
+        else:
+            point = bisect.bisect_right(log.seqs, after_seq) - 1
+        offset = log.offsets[point] if 0 <= point < len(log.offsets) else 0
+    if tail:
+        recent: deque = deque(maxlen=limit)
+        for entry in _iter_entries(path, offset):
+            if int(entry.get("seq") or 0) > after_seq:
+                recent.append(entry)
+        return list(recent)
+    entries: list[Dict[str, Any]] = []
+    for entry in _iter_entries(path, offset):
+        if int(entry.get("seq") or 0) <= after_seq:
+            continue
+        entries.append(entry)
+        if len(entries) >= limit:
+            break
+    return entries
+
+
+def cached_log_seq(path: Path) -> int:
+    with _LOCK:
+        log = _LOGS.get(str(path))
+        return log.seq if log is not None else 0
+
+
+def forget_log(path: Path) -> None:
+    with _LOCK:
+        _LOGS.pop(str(path), None)
+
+
+def _summary_row(meta: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: meta.get(key) for key in SUMMARY_FIELDS}
+
+
+def _summary_signature(index_path: Path) -> Any:
+    try:
+        stat = index_path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _index_path(sessions_dir: Path) -> Path:
+    return sessions_dir / SUMMARY_INDEX_DIR / SUMMARY_INDEX_NAME
+
+
+def _write_summaries(index_path: Path, rows: Dict[str, Dict[str, Any]]) -> None:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = index_path.with_name(f".{index_path.name}.tmp")
+    temp_path.write_text(json.dumps(rows, sort_keys=True), encoding="utf-8")
+    os.replace(temp_path, index_path)
+    _SUMMARIES[str(index_path)] = (_summary_signature(index_path), rows)
+
+
+def _rebuild_summaries(sessions_dir: Path) -> Dict[str, Dict[str, Any]]:
+    rows: Dict[str, Dict[str, Any]] = {}
+    for meta_path in sessions_dir.glob("*.json"):
+        try:
+            parsed = json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        # Meta files are named after their (sanitized) id; this also skips the
+        # old sessions/index.json summary file.
+        if not isinstance(parsed, dict) or not parsed.get("id"):
+            continue
+        if "".join(ch for ch in str(parsed["id"]) if ch.isalnum() or ch in {"_", "-"}) == meta_path.stem:
+            rows[str(parsed["id"])] = _summary_row(parsed)
+    return rows
+
+
+def _summaries(sessions_dir: Path) -> Dict[str, Dict[str, Any]]:
+    index_path = _index_path(sessions_dir)
+    signature = _summary_signature(index_path)
+    cached = _SUMMARIES.get(str(index_path))
+    if cached is not None and signature is not None and cached[0] == signature:
+        return cached[1]
+    rows: Any = None
+    if signature is not None:
+        try:
+            rows = json.loads(index_path.read_text(encoding="utf-8"))
+        except Exception:
+            rows = None
+    if not isinstance(rows, dict):
+        rows = _rebuild_summaries(sessions_dir)
+        _write_summaries(index_path, rows)
+        return rows
+    _SUMMARIES[str(index_path)] = (signature, rows)
+    return rows
+
+
+def session_summaries(sessions_dir: Path) -> list[Dict[str, Any]]:
+    with _LOCK:
+        return [dict(row) for row in _summaries(sessions_dir).values()]
+
+
+def record_session_summary(sessions_dir: Path, meta: Dict[str, Any]) -> None:
+    session_id = str(meta.get("id") or "")
+    if not session_id:
+        return
+    row = _summary_row(meta)
+    with _LOCK:
+        rows = _summaries(sessions_dir)
+        if rows.get(session_id) == row:
+            return
+        rows[session_id] = row
+        _write_summaries(_index_path(sessions_dir), rows)
+
+
+def drop_session_summary(sessions_dir: Path, session_id: str) -> None:
+    with _LOCK:
+        if not sessions_dir.exists():
+            return
+        rows = _summaries(sessions_dir)
+        if rows.pop(str(session_id or ""), None) is not None:
+            _write_summaries(_index_path(sessions_dir), rows)
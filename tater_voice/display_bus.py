@@ -322,26 +322,52 @@ def _event_from_payload(payload: Dict[str, Any], *, seq: int) -> Dict[str, Any]:
     return event
 
 
-def _load_events(client: Any = None) -> List[Dict[str, Any]]:
+_EVENT_CACHE_LOCK = threading.Lock()
+# (client, seq, parsed rows) for the last list read; reused until the seq
+# counter moves, so idle polls cost one GET instead of LRANGE + JSON parsing.
+_EVENT_CACHE: List[Any] = [None, -1, []]
+
+
+def display_event_seq(client: Any = None) -> int:
     store = client or redis_client
+    try:
+        return _as_int(store.get(DISPLAY_EVENT_SEQ_KEY), 0, minimum=0)
+    except Exception:
+        return 0
+
+
+def _parse_event_rows(store: Any) -> List[Dict[str, Any]]:
     try:
         raw_rows = store.lrange(DISPLAY_EVENTS_KEY, 0, -1)
     except Exception:
         return []
-    events: List[Dict[str, Any]] = []
-    now = time.time()
-    for raw in raw_rows:
+    rows: List[Dict[str, Any]] = []
+    for raw in raw_rows or []:
         try:
             row = json.loads(_text(raw))
         except Exception:
             continue
-        if not isinstance(row, dict):
-            continue
-        if float(row.get("expires_at") or 0.0) <= now:
-            continue
-        events.append(row)
-    events.sort(key=lambda item: int(item.get("seq") or 0))
-    return events
+        if isinstance(row, dict):
+            rows.append(row)
+    rows.sort(key=lambda item: int(item.get("seq") or 0))
+    return rows
+
+
+def _load_events(client: Any = None, *, seq: Optional[int] = None) -> List[Dict[str, Any]]:
+    store = client or redis_client
+    current_seq = display_event_seq(store) if seq is None else int(seq)
+    with _EVENT_CACHE_LOCK:
+        cached_client, cached_seq, cached_rows = _EVENT_CACHE
+        rows = cached_rows if cached_client is store and cached_seq == current_seq else None
+    if rows is None:
+        rows = _parse_event_rows(store)
+        # The seq is taken before the event is pushed; only cache a read that
+        # already contains the event the counter points at.
+        if rows and int(rows[-1].get("seq") or 0) == current_seq:
+            with _EVENT_CACHE_LOCK:
+                _EVENT_CACHE[:] = [store, current_seq, rows]
+    now = time.time()
+    return [row for row in rows if float(row.get("expires_at") or 0.0) > now]
 
 
 def publish_display_event(payload: Dict[str, Any], *, client: Any = None) -> Dict[str, Any]:
@@ -363,11 +389,14 @@ def list_display_events(
 ) -> Dict[str, Any]:
     max_rows = _as_int(limit, 20, minimum=1, maximum=50)
     threshold = _as_int(after_seq, 0, minimum=0)
-    events = [
-        event
-        for event in _load_events(client)
-        if int(event.get("seq") or 0) > threshold and _matches_target(event, target)
-    ]
+    current_seq = display_event_seq(client)
+    events = []
+    if current_seq > threshold:
+        events = [
+            event
+            for event in _load_events(client, seq=current_seq)
+            if int(event.get("seq") or 0) > threshold and _matches_target(event, target)
+        ]
     events = events[:max_rows]
     last_seq = threshold
     for event in events:
@@ -382,10 +411,16 @@ def list_display_events(
     }
 
 
-def display_feed_events(target: str = "", *, limit: int = 3, client: Any = None) -> List[Dict[str, Any]]:
+def display_feed_events(
+    target: str = "",
+    *,
+    limit: int = 3,
+    client: Any = None,
+    seq: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     rows = [
         event
-        for event in reversed(_load_events(client))
+        for event in reversed(_load_events(client, seq=seq))
         if _matches_target(event, target)
     ]
     return rows[: _as_int(limit, 3, minimum=0, maximum=10)]
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import math
 import re
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from helpers import redis_client
-from integration_runtime import integration_runtime_states
+from integration_runtime import integration_runtime_state_lookup
 from . import display_bus
 
 
 _DISPLAY_PROFILE_HASH_KEY = "tater:display:profiles:v1"
+_DISPLAY_PROFILE_VERSION_KEY = "tater:display:profiles:version:v1"
 _DEFAULT_SLOT_LABELS: Dict[str, str] = {
     "temp_out": "Outdoor Temperature",
     "temp_in": "Indoor Temperature",
@@ -57,6 +61,16 @@ _ENVIRONMENT_PROVIDER_LATEST_KEYS: Dict[str, str] = {
 _ENVIRONMENT_SETTINGS_KEY = "environment_core_settings"
 _DEFAULT_TEMPERATURE_UNIT = "F"
 
+# Composed-feed caches. Resolved slot maps are keyed by the saved-profile
+# version and the request query; normalized slots by the change token of the
+# record they were built from (entity version or environment snapshot hash).
+_FEED_CACHE_LOCK = threading.Lock()
+_SLOT_MAP_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, str]]" = OrderedDict()
+_SLOT_MAP_CACHE_LIMIT = 256
+_SLOT_CACHE: "OrderedDict[Tuple[str, str, Any], Dict[str, Any]]" = OrderedDict()
+_SLOT_CACHE_LIMIT = 2048
+_ENVIRONMENT_CACHE: Dict[str, Any] = {}
+
 
 def _text(value: Any) -> str:
     if value is None:
@@ -438,57 +452,52 @@ def _compact_requested(query: Any) -> bool:
     return False
 
 
-def _runtime_integration_states(client: Any = None) -> Dict[str, Dict[str, Any]]:
+def _slot_runtime_records(client: Any, requested_slots: Mapping[str, str]) -> Dict[str, Tuple[Dict[str, Any], Any]]:
+    """Runtime record and change token for each requested slot spec.
+
+    Integration states come from the incremental runtime state cache, so only
+    the referenced entities are copied; their per-entity ``version`` is the
+    token. Environment readings share one token derived from the raw
+    snapshots they were built from.
+    """
+    specs = {spec: _split_slot_spec(spec) for spec in requested_slots.values()}
+    runtime_keys = [key for key in specs.values() if key[0] and key[0] != "environment"]
     try:
-        snapshot = integration_runtime_states(client or redis_client)
+        found, _version = integration_runtime_state_lookup(client, runtime_keys)
     except Exception:
-        snapshot = {}
-    rows = snapshot.get("states") if isinstance(snapshot, dict) and isinstance(snapshot.get("states"), list) else []
-    out: Dict[str, Dict[str, Any]] = {}
-    for record in rows:
-        if not isinstance(record, dict):
+        found = {}
+    environment_states: Dict[str, Dict[str, Any]] = {}
+    environment_token = ""
+    if any(provider == "environment" for provider, _state_id in specs.values()):
+        environment_states, environment_token = _environment_state_index(client)
+    out: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+    for spec, (provider, state_id) in specs.items():
+        if provider == "environment":
+            record = environment_states.get(f"environment:{state_id}") or {}
+            out[spec] = (record, environment_token if record else 0)
             continue
-        provider = _lower(record.get("provider"))
-        if not provider:
-            continue
-        payload = record.get("payload") if isinstance(record.get("payload"), dict) else {}
-        state_id = _text(payload.get("entity_id") if provider == "homeassistant" else record.get("id"))
-        if not state_id:
-            state_id = _text(record.get("id"))
-        if not state_id:
-            continue
-        out[f"{provider}:{state_id}"] = record
-        if provider == "homeassistant":
-            out[state_id] = record
-    out.update(_environment_runtime_states(client or redis_client))
+        record = found.get((provider, state_id)) or {}
+        out[spec] = (record, int(record.get("version") or 0) if record else 0)
     return out
 
 
-def _json_from_redis_key(client: Any, key: str, default: Any) -> Any:
-    try:
-        raw = client.get(key)
-    except Exception:
-        return default
-    if raw in (None, ""):
-        return default
-    if isinstance(raw, bytes):
-        raw = raw.decode("utf-8", errors="replace")
-    try:
-        return json.loads(str(raw))
-    except Exception:
-        return default
+_ENVIRONMENT_LATEST_KEY = "environment:latest"
 
 
-def _environment_provider_snapshots(client: Any) -> Dict[str, Dict[str, Any]]:
+def _environment_provider_snapshots(raw_values: List[Any]) -> Dict[str, Dict[str, Any]]:
     snapshots: Dict[str, Dict[str, Any]] = {}
-    for provider, key in _ENVIRONMENT_PROVIDER_LATEST_KEYS.items():
-        snapshot = _json_from_redis_key(client, key, {})
-        if isinstance(snapshot, dict) and snapshot:
+    keys = [*_ENVIRONMENT_PROVIDER_LATEST_KEYS.keys(), ""]
+    for provider, raw in zip(keys, raw_values):
+        try:
+            snapshot = json.loads(_text(raw)) if raw not in (None, "") else {}
+        except Exception:
+            snapshot = {}
+        if not isinstance(snapshot, dict) or not snapshot:
+            continue
+        if provider:
             snapshots[provider] = snapshot
-    latest = _json_from_redis_key(client, "environment:latest", {})
-    if isinstance(latest, dict) and latest:
-        provider = _lower(latest.get("provider")) or "environment"
-        snapshots.setdefault(provider, latest)
+        else:
+            snapshots.setdefault(_lower(snapshot.get("provider")) or "environment", snapshot)
     return snapshots
 
 
@@ -499,10 +508,9 @@ def _environment_reading_state_id(row: Dict[str, Any]) -> str:
     return f"{provider}:{source_id}:{key}" if key else ""
 
 
-def _environment_runtime_states(client: Any) -> Dict[str, Dict[str, Any]]:
+def _environment_runtime_states(raw_values: List[Any], preferred_temperature_unit: str) -> Dict[str, Dict[str, Any]]:
     out: Dict[str, Dict[str, Any]] = {}
-    preferred_temperature_unit = _environment_temperature_unit(client)
-    for provider, snapshot in _environment_provider_snapshots(client).items():
+    for provider, snapshot in _environment_provider_snapshots(raw_values).items():
         if not isinstance(snapshot, dict):
             continue
         provider_token = _lower(snapshot.get("provider")) or _lower(provider)
@@ -552,6 +560,25 @@ def _environment_runtime_states(client: Any) -> Dict[str, Dict[str, Any]]:
     return out
 
 
+def _environment_state_index(client: Any) -> Tuple[Dict[str, Dict[str, Any]], str]:
+    """Environment readings as runtime records, rebuilt only when one of the
+    raw provider snapshots or the temperature unit changes."""
+    keys = [*_ENVIRONMENT_PROVIDER_LATEST_KEYS.values(), _ENVIRONMENT_LATEST_KEY]
+    try:
+        raw_values = list(client.mget(keys) or [])
+    except Exception:
+        raw_values = []
+    unit = _environment_temperature_unit(client)
+    token = hashlib.blake2b(repr((raw_values, unit)).encode("utf-8"), digest_size=8).hexdigest()
+    with _FEED_CACHE_LOCK:
+        if _ENVIRONMENT_CACHE.get("token") == token:
+            return _ENVIRONMENT_CACHE["states"], token
+    states = _environment_runtime_states(raw_values, unit)
+    with _FEED_CACHE_LOCK:
+        _ENVIRONMENT_CACHE.update(token=token, states=states)
+    return states, token
+
+
 def _display_text(state: str, unit: str) -> str:
     token = _text(state)
     if not token:
@@ -655,36 +682,115 @@ def _normalize_integration_slot(
     }
 
 
-def build_display_feed(query: Any = None, *, client: Any = None, version: str = "") -> Dict[str, Any]:
-    redis_obj = client or redis_client
+def _cache_get(cache: "OrderedDict[Any, Any]", key: Any) -> Any:
+    with _FEED_CACHE_LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: "OrderedDict[Any, Any]", key: Any, value: Any, limit: int) -> None:
+    with _FEED_CACHE_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+
+def _display_profile_version(client: Any) -> str:
+    try:
+        return _text(client.get(_DISPLAY_PROFILE_VERSION_KEY))
+    except Exception:
+        return ""
+
+
+def _requested_slot_map(query: Any, client: Any) -> Dict[str, str]:
+    cache_key = (_display_profile_version(client), tuple(_iter_query_items(query)))
+    cached = _cache_get(_SLOT_MAP_CACHE, cache_key)
+    if cached is not None:
+        return cached
     identity_present = bool(_display_identity_candidates(query))
-    requested_slots, saved_profile_found = _slot_map_from_saved_display_profile(query, redis_obj)
+    requested_slots, saved_profile_found = _slot_map_from_saved_display_profile(query, client)
     if not requested_slots and not saved_profile_found and not identity_present:
         requested_slots = _slot_map_from_query(query)
-    runtime_states = _runtime_integration_states(redis_obj)
+    _cache_put(_SLOT_MAP_CACHE, cache_key, requested_slots, _SLOT_MAP_CACHE_LIMIT)
+    return requested_slots
+
+
+def _cached_slot(alias: str, spec: str, record: Dict[str, Any], token: Any) -> Dict[str, Any]:
+    cache_key = (alias, spec, token)
+    slot = _cache_get(_SLOT_CACHE, cache_key) if token else None
+    if slot is None:
+        slot = _normalize_integration_slot(alias, spec, runtime_record=record or None)
+        if token:
+            _cache_put(_SLOT_CACHE, cache_key, slot, _SLOT_CACHE_LIMIT)
+    return slot
+
+
+def _etag_matches(if_none_match: Any, etag: str) -> bool:
+    for candidate in _text(if_none_match).split(","):
+        token = candidate.strip()
+        if token.startswith("W/"):
+            token = token[2:]
+        if token == "*" or token == etag:
+            return True
+    return False
+
+
+def compose_display_feed(
+    query: Any = None,
+    *,
+    client: Any = None,
+    version: str = "",
+    if_none_match: Any = "",
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Return ``(etag, feed)``. ``feed`` is None when ``if_none_match`` still
+    names the current ETag, so an unchanged poll is answered without building
+    or serializing the payload."""
+    redis_obj = client or redis_client
+    requested_slots = _requested_slot_map(query, redis_obj)
+    runtime_records = _slot_runtime_records(redis_obj, requested_slots)
     clock = _local_clock()
+    first_name = _assistant_first_name(redis_obj)
+    compact = _compact_requested(query)
+    target = _target_from_query(query)
+    events: List[Dict[str, Any]] = []
+    if not compact:
+        event_seq = display_bus.display_event_seq(redis_obj)
+        events = display_bus.display_feed_events(target, client=redis_obj, seq=event_seq)
+
+    # Everything the payload is built from except the per-request timestamps.
+    fingerprint = (
+        _text(version),
+        compact,
+        first_name,
+        clock.get("date", ""),
+        clock.get("time", ""),
+        clock.get("ampm", ""),
+        tuple((alias, spec, runtime_records[spec][1]) for alias, spec in requested_slots.items()),
+        tuple((event.get("seq"), event.get("id")) for event in events),
+    )
+    etag = '"' + hashlib.blake2b(repr(fingerprint).encode("utf-8"), digest_size=12).hexdigest() + '"'
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return etag, None
+
     assistant = {
-        "first_name": _assistant_first_name(redis_obj),
+        "first_name": first_name,
     }
-
     slots: Dict[str, Dict[str, Any]] = {}
     values: Dict[str, Any] = {}
     text_values: Dict[str, str] = {}
     for alias, spec in requested_slots.items():
-        provider, state_id = _split_slot_spec(spec)
-        runtime_record = runtime_states.get(spec) or runtime_states.get(f"{provider}:{state_id}")
-        slot = _normalize_integration_slot(
-            alias,
-            spec,
-            runtime_record=runtime_record,
-        )
+        record, token = runtime_records[spec]
+        slot = _cached_slot(alias, spec, record, token)
         clean_alias = _text(slot.get("alias")) or alias
         slots[clean_alias] = slot
         values[clean_alias] = slot.get("numeric_value") if slot.get("numeric_value") is not None else slot.get("state")
         text_values[clean_alias] = _text(slot.get("display") or slot.get("state"))
 
-    if _compact_requested(query):
-        return {
+    if compact:
+        return etag, {
             "ok": True,
             "service": "tater_display",
             "version": _text(version),
@@ -701,7 +807,7 @@ def build_display_feed(query: Any = None, *, client: Any = None, version: str =
             "count": len(slots),
         }
 
-    return {
+    return etag, {
         "ok": True,
         "service": "tater_display",
         "version": _text(version),
@@ -712,6 +818,11 @@ def build_display_feed(query: Any = None, *, client: Any = None, version: str =
         "slots": slots,
         "values": values,
         "text": text_values,
-        "events": display_bus.display_feed_events(_target_from_query(query), client=redis_obj),
+        "events": events,
         "count": len(slots),
     }
+
+
+def build_display_feed(query: Any = None, *, client: Any = None, version: str = "") -> Dict[str, Any]:
+    _etag, feed = compose_display_feed(query, client=client, version=version)
+    return feed or {}
@@ -0,0 +1,219 @@
+"""Vectorized PCM kernels for the per-chunk voice path.
+
+Every kernel reads its input through ``np.frombuffer`` (no copy for bytes,
+bytearray or memoryview input) and returns ``None`` when numpy is missing or
+the sample width is unsupported, so callers can keep their audioop / pure
+Python fallbacks. Results match the pure-Python fallbacks in
+``tater_voice.voice_pipeline`` and, for downmix/resample, ``audioop``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+_NUMPY: Any = None
+_NUMPY_CHECKED = False
+_HIGH_PASS_BLOCK = 128
+_HIGH_PASS_KERNELS: Dict[float, Tuple[Any, Any]] = {}
+_HIGH_PASS_KERNELS_LOCK = threading.Lock()
+_SAMPLE_DTYPES = {2: "<i2", 4: "<i4"}
+
+
+def _numpy() -> Any:
+    global _NUMPY, _NUMPY_CHECKED
+    if not _NUMPY_CHECKED:
+        try:
+            _NUMPY = importlib.import_module("numpy")
+        except Exception:
+            _NUMPY = None
+        _NUMPY_CHECKED = True
+    return _NUMPY
+
+
+def available() -> bool:
+    return _numpy() is not None
+
+
+def _samples(data: Any, sample_width: int) -> Any:
+    np = _numpy()
+    dtype = _SAMPLE_DTYPES.get(int(sample_width or 0))
+    if np is None or dtype is None:
+        return None
+    view = memoryview(data).cast("B")
+    usable = len(view) - (len(view) % int(sample_width))
+    return np.frombuffer(view[:usable], dtype=dtype)
+
+
+def _with_remainder(out: Any, data: Any, sample_width: int) -> bytes:
+    view = memoryview(data).cast("B")
+    remainder = len(view) % int(sample_width)
+    if not remainder:
+        return out.tobytes()
+    return out.tobytes() + bytes(view[len(view) - remainder :])
+
+
+def pcm_rms(data: Any, sample_width: int) -> Optional[float]:
+    samples = _samples(data, sample_width)
+    if samples is None:
+        return None
+    if not len(samples):
+        return 0.0
+    values = samples.astype(_numpy().float64)
+    return math.sqrt(float(values.dot(values)) / float(len(values)))
+
+
+def pcm_dbfs(data: Any, sample_width: int) -> Optional[float]:
+    rms = pcm_rms(data, sample_width)
+    if rms is None:
+        return None
+    if rms <= 0.0:
+        return -120.0
+    full_scale = float((1 << ((8 * int(sample_width)) - 1)) - 1)
+    return 20.0 * math.log10(min(1.0, max(rms / full_scale, 1e-9)))
+
+
+def pcm_apply_gain(data: Any, sample_width: int, gain: float) -> Optional[bytes]:
+    samples = _samples(data, sample_width)
+    if samples is None:
+        return None
+    np = _numpy()
+    info = np.iinfo(samples.dtype)
+    scaled = np.rint(samples.astype(np.float64) * float(gain))
+    out = np.clip(scaled, info.min, info.max).astype(samples.dtype)
+    return _with_remainder(out, data, sample_width)
+
+
+def _high_pass_kernel(alpha: float) -> Tuple[Any, Any]:
+    # y[n] = x[n] - x[n-1] + alpha * y[n-1] solved per block as a lower
+    # triangular matrix of alpha powers (zero-state part) plus the carried
+    # output decaying by alpha**(i + 1).
+    with _HIGH_PASS_KERNELS_LOCK:
+        cached = _HIGH_PASS_KERNELS.get(alpha)
+        if cached is not None:
+            return cached
+        np = _numpy()
+        index = np.arange(_HIGH_PASS_BLOCK)
+        lags = index[:, None] - index[None, :]
+        matrix = np.where(lags >= 0, alpha ** np.maximum(lags, 0), 0.0).T
+        decay = alpha ** (index + 1.0)
+        if len(_HIGH_PASS_KERNELS) >= 8:
+            _HIGH_PASS_KERNELS.clear()
+        _HIGH_PASS_KERNELS[alpha] = (matrix, decay)
+        return matrix, decay
+
+
+def pcm_high_pass(
+    data: Any,
+    alpha: float,
+    prev_input: float = 0.0,
+    prev_output: float = 0.0,
+) -> Optional[Tuple[bytes, float, float]]:
+    """One-pole DC-blocking high-pass over int16 PCM.
+
+    Returns ``(filtered_bytes, prev_input, prev_output)`` so the caller can
+    carry filter state across chunks.
+    """
+    samples = _samples(data, 2)
+    if samples is None:
+        return None
+    if not len(samples):
+        return bytes(data), float(prev_input), float(prev_output)
+    np = _numpy()
+    alpha = float(alpha)
+    matrix, decay = _high_pass_kernel(alpha)
+    values = samples.astype(np.float64)
+    diff = np.empty_like(values)
+    diff[0] = values[0] - float(prev_input)
+    np.subtract(values[1:], values[:-1], out=diff[1:])
+
+    count = len(diff)
+    blocks = -(-count // _HIGH_PASS_BLOCK)
+    padded = np.zeros(blocks * _HIGH_PASS_BLOCK)
+    padded[:count] = diff
+    filtered = padded.reshape(blocks, _HIGH_PASS_BLOCK) @ matrix
+    carry = float(prev_output)
+    for row in filtered:
+        row += carry * decay
+        carry = float(row[-1])
+    filtered = filtered.reshape(-1)[:count]
+
+    out = np.rint(np.clip(filtered, -32768.0, 32767.0)).astype("<i2")
+    return _with_remainder(out, data, 2), float(values[-1]), float(filtered[-1])
+
+
+def pcm_deinterleave(data: Any, sample_width: int, channels: int) -> Any:
+    # A (frames, channels) view over the interleaved buffer; no copy.
+    samples = _samples(data, sample_width)
+    channels = max(1, int(channels or 1))
+    if samples is None:
+        return None
+    frames = len(samples) // channels
+    return samples[: frames * channels].reshape(frames, channels)
+
+
+def pcm_downmix(data: Any, sample_width: int, channels: int) -> Optional[bytes]:
+    # Floor of the channel mean, which for stereo is audioop.tomono(.., 0.5, 0.5).
+    frames = pcm_deinterleave(data, sample_width, channels)
+    if frames is None:
+        return None
+    if frames.shape[1] == 1:
+        return frames.reshape(-1).tobytes()
+    np = _numpy()
+    mixed = np.floor_divide(frames.sum(axis=1, dtype=np.int64), frames.shape[1])
+    return mixed.astype(frames.dtype).tobytes()
+
+
+def pcm_ratecv(
+    data: Any,
+    in_rate: int,
+    out_rate: int,
+    state: Any = None,
+) -> Optional[Tuple[bytes, Any]]:
+    """Mono int16 linear-interpolation resampler, equivalent to
+    ``audioop.ratecv(data, 2, 1, in_rate, out_rate, state)`` including the
+    state tuple, so the two can be swapped mid-stream."""
+    samples = _samples(data, 2)
+    if samples is None or int(in_rate) <= 0 or int(out_rate) <= 0:
+        return None
+    np = _numpy()
+    divisor = math.gcd(int(in_rate), int(out_rate))
+    in_rate, out_rate = int(in_rate) // divisor, int(out_rate) // divisor
+    if state is None:
+        d0, prev_sample, cur_sample = -out_rate, 0, 0
+    else:
+        d0, ((prev_sample, cur_sample),) = state
+        d0 = int(d0)
+
+    # audioop works on samples scaled to 32 bits.
+    count = len(samples)
+    ext = np.empty(count + 1, dtype=np.int64)
+    ext[0] = int(cur_sample)
+    np.left_shift(samples, 16, out=ext[1:], dtype=np.int64)
+
+    top = d0 + count * out_rate
+    outputs = top // in_rate + 1 if top >= 0 else 0
+    step = np.arange(outputs, dtype=np.int64) * in_rate
+    read = -((d0 - step) // out_rate)
+    weight = d0 + read * out_rate - step
+    mixed = ext[read - 1] * weight + ext[read] * (out_rate - weight)
+    mixed = np.where(mixed >= 0, mixed // out_rate, -((-mixed) // out_rate))
+    out = (mixed >> 16).astype("<i2")
+
+    if count:
+        next_state = (int(top - outputs * in_rate), ((int(ext[count - 1]), int(ext[count])),))
+    else:
+        next_state = (d0, ((int(prev_sample), int(cur_sample)),))
+    return out.tobytes(), next_state
+
+
+def pcm_to_pcm16(data: Any, sample_width: int) -> Optional[bytes]:
+    width = int(sample_width or 0)
+    if width == 2:
+        return bytes(data)
+    samples = _samples(data, width)
+    if samples is None:
+        return None
+    return (samples >> 16).astype("<i2").tobytes()
@@ -16,6 +16,7 @@ from helpers import redis_client
 from tater_paths import agent_lab_path
 from tateros import integration_store as integration_store_module
 
+from . import dsp as _dsp
 from . import runtime as esphome_runtime
 
 
@@ -592,21 +593,28 @@ def warmup_model(*, enabled_only: bool = True) -> str:
 
 
 def _prepare_pcm_16k_mono(audio_bytes: bytes, audio_format: Dict[str, Any]) -> bytes:
-    pcm = bytes(audio_bytes or b"")
+    pcm = memoryview(audio_bytes or b"").cast("B")
     rate = int(audio_format.get("rate") or _vp().DEFAULT_VOICE_SAMPLE_RATE_HZ)
     width = int(audio_format.get("width") or _vp().DEFAULT_VOICE_SAMPLE_WIDTH)
     channels = int(audio_format.get("channels") or _vp().DEFAULT_VOICE_CHANNELS)
     if width != 2:
         raise RuntimeError(f"Unsupported sample width for Emotion ID: {width}")
     if channels > 1:
-        if _AUDIOOP is None:
-            raise RuntimeError("Stereo audio requires audioop for Emotion ID conversion.")
-        pcm = _AUDIOOP.tomono(pcm, width, 0.5, 0.5)
+        if _AUDIOOP is not None and channels == 2:
+            pcm = _AUDIOOP.tomono(pcm, width, 0.5, 0.5)
+        else:
+            pcm = _dsp.pcm_downmix(pcm, width, channels)
+            if pcm is None:
+                raise RuntimeError("Multichannel audio requires audioop or numpy for Emotion ID conversion.")
         channels = 1
     if rate != 16000:
-        if _AUDIOOP is None:
-            raise RuntimeError("Resampling requires audioop for Emotion ID conversion.")
-        pcm, _ = _AUDIOOP.ratecv(pcm, width, channels, rate, 16000, None)
+        if _AUDIOOP is not None:
+            pcm, _ = _AUDIOOP.ratecv(pcm, width, channels, rate, 16000, None)
+        else:
+            resampled = _dsp.pcm_ratecv(pcm, rate, 16000)
+            if resampled is None:
+                raise RuntimeError("Resampling requires audioop or numpy for Emotion ID conversion.")
+            pcm = resampled[0]
     if not pcm:
         raise RuntimeError("No audio available for Emotion ID.")
     return pcm
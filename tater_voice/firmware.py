@@ -32,6 +32,8 @@ logger = logging.getLogger(__name__)
 
 FIRMWARE_INSTALLED_VERSION_HASH_KEY = "tater:esphome:firmware:installed_versions:v1"
 DISPLAY_PROFILE_HASH_KEY = "tater:display:profiles:v1"
+# Bumped on every profile write so the display feed can cache slot maps.
+DISPLAY_PROFILE_VERSION_KEY = "tater:display:profiles:version:v1"
 FIRMWARE_WORKSPACE_ROOT = agent_lab_path("firmware")
 FIRMWARE_WEB_FLASH_ROOT = FIRMWARE_WORKSPACE_ROOT / "web_flash"
 FIRMWARE_PREBUILT_ROOT = FIRMWARE_WORKSPACE_ROOT / "prebuilt_firmware"
@@ -1460,6 +1462,7 @@ def _display_profile_save(selector: str, values: Dict[str, str]) -> None:
     }
     redis_client.hset(DISPLAY_PROFILE_HASH_KEY, target, json.dumps(payload, ensure_ascii=False))
     _cleanup_stale_display_profiles(target, _text(selector))
+    redis_client.incr(DISPLAY_PROFILE_VERSION_KEY)
 
 
 def _display_profile_rows_from_store() -> Dict[str, Dict[str, Any]]:
@@ -495,7 +495,7 @@ async def close_auto_reply_for_selector(selector: Any, *, conversation_id: Any =
 
 
 def _pcm_to_wav_bytes(audio_bytes: bytes, audio_format: Dict[str, Any]) -> bytes:
-    pcm = bytes(audio_bytes or b"")
+    pcm = memoryview(audio_bytes or b"").cast("B")
     if not pcm:
         return b""
     try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import contextlib
 import hashlib
 import hmac
@@ -30,6 +31,7 @@ NATIVE_WEBSOCKET_TASK_CANCEL_TIMEOUT_S = 1.0
 NATIVE_WEBSOCKET_BRIDGE_CLOSE_TIMEOUT_S = 3.0
 NATIVE_WEBSOCKET_DISCONNECT_TIMEOUT_S = 1.0
 NATIVE_MEDIA_DISCONNECT_GRACE_S = 6.0
+CREDENTIAL_LAST_SEEN_FLUSH_S = 30.0
 
 VOICE_EVENT_STATE = {
     "RUN_START": "listening",
@@ -52,6 +54,8 @@ _state_change_lock = threading.RLock()
 _state_change_listeners: list[Callable[[str, str], Any]] = []
 _pairing_lock = threading.RLock()
 _pairing_sessions: Dict[str, Dict[str, Any]] = {}
+_credential_index: Optional["_CredentialIndex"] = None
+_credential_flush_timer: Optional[threading.Timer] = None
 _stereo_sessions: Dict[str, Dict[str, Any]] = {}
 _stereo_adjust_tasks: Dict[str, asyncio.Task] = {}
 _media_disconnect_tasks: Dict[str, asyncio.Task] = {}
@@ -502,6 +506,106 @@ def _save_credentials_unlocked(data: Dict[str, Any]) -> None:
     os.replace(tmp, path)
 
 
+def _credential_last_seen_flush_s() -> float:
+    try:
+        return max(1.0, float(os.getenv("TATER_NATIVE_SATELLITE_LAST_SEEN_FLUSH_S", CREDENTIAL_LAST_SEEN_FLUSH_S)))
+    except Exception:
+        return CREDENTIAL_LAST_SEEN_FLUSH_S
+
+
+def _credentials_signature() -> Optional[tuple[int, int]]:
+    try:
+        stat = _credentials_path().stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _CredentialIndex:
+    """Loaded credentials file plus a token-hash -> device key map."""
+
+    def __init__(self, data: Dict[str, Any], signature: Optional[tuple[int, int]]) -> None:
+        self.data = data
+        self.signature = signature
+        self.dirty = False
+        self.by_hash: Dict[str, list[str]] = {}
+        self.reindex()
+
+    @property
+    def devices(self) -> Dict[str, Any]:
+        devices = self.data.get("devices")
+        if not isinstance(devices, dict):
+            devices = {}
+            self.data["devices"] = devices
+        return devices
+
+    def reindex(self) -> None:
+        by_hash: Dict[str, list[str]] = {}
+        for key, row in self.devices.items():
+            if isinstance(row, dict) and _text(row.get("token_hash")):
+                by_hash.setdefault(_text(row.get("token_hash")), []).append(key)
+        self.by_hash = by_hash
+
+
+def _credential_index_unlocked() -> _CredentialIndex:
+    """The cached index while the file's mtime/size are unchanged.
+
+    A missing file is never cached. An external edit wins over last-seen
+    updates that have not been flushed yet.
+    """
+    global _credential_index
+    signature = _credentials_signature()
+    index = _credential_index
+    if index is not None and signature is not None and index.signature == signature:
+        return index
+    index = _CredentialIndex(_load_credentials_unlocked(), signature)
+    _credential_index = index if signature is not None else None
+    return index
+
+
+def _write_credential_index_unlocked(index: _CredentialIndex) -> None:
+    global _credential_index, _credential_flush_timer
+    try:
+        _save_credentials_unlocked(index.data)
+    except Exception:
+        # The in-memory edit never reached disk: drop it so the next lookup
+        # reloads the file instead of serving credentials that were not saved.
+        if _credential_index is index:
+            _credential_index = None
+        raise
+    index.reindex()
+    index.dirty = False
+    index.signature = _credentials_signature()
+    _credential_index = index if index.signature is not None else None
+    if _credential_flush_timer is not None:
+        _credential_flush_timer.cancel()
+        _credential_flush_timer = None
+
+
+def _flush_credential_last_seen() -> None:
+    global _credential_flush_timer
+    with _pairing_lock:
+        _credential_flush_timer = None
+        index = _credential_index
+        if index is not None and index.dirty and index.signature == _credentials_signature():
+            try:
+                _write_credential_index_unlocked(index)
+            except Exception as exc:
+                _vp().logger.warning("[native-satellite] last-seen flush failed: %s", exc)
+
+
+def _schedule_credential_flush_unlocked(index: _CredentialIndex) -> None:
+    global _credential_flush_timer
+    index.dirty = True
+    if _credential_flush_timer is None:
+        _credential_flush_timer = threading.Timer(_credential_last_seen_flush_s(), _flush_credential_last_seen)
+        _credential_flush_timer.daemon = True
+        _credential_flush_timer.start()
+
+
+atexit.register(_flush_credential_last_seen)
+
+
 def _token_hash(token: Any) -> str:
     value = _text(token)
     if not value:
@@ -621,17 +725,14 @@ def _save_device_credential(selector: str, payload: Dict[str, Any], device_token
     if not token_hash:
         raise ValueError("device token is empty")
     with _pairing_lock:
-        data = _load_credentials_unlocked()
-        devices = data.get("devices")
-        if not isinstance(devices, dict):
-            devices = {}
-            data["devices"] = devices
+        index = _credential_index_unlocked()
+        devices = index.devices
         existing = devices.get(selector) if isinstance(devices.get(selector), dict) else {}
         row = _credential_row(selector, payload, token_hash)
         if existing.get("created_ts"):
             row["created_ts"] = existing.get("created_ts")
         devices[selector] = row
-        _save_credentials_unlocked(data)
+        _write_credential_index_unlocked(index)
 
 
 def _remove_device_credentials(selector: Any) -> int:
@@ -639,8 +740,8 @@ def _remove_device_credentials(selector: Any) -> int:
     if not token:
         return 0
     with _pairing_lock:
-        data = _load_credentials_unlocked()
-        devices = data.get("devices") if isinstance(data.get("devices"), dict) else {}
+        index = _credential_index_unlocked()
+        devices = index.devices
         remove_keys = [
             key
             for key, row in devices.items()
@@ -651,8 +752,7 @@ def _remove_device_credentials(selector: Any) -> int:
             return 0
         for key in remove_keys:
             devices.pop(key, None)
-        data["devices"] = devices
-        _save_credentials_unlocked(data)
+        _write_credential_index_unlocked(index)
         return len(remove_keys)
 
 
@@ -663,11 +763,12 @@ def _valid_device_credential(token: str, selector: str, payload: Dict[str, Any])
     device_id = _text(payload.get("device_id") or payload.get("id"))
     hardware_id = _hardware_id(payload.get("hardware_id"))
     with _pairing_lock:
-        data = _load_credentials_unlocked()
-        devices = data.get("devices") if isinstance(data.get("devices"), dict) else {}
+        index = _credential_index_unlocked()
+        devices = index.devices
         matched_key = ""
         matched_row: Optional[Dict[str, Any]] = None
-        for key, row in list(devices.items()):
+        for key in list(index.by_hash.get(supplied_hash) or ()):
+            row = devices.get(key)
             if not isinstance(row, dict):
                 continue
             row_hash = _text(row.get("token_hash"))
@@ -693,21 +794,26 @@ def _valid_device_credential(token: str, selector: str, payload: Dict[str, Any])
             return None
         row = devices.get(matched_key)
         if isinstance(row, dict):
-            row.update(
-                {
-                    "selector": selector or _text(row.get("selector")),
-                    "device_id": device_id or _text(row.get("device_id")),
-                    "hardware_id": hardware_id or _hardware_id(row.get("hardware_id")),
-                    "device_name": _device_name_from_hello(payload, row.get("device_name")),
-                    "board": _text(payload.get("board")) or _text(row.get("board")),
-                    "firmware_version": _text(payload.get("firmware_version")) or _text(row.get("firmware_version")),
-                    "last_seen_ts": _now(),
-                }
-            )
+            identity = {
+                "selector": selector or _text(row.get("selector")),
+                "device_id": device_id or _text(row.get("device_id")),
+                "hardware_id": hardware_id or _hardware_id(row.get("hardware_id")),
+                "device_name": _device_name_from_hello(payload, row.get("device_name")),
+                "board": _text(payload.get("board")) or _text(row.get("board")),
+                "firmware_version": _text(payload.get("firmware_version")) or _text(row.get("firmware_version")),
+            }
+            changed = any(row.get(field) != value for field, value in identity.items())
+            row.update(identity)
+            row["last_seen_ts"] = _now()
             if selector and matched_key != selector:
                 devices.pop(matched_key, None)
                 devices[selector] = row
-            _save_credentials_unlocked(data)
+                changed = True
+            if changed or index.signature is None:
+                _write_credential_index_unlocked(index)
+            else:
+                # Only last-seen moved: coalesce into the periodic flush.
+                _schedule_credential_flush_unlocked(index)
             matched_row = dict(row)
         return matched_row
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import array
 import contextlib
 import hashlib
+import importlib
 import json
 import logging
 import os
@@ -18,6 +19,7 @@ from helpers import redis_client
 from tater_paths import agent_lab_path
 from tateros import integration_store as integration_store_module
 
+from . import dsp as _dsp
 from . import runtime as esphome_runtime
 
 
@@ -85,6 +87,11 @@ SPEAKER_ID_PENDING_TTL_S = 15 * 60
 SPEAKER_ID_AGENT_LABS_ROOT = agent_lab_path("speaker_id")
 SPEAKER_ID_MODEL_ROOT = agent_lab_path("models", "speaker_id")
 SPEAKER_ID_PROFILES_PATH = SPEAKER_ID_AGENT_LABS_ROOT / "profiles.json"
+# Enrollment embeddings live in a float32 .npy sidecar; profiles.json samples
+# point at rows with "embedding_row", and "embeddings_sha1" pins the sidecar
+# they were written with. Inline "embedding" lists are still read.
+SPEAKER_ID_EMBEDDINGS_PATH = SPEAKER_ID_AGENT_LABS_ROOT / "profiles.embeddings.npy"
+SPEAKER_ID_TOP_SAMPLES = 3
 
 DEFAULT_SPEAKER_ID_ENABLED = False
 DEFAULT_SPEAKER_ID_BEST_MATCH = False
@@ -114,6 +121,8 @@ _ENGINE_AUTH_FINGERPRINT = ""
 _ENGINE_ERROR = ""
 _PENDING_LOCK = threading.Lock()
 _PENDING_ENROLLMENT: Dict[str, Any] = {}
+_INDEX_LOCK = threading.Lock()
+_INDEX: Optional["SpeakerIndex"] = None
 
 
 def _ensure_dirs() -> None:
@@ -395,6 +404,53 @@ def _ensure_speechbrain_snapshot(source: str, savedir: Path, hf_cache_dir: Path)
     return str(savedir) if _snapshot_complete(savedir) else source
 
 
+def _numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except Exception:
+        return None
+
+
+def _profiles_stamp() -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    stamps = []
+    for path in (SPEAKER_ID_PROFILES_PATH, SPEAKER_ID_EMBEDDINGS_PATH):
+        try:
+            stat = path.stat()
+            stamps.append((int(stat.st_mtime_ns), int(stat.st_size)))
+        except OSError:
+            stamps.append((0, 0))
+    return stamps[0], stamps[1]
+
+
+def _embeddings_digest(matrix: Any) -> str:
+    return hashlib.sha1(matrix.tobytes()).hexdigest()
+
+
+def _hydrate_sidecar_embeddings(payload: Dict[str, Any]) -> None:
+    expected = str(payload.pop("embeddings_sha1", "") or "")
+    matrix = None
+    for speaker in payload.get("speakers") or []:
+        if not isinstance(speaker, dict):
+            continue
+        for sample in speaker.get("samples") or []:
+            if not isinstance(sample, dict) or "embedding_row" not in sample:
+                continue
+            row = sample.pop("embedding_row")
+            if matrix is None:
+                np_mod = _numpy()
+                matrix = False
+                if np_mod is not None and SPEAKER_ID_EMBEDDINGS_PATH.is_file():
+                    with contextlib.suppress(Exception):
+                        matrix = np_mod.load(SPEAKER_ID_EMBEDDINGS_PATH, allow_pickle=False)
+                    if matrix is not False and expected and _embeddings_digest(matrix) != expected:
+                        # Interrupted save: the rows belong to a different profiles.json.
+                        logger.warning("Speaker ID embeddings sidecar does not match profiles.json; ignoring it.")
+                        matrix = False
+            with contextlib.suppress(Exception):
+                if matrix is not False and 0 <= int(row) < len(matrix):
+                    sample["embedding"] = matrix[int(row)].tolist()
+
+
 def _load_profiles() -> Dict[str, Any]:
     _ensure_dirs()
     if not SPEAKER_ID_PROFILES_PATH.is_file():
@@ -405,6 +461,7 @@ def _load_profiles() -> Dict[str, Any]:
             payload.setdefault("version", 1)
             payload.setdefault("speakers", [])
             if isinstance(payload.get("speakers"), list):
+                _hydrate_sidecar_embeddings(payload)
                 return payload
     return {"version": 1, "speakers": []}
 
@@ -413,8 +470,49 @@ def _save_profiles(data: Dict[str, Any]) -> None:
     _ensure_dirs()
     payload = dict(data or {})
     payload["version"] = int(payload.get("version") or 1)
-    payload["speakers"] = list(payload.get("speakers") or [])
-    SPEAKER_ID_PROFILES_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    speakers = []
+    vectors: List[List[float]] = []
+    for row in list(payload.get("speakers") or []):
+        if not isinstance(row, dict):
+            continue
+        speaker = dict(row)
+        samples = []
+        for sample in list(speaker.get("samples") or []):
+            sample = dict(sample) if isinstance(sample, dict) else {}
+            if isinstance(sample.get("embedding"), list) and sample["embedding"]:
+                sample["embedding_row"] = len(vectors)
+                vectors.append(sample.pop("embedding"))
+            samples.append(sample)
+        speaker["samples"] = samples
+        speakers.append(speaker)
+
+    np_mod = _numpy()
+    use_sidecar = bool(np_mod is not None and vectors and len({len(vector) for vector in vectors}) == 1)
+    embeddings_tmp = SPEAKER_ID_EMBEDDINGS_PATH.with_name(SPEAKER_ID_EMBEDDINGS_PATH.name + ".tmp")
+    if use_sidecar:
+        matrix = np_mod.asarray(vectors, dtype=np_mod.float32)
+        payload["embeddings_sha1"] = _embeddings_digest(matrix)
+        with embeddings_tmp.open("wb") as handle:
+            np_mod.save(handle, matrix, allow_pickle=False)
+    else:
+        # No numpy or mixed embedding sizes (model switch): keep vectors inline.
+        payload.pop("embeddings_sha1", None)
+        for speaker in speakers:
+            for sample in speaker["samples"]:
+                if "embedding_row" in sample:
+                    sample["embedding"] = vectors[int(sample.pop("embedding_row"))]
+    payload["speakers"] = speakers
+    profiles_tmp = SPEAKER_ID_PROFILES_PATH.with_name(SPEAKER_ID_PROFILES_PATH.name + ".tmp")
+    profiles_tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Sidecar first, then profiles.json; a crash in between is caught by the
+    # embeddings_sha1 check on load instead of pairing rows with the wrong file.
+    if use_sidecar:
+        embeddings_tmp.replace(SPEAKER_ID_EMBEDDINGS_PATH)
+    profiles_tmp.replace(SPEAKER_ID_PROFILES_PATH)
+    if not use_sidecar:
+        with contextlib.suppress(FileNotFoundError):
+            SPEAKER_ID_EMBEDDINGS_PATH.unlink()
+    _invalidate_speaker_index()
 
 
 def _normalize_speaker_row(row: Dict[str, Any]) -> Dict[str, Any]:
@@ -507,6 +605,110 @@ def _cosine_similarity(a: List[float], b: List[float]) -> float:
     return float(sum(float(left) * float(right) for left, right in zip(a, b)))
 
 
+class SpeakerIndex:
+    # L2-normalized per-speaker centroids and per-sample embeddings, stacked
+    # into float32 matrices (one per embedding size) so a match is a single
+    # matrix-vector product. Falls back to cached Python lists without numpy.
+    def __init__(self, speakers: List[Dict[str, Any]], *, stamp: Any = None, np_mod: Any = None):
+        self.stamp = stamp
+        self.np = np_mod
+        self.speakers = [
+            {
+                "speaker_id": _vp()._text(speaker.get("id")),
+                "speaker_name": _vp()._text(speaker.get("name")),
+                "sample_count": len(list(speaker.get("samples") or [])),
+            }
+            for speaker in speakers
+        ]
+        self.centroids: Dict[int, Tuple[Any, List[int]]] = {}
+        self.samples: Dict[int, Tuple[Any, List[int]]] = {}
+        centroid_rows: Dict[int, List[Tuple[int, List[float]]]] = {}
+        sample_rows: Dict[int, List[Tuple[int, List[float]]]] = {}
+        for position, speaker in enumerate(speakers):
+            avg = _speaker_average_embedding(speaker)
+            if avg:
+                centroid_rows.setdefault(len(avg), []).append((position, avg))
+            for sample in list(speaker.get("samples") or []):
+                vector = sample.get("embedding") if isinstance(sample, dict) else None
+                if isinstance(vector, list) and vector:
+                    sample_rows.setdefault(len(vector), []).append((position, vector))
+        for dim, rows in centroid_rows.items():
+            self.centroids[dim] = self._stack(rows)
+        for dim, rows in sample_rows.items():
+            self.samples[dim] = self._stack(rows, normalize=True)
+
+    def _stack(self, rows: List[Tuple[int, List[float]]], *, normalize: bool = False) -> Tuple[Any, List[int]]:
+        owners = [position for position, _vector in rows]
+        vectors = [vector for _position, vector in rows]
+        if self.np is None:
+            if normalize:
+                normalized = []
+                for vector in vectors:
+                    norm = sum(float(value) * float(value) for value in vector) ** 0.5
+                    normalized.append([float(value) / norm for value in vector] if norm > 1e-9 else [0.0] * len(vector))
+                vectors = normalized
+            return vectors, owners
+        matrix = self.np.asarray(vectors, dtype=self.np.float32)
+        if normalize:
+            norms = self.np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / self.np.maximum(norms, 1e-9)
+        return self.np.ascontiguousarray(matrix), owners
+
+    def __len__(self) -> int:
+        return len(self.speakers)
+
+    def _similarities(self, table: Tuple[Any, List[int]], query: Any) -> List[float]:
+        matrix, _owners = table
+        if self.np is None:
+            return [_cosine_similarity(query, row) for row in matrix]
+        return (matrix @ self.np.asarray(query, dtype=self.np.float32)).tolist()
+
+    def score(self, query: List[float]) -> List[Dict[str, Any]]:
+        table = self.centroids.get(len(query))
+        scores: Dict[int, float] = {}
+        if table is not None:
+            scores = dict(zip(table[1], self._similarities(table, query)))
+        # Centroids of a different embedding size score 0.0, as before.
+        positions = sorted(position for _matrix, owners in self.centroids.values() for position in owners)
+        scored = [{**self.speakers[position], "score": float(scores.get(position, 0.0))} for position in positions]
+        scored.sort(key=lambda item: float(item.get("score") or 0.0), reverse=True)
+        return scored
+
+    def top_samples(self, query: List[float], k: int = SPEAKER_ID_TOP_SAMPLES) -> List[Dict[str, Any]]:
+        table = self.samples.get(len(query))
+        if table is None or k <= 0:
+            return []
+        similarities = self._similarities(table, query)
+        order = sorted(range(len(similarities)), key=lambda index: similarities[index], reverse=True)[:k]
+        return [
+            {
+                "speaker_id": self.speakers[table[1][index]]["speaker_id"],
+                "speaker_name": self.speakers[table[1][index]]["speaker_name"],
+                "score": float(similarities[index]),
+            }
+            for index in order
+        ]
+
+
+def _invalidate_speaker_index() -> None:
+    global _INDEX
+    with _INDEX_LOCK:
+        _INDEX = None
+
+
+def _speaker_index() -> SpeakerIndex:
+    global _INDEX
+    stamp = _profiles_stamp()
+    with _INDEX_LOCK:
+        index = _INDEX
+        if index is not None and index.stamp == stamp:
+            return index
+    index = SpeakerIndex(_all_speakers(), stamp=stamp, np_mod=_numpy())
+    with _INDEX_LOCK:
+        _INDEX = index
+    return index
+
+
 def _pretty_timestamp(value: Any) -> str:
     with contextlib.suppress(Exception):
         ts = float(value or 0.0)
@@ -885,7 +1087,7 @@ def _pcm_to_waveform(audio_bytes: bytes, audio_format: Dict[str, Any]) -> Any:
         raise RuntimeError(detail or "SpeechBrain is unavailable")
     import torch  # type: ignore
 
-    pcm = bytes(audio_bytes or b"")
+    pcm = memoryview(audio_bytes or b"").cast("B")
     rate = int(audio_format.get("rate") or _vp().DEFAULT_VOICE_SAMPLE_RATE_HZ)
     width = int(audio_format.get("width") or _vp().DEFAULT_VOICE_SAMPLE_WIDTH)
     channels = int(audio_format.get("channels") or _vp().DEFAULT_VOICE_CHANNELS)
@@ -893,15 +1095,22 @@ def _pcm_to_waveform(audio_bytes: bytes, audio_format: Dict[str, Any]) -> Any:
         raise RuntimeError(f"Unsupported sample width for Speaker ID: {width}")
 
     if channels > 1:
-        if _AUDIOOP is None:
-            raise RuntimeError("Stereo audio requires audioop for Speaker ID conversion.")
-        pcm = _AUDIOOP.tomono(pcm, width, 0.5, 0.5)
+        if _AUDIOOP is not None and channels == 2:
+            pcm = _AUDIOOP.tomono(pcm, width, 0.5, 0.5)
+        else:
+            pcm = _dsp.pcm_downmix(pcm, width, channels)
+            if pcm is None:
+                raise RuntimeError("Multichannel audio requires audioop or numpy for Speaker ID conversion.")
         channels = 1
 
     if rate != 16000:
-        if _AUDIOOP is None:
-            raise RuntimeError("Resampling requires audioop for Speaker ID conversion.")
-        pcm, _ = _AUDIOOP.ratecv(pcm, width, channels, rate, 16000, None)
+        if _AUDIOOP is not None:
+            pcm, _ = _AUDIOOP.ratecv(pcm, width, channels, rate, 16000, None)
+        else:
+            resampled = _dsp.pcm_ratecv(pcm, rate, 16000)
+            if resampled is None:
+                raise RuntimeError("Resampling requires audioop or numpy for Speaker ID conversion.")
+            pcm = resampled[0]
         rate = 16000
 
     if not pcm:
@@ -922,7 +1131,7 @@ def _pcm_to_waveform(audio_bytes: bytes, audio_format: Dict[str, Any]) -> Any:
 
 
 def _estimate_audio_duration_s(audio_bytes: bytes, audio_format: Dict[str, Any]) -> float:
-    pcm = bytes(audio_bytes or b"")
+    pcm = memoryview(audio_bytes or b"").cast("B")
     if not pcm:
         return 0.0
     rate = int(audio_format.get("rate") or _vp().DEFAULT_VOICE_SAMPLE_RATE_HZ)
@@ -989,27 +1198,14 @@ def match_speaker_for_audio(
             f"minimum_s={_min_speech_seconds():.2f}"
         )
         return {"matched": False, "reason": "too_short"}
-    speakers = _all_speakers()
-    if not speakers:
+    index = _speaker_index()
+    if not len(index):
         _debug("match skipped reason=no_speakers")
         return {"matched": False, "reason": "no_speakers"}
-    _log_info("match start speech_s=%.2f speakers=%s", effective_speech_s, len(speakers))
-    _debug(f"match start speech_s={effective_speech_s:.2f} speakers={len(speakers)}")
+    _log_info("match start speech_s=%.2f speakers=%s", effective_speech_s, len(index))
+    _debug(f"match start speech_s={effective_speech_s:.2f} speakers={len(index)}")
     query = _compute_embedding(audio_bytes, audio_format)
-    scored: List[Dict[str, Any]] = []
-    for speaker in speakers:
-        avg = _speaker_average_embedding(speaker)
-        if not avg:
-            continue
-        score = _cosine_similarity(query, avg)
-        scored.append(
-            {
-                "speaker_id": _vp()._text(speaker.get("id")),
-                "speaker_name": _vp()._text(speaker.get("name")),
-                "score": float(score),
-                "sample_count": len(list(speaker.get("samples") or [])),
-            }
-        )
+    scored = index.score(query)
     if not scored:
         _debug("match skipped reason=no_embeddings")
         result = {
@@ -1021,7 +1217,6 @@ def match_speaker_for_audio(
         }
         _save_last_result(result)
         return result
-    scored.sort(key=lambda item: float(item.get("score") or 0.0), reverse=True)
     best = scored[0]
     second_score = float(scored[1].get("score") or 0.0) if len(scored) > 1 else -1.0
     margin = float(best.get("score") or 0.0) - second_score
@@ -1068,6 +1263,7 @@ def match_speaker_for_audio(
         "best_match": bool(best_match),
         "sample_count": int(best.get("sample_count") or 0),
         "candidates": scored[:3],
+        "top_samples": index.top_samples(query),
         "speech_s": effective_speech_s,
         "model_source": _model_source(),
         "updated_ts": time.time(),
@@ -47,9 +47,10 @@ import time
 import uuid
 import wave
 import zipfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from urllib import request as urllib_request
 from urllib.parse import unquote, urlsplit
 
@@ -58,11 +59,12 @@ from dotenv import load_dotenv
 from fastapi import HTTPException
 
 from helpers import extract_json, get_llm_client_from_env, redis_client
+from runtime_assets import runtime_asset_store
 from runtime_executors import run_background, run_speech
 from tater_paths import agent_lab_path
 from tateros import integration_store as integration_store_module
 import verba_registry
-from verba_settings import get_verba_enabled
+from verba_settings import verba_enabled_map
 from hydra import run_hydra_turn, resolve_agent_limits
 from speech_settings import (
     DEFAULT_OMNIVOICE_TTS_MODEL,
@@ -70,10 +72,12 @@ from speech_settings import (
     get_speech_settings as get_shared_speech_settings,
     normalize_speech_acceleration,
 )
+from .. import dsp as _dsp
 from .. import reply_playback
 # Compatibility re-exports for package-level callers while the implementation
 # lives in smaller modules.
 from .conversation import (
+    AudioCaptureBuffer,
     VoiceSessionRuntime,
     _history_ctx_key,
     _history_key,
@@ -90,6 +94,7 @@ from .backends import (
     clear_tts_model_caches,
     _chatterbox_tts_request,
     _iter_chatterbox_tts_stream_response,
+    _iter_managed_tts_stream_response,
     _load_faster_whisper_model,
     _load_kokoro_pipeline,
     _load_parakeet_onnx_model,
@@ -98,6 +103,7 @@ from .backends import (
     _load_qwen3_asr_llama_cpp_server,
     _load_vosk_model,
     _native_local_partial_stt_task,
+    _managed_tts_synthesis_kwargs,
     _open_chatterbox_tts_stream_response,
     _native_synthesize_text,
     _native_transcribe_local_audio_bytes,
@@ -484,10 +490,13 @@ _wake_arbitration_room_claims: Dict[str, Dict[str, Any]] = {}
 _CUDA_RUNTIME_AVAILABLE_CACHE: Optional[bool] = None
 _CUDA_RUNTIME_AVAILABLE_LOCK = threading.RLock()
 _VOICE_CONFIG_CACHE_TTL_S = 1.0
+_VOICE_SETTINGS_WATCH_RETRY_S = 15.0
+_VOICE_SETTINGS_WATCH_POLL_S = 30.0
 _voice_config_cache_lock = threading.RLock()
-_voice_settings_cache: Dict[str, Any] = {}
-_voice_settings_cache_loaded = False
-_voice_settings_cache_until = 0.0
+_voice_settings_snapshot: Optional["VoiceSettingsSnapshot"] = None
+_voice_settings_version = 0
+_voice_settings_watch_thread: Optional[threading.Thread] = None
+_voice_settings_watch_connected = False
 _voice_settings_merged_cache: Dict[str, Any] = {}
 _voice_settings_merged_cache_loaded = False
 _voice_settings_merged_cache_until = 0.0
@@ -496,8 +505,8 @@ _voice_config_snapshot_cache_until = 0.0
 
 _background_tasks: Dict[str, asyncio.Task] = {}
 
-_tts_url_store: Dict[str, Dict[str, Any]] = {}
-_tts_url_store_lock = threading.Lock()
+# TTS/media URLs share the process-wide byte-budgeted runtime asset store.
+_tts_url_store = runtime_asset_store()
 
 _wyoming_tts_voice_catalog_mem: List[Dict[str, str]] = []
 _wyoming_tts_voice_catalog_meta_mem: Dict[str, Any] = {
@@ -678,6 +687,9 @@ def _pcm_rms(data: bytes, sample_width: int) -> float:
             return float(_audioop.rms(data, sample_width))
     if not data:
         return 0.0
+    rms = _dsp.pcm_rms(data, sample_width)
+    if rms is not None:
+        return rms
     if sample_width == 2:
         usable = len(data) - (len(data) % 2)
         if usable <= 0:
@@ -2036,10 +2048,60 @@ def _require_configured_api_auth(x_tater_token: Optional[str]) -> None:
     _require_api_auth(x_tater_token)
 
 
+@dataclass(frozen=True)
+class VoiceSettingsSnapshot:
+    """One published version of the ``voice_core_settings`` hash.
+
+    A snapshot is never mutated once published; a settings change swaps in a
+    new one. Per-chunk code reads the module global without a lock or a copy,
+    and parsed/clamped values are memoized for the life of the version.
+    """
+
+    version: int
+    values: Mapping[str, Any]
+    expires_ts: float = 0.0
+    _parsed: Dict[Tuple[Any, ...], Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.values.get(name, default)
+
+    def _memo(self, key: Tuple[Any, ...], parse: Callable[[], Any]) -> Any:
+        try:
+            return self._parsed[key]
+        except KeyError:
+            value = parse()
+            self._parsed[key] = value
+            return value
+
+    def get_bool(self, name: str, default: bool) -> bool:
+        return self._memo(("bool", name, default), lambda: _as_bool(self.values.get(name), default))
+
+    def get_int(self, name: str, default: int, *, minimum: Optional[int] = None, maximum: Optional[int] = None) -> int:
+        return self._memo(
+            ("int", name, default, minimum, maximum),
+            lambda: _as_int(self.values.get(name), default, minimum=minimum, maximum=maximum),
+        )
+
+    def get_float(
+        self,
+        name: str,
+        default: float,
+        *,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+    ) -> float:
+        return self._memo(
+            ("float", name, default, minimum, maximum),
+            lambda: _as_float(self.values.get(name), default, minimum=minimum, maximum=maximum),
+        )
+
+
+_EMPTY_VOICE_SETTINGS = VoiceSettingsSnapshot(version=0, values=MappingProxyType({}))
+
+
 def _invalidate_voice_config_cache() -> None:
-    global _voice_settings_cache
-    global _voice_settings_cache_loaded
-    global _voice_settings_cache_until
+    global _voice_settings_snapshot
+    global _voice_settings_version
     global _voice_settings_merged_cache
     global _voice_settings_merged_cache_loaded
     global _voice_settings_merged_cache_until
@@ -2047,9 +2109,9 @@ def _invalidate_voice_config_cache() -> None:
     global _voice_config_snapshot_cache_until
 
     with _voice_config_cache_lock:
-        _voice_settings_cache = {}
-        _voice_settings_cache_loaded = False
-        _voice_settings_cache_until = 0.0
+        # Bumping the version also discards any reload that is still in flight.
+        _voice_settings_version += 1
+        _voice_settings_snapshot = None
         _voice_settings_merged_cache = {}
         _voice_settings_merged_cache_loaded = False
         _voice_settings_merged_cache_until = 0.0
@@ -2057,31 +2119,91 @@ def _invalidate_voice_config_cache() -> None:
         _voice_config_snapshot_cache_until = 0.0
 
 
-def _voice_settings() -> Dict[str, Any]:
-    global _voice_settings_cache
-    global _voice_settings_cache_loaded
-    global _voice_settings_cache_until
+def _voice_settings_keyspace_events_enabled() -> bool:
+    row = redis_client.config_get("notify-keyspace-events")
+    flags = _text(row.get("notify-keyspace-events")) if isinstance(row, dict) else ""
+    return "K" in flags and ("h" in flags or "A" in flags)
+
+
+def _voice_settings_watch_worker() -> None:
+    global _voice_settings_watch_connected
+
+    pattern = f"__keyspace@*__:{VOICE_CORE_SETTINGS_HASH_KEY}"
+    while True:
+        pubsub = None
+        try:
+            if _voice_settings_keyspace_events_enabled():
+                pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(pattern)
+                _voice_settings_watch_connected = True
+                # Writes that landed before the subscription was live are unseen.
+                _invalidate_voice_config_cache()
+                while True:
+                    if pubsub.get_message(timeout=_VOICE_SETTINGS_WATCH_POLL_S) is not None:
+                        _invalidate_voice_config_cache()
+        except Exception as exc:
+            _native_debug(f"voice settings watch unavailable error={exc}")
+        finally:
+            # Until the watch is back, snapshots fall back to expiring on a TTL.
+            _voice_settings_watch_connected = False
+            if pubsub is not None:
+                with contextlib.suppress(Exception):
+                    pubsub.close()
+        time.sleep(_VOICE_SETTINGS_WATCH_RETRY_S)
+
+
+def _ensure_voice_settings_watch() -> None:
+    global _voice_settings_watch_thread
 
-    now = time.monotonic()
     with _voice_config_cache_lock:
-        if _voice_settings_cache_loaded and now < _voice_settings_cache_until:
-            return dict(_voice_settings_cache)
+        thread = _voice_settings_watch_thread
+        if thread is not None and thread.is_alive():
+            return
+        thread = threading.Thread(
+            target=_voice_settings_watch_worker,
+            daemon=True,
+            name="tater-voice-settings-watch",
+        )
+        _voice_settings_watch_thread = thread
+    thread.start()
+
+
+def _load_voice_settings_snapshot() -> VoiceSettingsSnapshot:
+    global _voice_settings_snapshot
+    global _voice_settings_version
 
+    _ensure_voice_settings_watch()
+    started_version = _voice_settings_version
     try:
         row = redis_client.hgetall(VOICE_CORE_SETTINGS_HASH_KEY) or {}
     except Exception:
-        with _voice_config_cache_lock:
-            if _voice_settings_cache_loaded:
-                return dict(_voice_settings_cache)
-        return {}
+        current = _voice_settings_snapshot
+        return current if current is not None else _EMPTY_VOICE_SETTINGS
     if not isinstance(row, dict):
         row = {}
 
+    snapshot = VoiceSettingsSnapshot(
+        version=started_version + 1,
+        values=MappingProxyType(dict(row)),
+        expires_ts=time.monotonic() + _VOICE_CONFIG_CACHE_TTL_S,
+    )
     with _voice_config_cache_lock:
-        _voice_settings_cache = dict(row)
-        _voice_settings_cache_loaded = True
-        _voice_settings_cache_until = time.monotonic() + _VOICE_CONFIG_CACHE_TTL_S
-        return dict(_voice_settings_cache)
+        # An invalidation raced the read; serve this one but do not publish it.
+        if _voice_settings_version == started_version:
+            _voice_settings_version = snapshot.version
+            _voice_settings_snapshot = snapshot
+    return snapshot
+
+
+def _current_voice_settings() -> VoiceSettingsSnapshot:
+    snapshot = _voice_settings_snapshot
+    if snapshot is not None and (_voice_settings_watch_connected or time.monotonic() < snapshot.expires_ts):
+        return snapshot
+    return _load_voice_settings_snapshot()
+
+
+def _voice_settings() -> Dict[str, Any]:
+    return dict(_current_voice_settings().values)
 
 
 def _shared_speech_voice_settings() -> Dict[str, Any]:
@@ -2403,15 +2525,15 @@ def _kokoro_provider() -> str:
 
 
 def _get_bool_setting(name: str, default: bool) -> bool:
-    return _as_bool(_voice_settings().get(name), default)
+    return _current_voice_settings().get_bool(name, default)
 
 
 def _get_int_setting(name: str, default: int, *, minimum: Optional[int] = None, maximum: Optional[int] = None) -> int:
-    return _as_int(_voice_settings().get(name), default, minimum=minimum, maximum=maximum)
+    return _current_voice_settings().get_int(name, default, minimum=minimum, maximum=maximum)
 
 
 def _get_float_setting(name: str, default: float, *, minimum: Optional[float] = None, maximum: Optional[float] = None) -> float:
-    return _as_float(_voice_settings().get(name), default, minimum=minimum, maximum=maximum)
+    return _current_voice_settings().get_float(name, default, minimum=minimum, maximum=maximum)
 
 
 def _normalize_stt_backend(value: Any) -> str:
@@ -3076,22 +3198,26 @@ def _build_voice_config_snapshot() -> Dict[str, Any]:
     }
 
 
-def _voice_config_snapshot() -> Dict[str, Any]:
+def _voice_config_view() -> Dict[str, Any]:
+    """Shared cached voice config; callers must treat it as read-only."""
     global _voice_config_snapshot_cache
     global _voice_config_snapshot_cache_until
 
-    now = time.monotonic()
-    with _voice_config_cache_lock:
-        if _voice_config_snapshot_cache is not None and now < _voice_config_snapshot_cache_until:
-            return copy.deepcopy(_voice_config_snapshot_cache)
+    cached = _voice_config_snapshot_cache
+    if cached is not None and time.monotonic() < _voice_config_snapshot_cache_until:
+        return cached
 
     snapshot = _build_voice_config_snapshot()
     with _voice_config_cache_lock:
-        _voice_config_snapshot_cache = copy.deepcopy(snapshot)
+        _voice_config_snapshot_cache = snapshot
         _voice_config_snapshot_cache_until = time.monotonic() + _VOICE_CONFIG_CACHE_TTL_S
     return snapshot
 
 
+def _voice_config_snapshot() -> Dict[str, Any]:
+    return copy.deepcopy(_voice_config_view())
+
+
 # -------------------- Voice Catalog Helpers --------------------
 def _load_wyoming_tts_voice_catalog() -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
     global _wyoming_tts_voice_catalog_mem, _wyoming_tts_voice_catalog_meta_mem
@@ -3293,6 +3419,9 @@ def _pcm_apply_gain(audio_bytes: bytes, *, sample_width: int, gain: float) -> by
             return _audioop.mul(data, width, factor)
     if width != 2:
         return data
+    scaled = _dsp.pcm_apply_gain(data, width, factor)
+    if scaled is not None:
+        return scaled
     usable = len(data) - (len(data) % 2)
     if usable <= 0:
         return data
@@ -3325,11 +3454,15 @@ def _pcm_high_pass_filter_session(session: "VoiceSessionRuntime", audio_bytes: b
         minimum=0.90,
         maximum=0.9999,
     )
+    prev_input = float(getattr(session, "noise_highpass_prev_input", 0.0) or 0.0)
+    prev_output = float(getattr(session, "noise_highpass_prev_output", 0.0) or 0.0)
+    filtered = _dsp.pcm_high_pass(data, float(alpha), prev_input, prev_output)
+    if filtered is not None:
+        out_bytes, session.noise_highpass_prev_input, session.noise_highpass_prev_output = filtered
+        return out_bytes
     out = bytearray(usable)
     src = memoryview(data[:usable]).cast("h")
     dst = memoryview(out).cast("h")
-    prev_input = float(getattr(session, "noise_highpass_prev_input", 0.0) or 0.0)
-    prev_output = float(getattr(session, "noise_highpass_prev_output", 0.0) or 0.0)
     for idx, sample in enumerate(src):
         current = float(sample)
         filtered = current - prev_input + (float(alpha) * prev_output)
@@ -3419,12 +3552,14 @@ def _audio_bytes_for_seconds(audio_format: Dict[str, Any], seconds: float) -> in
     return int(frames * frame_bytes)
 
 
-def _stt_audio_bytes_for_transcription(session: "VoiceSessionRuntime") -> bytes:
+def _stt_audio_bytes_for_transcription(session: "VoiceSessionRuntime") -> memoryview:
+    # A read-only view over the capture buffer (trailing silence trimmed);
+    # callers that need their own bytes copy it themselves.
     if not isinstance(session, VoiceSessionRuntime):
-        return b""
-    data = bytes(session.audio_buffer or b"")
+        return memoryview(b"")
+    data = session.audio_buffer.view()
     if not data:
-        return b""
+        return data
 
     silence_s = max(0.0, float(getattr(session, "silence_duration_s", 0.0) or 0.0))
     keep_s = _get_float_setting(
@@ -3510,29 +3645,40 @@ def _pcm_to_pcm16_mono_16k(
     channels = int(audio_format.get("channels") or DEFAULT_VOICE_CHANNELS)
 
     if width != 2:
-        if _audioop is None:
-            return b"", ratecv_state
         with contextlib.suppress(Exception):
-            data = _audioop.lin2lin(data, width, 2)
-            width = 2
+            if _audioop is not None:
+                data = _audioop.lin2lin(data, width, 2)
+                width = 2
+            else:
+                converted = _dsp.pcm_to_pcm16(data, width)
+                if converted is not None:
+                    data, width = converted, 2
         if width != 2:
             return b"", ratecv_state
 
     if channels > 1:
-        if _audioop is None:
-            return b"", ratecv_state
+        # audioop.tomono only knows stereo; the numpy downmix averages every
+        # channel and is used for >2 channels or when audioop is gone.
         with contextlib.suppress(Exception):
-            data = _audioop.tomono(data, 2, 0.5, 0.5)
-            channels = 1
+            if _audioop is not None and channels == 2:
+                data = _audioop.tomono(data, 2, 0.5, 0.5)
+                channels = 1
+            else:
+                mixed = _dsp.pcm_downmix(data, 2, channels)
+                if mixed is not None:
+                    data, channels = mixed, 1
         if channels != 1:
             return b"", ratecv_state
 
     if rate != 16000:
-        if _audioop is None:
-            return b"", ratecv_state
         with contextlib.suppress(Exception):
-            data, ratecv_state = _audioop.ratecv(data, 2, 1, rate, 16000, ratecv_state)
-            rate = 16000
+            if _audioop is not None:
+                data, ratecv_state = _audioop.ratecv(data, 2, 1, rate, 16000, ratecv_state)
+                rate = 16000
+            else:
+                resampled = _dsp.pcm_ratecv(data, rate, 16000, ratecv_state)
+                if resampled is not None:
+                    (data, ratecv_state), rate = resampled, 16000
         if rate != 16000:
             return b"", ratecv_state
 
@@ -4069,7 +4215,7 @@ def _build_eou_engine(
     reopen_capture_profile: bool = False,
     cfg: Optional[Dict[str, Any]] = None,
 ) -> EouEngine:
-    cfg_row = cfg if isinstance(cfg, dict) else _voice_config_snapshot()
+    cfg_row = cfg if isinstance(cfg, dict) else _voice_config_view()
     eou = cfg_row.get("eou") if isinstance(cfg_row.get("eou"), dict) else {}
     selected_backend = _normalize_vad_backend(eou.get("backend"))
     if selected_backend == "auto":
@@ -4136,7 +4282,7 @@ def _build_eou_engine(
 
 # -------------------- STT + Voice Event Helpers --------------------
 def _stt_config_snapshot() -> Dict[str, Any]:
-    cfg = _voice_config_snapshot()
+    cfg = _voice_config_view()
     stt = cfg.get("stt") if isinstance(cfg.get("stt"), dict) else {}
     return stt if isinstance(stt, dict) else {}
 
@@ -4531,27 +4677,33 @@ async def _start_chatterbox_streamed_tts_response(
     transcript: str,
 ) -> Optional[Dict[str, Any]]:
     selection = _tts_selection_from_values()
-    if not _chatterbox_tts_streaming_enabled(selection):
-        return None
     effective_backend = _normalize_tts_backend(_text(session.tts_backend_effective))
-    if effective_backend != "chatterbox":
+    # Managed workers stream sentence by sentence, so the satellite starts on
+    # the first sentence while the rest is still being synthesized.
+    managed = effective_backend in {"qwen3_tts", "omnivoice"}
+    if not managed and not (effective_backend == "chatterbox" and _chatterbox_tts_streaming_enabled(selection)):
         return None
     prompt = _text(response_text)
     if not prompt:
         return None
+    stream_label = "managed" if managed else "chatterbox"
 
     tts_started = time.monotonic()
     try:
-        stream_url = _store_chatterbox_tts_stream_url(selector, session.session_id, prompt, selection)
+        if managed:
+            stream_url = _store_managed_tts_stream_url(selector, session.session_id, prompt, selection, effective_backend)
+        else:
+            stream_url = _store_chatterbox_tts_stream_url(selector, session.session_id, prompt, selection)
     except Exception as exc:
         logger.warning(
-            "[native-voice] Chatterbox streaming TTS URL preparation failed selector=%s session_id=%s error=%s",
+            "[native-voice] %s streaming TTS URL preparation failed selector=%s session_id=%s error=%s",
+            stream_label,
             selector,
             session.session_id,
             _text(exc),
         )
         _native_debug(
-            f"chatterbox streaming tts url failed selector={selector} session_id={session.session_id} error={exc}"
+            f"{stream_label} streaming tts url failed selector={selector} session_id={session.session_id} error={exc}"
         )
         return None
     if not stream_url:
@@ -4567,7 +4719,7 @@ async def _start_chatterbox_streamed_tts_response(
         _set_awaiting_announcement_state(
             runtime,
             session_id=_text(session.session_id),
-            kind="response_chatterbox_stream",
+            kind=f"response_{stream_label}_stream",
             future=None,
             timeout_s=timeout_s,
         )
@@ -4581,7 +4733,7 @@ async def _start_chatterbox_streamed_tts_response(
     await _esphome_send_event(client, module, ("VOICE_ASSISTANT_TTS_START", "TTS_START"), {"text": prompt})
     await _esphome_send_event(client, module, ("VOICE_ASSISTANT_TTS_END", "TTS_END"), {"url": stream_url})
     _native_debug(
-        f"chatterbox streaming tts started selector={selector} session_id={session.session_id} "
+        f"{stream_label} streaming tts started selector={selector} session_id={session.session_id} "
         f"timeout_s={timeout_s:.2f} url={stream_url}"
     )
     return {
@@ -4589,7 +4741,7 @@ async def _start_chatterbox_streamed_tts_response(
         "backend_used": effective_backend,
         "backend_note": "",
         "tts_bytes": 0,
-        "tts_mode": "chatterbox_stream_url",
+        "tts_mode": f"{stream_label}_stream_url",
         "run_end_mode": "announcement_streamed",
         "segment_count": 1,
     }
@@ -4630,26 +4782,11 @@ def _pcm_to_wav(audio_bytes: bytes, audio_format: Dict[str, Any]) -> Tuple[bytes
 
 
 def _tts_url_ttl_s() -> float:
-    cfg = _voice_config_snapshot()
+    cfg = _voice_config_view()
     limits = cfg.get("limits") if isinstance(cfg.get("limits"), dict) else {}
     return float(limits.get("tts_url_ttl_s") or DEFAULT_TTS_URL_TTL_S)
 
 
-def _tts_url_prune_locked(now_ts: Optional[float] = None) -> int:
-    now = float(now_ts if isinstance(now_ts, (int, float)) else _now())
-    removed = 0
-    for stream_id, row in list(_tts_url_store.items()):
-        if not isinstance(row, dict):
-            _tts_url_store.pop(stream_id, None)
-            removed += 1
-            continue
-        expires_ts = float(row.get("expires_ts") or 0.0)
-        if expires_ts > 0 and now >= expires_ts:
-            _tts_url_store.pop(stream_id, None)
-            removed += 1
-    return removed
-
-
 def _service_host_for_peer(peer_host: str) -> str:
     env_host = _text(os.getenv("VOICE_CORE_PUBLIC_HOST"))
     if env_host:
@@ -4730,18 +4867,23 @@ def _store_tts_url(selector: str, session_id: str, audio_bytes: bytes, audio_for
         return ""
 
     stream_id = uuid.uuid4().hex
-    expires_ts = _now() + _tts_url_ttl_s()
-    with _tts_url_store_lock:
-        _tts_url_prune_locked()
-        _tts_url_store[stream_id] = {
+    ttl_s = _tts_url_ttl_s()
+    stored = _tts_url_store.put(
+        wav_bytes,
+        ttl_s=ttl_s,
+        asset_id=stream_id,
+        meta={
             "id": stream_id,
             "selector": _text(selector),
             "session_id": _text(session_id),
             "created_ts": _now(),
-            "expires_ts": expires_ts,
+            "expires_ts": _now() + ttl_s,
             "audio_format": normalized_format,
-            "wav_bytes": wav_bytes,
-        }
+        },
+    )
+    if not stored:
+        _native_debug(f"native tts url rejected selector={_text(selector)} bytes={len(wav_bytes)} reason=asset_budget")
+        return ""
 
     base_url = _service_base_url_for_peer(_selector_host(selector))
     url = f"{base_url}/api/tater/satellite/v1/tts/{stream_id}.wav"
@@ -4779,20 +4921,22 @@ def _store_chatterbox_tts_stream_url(
         return ""
 
     stream_id = uuid.uuid4().hex
-    expires_ts = _now() + _tts_url_ttl_s()
-    with _tts_url_store_lock:
-        _tts_url_prune_locked()
-        _tts_url_store[stream_id] = {
+    ttl_s = _tts_url_ttl_s()
+    _tts_url_store.put(
+        ttl_s=ttl_s,
+        asset_id=stream_id,
+        meta={
             "id": stream_id,
             "selector": _text(selector),
             "session_id": _text(session_id),
             "created_ts": _now(),
-            "expires_ts": expires_ts,
+            "expires_ts": _now() + ttl_s,
             "stream_kind": "chatterbox",
             "endpoint": endpoint,
             "payload": dict(payload),
             "max_bytes": DEFAULT_CHATTERBOX_TTS_STREAM_MAX_BYTES,
-        }
+        },
+    )
 
     base_url = _service_base_url_for_peer(_selector_host(selector))
     url = f"{base_url}/api/tater/satellite/v1/tts/{stream_id}.wav"
@@ -4803,16 +4947,50 @@ def _store_chatterbox_tts_stream_url(
     return url
 
 
+def _store_managed_tts_stream_url(
+    selector: str,
+    session_id: str,
+    text: str,
+    selection: Dict[str, Any],
+    backend: str,
+) -> str:
+    prompt = _text(text)
+    if not prompt:
+        return ""
+
+    stream_id = uuid.uuid4().hex
+    ttl_s = _tts_url_ttl_s()
+    _tts_url_store.put(
+        ttl_s=ttl_s,
+        asset_id=stream_id,
+        meta={
+            "id": stream_id,
+            "selector": _text(selector),
+            "session_id": _text(session_id),
+            "created_ts": _now(),
+            "expires_ts": _now() + ttl_s,
+            "stream_kind": "managed",
+            "text": prompt,
+            "managed_kwargs": _managed_tts_synthesis_kwargs(backend, selection),
+        },
+    )
+
+    base_url = _service_base_url_for_peer(_selector_host(selector))
+    url = f"{base_url}/api/tater/satellite/v1/tts/{stream_id}.wav"
+    _native_debug(
+        f"managed streaming tts url prepared selector={_text(selector)} session_id={_text(session_id)} "
+        f"stream_id={stream_id} url={url}"
+    )
+    return url
+
+
 def _fetch_tts_url(stream_id: str) -> Optional[Dict[str, Any]]:
-    token = _text(stream_id)
-    if not token:
+    asset = _tts_url_store.get(_text(stream_id))
+    if asset is None:
         return None
-    with _tts_url_store_lock:
-        _tts_url_prune_locked()
-        row = _tts_url_store.get(token)
-        if not isinstance(row, dict):
-            return None
-        return dict(row)
+    row = dict(asset.meta)
+    row["body"] = asset.body
+    return row
 
 
 def _strip_flac_picture_blocks(media_bytes: bytes) -> Tuple[bytes, int]:
@@ -4884,20 +5062,25 @@ def _store_media_url(
         return ""
 
     stream_id = uuid.uuid4().hex
-    expires_ts = _now() + _tts_url_ttl_s()
+    ttl_s = _tts_url_ttl_s()
     mime = _text(media_type).strip() or "application/octet-stream"
-    with _tts_url_store_lock:
-        _tts_url_prune_locked()
-        _tts_url_store[stream_id] = {
+    stored = _tts_url_store.put(
+        data,
+        ttl_s=ttl_s,
+        asset_id=stream_id,
+        meta={
             "id": stream_id,
             "selector": _text(selector),
             "session_id": _text(session_id),
             "created_ts": _now(),
-            "expires_ts": expires_ts,
+            "expires_ts": _now() + ttl_s,
             "media_type": mime,
             "filename": _text(filename) or "audio.bin",
-            "body_bytes": data,
-        }
+        },
+    )
+    if not stored:
+        _native_debug(f"native media url rejected selector={_text(selector)} bytes={len(data)} reason=asset_budget")
+        return ""
 
     base_url = _service_base_url_for_peer(_selector_host(selector))
     url = f"{base_url}/api/tater/satellite/v1/media/{stream_id}"
@@ -5941,7 +6124,7 @@ def _apply_startup_preroll(session: VoiceSessionRuntime) -> int:
     applied = 0
     if allowed > 0:
         preroll = bytes(session.startup_preroll_buffer)[-allowed:]
-        session.audio_buffer.extend(preroll)
+        session.audio_buffer.extend(preroll, preroll=True)
         session.audio_bytes += len(preroll)
         applied = len(preroll)
     session.startup_preroll_buffer.clear()
@@ -6012,7 +6195,7 @@ async def _process_voice_turn(session: VoiceSessionRuntime) -> Dict[str, Any]:
             enrollment = await run_speech(
                 esphome_speaker_id.add_enrollment_sample,
                 speaker_id=_text(pending_enrollment.get("speaker_id")),
-                audio_bytes=bytes(session.audio_buffer),
+                audio_bytes=session.audio_buffer.view(),
                 audio_format=dict(session.audio_format or {}),
                 speech_s=float(session.speech_duration_s or 0.0),
             )
@@ -6060,7 +6243,7 @@ async def _process_voice_turn(session: VoiceSessionRuntime) -> Dict[str, Any]:
         return await esphome_intercom.handle_broadcast_voice_turn(
             selector=session.selector,
             transcript=transcript,
-            audio_bytes=bytes(session.audio_buffer),
+            audio_bytes=session.audio_buffer.view(),
             audio_format=dict(session.audio_format or {}),
             speech_s=float(session.speech_duration_s or 0.0),
         )
@@ -6068,7 +6251,7 @@ async def _process_voice_turn(session: VoiceSessionRuntime) -> Dict[str, Any]:
     intercom_result = await esphome_intercom.handle_voice_turn(
         selector=session.selector,
         transcript=transcript,
-        audio_bytes=bytes(session.audio_buffer),
+        audio_bytes=session.audio_buffer.view(),
         audio_format=dict(session.audio_format or {}),
         speech_s=float(session.speech_duration_s or 0.0),
     )
@@ -6152,7 +6335,7 @@ async def _process_voice_turn(session: VoiceSessionRuntime) -> Dict[str, Any]:
     try:
         speaker_match = await run_speech(
             esphome_speaker_id.match_speaker_for_audio,
-            audio_bytes=bytes(session.audio_buffer),
+            audio_bytes=session.audio_buffer.view(),
             audio_format=dict(session.audio_format or {}),
             speech_s=float(session.speech_duration_s or 0.0),
         )
@@ -6186,7 +6369,7 @@ async def _process_voice_turn(session: VoiceSessionRuntime) -> Dict[str, Any]:
 
         emotion_result = await run_speech(
             esphome_emotion_id.classify_emotion_for_audio,
-            audio_bytes=bytes(session.audio_buffer),
+            audio_bytes=session.audio_buffer.view(),
             audio_format=dict(session.audio_format or {}),
             speech_s=float(session.speech_duration_s or 0.0),
         )
@@ -6270,7 +6453,7 @@ async def _finalize_session(
             f"bytes={preroll_bytes} preroll_s={float(session.startup_preroll_s or 0.0):.2f}"
         )
         if session.stt_queue is not None:
-            _enqueue_stt_stream_item(session, bytes(session.audio_buffer[-preroll_bytes:]), reason="stt_stream_preroll_finalize")
+            _enqueue_stt_stream_item(session, bytes(session.audio_buffer.preroll()), reason="stt_stream_preroll_finalize")
 
     if session.stt_queue is not None:
         _enqueue_stt_stream_item(session, None, reason="session_finalize")
@@ -6956,7 +7139,7 @@ async def _esphome_subscribe_voice_assistant(selector: str, client: Any, module:
             )
             return None
 
-        voice_cfg = _voice_config_snapshot()
+        voice_cfg = _voice_config_view()
         eou_cfg = voice_cfg.get("eou") if isinstance(voice_cfg.get("eou"), dict) else {}
         limits_cfg = voice_cfg.get("limits") if isinstance(voice_cfg.get("limits"), dict) else {}
 
@@ -8,24 +8,26 @@ import io
 import json
 import os
 import re
+import struct
 import subprocess
 import sys
 import tempfile
 import threading
 import time
 import wave
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
 from .conversation import VoiceSessionRuntime
 from runtime_executors import run_stt, run_tts
+from tts_audio_cache import get_cached_tts_audio, store_cached_tts_audio, tts_audio_cache_key
 from tateros import integration_store as integration_store_module
 from managed_tts import (
     DEFAULT_OMNIVOICE_TTS_MODEL,
     DEFAULT_QWEN_TTS_MODEL,
+    aiter_managed_tts_pcm,
     clear_managed_tts_workers,
-    synthesize_managed_tts_pcm,
 )
 from helpers import (
     _llama_cpp_native_free_port,
@@ -105,7 +107,7 @@ def _resolve_stt_backend() -> Tuple[str, str]:
 
 def _tts_config_snapshot() -> Dict[str, Any]:
     vp = _vp()
-    cfg = vp._voice_config_snapshot()
+    cfg = vp._voice_config_view()
     tts = cfg.get("tts") if isinstance(cfg.get("tts"), dict) else {}
     return tts if isinstance(tts, dict) else {}
 
@@ -1114,7 +1116,7 @@ def _decode_wav_bytes(wav_bytes: bytes) -> Tuple[bytes, Dict[str, Any]]:
 
 def _wyoming_stt_endpoint() -> Tuple[str, int]:
     vp = _vp()
-    cfg = vp._voice_config_snapshot()
+    cfg = vp._voice_config_view()
     stt = cfg.get("wyoming_stt") if isinstance(cfg.get("wyoming_stt"), dict) else {}
     host = vp._text(stt.get("host")) or vp.DEFAULT_WYOMING_STT_HOST
     port = int(stt.get("port") or vp.DEFAULT_WYOMING_STT_PORT)
@@ -1123,7 +1125,7 @@ def _wyoming_stt_endpoint() -> Tuple[str, int]:
 
 def _wyoming_tts_endpoint() -> Tuple[str, int]:
     vp = _vp()
-    cfg = vp._voice_config_snapshot()
+    cfg = vp._voice_config_view()
     tts = cfg.get("wyoming_tts") if isinstance(cfg.get("wyoming_tts"), dict) else {}
     host = vp._text(tts.get("host")) or vp.DEFAULT_WYOMING_TTS_HOST
     port = int(tts.get("port") or vp.DEFAULT_WYOMING_TTS_PORT)
@@ -1507,20 +1509,30 @@ async def _native_transcribe_session_audio(session: VoiceSessionRuntime) -> str:
             await session.partial_stt_task
         session.partial_stt_task = None
 
+    stream = session.partial_stt_stream
+    session.partial_stt_stream = None
     audio_bytes = vp._stt_audio_bytes_for_transcription(session)
     if not audio_bytes:
         session.stt_transcript = ""
         return ""
 
+    window_start = 0
+    if isinstance(stream, LocalAgreementStream) and backend in _STREAMING_PARTIAL_STT_BACKENDS:
+        if 0 < stream.window_start < len(audio_bytes):
+            window_start = stream.window_start
     transcript = await _native_transcribe_local_audio_bytes(
         backend=backend,
-        audio_bytes=audio_bytes,
+        audio_bytes=audio_bytes[window_start:] if window_start else audio_bytes,
         audio_format=session.audio_format,
         language=session.language,
         selector=session.selector,
         session_id=session.session_id,
         partial=False,
     )
+    if window_start:
+        # The committed prefix from partial STT covers everything before the
+        # last window; only the tail was transcribed again.
+        transcript = vp._sanitize_stt_transcript(stream.finalize(transcript))
 
     session.stt_transcript = vp._text(transcript)
     vp._native_debug(f"STT {backend} transcript={session.stt_transcript!r}")
@@ -1671,6 +1683,96 @@ async def _native_transcribe_wake_audio_bytes(
     return vp._text(transcript)
 
 
+_STREAMING_PARTIAL_STT_BACKENDS = {"faster_whisper", "parakeet_onnx"}
+_STREAMING_PARTIAL_STT_MAX_WINDOW_S = 6.0
+_STREAMING_PARTIAL_STT_FORCE_WINDOW_S = 12.0
+_STREAMING_PARTIAL_STT_OVERLAP_S = 0.8
+_STREAMING_PARTIAL_STT_DEDUPE_WORDS = 8
+
+
+def _stt_words(text: Any) -> List[str]:
+    return [word for word in str(text or "").split() if word]
+
+
+def _stt_word_key(word: str) -> str:
+    return re.sub(r"[^a-z0-9']+", "", str(word or "").lower())
+
+
+class LocalAgreementStream:
+    """Sliding-window partial STT with a committed prefix and an unstable tail.
+
+    Each tick transcribes only ``audio[window_start:]``. Words on which two
+    consecutive hypotheses of the same window agree are committed; once a
+    window is long enough and has committed words it slides forward, keeping
+    an overlap whose re-recognized words are dropped against the committed
+    tail. The final transcript only re-runs the last window.
+    """
+
+    def __init__(self, bytes_per_second: int, frame_bytes: int = 2):
+        self.bytes_per_second = max(1, int(bytes_per_second))
+        self.frame_bytes = max(1, int(frame_bytes))
+        self.committed: List[str] = []
+        self.window_start = 0
+        self.window_committed = 0
+        self.previous: List[str] = []
+        self.tail: List[str] = []
+        self.anchor: List[str] = []
+
+    def _bytes_for(self, seconds: float) -> int:
+        value = int(self.bytes_per_second * float(seconds))
+        return value - value % self.frame_bytes
+
+    def _strip_overlap(self, words: List[str]) -> List[str]:
+        # Drop the words re-recognized from the overlap, matched against the
+        # committed tail as it was when the window slid.
+        anchor = [_stt_word_key(word) for word in self.anchor]
+        keys = [_stt_word_key(word) for word in words]
+        for size in range(min(len(anchor), len(keys)), 0, -1):
+            if anchor[-size:] == keys[:size]:
+                return words[size:]
+        return words
+
+    def feed(self, audio_len: int, transcript: Any) -> str:
+        words = self._strip_overlap(_stt_words(transcript))
+        agreed = 0
+        for left, right in zip(self.previous, words):
+            if _stt_word_key(left) != _stt_word_key(right):
+                break
+            agreed += 1
+        if agreed > self.window_committed:
+            self.committed.extend(words[self.window_committed:agreed])
+            self.window_committed = agreed
+        self.previous = words
+        self.tail = words[self.window_committed:]
+        text = self.text()
+
+        window_bytes = int(audio_len) - self.window_start
+        settled = self.window_committed > 0 and window_bytes >= self._bytes_for(_STREAMING_PARTIAL_STT_MAX_WINDOW_S)
+        forced = window_bytes >= self._bytes_for(_STREAMING_PARTIAL_STT_FORCE_WINDOW_S)
+        if settled or forced:
+            if forced:
+                self.committed.extend(self.tail)
+                self.tail = []
+            # No word timestamps: size the overlap so the unstable tail (at the
+            # window's average word rate) is heard again in the next window.
+            word_s = (window_bytes / float(self.bytes_per_second)) / max(1, len(words))
+            overlap_s = max(_STREAMING_PARTIAL_STT_OVERLAP_S, 1.5 * word_s * (len(self.tail) + 1))
+            self.window_start = max(self.window_start, int(audio_len) - self._bytes_for(overlap_s))
+            self.anchor = self.committed[-_STREAMING_PARTIAL_STT_DEDUPE_WORDS:]
+            self.window_committed = 0
+            self.previous = []
+        return text
+
+    def text(self) -> str:
+        return " ".join(self.committed + self.tail)
+
+    def finalize(self, transcript: Any) -> str:
+        # ``transcript`` is the final pass over ``audio[window_start:]``, which
+        # supersedes anything committed from the current window.
+        before_window = self.committed[: len(self.committed) - self.window_committed]
+        return " ".join(before_window + self._strip_overlap(_stt_words(transcript)))
+
+
 async def _native_local_partial_stt_task(
     token: str,
     session_id: str,
@@ -1680,6 +1782,7 @@ async def _native_local_partial_stt_task(
     vp = _vp()
     last_audio_bytes = 0
     last_partial = ""
+    stream: Optional[LocalAgreementStream] = None
     while True:
         try:
             await asyncio.sleep(float(vp.DEFAULT_EXPERIMENTAL_PARTIAL_STT_INTERVAL_S))
@@ -1700,8 +1803,21 @@ async def _native_local_partial_stt_task(
                 backend = vp._normalize_stt_backend(vp._text(session.stt_backend_effective) or vp._text(session.stt_backend))
                 if backend == "wyoming":
                     return
-                audio_bytes = bytes(session.audio_buffer or b"")
                 audio_format = dict(session.audio_format or {})
+                rate = int(audio_format.get("rate") or vp.DEFAULT_VOICE_SAMPLE_RATE_HZ)
+                width = int(audio_format.get("width") or vp.DEFAULT_VOICE_SAMPLE_WIDTH)
+                channels = int(audio_format.get("channels") or vp.DEFAULT_VOICE_CHANNELS)
+                bytes_per_second = max(1, rate * width * channels)
+                if stream is None and backend in _STREAMING_PARTIAL_STT_BACKENDS:
+                    stream = LocalAgreementStream(bytes_per_second, width * channels)
+                    session.partial_stt_stream = stream
+                    if isinstance(session_ref, VoiceSessionRuntime) and session_ref is not session:
+                        session_ref.partial_stt_stream = stream
+                # Streaming backends only copy the current window, not the
+                # whole utterance.
+                audio_len = len(session.audio_buffer)
+                window_start = min(stream.window_start, audio_len) if stream is not None else 0
+                audio_bytes = session.audio_buffer.view(window_start, audio_len)
                 language = session.language
                 speech_s = float(session.speech_duration_s or 0.0)
                 partial_updates = int(session.partial_transcript_updates or 0)
@@ -1709,16 +1825,12 @@ async def _native_local_partial_stt_task(
             if not audio_bytes:
                 continue
 
-            rate = int(audio_format.get("rate") or vp.DEFAULT_VOICE_SAMPLE_RATE_HZ)
-            width = int(audio_format.get("width") or vp.DEFAULT_VOICE_SAMPLE_WIDTH)
-            channels = int(audio_format.get("channels") or vp.DEFAULT_VOICE_CHANNELS)
-            bytes_per_second = max(1, rate * width * channels)
-            audio_s = float(len(audio_bytes)) / float(bytes_per_second)
+            audio_s = float(audio_len) / float(bytes_per_second)
             min_audio_s = float(vp.DEFAULT_EXPERIMENTAL_PARTIAL_STT_MIN_AUDIO_S)
             if speech_s < min_audio_s and audio_s < min_audio_s:
                 continue
             min_new_bytes = int(bytes_per_second * float(vp.DEFAULT_EXPERIMENTAL_PARTIAL_STT_MIN_NEW_AUDIO_S))
-            if last_audio_bytes > 0 and (len(audio_bytes) - last_audio_bytes) < min_new_bytes and partial_updates > 0:
+            if last_audio_bytes > 0 and (audio_len - last_audio_bytes) < min_new_bytes and partial_updates > 0:
                 continue
 
             transcript = await _native_transcribe_local_audio_bytes(
@@ -1730,10 +1842,10 @@ async def _native_local_partial_stt_task(
                 session_id=session_id,
                 partial=True,
             )
-            text_value = vp._text(transcript)
+            text_value = vp._text(stream.feed(audio_len, transcript) if stream is not None else transcript)
             if not text_value or text_value == last_partial:
                 if text_value:
-                    last_audio_bytes = len(audio_bytes)
+                    last_audio_bytes = audio_len
                 continue
 
             async with lock:
@@ -1753,7 +1865,7 @@ async def _native_local_partial_stt_task(
                     session_ref.partial_transcript_updated_ts = vp._now()
 
             last_partial = text_value
-            last_audio_bytes = len(audio_bytes)
+            last_audio_bytes = audio_len
             vp._native_debug(f"STT partial transcript selector={token} session_id={session_id} transcript={text_value!r}")
         except asyncio.CancelledError:
             return
@@ -1784,7 +1896,7 @@ async def _native_wyoming_synthesize(
     if not prompt:
         return b"", {}
 
-    cfg = vp._voice_config_snapshot()
+    cfg = vp._voice_config_view()
     tts = cfg.get("wyoming_tts") if isinstance(cfg.get("wyoming_tts"), dict) else {}
     host = vp._text(host) or vp._text(tts.get("host")) or vp.DEFAULT_WYOMING_TTS_HOST
     port = vp._as_int(port, int(tts.get("port") or vp.DEFAULT_WYOMING_TTS_PORT), minimum=1, maximum=65535)
@@ -2067,6 +2179,63 @@ def _iter_chatterbox_tts_stream_response(response: requests.Response, row: Dict[
         )
 
 
+def _managed_tts_synthesis_kwargs(backend: str, selection: Dict[str, Any]) -> Dict[str, Any]:
+    vp = _vp()
+    prefix = "qwen_tts" if backend == "qwen3_tts" else "omnivoice_tts"
+    default_model = DEFAULT_QWEN_TTS_MODEL if backend == "qwen3_tts" else DEFAULT_OMNIVOICE_TTS_MODEL
+    return {
+        "backend": backend,
+        "model": vp._text((selection or {}).get("model")) or default_model,
+        "clone_audio": (selection or {}).get(f"{prefix}_clone_audio"),
+        "clone_text": (selection or {}).get(f"{prefix}_clone_text"),
+        "language": (selection or {}).get(f"{prefix}_language"),
+        "instruct": (selection or {}).get(f"{prefix}_instruct"),
+        "acceleration": vp._voice_settings_with_shared_speech().get("VOICE_ACCELERATION"),
+    }
+
+
+def _wav_stream_header(audio_format: Dict[str, Any]) -> bytes:
+    """WAV header with open-ended sizes, for audio whose length is not known yet."""
+    rate = int(audio_format.get("rate") or 0)
+    width = int(audio_format.get("width") or 2)
+    channels = int(audio_format.get("channels") or 1)
+    return b"".join(
+        (
+            b"RIFF",
+            struct.pack("<I", 0xFFFFFFFF),
+            b"WAVEfmt ",
+            struct.pack("<IHHIIHH", 16, 1, channels, rate, rate * width * channels, width * channels, width * 8),
+            b"data",
+            struct.pack("<I", 0xFFFFFFFF),
+        )
+    )
+
+
+async def _iter_managed_tts_stream_response(row: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """Stream a managed TTS reply as WAV, sentence by sentence.
+
+    The first sentence is sent while the worker is still synthesizing the
+    rest; a satellite that hangs up cancels the remaining sentences.
+    """
+    vp = _vp()
+    stream_id = vp._text((row or {}).get("id"))
+    total_bytes = 0
+    try:
+        async for chunk, audio_format in aiter_managed_tts_pcm(
+            vp._text((row or {}).get("text")),
+            **dict((row or {}).get("managed_kwargs") or {}),
+        ):
+            if not total_bytes:
+                yield _wav_stream_header(audio_format)
+            total_bytes += len(chunk)
+            yield chunk
+    finally:
+        vp._native_debug(
+            f"managed streaming tts finished stream_id={stream_id} session_id={vp._text((row or {}).get('session_id'))} "
+            f"bytes={total_bytes}"
+        )
+
+
 def _kokoro_output_gain() -> float:
     vp = _vp()
     env_value = os.getenv("TATER_KOKORO_OUTPUT_GAIN")
@@ -2553,6 +2722,50 @@ async def _native_synthesize_text(
     if not effective_backend:
         effective_backend, backend_note = _resolve_tts_backend(values)
 
+    cache_key = _native_tts_cache_key(prompt, effective_backend, selection)
+    cached = get_cached_tts_audio(cache_key)
+    if cached is not None:
+        vp._native_debug(f"TTS ({effective_backend}) phrase cache hit text_len={len(prompt)}")
+        return cached[0], cached[1], effective_backend, backend_note
+
+    audio_bytes, audio_format, backend_used, note = await _native_synthesize_selection(
+        prompt,
+        selection=selection,
+        selected_backend=selected_backend,
+        effective_backend=effective_backend,
+        backend_note=backend_note,
+    )
+    # Wyoming fallbacks are not what the key describes, so they stay uncached.
+    if backend_used == effective_backend:
+        store_cached_tts_audio(cache_key, audio_bytes, audio_format)
+    return audio_bytes, audio_format, backend_used, note
+
+
+def _native_tts_cache_key(prompt: str, backend: str, selection: Dict[str, Any]) -> str:
+    gain = None
+    if backend == "kokoro":
+        gain = _kokoro_output_gain()
+    elif backend == "pocket_tts":
+        gain = _pocket_tts_output_gain()
+    return tts_audio_cache_key(
+        backend=backend,
+        model=selection.get("model"),
+        voice=selection.get("voice"),
+        gain=gain,
+        text=prompt,
+        extra={key: value for key, value in selection.items() if key not in {"backend", "model", "voice"}},
+    )
+
+
+async def _native_synthesize_selection(
+    prompt: str,
+    *,
+    selection: Dict[str, Any],
+    selected_backend: str,
+    effective_backend: str,
+    backend_note: str,
+) -> Tuple[bytes, Dict[str, Any], str, str]:
+    vp = _vp()
     try:
         if effective_backend == "kokoro":
             vp._native_debug(f"TTS (kokoro) local model={selection.get('model')} voice={selection.get('voice') or vp.DEFAULT_KOKORO_VOICE}")
@@ -2577,21 +2790,17 @@ async def _native_synthesize_text(
             audio_bytes, audio_format = await run_tts(_synthesize_piper_sync, prompt, vp._text(selection.get("model")) or vp.DEFAULT_PIPER_MODEL)
             return audio_bytes, audio_format, effective_backend, backend_note
         if effective_backend in {"qwen3_tts", "omnivoice"}:
-            prefix = "qwen_tts" if effective_backend == "qwen3_tts" else "omnivoice_tts"
-            default_model = DEFAULT_QWEN_TTS_MODEL if effective_backend == "qwen3_tts" else DEFAULT_OMNIVOICE_TTS_MODEL
-            vp._native_debug(f"TTS ({effective_backend}) managed local model={selection.get('model') or default_model}")
-            audio_bytes, audio_format = await run_tts(
-                synthesize_managed_tts_pcm,
-                prompt,
-                backend=effective_backend,
-                model=vp._text(selection.get("model")) or default_model,
-                clone_audio=selection.get(f"{prefix}_clone_audio"),
-                clone_text=selection.get(f"{prefix}_clone_text"),
-                language=selection.get(f"{prefix}_language"),
-                instruct=selection.get(f"{prefix}_instruct"),
-                acceleration=vp._voice_settings_with_shared_speech().get("VOICE_ACCELERATION"),
-            )
-            return audio_bytes, audio_format, effective_backend, backend_note
+            managed_kwargs = _managed_tts_synthesis_kwargs(effective_backend, selection)
+            vp._native_debug(f"TTS ({effective_backend}) managed local model={managed_kwargs['model']}")
+            # Awaited chunk by chunk so barge-in cancellation reaches the worker
+            # request too; unsplit, since the caller needs the whole clip.
+            chunks: List[bytes] = []
+            audio_format: Dict[str, Any] = {}
+            async for chunk, audio_format in aiter_managed_tts_pcm(prompt, **managed_kwargs, split=False):
+                chunks.append(chunk)
+            if not chunks:
+                raise RuntimeError("Managed TTS produced no audio.")
+            return b"".join(chunks), audio_format, effective_backend, backend_note
         if effective_backend == "openai_compatible":
             vp._native_debug(
                 f"TTS (openai-compatible) remote base={selection.get('openai_base_url')} "
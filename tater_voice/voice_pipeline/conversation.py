@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import inspect
 import json
+import mmap
 import sys
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
@@ -13,6 +14,79 @@ def _vp():
     return sys.modules[__package__]
 
 
+class AudioCaptureBuffer:
+    """Append-only PCM capture buffer for one voice turn.
+
+    Capacity is reserved up front as an anonymous mmap, so untouched capacity
+    costs address space rather than RSS, and appends never move the data.
+    Readers get read-only ``memoryview`` windows over the captured bytes, so
+    STT, speaker ID and emotion ID share one copy of the audio. ``bytes()``,
+    ``len()`` and slicing keep working for bytearray-style callers.
+    """
+
+    def __init__(self, capacity: int = 0):
+        self.capacity = max(0, int(capacity or 0))
+        self._map: Optional[mmap.mmap] = None
+        self._length = 0
+        self.preroll_start = 0
+        self.preroll_end = 0
+
+    def _reserve(self, needed: int) -> mmap.mmap:
+        current = self._map
+        if current is not None and len(current) >= needed:
+            return current
+        size = max(int(needed), self.capacity, 2 * len(current) if current is not None else 0, mmap.PAGESIZE)
+        grown = mmap.mmap(-1, size)
+        if current is not None and self._length:
+            grown[: self._length] = current[: self._length]
+        # Views already handed out keep the old mapping alive until released.
+        self._map = grown
+        self.capacity = size
+        return grown
+
+    def extend(self, data: Any, *, preroll: bool = False) -> None:
+        view = memoryview(data).cast("B")
+        if not len(view):
+            return
+        end = self._length + len(view)
+        target = self._reserve(end)
+        target[self._length : end] = view
+        if preroll:
+            self.preroll_start, self.preroll_end = self._length, end
+        self._length = end
+
+    def clear(self) -> None:
+        self._length = 0
+        self.preroll_start = self.preroll_end = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.view())
+
+    def __getitem__(self, key: Any) -> bytes:
+        return bytes(self.view()[key])
+
+    def view(self, start: int = 0, end: Optional[int] = None) -> memoryview:
+        if self._map is None or not self._length:
+            return memoryview(b"")
+        stop = self._length if end is None else max(0, min(int(end), self._length))
+        return memoryview(self._map)[max(0, int(start)) : stop].toreadonly()
+
+    def head(self, size: int) -> memoryview:
+        return self.view(0, max(0, int(size)))
+
+    def tail(self, size: int) -> memoryview:
+        return self.view(max(0, self._length - max(0, int(size))))
+
+    def preroll(self) -> memoryview:
+        return self.view(self.preroll_start, self.preroll_end)
+
+
 @dataclass
 class VoiceSessionRuntime:
     selector: str
@@ -61,7 +135,7 @@ class VoiceSessionRuntime:
     noise_suppression_chunks: int = 0
     noise_suppression_last_log_ts: float = 0.0
 
-    audio_buffer: bytearray = field(default_factory=bytearray)
+    audio_buffer: AudioCaptureBuffer = field(default_factory=AudioCaptureBuffer)
     secondary_audio_buffer: bytearray = field(default_factory=bytearray)
     eou_engine: Any = None
 
@@ -74,6 +148,7 @@ class VoiceSessionRuntime:
     stt_stream_fallback_reason: str = ""
     stt_stream_fallback_used: bool = False
     partial_stt_task: Optional[asyncio.Task] = None
+    partial_stt_stream: Any = None
     stt_transcript: str = ""
     partial_transcript: str = ""
     partial_transcript_updates: int = 0
@@ -120,6 +195,10 @@ class VoiceSessionRuntime:
     wake_arbitration_peak_dbfs: float = -120.0
     wake_arbitration_audio_chunks: int = 0
 
+    def __post_init__(self) -> None:
+        if not self.audio_buffer.capacity:
+            self.audio_buffer.capacity = int(self.max_audio_bytes or 0)
+
 
 def _history_key(conv_id: str) -> str:
     return f"tater:voice:conv:{conv_id}:history"
@@ -168,7 +247,7 @@ async def _load_history(conv_id: str, limit: int) -> List[Dict[str, Any]]:
 
 async def _save_history_message(conv_id: str, role: str, content: Any) -> None:
     vp = _vp()
-    cfg = vp._voice_config_snapshot()
+    cfg = vp._voice_config_view()
     limits = cfg.get("limits") if isinstance(cfg.get("limits"), dict) else {}
     max_store = int(limits.get("history_store") or vp.DEFAULT_HISTORY_MAX_STORE)
     ttl = int(limits.get("session_ttl_s") or vp.DEFAULT_SESSION_TTL_SECONDS)
@@ -198,7 +277,7 @@ async def _save_context(conv_id: str, ctx: Dict[str, Any]) -> None:
     vp = _vp()
     if not isinstance(ctx, dict):
         return
-    cfg = vp._voice_config_snapshot()
+    cfg = vp._voice_config_view()
     limits = cfg.get("limits") if isinstance(cfg.get("limits"), dict) else {}
     ttl = int(limits.get("session_ttl_s") or vp.DEFAULT_SESSION_TTL_SECONDS)
     with contextlib.suppress(Exception):
@@ -211,7 +290,7 @@ async def _run_hydra_turn_for_voice(*, transcript: str, conv_id: str, session: V
     if not user_text:
         return ""
 
-    cfg = vp._voice_config_snapshot()
+    cfg = vp._voice_config_view()
     limits = cfg.get("limits") if isinstance(cfg.get("limits"), dict) else {}
     max_llm = int(limits.get("history_llm") or vp.DEFAULT_HISTORY_MAX_LLM)
 
@@ -350,7 +429,7 @@ async def _run_hydra_turn_for_voice(*, transcript: str, conv_id: str, session: V
             platform="voice_core",
             history_messages=history,
             registry=registry,
-            enabled_predicate=vp.get_verba_enabled,
+            enabled_predicate=vp.verba_enabled_map(),
             context=context,
             user_text=user_text,
             scope=conv_id,
@@ -10,9 +10,11 @@ import uuid
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Header, HTTPException, Request, Response, WebSocket
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 
 from .conversation import VoiceSessionRuntime
+from runtime_assets import byte_range_response, runtime_asset_snapshot
+from tts_audio_cache import tts_audio_cache_snapshot
 
 
 def _vp():
@@ -142,11 +144,14 @@ async def startup() -> None:
         vp.__version__,
     )
     vp.logger.info(
-        "[native-voice] pcm path audioop=%s input_gain=%.2f",
+        "[native-voice] pcm path audioop=%s numpy=%s input_gain=%.2f",
         "enabled" if vp._audioop is not None else "fallback",
+        "enabled" if vp._dsp.available() else "missing",
         vp._as_float(eou_cfg.get("input_gain"), vp.DEFAULT_AUDIO_INPUT_GAIN, minimum=0.5, maximum=16.0),
     )
-    if vp._audioop is None:
+    if vp._audioop is None and vp._dsp.available():
+        vp.logger.info("[native-voice] audioop unavailable; numpy PCM kernels active")
+    elif vp._audioop is None:
         if sys.version_info < (3, 13):
             vp.logger.warning(
                 "[native-voice] audioop unavailable on Python %s.%s; fallback PCM math is slower and may add VAD latency",
@@ -362,6 +367,8 @@ async def native_status(x_tater_token: Optional[str] = Header(None)) -> Dict[str
         "wyoming_available": vp.WYOMING_IMPORT_ERROR is None,
         "wyoming_error": vp._text(vp.WYOMING_IMPORT_ERROR),
         "openai_compatible_available": bool(vp._text(((vp._tts_config_snapshot().get("openai_compatible") or {}).get("base_url")))),
+        "tts_phrase_cache": tts_audio_cache_snapshot(),
+        "runtime_assets": runtime_asset_snapshot(),
         "selectors": selectors,
         "legacy_satellite_api": {
             "enabled": False,
@@ -610,12 +617,19 @@ async def native_satellite_timer_snooze(payload: Dict[str, Any], x_tater_token:
 
 
 @router.get("/tater-ha/v1/display/feed")
-async def display_feed(request: Request, x_tater_token: Optional[str] = Header(None)) -> Dict[str, Any]:
+async def display_feed(request: Request, x_tater_token: Optional[str] = Header(None)) -> Response:
     vp = _vp()
     vp._require_api_auth(x_tater_token)
     from .. import display_feed as display_feed_module
 
-    return display_feed_module.build_display_feed(request.query_params, version=vp.__version__)
+    etag, feed = display_feed_module.compose_display_feed(
+        request.query_params,
+        version=vp.__version__,
+        if_none_match=request.headers.get("if-none-match", ""),
+    )
+    if feed is None:
+        return Response(status_code=304, headers={"ETag": etag})
+    return JSONResponse(feed, headers={"ETag": etag})
 
 
 @router.post("/tater-ha/v1/display/feed")
@@ -1523,7 +1537,7 @@ async def intercom_cancel(payload: Dict[str, Any], x_tater_token: Optional[str]
 
 
 @router.get("/api/tater/satellite/v1/tts/{stream_id}.wav")
-async def native_tts_stream(stream_id: str) -> Response:
+async def native_tts_stream(stream_id: str, request: Request) -> Response:
     vp = _vp()
     row = vp._fetch_tts_url(stream_id)
     if not isinstance(row, dict):
@@ -1548,36 +1562,50 @@ async def native_tts_stream(stream_id: str) -> Response:
             headers=headers,
         )
 
-    wav_bytes = row.get("wav_bytes") if isinstance(row.get("wav_bytes"), (bytes, bytearray)) else b""
+    if vp._text(row.get("stream_kind")) == "managed":
+        vp._native_debug(
+            f"native managed tts stream fetch stream_id={vp._text(stream_id)} "
+            f"session_id={vp._text(row.get('session_id'))} selector={vp._text(row.get('selector'))}"
+        )
+        return StreamingResponse(
+            vp._iter_managed_tts_stream_response(row),
+            media_type="audio/wav",
+            headers=headers,
+        )
+
+    wav_bytes = row.get("body")
     if not wav_bytes:
         raise HTTPException(status_code=404, detail="TTS stream has no audio data")
 
+    range_header = request.headers.get("range")
     vp._native_debug(
         f"native tts url fetch stream_id={vp._text(stream_id)} session_id={vp._text(row.get('session_id'))} "
-        f"selector={vp._text(row.get('selector'))} bytes={len(wav_bytes)}"
+        f"selector={vp._text(row.get('selector'))} bytes={len(wav_bytes)} range={range_header or '-'}"
     )
-    return Response(content=bytes(wav_bytes), media_type="audio/wav", headers=headers)
+    return byte_range_response(wav_bytes, media_type="audio/wav", range_header=range_header, headers=headers)
 
 
 @router.get("/api/tater/satellite/v1/media/{stream_id}")
-async def native_media_stream(stream_id: str) -> Response:
+async def native_media_stream(stream_id: str, request: Request) -> Response:
     vp = _vp()
     row = vp._fetch_tts_url(stream_id)
     if not isinstance(row, dict):
         raise HTTPException(status_code=404, detail="Media stream not found or expired")
 
-    body_bytes = row.get("body_bytes") if isinstance(row.get("body_bytes"), (bytes, bytearray)) else b""
+    body_bytes = row.get("body")
     if not body_bytes:
         raise HTTPException(status_code=404, detail="Media stream has no audio data")
 
     media_type = vp._text(row.get("media_type")).split(";", 1)[0].strip().lower() or "application/octet-stream"
+    range_header = request.headers.get("range")
     vp._native_debug(
         f"native media url fetch stream_id={vp._text(stream_id)} session_id={vp._text(row.get('session_id'))} "
-        f"selector={vp._text(row.get('selector'))} bytes={len(body_bytes)} media_type={media_type}"
+        f"selector={vp._text(row.get('selector'))} bytes={len(body_bytes)} media_type={media_type} "
+        f"range={range_header or '-'}"
     )
 
     headers = {
         "Cache-Control": "no-store, max-age=0",
         "Pragma": "no-cache",
     }
-    return Response(content=bytes(body_bytes), media_type=media_type, headers=headers)
+    return byte_range_response(body_bytes, media_type=media_type, range_header=range_header, headers=headers)
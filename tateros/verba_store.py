@@ -9,6 +9,7 @@ import requests
 
 import verba_registry as verba_registry_mod
 from helpers import redis_client
+from verba_settings import bump_verba_enabled_version
 from verba_kernel import expand_verba_platforms
 
 VERBA_DIR = os.getenv("TATER_VERBA_DIR", "verba")
@@ -63,6 +64,7 @@ def _enabled_missing_verba_ids() -> list[str]:
         if pid in RETIRED_PLUGIN_IDS:
             try:
                 redis_client.hdel("verba_enabled", pid)
+                bump_verba_enabled_version(redis_client)
             except Exception:
                 pass
             continue
@@ -417,6 +419,7 @@ def clear_verba_redis_data(plugin_id: str, category_hint: str | None = None) ->
 
         if redis_client.hexists("verba_enabled", plugin_id):
             redis_client.hdel("verba_enabled", plugin_id)
+            bump_verba_enabled_version(redis_client)
             deleted.append(f"verba_enabled[{plugin_id}]")
 
         if deleted:
@@ -720,6 +723,7 @@ def auto_restore_missing_verbas(
             logging.error(f"[restore] {plugin_id} enabled but not found in manifest")
             try:
                 redis_client.hdel("verba_enabled", plugin_id)
+                bump_verba_enabled_version(redis_client)
                 logging.info(f"[restore] Removed stale enabled key for {plugin_id}")
             except Exception as e:
                 logging.error(f"[restore] Failed to remove stale enabled key for {plugin_id}: {e}")
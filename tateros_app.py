@@ -10,7 +10,6 @@ import json
 import logging
 import mimetypes
 import os
-import queue
 import re
 import secrets
 import shutil
@@ -89,6 +88,9 @@ from tater_voice import home as esphome_home_module
 from tater_voice import native_satellite as native_satellite_module
 from admin_gate import DEFAULT_ADMIN_ONLY_PLUGINS, REDIS_KEY as ADMIN_GATE_KEY, get_admin_only_plugins
 from hydra import estimate_hydra_chat_context_window, get_active_chat_jobs_snapshot, run_hydra_turn
+from hydra.hydra_metrics import RESOLUTIONS as HYDRA_METRIC_RESOLUTIONS
+from hydra.hydra_metrics import clear_hydra_metric_buckets, read_hydra_metric_range
+from hydra.hydra_ledger import attach_ledger_payloads, delete_ledger_keys, load_ledger_rows, summarize_ledger_rows
 from hydra import (
     HYDRA_ASTRAEUS_PLAN_REVIEW_ENABLED_KEY,
     HYDRA_AUTO_CONTINUE_INCOMPLETE_FINAL_ENABLED_KEY,
@@ -106,7 +108,7 @@ from hydra import (
 from emoji_responder import get_emoji_settings as get_core_emoji_settings, save_emoji_settings as save_core_emoji_settings
 from notify import notifier_destination_catalog
 from notify.media import BLOB_PREFIX as NOTIFY_BLOB_PREFIX, load_queue_attachments
-from notify.queue import is_expired as is_notify_expired, queue_key as notify_queue_key
+from notify import inbox as little_spud_inbox
 from helpers import (
     DEFAULT_HF_TRANSFORMERS_ATTN_IMPLEMENTATION,
     DEFAULT_HF_TRANSFORMERS_CONTEXT_TOKENS,
@@ -178,6 +180,7 @@ from helpers import (
     get_redis_connection_config,
     get_redis_encryption_status,
     get_redis_connection_status,
+    prepare_async_redis_clients,
     get_llm_call_runtime_summary,
     get_llm_debug_runtime_snapshot,
     get_vision_call_runtime_summary,
@@ -202,12 +205,15 @@ from helpers import (
     close_shared_async_http_client,
     unload_local_llm_models,
 )
+from event_ring import EventRing
+from runtime_assets import byte_range_response
 from runtime_executors import configure_runtime_executors, run_dashboard, shutdown_runtime_executors
 from verba_settings import (
     get_verba_enabled,
     get_verba_settings,
     save_verba_settings as save_verba_settings_values,
     set_verba_enabled as set_verba_enabled_flag,
+    verba_enabled_map,
 )
 from verba_kernel import normalize_platform
 from speech_settings import (
@@ -6507,34 +6513,6 @@ def _clear_little_spud_active_run(identity: Dict[str, str], run_id: str = "") ->
         pass
 
 
-def _little_spud_notification_target_matches(
-    *,
-    targets: Dict[str, Any],
-    identity: Dict[str, str],
-    node: Dict[str, Any],
-) -> bool:
-    target_map = targets if isinstance(targets, dict) else {}
-    wildcard_tokens = {"*", "all", "any"}
-    checks = (
-        ("node_id", str(node.get("id") or "").strip()),
-        ("destination", str(node.get("id") or "").strip()),
-        ("scope", str(identity.get("scope") or "").strip()),
-        ("device_id", str(identity.get("device_name") or "").strip()),
-        ("device_name", str(identity.get("device_name") or "").strip()),
-        ("user", str(identity.get("user_name") or "").strip()),
-        ("user_name", str(identity.get("user_name") or "").strip()),
-    )
-    for key, expected in checks:
-        wanted = str(target_map.get(key) or "").strip()
-        if not wanted:
-            continue
-        if wanted.lower() in wildcard_tokens:
-            return True
-        if expected and hmac.compare_digest(wanted, expected):
-            return True
-    return False
-
-
 def _little_spud_notification_media_url(blob_key: str, mimetype: str) -> str:
     ref = _b64url_encode(str(blob_key or "").encode("utf-8", errors="ignore"))
     if not ref:
@@ -6657,42 +6635,10 @@ def _pop_little_spud_notification(
     *,
     identity: Dict[str, str],
     node: Dict[str, Any],
-    wait_seconds: int,
-    max_scan: int = 200,
     consume: bool = True,
 ) -> Optional[Dict[str, Any]]:
-    key = notify_queue_key("little_spud") or "notifyq:little_spud"
-    deadline = time.monotonic() + max(0.0, min(25.0, float(wait_seconds or 0)))
-    scan_count = max(1, min(500, int(max_scan or 200)))
-    while True:
-        try:
-            raw_rows = redis_client.lrange(key, 0, scan_count - 1) or []
-        except Exception:
-            raw_rows = []
-        for raw in raw_rows:
-            try:
-                item = json.loads(str(raw or "{}"))
-            except Exception:
-                redis_client.lrem(key, 1, raw)
-                continue
-            if not isinstance(item, dict):
-                redis_client.lrem(key, 1, raw)
-                continue
-            if is_notify_expired(item):
-                redis_client.lrem(key, 1, raw)
-                continue
-            targets = item.get("targets") if isinstance(item.get("targets"), dict) else {}
-            if not _little_spud_notification_target_matches(targets=targets, identity=identity, node=node):
-                continue
-            if not consume:
-                return item
-            removed = int(redis_client.lrem(key, 1, raw) or 0)
-            if removed > 0:
-                return item
-
-        if time.monotonic() >= deadline:
-            return None
-        time.sleep(0.5)
+    tokens = little_spud_inbox.identity_tokens(identity, node)
+    return little_spud_inbox.pop(redis_client, tokens, consume=consume)
 
 
 def _pop_little_spud_notification_by_id(
@@ -6700,74 +6646,37 @@ def _pop_little_spud_notification_by_id(
     event_id: str,
     identity: Dict[str, str],
     node: Dict[str, Any],
-    wait_seconds: int,
-    max_scan: int = 1000,
     consume: bool = True,
 ) -> Optional[Dict[str, Any]]:
-    wanted_id = str(event_id or "").strip()
-    if not wanted_id:
-        return None
+    tokens = little_spud_inbox.identity_tokens(identity, node)
+    return little_spud_inbox.pop_by_id(redis_client, event_id, tokens, consume=consume)
 
-    key = notify_queue_key("little_spud") or "notifyq:little_spud"
-    deadline = time.monotonic() + max(0.0, min(8.0, float(wait_seconds or 0)))
-    scan_count = max(1, min(2000, int(max_scan or 1000)))
-    while True:
-        try:
-            raw_rows = redis_client.lrange(key, 0, scan_count - 1) or []
-        except Exception:
-            raw_rows = []
-        for raw in raw_rows:
-            try:
-                item = json.loads(str(raw or "{}"))
-            except Exception:
-                redis_client.lrem(key, 1, raw)
-                continue
-            if not isinstance(item, dict):
-                redis_client.lrem(key, 1, raw)
-                continue
-            if is_notify_expired(item):
-                redis_client.lrem(key, 1, raw)
-                continue
-            if str(item.get("id") or "").strip() != wanted_id:
-                continue
-            targets = item.get("targets") if isinstance(item.get("targets"), dict) else {}
-            if not _little_spud_notification_target_matches(targets=targets, identity=identity, node=node):
-                return None
-            if not consume:
-                return item
-            removed = int(redis_client.lrem(key, 1, raw) or 0)
-            if removed > 0:
-                return item
 
-        if time.monotonic() >= deadline:
-            return None
-        time.sleep(0.25)
+async def _wait_little_spud_notification(
+    *,
+    identity: Dict[str, str],
+    node: Dict[str, Any],
+    wait_seconds: int,
+    event_id: str = "",
+    consume: bool = True,
+) -> Optional[Dict[str, Any]]:
+    # Lookups by id only wait briefly for a push that raced its delivery.
+    limit = 8.0 if event_id else 25.0
+    return await little_spud_inbox.wait_next(
+        redis_client,
+        little_spud_inbox.identity_tokens(identity, node),
+        wait_seconds=max(0.0, min(limit, float(wait_seconds or 0))),
+        consume=consume,
+        event_id=event_id,
+    )
 
 
 def _forget_little_spud_pending_notifications(identity: Dict[str, str], node: Dict[str, Any]) -> int:
-    key = notify_queue_key("little_spud") or "notifyq:little_spud"
     try:
-        raw_rows = redis_client.lrange(key, 0, -1) or []
+        return little_spud_inbox.forget(redis_client, little_spud_inbox.identity_tokens(identity, node))
     except Exception:
         return 0
 
-    deleted = 0
-    for raw in raw_rows:
-        try:
-            item = json.loads(str(raw or "{}"))
-        except Exception:
-            continue
-        if not isinstance(item, dict):
-            continue
-        targets = item.get("targets") if isinstance(item.get("targets"), dict) else {}
-        if not _little_spud_notification_target_matches(targets=targets, identity=identity, node=node):
-            continue
-        try:
-            deleted += max(0, int(redis_client.lrem(key, 1, raw) or 0))
-        except Exception:
-            pass
-    return deleted
-
 
 def _spud_link_forget_little_spud_node(node: Dict[str, Any]) -> Dict[str, int]:
     cleanup = _spud_link_forget_node_history(node)
@@ -7069,7 +6978,7 @@ async def _run_tater_api_hydra_completion(
             platform=platform_token,
             history_messages=history_messages,
             registry=registry,
-            enabled_predicate=(get_verba_enabled if tools_enabled else None),
+            enabled_predicate=(verba_enabled_map() if tools_enabled else None),
             context=context_payload,
             user_text=user_text,
             scope=scope_override if scope_override is not None else f"session:{session_id}",
@@ -7288,7 +7197,7 @@ async def _run_spud_link_native_hydra_completion(
             platform=platform_token,
             history_messages=history_messages,
             registry=registry,
-            enabled_predicate=(get_verba_enabled if tools_enabled else None),
+            enabled_predicate=(verba_enabled_map() if tools_enabled else None),
             context=context_payload,
             user_text=user_text,
             scope=scope_override if scope_override is not None else f"session:{session_id}",
@@ -7600,7 +7509,7 @@ async def _process_message(
             platform="webui",
             history_messages=loop_messages,
             registry=merged_registry,
-            enabled_predicate=get_verba_enabled,
+            enabled_predicate=verba_enabled_map(),
             context={"raw_message": message_content, "input_artifacts": list(input_artifacts or [])},
             user_text=(message_content or ""),
             scope=f"session:{session_scope_id}",
@@ -7681,21 +7590,13 @@ class ChatJobManager:
             raise RuntimeError("Chat async runtime did not start.")
         return loop
 
-    def _emit(self, job: Dict[str, Any], event: Dict[str, Any]) -> None:
-        event_queue = job.get("events")
-        if not isinstance(event_queue, queue.Queue):
+    def _emit(self, job: Dict[str, Any], event: Dict[str, Any], *, final: bool = False) -> None:
+        ring = job.get("events")
+        if not isinstance(ring, EventRing):
             return
-        try:
-            event_queue.put_nowait(dict(event))
-        except queue.Full:
-            try:
-                event_queue.get_nowait()
-            except Exception:
-                pass
-            try:
-                event_queue.put_nowait(dict(event))
-            except Exception:
-                pass
+        ring.publish(event)
+        if final:
+            ring.close()
 
     def _cleanup_locked(self) -> None:
         now = time.time()
@@ -7713,7 +7614,10 @@ class ChatJobManager:
             if len(keep) >= self.max_jobs:
                 should_drop = True
             if should_drop:
-                self.jobs.pop(job_id, None)
+                dropped = self.jobs.pop(job_id, None)
+                ring = dropped.get("events") if isinstance(dropped, dict) else None
+                if isinstance(ring, EventRing):
+                    ring.close()
                 continue
             keep.append(job_id)
         self.order = keep[-self.max_jobs :]
@@ -7877,6 +7781,7 @@ class ChatJobManager:
                         "job_id": job_id,
                         "task_name": str(job.get("task_name") or "").strip(),
                     },
+                    final=True,
                 )
         except Exception as exc:
             logger.error("chat job failed: %s", exc, exc_info=True)
@@ -7896,6 +7801,7 @@ class ChatJobManager:
                         "job_id": job_id,
                         "task_name": str(job.get("task_name") or "").strip(),
                     },
+                    final=True,
                 )
 
     def create_job(
@@ -7926,7 +7832,7 @@ class ChatJobManager:
                 "stream_last_emit": 0.0,
                 "created_at": time.time(),
                 "completed_at": 0.0,
-                "events": queue.Queue(maxsize=512),
+                "events": EventRing(maxlen=512),
             }
             self.jobs[job_id] = job
             self.order = [jid for jid in self.order if jid != job_id]
@@ -8016,13 +7922,13 @@ class ChatJobManager:
                     break
             return {"active": active, "recent": recent}
 
-    def get_event_queue(self, job_id: str) -> Optional[queue.Queue]:
+    def get_event_ring(self, job_id: str) -> Optional[EventRing]:
         with self.lock:
             job = self.jobs.get(job_id)
             if not isinstance(job, dict):
                 return None
-            q = job.get("events")
-            return q if isinstance(q, queue.Queue) else None
+            ring = job.get("events")
+            return ring if isinstance(ring, EventRing) else None
 
     def active_count(self) -> int:
         with self.lock:
@@ -8068,8 +7974,9 @@ class ChatJobManager:
 chat_jobs = ChatJobManager()
 
 
-def _sse(event_type: str, payload: Dict[str, Any]) -> str:
-    return f"event: {event_type}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+def _sse(event_type: str, payload: Dict[str, Any], *, event_id: Optional[int] = None) -> str:
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {event_type}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
 
 
 def _normalize_repo_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, str]]:
@@ -9826,6 +9733,7 @@ async def _startup_event() -> None:
         logger.info("TaterOS backend started")
         return
 
+    await asyncio.to_thread(prepare_async_redis_clients)
     bind_integration_runtime_loop()
     verba_registry_module.ensure_verbas_loaded()
 
@@ -10362,7 +10270,7 @@ def _estimate_webui_chat_context_window(*, force_refresh: bool = False) -> Dict[
             platform="webui",
             history_messages=loop_messages,
             registry=merged_registry,
-            enabled_predicate=get_verba_enabled,
+            enabled_predicate=verba_enabled_map(),
             redis_client=redis_client,
             scope="session:webui:context_estimate",
             origin={
@@ -14397,10 +14305,10 @@ async def run_spudex_chat(payload: SpudexChatRequest) -> Dict[str, Any]:
 
 
 @app.get("/api/spudex/sessions/{session_id}/logs")
-def get_spudex_session_logs(session_id: str, after_seq: int = 0, limit: int = 200) -> Dict[str, Any]:
+def get_spudex_session_logs(session_id: str, after_seq: int = 0, limit: int = 200, tail: bool = False) -> Dict[str, Any]:
     from spudex.runner import read_spudex_logs
 
-    return read_spudex_logs(session_id, after_seq=after_seq, limit=limit)
+    return read_spudex_logs(session_id, after_seq=after_seq, limit=limit, tail=tail)
 
 
 @app.post("/api/spudex/sessions/{session_id}/file-changes/approve")
@@ -14572,6 +14480,7 @@ def _native_mascot_hydra_recent(*, recent_seconds: int = 300) -> Dict[str, Any]:
         if outcome not in {"done", "blocked", "failed"}:
             continue
 
+        row = attach_ledger_payloads(redis_client, [row])[0]
         tool_result = row.get("tool_result") if isinstance(row.get("tool_result"), dict) else {}
         response_text = _native_mascot_compact_text(row.get("assistant_response"), limit=112)
         if not response_text:
@@ -15954,13 +15863,14 @@ def spud_link_history(request: Request, limit: int = 80) -> Dict[str, Any]:
 
 
 @app.get("/api/spudlink/v1/notifications/next")
-def spud_link_notification_next(
+async def spud_link_notification_next(
     request: Request,
     wait_seconds: int = 20,
     event_id: str = "",
     consume: bool = True,
 ) -> Dict[str, Any]:
-    _settings, node = _require_spud_link_node_request(request)
+    # Runs on the event loop: every Redis round trip goes to a worker thread.
+    _settings, node = await asyncio.to_thread(_require_spud_link_node_request, request)
     role = _normalize_spud_link_mode(node.get("role"), default=SPUD_LINK_MODE_SPUDLET)
     if role != SPUD_LINK_MODE_LITTLE_SPUD:
         raise HTTPException(status_code=403, detail="Little Spud notifications require a paired Little Spud client.")
@@ -15977,27 +15887,21 @@ def spud_link_notification_next(
     identity = _spud_link_identity_from_request(identity_payload, request, node)
     wait_value = max(0, min(25, int(wait_seconds or 0)))
     clean_event_id = str(event_id or "").strip()
-    notification = None
-    if clean_event_id:
-        notification = _pop_little_spud_notification_by_id(
-            event_id=clean_event_id,
-            identity=identity,
-            node=node,
-            wait_seconds=wait_value,
-            consume=bool(consume),
-        )
-    if notification is None and not clean_event_id:
-        notification = _pop_little_spud_notification(
-            identity=identity,
-            node=node,
-            wait_seconds=wait_value,
-            consume=bool(consume),
-        )
+    notification = await _wait_little_spud_notification(
+        identity=identity,
+        node=node,
+        wait_seconds=wait_value,
+        event_id=clean_event_id,
+        consume=bool(consume),
+    )
     _spud_link_touch_node_from_request(node, request)
-    _spud_link_store_node(node)
+    await asyncio.to_thread(_spud_link_store_node, node)
+    payload = None
+    if isinstance(notification, dict):
+        payload = await asyncio.to_thread(_little_spud_notification_payload, notification)
     return {
         "ok": True,
-        "notification": _little_spud_notification_payload(notification) if isinstance(notification, dict) else None,
+        "notification": payload,
         "identity": {
             "user_name": identity.get("user_name"),
             "device_name": identity.get("device_name"),
@@ -16029,7 +15933,6 @@ def spud_link_notification_ack(event_id: str, request: Request) -> Dict[str, Any
         event_id=str(event_id or "").strip(),
         identity=identity,
         node=node,
-        wait_seconds=0,
         consume=True,
     )
     _spud_link_touch_node_from_request(node, request)
@@ -16879,39 +16782,35 @@ def chat_job_status(job_id: str) -> Dict[str, Any]:
 
 @app.get("/api/chat/jobs/{job_id}/events")
 async def chat_job_events(job_id: str, request: Request):
-    event_queue = chat_jobs.get_event_queue(job_id)
-    if event_queue is None:
+    event_ring = chat_jobs.get_event_ring(job_id)
+    if event_ring is None:
         raise HTTPException(status_code=404, detail=f"Unknown chat job: {job_id}")
+    try:
+        last_seq = max(0, int(str(request.headers.get("last-event-id") or "0").strip() or 0))
+    except ValueError:
+        last_seq = 0
 
     async def _event_stream():
+        nonlocal last_seq
         snapshot = chat_jobs.get_snapshot(job_id)
         if snapshot is not None:
             yield _sse("status", snapshot)
 
-        tick = 0
         while True:
             if await request.is_disconnected():
                 break
-
-            try:
-                event = event_queue.get_nowait()
-            except queue.Empty:
-                await asyncio.sleep(1.0)
-                tick += 1
-                status_snapshot = chat_jobs.get_snapshot(job_id)
-                if status_snapshot is None:
+            rows = await event_ring.wait_after(last_seq, timeout=15.0)
+            if not rows:
+                if event_ring.closed:
                     break
-                if str(status_snapshot.get("status") or "") in {"done", "error"} and event_queue.empty():
-                    break
-                if tick % 15 == 0:
-                    yield _sse("ping", {"job_id": job_id, "ts": time.time()})
+                yield _sse("ping", {"job_id": job_id, "ts": time.time()})
                 continue
-
-            tick = 0
-            event_type = str(event.get("type") or "status")
-            yield _sse(event_type, event)
-            if event_type in {"done", "job_error"}:
-                break
+            for seq, event in rows:
+                last_seq = seq
+                event_type = str(event.get("type") or "status")
+                yield _sse(event_type, event, event_id=seq)
+                if event_type in {"done", "job_error"}:
+                    return
 
     return StreamingResponse(
         _event_stream(),
@@ -18346,24 +18245,7 @@ def _hydra_ledger_keys_for_platform(platform: str) -> List[str]:
 
 def _load_hydra_ledger_entries(platform: str, limit: int) -> List[Dict[str, Any]]:
     max_limit = max(10, min(int(limit or 50), 300))
-    rows: List[Dict[str, Any]] = []
-    for key in _hydra_ledger_keys_for_platform(platform):
-        try:
-            raw_items = redis_client.lrange(key, -max_limit, -1) or []
-        except Exception:
-            raw_items = []
-        for raw in raw_items:
-            try:
-                item = json.loads(raw)
-            except Exception:
-                continue
-            if not isinstance(item, dict):
-                continue
-            row = dict(item)
-            row["_ledger_key"] = key
-            rows.append(row)
-    rows.sort(key=lambda item: float(item.get("timestamp") or 0.0), reverse=True)
-    return rows[:max_limit]
+    return load_ledger_rows(redis_client, _hydra_ledger_keys_for_platform(platform), limit=max_limit)[:max_limit]
 
 
 def _normalize_hydra_validation_for_view(
@@ -18432,31 +18314,41 @@ def _hydra_rate_rows(metrics: Dict[str, int]) -> List[Dict[str, Any]]:
     ]
 
 
+def _read_hydra_metric_counters(platforms: List[str]) -> Tuple[Dict[str, int], Dict[str, Dict[str, int]]]:
+    # Lifetime totals for the global keys and every requested platform in one MGET.
+    keys = [f"tater:hydra:metrics:{name}" for name in _HYDRA_METRIC_NAMES]
+    for platform in platforms:
+        keys.extend(f"tater:hydra:metrics:{name}:{platform}" for name in _HYDRA_METRIC_NAMES)
+    try:
+        values = list(redis_client.mget(keys) or [])
+    except Exception:
+        values = []
+    values.extend([None] * (len(keys) - len(values)))
+    counts = iter(_coerce_redis_counter(value) for value in values)
+    global_metrics = {name: next(counts) for name in _HYDRA_METRIC_NAMES}
+    platform_metrics = {platform: {name: next(counts) for name in _HYDRA_METRIC_NAMES} for platform in platforms}
+    return global_metrics, platform_metrics
+
+
 def _load_hydra_metrics(platform: str) -> Tuple[str, Dict[str, int], Dict[str, int]]:
     selected = str(platform or "").strip().lower()
     metric_platform = normalize_platform(selected if selected and selected != "all" else "webui")
-    global_metrics: Dict[str, int] = {}
-    platform_metrics: Dict[str, int] = {}
-    for name in _HYDRA_METRIC_NAMES:
-        global_metrics[name] = _coerce_redis_counter(redis_client.get(f"tater:hydra:metrics:{name}"))
-        if selected == "all":
-            platform_metrics[name] = global_metrics[name]
-        else:
-            platform_metrics[name] = _coerce_redis_counter(
-                redis_client.get(f"tater:hydra:metrics:{name}:{metric_platform}")
-            )
-    return metric_platform, global_metrics, platform_metrics
+    if selected == "all":
+        global_metrics, _ = _read_hydra_metric_counters([])
+        return metric_platform, global_metrics, dict(global_metrics)
+    global_metrics, by_platform = _read_hydra_metric_counters([metric_platform])
+    return metric_platform, global_metrics, by_platform[metric_platform]
 
 
 def _load_hydra_platform_metric_rows() -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
+    _, by_platform = _read_hydra_metric_counters(list(_HYDRA_METRIC_PLATFORMS))
     for platform in _HYDRA_METRIC_PLATFORMS:
         row: Dict[str, Any] = {
             "platform": platform,
             "platform_label": _hydra_platform_display_label(platform),
         }
-        for name in _HYDRA_METRIC_NAMES:
-            row[name] = _coerce_redis_counter(redis_client.get(f"tater:hydra:metrics:{name}:{platform}"))
+        row.update(by_platform[platform])
         rates = _hydra_rate_rows(row)
         for rate_row in rates:
             row[str(rate_row.get("metric") or "")] = float(rate_row.get("value") or 0.0)
@@ -18479,6 +18371,11 @@ def _reset_hydra_metrics(platform: str) -> int:
             keys.append(f"tater:hydra:metrics:{name}:{metric_platform}")
 
     deleted = 0
+    if plat != "all":
+        try:
+            deleted += clear_hydra_metric_buckets(redis_client, metric_platform)
+        except Exception:
+            pass
     for key in keys:
         try:
             deleted += int(redis_client.delete(key) or 0)
@@ -18488,13 +18385,7 @@ def _reset_hydra_metrics(platform: str) -> int:
 
 
 def _clear_hydra_ledger(platform: str) -> int:
-    deleted = 0
-    for key in _hydra_ledger_keys_for_platform(platform):
-        try:
-            deleted += int(redis_client.delete(key) or 0)
-        except Exception:
-            continue
-    return deleted
+    return delete_ledger_keys(redis_client, _hydra_ledger_keys_for_platform(platform))
 
 
 @app.get("/api/settings/hydra/metrics")
@@ -18534,11 +18425,10 @@ def get_hydra_metrics(
         selected_tool_cmp = "all"
 
     filtered_rows: List[Dict[str, Any]] = []
-    summary_rows: List[Dict[str, Any]] = []
     tool_counts: Dict[str, int] = {}
     reason_counts: Dict[str, int] = {}
 
-    for idx, row in enumerate(ledger_rows):
+    for row in ledger_rows:
         planned_tool = row.get("planned_tool") if isinstance(row.get("planned_tool"), dict) else {}
         planned_tool_name = str(planned_tool.get("function") or "").strip()
         row_outcome = str(row.get("outcome") or "").strip().lower()
@@ -18552,6 +18442,29 @@ def get_hydra_metrics(
 
         filtered_rows.append(row)
         validation = _normalize_hydra_validation_for_view(row.get("validation"), planned_tool=planned_tool)
+        if planned_tool_name:
+            tool_counts[planned_tool_name] = int(tool_counts.get(planned_tool_name, 0)) + 1
+
+        validation_reason = str(validation.get("reason") or "").strip()
+        if validation_reason:
+            key = f"validation:{validation_reason}"
+            reason_counts[key] = int(reason_counts.get(key, 0)) + 1
+
+        checker_reason = str(row.get("checker_reason") or "").strip()
+        if checker_reason:
+            key = f"checker:{checker_reason}"
+            reason_counts[key] = int(reason_counts.get(key, 0)) + 1
+
+        outcome_reason = str(row.get("outcome_reason") or "").strip()
+        if outcome_reason and row_outcome == "failed":
+            key = f"outcome:{outcome_reason}"
+            reason_counts[key] = int(reason_counts.get(key, 0)) + 1
+
+    # Aggregates above only need summary rows; payloads are read for the rows shown.
+    summary_rows: List[Dict[str, Any]] = []
+    for row in attach_ledger_payloads(redis_client, filtered_rows):
+        planned_tool = row.get("planned_tool") if isinstance(row.get("planned_tool"), dict) else {}
+        validation = _normalize_hydra_validation_for_view(row.get("validation"), planned_tool=planned_tool)
         tool_result = row.get("tool_result") if isinstance(row.get("tool_result"), dict) else {}
         tool_result_summary = str(tool_result.get("summary") or row.get("tool_result_summary") or "").strip()
         ts = float(row.get("timestamp") or 0.0)
@@ -18559,7 +18472,7 @@ def get_hydra_metrics(
 
         summary_rows.append(
             {
-                "#": len(summary_rows) + 1 if filtered_rows else (idx + 1),
+                "#": len(summary_rows) + 1,
                 "time": time_text,
                 "platform": str(row.get("platform") or ""),
                 "scope": str(row.get("scope") or ""),
@@ -18567,11 +18480,11 @@ def get_hydra_metrics(
                 "astraeus_thanatos_kind": str(row.get("planner_kind") or ""),
                 "outcome": str(row.get("outcome") or ""),
                 "outcome_reason": str(row.get("outcome_reason") or ""),
-                "planned_tool": planned_tool_name,
+                "planned_tool": str(planned_tool.get("function") or "").strip(),
                 "validation_status": str(validation.get("status") or ""),
                 "validation_reason": str(validation.get("reason") or ""),
                 "checker_action": str(row.get("checker_action") or ""),
-                "tool_result_ok": tool_result.get("ok") if isinstance(tool_result, dict) else row.get("tool_result_ok"),
+                "tool_result_ok": tool_result.get("ok") if tool_result else row.get("tool_result_ok"),
                 "tool_result_summary": tool_result_summary,
                 "astraeus_route_ms": int(row.get("astraeus_route_ms") or 0),
                 "planner_ms": int(row.get("planner_ms") or 0),
@@ -18583,24 +18496,6 @@ def get_hydra_metrics(
             }
         )
 
-        if planned_tool_name:
-            tool_counts[planned_tool_name] = int(tool_counts.get(planned_tool_name, 0)) + 1
-
-        validation_reason = str(validation.get("reason") or "").strip()
-        if validation_reason:
-            key = f"validation:{validation_reason}"
-            reason_counts[key] = int(reason_counts.get(key, 0)) + 1
-
-        checker_reason = str(row.get("checker_reason") or "").strip()
-        if checker_reason:
-            key = f"checker:{checker_reason}"
-            reason_counts[key] = int(reason_counts.get(key, 0)) + 1
-
-        outcome_reason = str(row.get("outcome_reason") or "").strip()
-        if outcome_reason and str(row.get("outcome") or "").strip().lower() == "failed":
-            key = f"outcome:{outcome_reason}"
-            reason_counts[key] = int(reason_counts.get(key, 0)) + 1
-
     top_tools = [
         {"label": name, "value": int(count)}
         for name, count in sorted(tool_counts.items(), key=lambda kv: (-int(kv[1]), str(kv[0])))[:12]
@@ -18631,17 +18526,54 @@ def get_hydra_metrics(
         "show_only_tool_turns": bool(show_only_tool_turns),
         "top_tools": top_tools,
         "top_reasons": top_reasons,
+        "tool_stats": summarize_ledger_rows(filtered_rows)["tools"],
     }
 
 
-@app.get("/api/settings/hydra/data")
-def get_hydra_data() -> Dict[str, Any]:
-    metric_keys: List[str] = []
+@app.get("/api/settings/hydra/ledger/summary")
+def get_hydra_ledger_summary(platform: str = "all", window_seconds: int = 24 * 3600) -> Dict[str, Any]:
+    selected = str(platform or "all").strip().lower() or "all"
+    if selected != "all":
+        selected = normalize_platform(selected)
+    window = max(0, int(window_seconds or 0))
+    rows = load_ledger_rows(
+        redis_client,
+        _hydra_ledger_keys_for_platform(selected),
+        limit=_read_positive_int(HYDRA_MAX_LEDGER_ITEMS_KEY, DEFAULT_MAX_LEDGER_ITEMS),
+    )
+    since = time.time() - window if window else 0.0
+    return {"platform": selected, "window_seconds": window, **summarize_ledger_rows(rows, since=since)}
+
+
+@app.get("/api/settings/hydra/metrics/range")
+def get_hydra_metrics_range(
+    platform: str = "all",
+    start: float = 0.0,
+    end: float = 0.0,
+    resolution: str = "minute",
+) -> Dict[str, Any]:
+    resolution_token = str(resolution or "minute").strip().lower()
+    if resolution_token not in HYDRA_METRIC_RESOLUTIONS:
+        raise HTTPException(status_code=400, detail=f"resolution must be one of: {', '.join(HYDRA_METRIC_RESOLUTIONS)}")
+    end_ts = float(end or 0.0) or time.time()
+    start_ts = float(start or 0.0) or end_ts - 3600.0
+    selected = str(platform or "all").strip().lower() or "all"
+    platforms = None if selected == "all" else [normalize_platform(selected)]
     try:
-        metric_keys = [str(k) for k in redis_client.scan_iter(match="tater:hydra:metrics:*")]
-    except Exception:
-        metric_keys = []
+        result = read_hydra_metric_range(
+            redis_client,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            resolution=resolution_token,
+            platforms=platforms,
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=503, detail=f"Hydra metrics unavailable: {exc}") from exc
+    return {"platform": selected if platforms is None else platforms[0], **result}
 
+
+@app.get("/api/settings/hydra/data")
+def get_hydra_data() -> Dict[str, Any]:
     ledger_rows: List[Dict[str, Any]] = []
     ledger_entries_total = 0
     for key in _hydra_ledger_keys_for_platform("all"):
@@ -18664,8 +18596,14 @@ def get_hydra_data() -> Dict[str, Any]:
     ledger_rows.sort(key=lambda row: (-int(row.get("entries") or 0), str(row.get("platform") or "")))
 
     platform_rows: List[Dict[str, Any]] = []
+    global_metrics, metrics_by_platform = _read_hydra_metric_counters(list(_HYDRA_METRIC_PLATFORMS))
+    # Lifetime counter keys only exist once incremented, so that one MGET
+    # already counts them; scanning the prefix would also walk every time bucket.
+    metric_keys = sum(1 for value in global_metrics.values() if value) + sum(
+        1 for row in metrics_by_platform.values() for value in row.values() if value
+    )
     for platform in _HYDRA_METRIC_PLATFORMS:
-        _, _, platform_metrics = _load_hydra_metrics(platform)
+        platform_metrics = metrics_by_platform[platform]
         platform_row: Dict[str, Any] = {
             "platform": platform,
             "platform_label": _hydra_platform_display_label(platform),
@@ -18695,7 +18633,7 @@ def get_hydra_data() -> Dict[str, Any]:
     return {
         "platform_options": list(_HYDRA_METRIC_PLATFORMS),
         "summary": {
-            "metric_keys": int(len(metric_keys)),
+            "metric_keys": int(metric_keys),
             "ledger_lists": int(len(ledger_rows)),
             "ledger_entries_total": int(ledger_entries_total),
         },
@@ -19501,24 +19439,28 @@ async def preview_speech_tts(payload: SpeechTtsPreviewRequest) -> Response:
     return Response(content=wav_bytes, media_type="audio/wav")
 
 
-def _runtime_tts_asset_response(asset_id: str) -> Response:
+def _runtime_tts_asset_response(asset_id: str, request: Request) -> Response:
     row = get_runtime_tts_wav(asset_id)
     if not isinstance(row, dict):
         raise HTTPException(status_code=404, detail="TTS audio not found or expired.")
-    wav_bytes = bytes(row.get("bytes") or b"")
+    wav_bytes = row.get("bytes")
     if not wav_bytes:
         raise HTTPException(status_code=404, detail="TTS audio is empty or expired.")
-    return Response(content=wav_bytes, media_type=str(row.get("content_type") or "audio/wav"))
+    return byte_range_response(
+        wav_bytes,
+        media_type=str(row.get("content_type") or "audio/wav"),
+        range_header=request.headers.get("range"),
+    )
 
 
 @app.get("/api/speech/tts/runtime/{asset_id}.wav")
-async def get_runtime_tts_asset(asset_id: str) -> Response:
-    return _runtime_tts_asset_response(asset_id)
+async def get_runtime_tts_asset(asset_id: str, request: Request) -> Response:
+    return _runtime_tts_asset_response(asset_id, request)
 
 
 @app.get("/api/speech/tts/runtime/{asset_id}/{filename:path}")
-async def get_runtime_tts_named_asset(asset_id: str, filename: str) -> Response:
-    return _runtime_tts_asset_response(asset_id)
+async def get_runtime_tts_named_asset(asset_id: str, filename: str, request: Request) -> Response:
+    return _runtime_tts_asset_response(asset_id, request)
 
 
 def _runtime_media_proxy_response(asset_id: str, filename: str, request: Request) -> Response:
@@ -20158,8 +20100,8 @@ def get_settings_logs(after_seq: int = 0, limit: int = 300, level: str = "", log
 
 
 @app.get("/api/settings/integrations/runtime/states")
-def get_settings_integrations_runtime_states() -> Dict[str, Any]:
-    return integration_runtime_states(redis_client)
+def get_settings_integrations_runtime_states(since_version: int = 0) -> Dict[str, Any]:
+    return integration_runtime_states(redis_client, since_version=since_version)
 
 
 @app.get("/api/settings/integrations/devices")
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import helpers
+
+# Token counting for context budgeting. Each model gets one counter: the
+# model's own vocabulary when it is on disk (GGUF tokenizer.ggml.tokens, or an
+# HF tokenizer.json, run through the `tokenizers` package when installed),
+# otherwise a character-class estimator. Counts are memoized per counter by
+# content hash, so re-budgeting a growing history only counts new messages.
+# Vocabularies load on a background thread; until one is ready the estimator
+# answers.
+TOKEN_COUNT_CACHE_MAX_ENTRIES = 4096
+TOKEN_PIECE_CACHE_MAX_ENTRIES = 50_000
+TOKEN_SOURCE_RECHECK_SECONDS = 60.0
+MAX_VOCAB_TOKEN_CHARS = 64
+
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_ESTIMATE_RE = re.compile(
+    rf"(?P<cjk>[{_CJK}])"
+    r"|(?P<word>[A-Za-z]+)"
+    r"|(?P<digits>\d+)"
+    rf"|(?P<intl>[^\x00-\x7f{_CJK}\s]+)"
+    r"|(?P<newlines>\n+)"
+    r"|(?P<indent>[ \t]{2,})"
+    r"|(?P<symbols>[!-/:-@\[-`{-~]+)"
+)
+_BYTE_LEVEL_PIECE_RE = re.compile(r"'(?:s|t|re|ve|m|ll|d)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+_SPM_SPACE = "\u2581"
+_SPM_PIECE_RE = re.compile(f"{_SPM_SPACE}?[^{_SPM_SPACE}]+|{_SPM_SPACE}+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Character-class estimate tuned against common BPE vocabularies.
+
+    English words cost about one token, longer identifiers split every ~8
+    letters, digits group in threes, punctuation runs (JSON, code) cost one
+    token per two characters, CJK costs one token per character and other
+    non-Latin scripts one per two characters.
+    """
+    total = 0.0
+    for match in _ESTIMATE_RE.finditer(str(text or "")):
+        kind = match.lastgroup
+        size = len(match.group())
+        if kind == "word":
+            total += 1 + size // 8
+        elif kind == "cjk":
+            total += 1
+        elif kind == "digits":
+            total += math.ceil(size / 3)
+        elif kind == "intl":
+            total += math.ceil(size / 2)
+        elif kind in {"newlines", "indent"}:
+            total += 1
+        else:
+            total += math.ceil(size / 2)
+    return int(math.ceil(total))
+
+
+def _byte_level_table() -> Dict[int, str]:
+    visible = list(range(ord("!"), ord("~") + 1)) + list(range(ord("\xa1"), ord("\xac") + 1)) + list(range(ord("\xae"), ord("\xff") + 1))
+    table = {byte: chr(byte) for byte in visible}
+    extra = 0
+    for byte in range(256):
+        if byte not in table:
+            table[byte] = chr(256 + extra)
+            extra += 1
+    return table
+
+
+_BYTE_LEVEL = _byte_level_table()
+
+
+class TokenCounter:
+    kind = "estimate"
+
+    def __init__(self, name: str = "estimate") -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._counts: "OrderedDict[bytes, int]" = OrderedDict()
+
+    def _count(self, text: str) -> int:
+        return estimate_tokens(text)
+
+    def count(self, text: Any) -> int:
+        content = str(text or "")
+        if not content:
+            return 0
+        key = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            hit = self._counts.get(key)
+            if hit is not None:
+                self._counts.move_to_end(key)
+                return hit
+        value = int(self._count(content))
+        with self._lock:
+            self._counts[key] = value
+            while len(self._counts) > TOKEN_COUNT_CACHE_MAX_ENTRIES:
+                self._counts.popitem(last=False)
+        return value
+
+
+class VocabTokenCounter(TokenCounter):
+    """Greedy longest-match over the model's vocabulary after a pre-tokenizer split."""
+
+    kind = "vocab"
+
+    def __init__(self, name: str, tokens: Iterable[str], *, byte_level: bool) -> None:
+        super().__init__(name)
+        self.vocab = {str(token) for token in tokens if token}
+        self.byte_level = bool(byte_level)
+        self.max_token_chars = min(MAX_VOCAB_TOKEN_CHARS, max((len(token) for token in self.vocab), default=1))
+        self._pieces: Dict[str, int] = {}
+
+    def _pieces_of(self, text: str) -> List[str]:
+        if self.byte_level:
+            return [
+                "".join(_BYTE_LEVEL[byte] for byte in piece.encode("utf-8", "surrogatepass"))
+                for piece in _BYTE_LEVEL_PIECE_RE.findall(text)
+            ]
+        return _SPM_PIECE_RE.findall(_SPM_SPACE + text.replace(" ", _SPM_SPACE))
+
+    def _count_piece(self, piece: str) -> int:
+        count = 0
+        start = 0
+        size = len(piece)
+        while start < size:
+            for end in range(min(size, start + self.max_token_chars), start, -1):
+                if piece[start:end] in self.vocab:
+                    break
+            else:
+                # Unknown character: SentencePiece byte fallback spends one token per UTF-8 byte.
+                end = start + 1
+                count += len(piece[start].encode("utf-8", "surrogatepass")) - 1
+            count += 1
+            start = end
+        return count
+
+    def _count(self, text: str) -> int:
+        total = 0
+        for piece in self._pieces_of(text):
+            cached = self._pieces.get(piece)
+            if cached is None:
+                cached = self._count_piece(piece)
+                if len(self._pieces) >= TOKEN_PIECE_CACHE_MAX_ENTRIES:
+                    self._pieces.clear()
+                self._pieces[piece] = cached
+            total += cached
+        return total
+
+
+class HFTokenizerCounter(TokenCounter):
+    kind = "tokenizer"
+
+    def __init__(self, name: str, tokenizer: Any) -> None:
+        super().__init__(name)
+        self.tokenizer = tokenizer
+
+    def _count(self, text: str) -> int:
+        return len(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+def _gguf_counter(path: Path) -> Optional[TokenCounter]:
+    metadata = helpers._read_gguf_metadata(path, keys=("tokenizer.ggml.model", "tokenizer.ggml.tokens"))
+    tokens = metadata.get("tokenizer.ggml.tokens")
+    if not isinstance(tokens, list) or not tokens:
+        return None
+    model_type = str(metadata.get("tokenizer.ggml.model") or "").strip().lower()
+    return VocabTokenCounter(f"gguf:{path.name}", tokens, byte_level=model_type == "gpt2")
+
+
+def _hf_counter(folder: Path) -> Optional[TokenCounter]:
+    tokenizer_file = folder / "tokenizer.json"
+    if not tokenizer_file.is_file():
+        return None
+    try:
+        from tokenizers import Tokenizer  # type: ignore
+    except Exception:
+        Tokenizer = None
+    if Tokenizer is not None:
+        try:
+            return HFTokenizerCounter(f"tokenizers:{folder.name}", Tokenizer.from_file(str(tokenizer_file)))
+        except Exception:
+            pass
+    try:
+        payload = json.loads(tokenizer_file.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    model = payload.get("model") if isinstance(payload, dict) else None
+    vocab = model.get("vocab") if isinstance(model, dict) else None
+    if isinstance(vocab, dict):
+        tokens = list(vocab)
+    elif isinstance(vocab, list):
+        tokens = [row[0] for row in vocab if isinstance(row, list) and row]
+    else:
+        return None
+    byte_level = '"ByteLevel"' in json.dumps(
+        [payload.get("pre_tokenizer"), payload.get("decoder")], separators=(",", ":")
+    )
+    return VocabTokenCounter(f"hf:{folder.name}", tokens, byte_level=byte_level)
+
+
+def _first_gguf(folder: Path) -> Optional[Path]:
+    try:
+        candidates = sorted(
+            path for path in folder.rglob("*.gguf") if path.is_file() and "mmproj" not in path.name.lower()
+        )
+    except Exception:
+        return None
+    return candidates[0] if candidates else None
+
+
+def tokenizer_source(model: str) -> Tuple[str, str]:
+    """Locate a local tokenizer for a model id or path without downloading anything."""
+    raw = str(model or "").strip()
+    if not raw:
+        return "", ""
+    local = Path(raw).expanduser()
+    if local.is_file() and local.suffix.lower() == ".gguf":
+        return "gguf", str(local)
+    if local.is_dir():
+        if (local / "tokenizer.json").is_file():
+            return "hf", str(local)
+        gguf = _first_gguf(local)
+        if gguf is not None:
+            return "gguf", str(gguf)
+    try:
+        ref = helpers._parse_llama_cpp_model_ref(raw)
+    except Exception:
+        ref = {}
+    if ref.get("kind") == "local" and Path(str(ref.get("path") or "")).is_file():
+        return "gguf", str(ref.get("path"))
+    repo_id = str(ref.get("repo_id") or "").strip()
+    if ref.get("kind") == "hf" and "/" in repo_id:
+        snapshot = helpers._latest_hf_snapshot_path(helpers._llama_cpp_model_root(), repo_id)
+        if snapshot:
+            filename = str(ref.get("filename") or "").strip()
+            wanted = Path(snapshot) / filename if filename else _first_gguf(Path(snapshot))
+            if wanted is not None and wanted.is_file():
+                return "gguf", str(wanted)
+        snapshot = helpers._latest_hf_snapshot_path(helpers._hf_llm_model_root(), repo_id)
+        if snapshot and (Path(snapshot) / "tokenizer.json").is_file():
+            return "hf", snapshot
+    return "", ""
+
+
+_ESTIMATOR = TokenCounter()
+_counters_lock = threading.Lock()
+# model -> (checked_at, tokenizer source)
+_counters: Dict[str, Tuple[float, Tuple[str, str]]] = {}
+_loaded: Dict[Tuple[str, str], TokenCounter] = {}
+_loading: Dict[Tuple[str, str], threading.Event] = {}
+
+
+def _load(source: Tuple[str, str]) -> None:
+    kind, path = source
+    counter: Optional[TokenCounter] = None
+    try:
+        counter = _gguf_counter(Path(path)) if kind == "gguf" else _hf_counter(Path(path))
+    except Exception as exc:
+        helpers.logger.debug("[tokens] could not load tokenizer from %s: %s", path, exc)
+    with _counters_lock:
+        _loaded[source] = counter or _ESTIMATOR
+        done = _loading.pop(source, None)
+    if done is not None:
+        done.set()
+
+
+def token_counter_for_model(model: str = "", *, wait: bool = False) -> TokenCounter:
+    token = str(model or "").strip()
+    if not token:
+        return _ESTIMATOR
+    now = time.monotonic()
+    with _counters_lock:
+        cached = _counters.get(token)
+    if cached is not None and now - cached[0] < TOKEN_SOURCE_RECHECK_SECONDS:
+        source = cached[1]
+    else:
+        source = tokenizer_source(token)
+        with _counters_lock:
+            _counters[token] = (now, source)
+    if not source[0]:
+        return _ESTIMATOR
+    with _counters_lock:
+        counter = _loaded.get(source)
+        pending = _loading.get(source)
+        if counter is None and pending is None:
+            pending = _loading[source] = threading.Event()
+            threading.Thread(target=_load, args=(source,), name="token-counter-load", daemon=True).start()
+    if counter is not None:
+        return counter
+    if wait and pending is not None:
+        pending.wait()
+        with _counters_lock:
+            return _loaded.get(source) or _ESTIMATOR
+    return _ESTIMATOR
+
+
+def count_tokens(text: Any, *, model: str = "") -> int:
+    return token_counter_for_model(model).count(text)
+
+
+def configured_model(redis_conn: Any = None) -> str:
+    """Model id of the first configured Hydra base server."""
+    try:
+        servers = helpers.resolve_hydra_base_servers(redis_conn=redis_conn, include_legacy=True)
+    except Exception:
+        servers = []
+    return str(servers[0].get("model") or "").strip() if servers else ""
@@ -27,6 +27,7 @@ from kernel_tools import (
     send_message,
 )
 from verba_result import action_failure, action_success, normalize_verba_result
+from verba_settings import verba_enabled_map
 from verba_supersession import is_verba_superseded
 from web_research import research_web
 from helpers import redis_client as default_redis
@@ -258,18 +259,8 @@ def _verba_enabled_from_settings(verba_id: str) -> bool:
     vid = str(verba_id or "").strip()
     if not vid:
         return False
-    try:
-        raw = default_redis.hget("verba_enabled", vid) if default_redis is not None else None
-    except Exception:
-        raw = None
-    value = str(raw or "").strip().lower()
-    if not value:
-        return True
-    if value in {"1", "true", "yes", "on"}:
-        return True
-    if value in {"0", "false", "no", "off"}:
-        return False
-    return True
+    # Unset verbas count as enabled here, unlike the settings UI default.
+    return verba_enabled_map(default=True)(vid)
 
 
 def _effective_enabled_predicate(
@@ -277,7 +268,7 @@ def _effective_enabled_predicate(
 ) -> Callable[[str], bool]:
     if callable(enabled_predicate):
         return enabled_predicate
-    return _verba_enabled_from_settings
+    return verba_enabled_map(default=True)
 
 
 def _origin_payload(args: Optional[Dict[str, Any]], origin: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from tater_paths import agent_lab_path
+
+
+DEFAULT_TTS_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_TTS_CACHE_DISK_MAX_BYTES = 0
+DEFAULT_TTS_CACHE_MAX_TEXT_CHARS = 200
+
+_TTS_CACHE_FILE_SUFFIX = ".tts"
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _env_int(name: str, default: int, *, minimum: int = 0) -> int:
+    raw = str(os.getenv(name, "") or "").strip()
+    if not raw:
+        return int(default)
+    try:
+        return max(int(minimum), int(float(raw)))
+    except Exception:
+        return int(default)
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def normalize_tts_cache_text(text: Any) -> str:
+    return _WHITESPACE_RE.sub(" ", str(text or "")).strip()
+
+
+def tts_audio_cache_key(
+    *,
+    backend: Any,
+    model: Any = "",
+    voice: Any = "",
+    gain: Any = None,
+    text: Any,
+    extra: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Content address for one synthesized phrase, or "" when the phrase is
+    too long to be worth caching (full LLM replies rarely repeat)."""
+    normalized = normalize_tts_cache_text(text)
+    if not normalized or len(normalized) > _env_int("TATER_TTS_CACHE_MAX_TEXT_CHARS", DEFAULT_TTS_CACHE_MAX_TEXT_CHARS):
+        return ""
+    payload = {
+        "backend": str(backend or ""),
+        "model": str(model or ""),
+        "voice": str(voice or ""),
+        "gain": None if gain is None else round(float(gain), 4),
+        "text": normalized,
+        "extra": extra or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class TtsAudioCache:
+    """Byte-budgeted LRU of synthesized audio with an optional disk tier.
+
+    Entries are ``(audio_bytes, audio_format)`` pairs. Memory evictions fall
+    through to the disk tier when it has a budget, and disk hits are promoted
+    back into memory.
+    """
+
+    def __init__(self, *, max_bytes: int, disk_max_bytes: int = 0, disk_dir: Optional[Path] = None):
+        self.max_bytes = max(0, int(max_bytes))
+        self.disk_max_bytes = max(0, int(disk_max_bytes))
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else agent_lab_path("cache", "tts")
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self._disk_entries: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "disk_evictions": 0}
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}{_TTS_CACHE_FILE_SUFFIX}"
+
+    def _disk_index_locked(self) -> "OrderedDict[str, int]":
+        if self._disk_entries is not None:
+            return self._disk_entries
+        rows = []
+        if self.disk_max_bytes > 0 and self.disk_dir.is_dir():
+            for path in self.disk_dir.glob(f"*{_TTS_CACHE_FILE_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                rows.append((stat.st_mtime, path.stem, int(stat.st_size)))
+        rows.sort()
+        self._disk_entries = OrderedDict((key, size) for _mtime, key, size in rows)
+        self._disk_bytes = sum(self._disk_entries.values())
+        return self._disk_entries
+
+    def _read_disk_locked(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        index = self._disk_index_locked()
+        if key not in index:
+            return None
+        path = self._disk_path(key)
+        try:
+            with path.open("rb") as handle:
+                header = json.loads(handle.readline().decode("utf-8") or "{}")
+                audio_bytes = handle.read()
+            os.utime(path)
+        except Exception:
+            self._disk_bytes -= index.pop(key, 0)
+            return None
+        index.move_to_end(key)
+        return audio_bytes, dict(header.get("audio_format") or {})
+
+    def _write_disk_locked(self, key: str, audio_bytes: bytes, audio_format: Dict[str, Any]) -> None:
+        header = json.dumps({"audio_format": audio_format}, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+        size = len(header) + len(audio_bytes)
+        if self.disk_max_bytes <= 0 or size > self.disk_max_bytes:
+            return
+        index = self._disk_index_locked()
+        if key in index:
+            index.move_to_end(key)
+            return
+        path = self._disk_path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as handle:
+                handle.write(header)
+                handle.write(audio_bytes)
+            os.replace(tmp_path, path)
+        except Exception:
+            _unlink_quietly(tmp_path)
+            return
+        index[key] = size
+        self._disk_bytes += size
+        while self._disk_bytes > self.disk_max_bytes and index:
+            old_key, old_size = index.popitem(last=False)
+            self._disk_bytes -= old_size
+            self._stats["disk_evictions"] += 1
+            _unlink_quietly(self._disk_path(old_key))
+
+    def _insert_locked(self, key: str, audio_bytes: bytes, audio_format: Dict[str, Any]) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous[0])
+        if len(audio_bytes) > self.max_bytes:
+            return
+        self._entries[key] = (audio_bytes, audio_format)
+        self._bytes += len(audio_bytes)
+        while self._bytes > self.max_bytes and self._entries:
+            old_key, (old_bytes, old_format) = self._entries.popitem(last=False)
+            self._bytes -= len(old_bytes)
+            self._stats["evictions"] += 1
+            self._write_disk_locked(old_key, old_bytes, old_format)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        if not key:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0], dict(entry[1])
+            entry = self._read_disk_locked(key) if self.disk_max_bytes > 0 else None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._insert_locked(key, entry[0], entry[1])
+            return entry[0], dict(entry[1])
+
+    def put(self, key: str, audio_bytes: Any, audio_format: Optional[Dict[str, Any]] = None) -> None:
+        data = bytes(audio_bytes or b"")
+        if not key or not data:
+            return
+        fmt = dict(audio_format or {})
+        with self._lock:
+            self._stats["stores"] += 1
+            if self.max_bytes > 0:
+                self._insert_locked(key, data, fmt)
+            else:
+                self._write_disk_locked(key, data, fmt)
+
+    def clear(self, *, include_disk: bool = False) -> Dict[str, int]:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            disk_removed = 0
+            if include_disk:
+                index = self._disk_index_locked()
+                for key in list(index.keys()):
+                    _unlink_quietly(self._disk_path(key))
+                    disk_removed += 1
+                index.clear()
+                self._disk_bytes = 0
+        return {"removed": removed, "disk_removed": disk_removed}
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+            disk_entries = len(self._disk_entries) if self._disk_entries is not None else 0
+            return {
+                "enabled": self.max_bytes > 0 or self.disk_max_bytes > 0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": round((stats["hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0,
+                **stats,
+                "disk": {
+                    "enabled": self.disk_max_bytes > 0,
+                    "path": str(self.disk_dir),
+                    "entries": disk_entries,
+                    "bytes": self._disk_bytes,
+                    "max_bytes": self.disk_max_bytes,
+                },
+            }
+
+
+_CACHE_LOCK = threading.Lock()
+_CACHE: Optional[TtsAudioCache] = None
+
+
+def tts_audio_cache() -> TtsAudioCache:
+    global _CACHE
+    cache = _CACHE
+    if cache is not None:
+        return cache
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = TtsAudioCache(
+                max_bytes=_env_int("TATER_TTS_CACHE_MAX_BYTES", DEFAULT_TTS_CACHE_MAX_BYTES),
+                disk_max_bytes=_env_int("TATER_TTS_CACHE_DISK_MAX_BYTES", DEFAULT_TTS_CACHE_DISK_MAX_BYTES),
+            )
+        return _CACHE
+
+
+def get_cached_tts_audio(key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+    return tts_audio_cache().get(key)
+
+
+def store_cached_tts_audio(key: str, audio_bytes: Any, audio_format: Optional[Dict[str, Any]] = None) -> None:
+    tts_audio_cache().put(key, audio_bytes, audio_format)
+
+
+def clear_tts_audio_cache(*, include_disk: bool = False) -> Dict[str, int]:
+    return tts_audio_cache().clear(include_disk=include_disk)
+
+
+def tts_audio_cache_snapshot() -> Dict[str, Any]:
+    return tts_audio_cache().snapshot()
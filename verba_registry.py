@@ -8,6 +8,9 @@ from verba_loader import load_verbas_from_directory
 # Keep module import side-effects minimal: verba code is loaded lazily.
 verba_registry: Dict[str, object] = {}
 _initialized = False
+# Bumped whenever the registry contents are replaced, so callers can key
+# rendered catalogs on it instead of re-walking every verba.
+_generation = 0
 
 # Global lock to prevent concurrent reloads (WebUI + platform threads, etc.)
 _reload_lock = threading.RLock()
@@ -24,7 +27,7 @@ def ensure_verbas_loaded() -> Dict[str, object]:
     This prevents verba side-effects from running while verba_registry itself
     is being imported, which can destabilize startup.
     """
-    global _initialized
+    global _initialized, _generation
     if _initialized:
         return verba_registry
 
@@ -37,6 +40,7 @@ def ensure_verbas_loaded() -> Dict[str, object]:
             verba_registry.update(load_verbas_from_directory(_verba_dir()))
         except Exception as e:
             print(f"WARNING: Initial verba load crashed; starting with empty registry: {e}")
+        _generation += 1
         _initialized = True
         return verba_registry
 
@@ -51,7 +55,7 @@ def reload_verbas() -> Dict[str, object]:
     - Guarded by a lock so two threads can't reload at the same time.
     - If reload yields 0 verbas, keep existing registry (last-known-good).
     """
-    global _initialized
+    global _initialized, _generation
     with _reload_lock:
         importlib.invalidate_caches()
 
@@ -68,6 +72,7 @@ def reload_verbas() -> Dict[str, object]:
         # Mutate in place so any modules holding a reference keep working.
         verba_registry.clear()
         verba_registry.update(new_registry)
+        _generation += 1
         _initialized = True
 
         print(f"Reloaded {len(verba_registry)} verbas from disk.")
@@ -93,3 +98,8 @@ def get_verba_registry() -> Dict[str, object]:
     """
     ensure_verbas_loaded()
     return verba_registry
+
+
+def get_verba_registry_generation() -> int:
+    """Return a counter that changes every time the registry is (re)loaded."""
+    return _generation
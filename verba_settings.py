@@ -1,24 +1,117 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
 import dotenv
 from helpers import redis_client
+from redis_runtime import redis_batch
 
 dotenv.load_dotenv()
 
 VERBA_ENABLED_HASH = "verba_enabled"
+VERBA_ENABLED_VERSION_KEY = "tater:verba_enabled_version"
 VERBA_SETTINGS_PREFIX = "verba_settings:"
+# How long a process trusts its enabled-map snapshot before re-reading the
+# version key. Writes from this process invalidate it immediately.
+VERBA_ENABLED_CHECK_SECONDS = 1.0
+
+_TRUE_VALUES = {"1", "true", "yes", "on", "enabled"}
+_FALSE_VALUES = {"0", "false", "no", "off"}
+
+_enabled_lock = threading.Lock()
+_enabled_states: Dict[str, str] = {}
+_enabled_version: Optional[str] = None
+_enabled_checked_at = 0.0
 
 
 def _to_bool(value: str) -> bool:
-    return str(value or "").strip().lower() in {"1", "true", "yes", "on", "enabled"}
+    return str(value or "").strip().lower() in _TRUE_VALUES
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", "ignore")
+    return str(value if value is not None else "")
+
+
+class VerbaEnabledMap:
+    """
+    Point-in-time view of the verba_enabled hash, usable as an enabled predicate.
+
+    ``default`` is the answer for verbas with no (or an unrecognized) stored
+    value. ``enabled_version`` changes whenever the stored map does, so callers
+    can key caches on it.
+    """
+
+    __slots__ = ("states", "default", "enabled_version")
+
+    def __init__(self, states: Dict[str, str], version: str, *, default: bool = False) -> None:
+        self.states = states
+        self.default = bool(default)
+        self.enabled_version = f"{version}:{int(self.default)}"
+
+    def __call__(self, verba_name: str) -> bool:
+        name = str(verba_name or "").strip()
+        if not name:
+            return False
+        value = self.states.get(name, "").strip().lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        return self.default
+
+
+def _refresh_enabled_states() -> tuple:
+    global _enabled_states, _enabled_version, _enabled_checked_at
+    with _enabled_lock:
+        now = time.monotonic()
+        if _enabled_version is not None and now - _enabled_checked_at < VERBA_ENABLED_CHECK_SECONDS:
+            return _enabled_version, _enabled_states
+        try:
+            version = _text(redis_client.get(VERBA_ENABLED_VERSION_KEY) or "0")
+            if version != _enabled_version:
+                raw = redis_client.hgetall(VERBA_ENABLED_HASH) or {}
+                _enabled_states = {_text(key).strip(): _text(value) for key, value in raw.items()}
+                _enabled_version = version
+        except Exception:
+            if _enabled_version is None:
+                return "unavailable", {}
+        _enabled_checked_at = now
+        return _enabled_version, _enabled_states
+
+
+def invalidate_verba_enabled_cache() -> None:
+    global _enabled_version
+    with _enabled_lock:
+        _enabled_version = None
+
+
+def verba_enabled_map(*, default: bool = False) -> VerbaEnabledMap:
+    """Shared enabled-state snapshot: at most one GET (plus one HGETALL on change) per check window."""
+    version, states = _refresh_enabled_states()
+    return VerbaEnabledMap(states, version, default=default)
+
+
+def bump_verba_enabled_version(client: Any = None) -> None:
+    try:
+        (client or redis_client).incr(VERBA_ENABLED_VERSION_KEY)
+    except Exception:
+        pass
+    invalidate_verba_enabled_cache()
 
 
 def get_verba_enabled(verba_name: str) -> bool:
-    value = redis_client.hget(VERBA_ENABLED_HASH, verba_name)
-    return _to_bool(str(value or ""))
+    return verba_enabled_map()(verba_name)
 
 
 def set_verba_enabled(verba_name: str, enabled: bool) -> None:
     value = "true" if enabled else "false"
-    redis_client.hset(VERBA_ENABLED_HASH, verba_name, value)
+    batch = redis_batch(redis_client)
+    batch.hset(VERBA_ENABLED_HASH, verba_name, value)
+    batch.incr(VERBA_ENABLED_VERSION_KEY)
+    batch.execute()
+    invalidate_verba_enabled_cache()
 
 
 def get_verba_settings(category: str) -> dict:
@@ -28,3 +121,4 @@ def get_verba_settings(category: str) -> dict:
 def save_verba_settings(category: str, settings: dict) -> None:
     mapping = {k: str(v) for k, v in (settings or {}).items()}
     redis_client.hset(f"{VERBA_SETTINGS_PREFIX}{category}", mapping=mapping)
+    bump_verba_enabled_version()
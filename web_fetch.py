@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+import kernel_tools
+from helpers import shared_async_loop_resource
+from tater_paths import runtime_dir
+
+# Async page fetching for research fan-out. Every event loop gets one shared
+# keep-alive aiohttp session plus a semaphore per host, so parallel fetches
+# reuse connections without hammering a single site. Successful responses are
+# cached on disk with their ETag/Last-Modified validators and the inspected
+# page (title, readable text, links) built from them: a later fetch sends a
+# conditional request and, on 304 or while Cache-Control max-age is fresh,
+# returns the stored inspection without downloading or parsing the page again.
+# Responses marked Cache-Control: no-store are never written to disk, and the
+# shared session keeps no cookies, so one site's cookies never ride along on
+# another fetch.
+WEB_FETCH_PER_HOST = 4
+WEB_FETCH_CACHE_MAX_ENTRIES = 2000
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+def _per_host_limit() -> int:
+    try:
+        return max(1, int(os.getenv("TATER_WEB_FETCH_PER_HOST", WEB_FETCH_PER_HOST)))
+    except Exception:
+        return WEB_FETCH_PER_HOST
+
+
+def web_cache_dir() -> Path:
+    raw = str(os.getenv("TATER_WEB_CACHE_DIR", "") or "").strip()
+    return Path(raw).expanduser() if raw else runtime_dir() / "web_cache"
+
+
+class _LoopClient:
+    def __init__(self) -> None:
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        self.hosts: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def closed(self) -> bool:
+        return self.session.closed
+
+    async def aclose(self) -> None:
+        await self.session.close()
+
+    def host_slot(self, url: str) -> asyncio.Semaphore:
+        host = str(urllib.parse.urlparse(url).hostname or "").lower()
+        slot = self.hosts.get(host)
+        if slot is None:
+            slot = self.hosts[host] = asyncio.Semaphore(_per_host_limit())
+        return slot
+
+
+def _client() -> _LoopClient:
+    # Registered with helpers' per-loop HTTP clients, so
+    # close_shared_async_http_client() shuts it down with the rest.
+    return shared_async_loop_resource("web_fetch", _LoopClient)
+
+
+def _cache_path(url: str) -> Path:
+    return web_cache_dir() / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_cache(url: str) -> Dict[str, Any]:
+    try:
+        parsed = json.loads(_cache_path(url).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(parsed, dict) or parsed.get("url") != url or not isinstance(parsed.get("fetch"), dict):
+        return {}
+    return parsed
+
+
+def _write_cache(url: str, entry: Dict[str, Any]) -> None:
+    path = _cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp_path, path)
+        _trim_cache(path.parent)
+    except Exception:
+        pass
+
+
+def _drop_cache(url: str) -> None:
+    try:
+        _cache_path(url).unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
+def _trim_cache(folder: Path) -> None:
+    entries = list(folder.glob("*.json"))
+    if len(entries) <= WEB_FETCH_CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda item: item.stat().st_mtime)
+    for stale in entries[: len(entries) - WEB_FETCH_CACHE_MAX_ENTRIES]:
+        stale.unlink(missing_ok=True)
+
+
+def _no_store(headers: Any) -> bool:
+    return "no-store" in str(headers.get("Cache-Control") or "").lower()
+
+
+def _fresh_until(headers: Any) -> float:
+    cache_control = str(headers.get("Cache-Control") or "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    return time.time() + int(match.group(1)) if match else 0.0
+
+
+async def _fetch(url: str, *, timeout_sec: int, max_bytes: int, cached: Dict[str, Any]) -> Dict[str, Any]:
+    client = _client()
+    timeout = aiohttp.ClientTimeout(total=None, connect=8, sock_read=timeout_sec)
+    attempts: List[Dict[str, Any]] = []
+    selected: Optional[Dict[str, Any]] = None
+    last_error = ""
+    async with client.host_slot(url):
+        for user_agent in kernel_tools.WEBPAGE_USER_AGENTS:
+            attempt: Dict[str, Any] = {"user_agent": user_agent, "status_code": 0, "blocked": False, "error": ""}
+            headers = kernel_tools._webpage_request_headers(user_agent)
+            headers["Accept-Encoding"] = "gzip, deflate"
+            if cached.get("etag"):
+                headers["If-None-Match"] = str(cached["etag"])
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = str(cached["last_modified"])
+            try:
+                async with client.session.get(url, headers=headers, timeout=timeout, allow_redirects=True) as response:
+                    attempt["status_code"] = int(response.status or 0)
+                    if response.status == 304 and cached.get("fetch"):
+                        return {
+                            "not_modified": True,
+                            "fresh_until": _fresh_until(response.headers),
+                            "no_store": _no_store(response.headers),
+                        }
+                    chunks: List[bytes] = []
+                    total = 0
+                    truncated = False
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        if total + len(chunk) > max_bytes:
+                            chunks.append(bytes(chunk[: max_bytes - total]))
+                            truncated = True
+                            break
+                        chunks.append(bytes(chunk))
+                        total += len(chunk)
+                    selected = kernel_tools._webpage_fetch_row(
+                        b"".join(chunks),
+                        final_url=str(response.url or url),
+                        content_type=str(response.headers.get("Content-Type") or ""),
+                        status_code=int(response.status or 0),
+                        response_encoding=str(response.charset or ""),
+                        truncated=truncated,
+                        attempt=attempt,
+                        attempts=attempts,
+                    )
+                    selected["etag"] = str(response.headers.get("ETag") or "")
+                    selected["last_modified"] = str(response.headers.get("Last-Modified") or "")
+                    selected["fresh_until"] = _fresh_until(response.headers)
+                    selected["no_store"] = _no_store(response.headers)
+            except Exception as exc:
+                last_error = str(exc).strip() or exc.__class__.__name__
+                attempt["error"] = last_error
+                attempts.append(attempt)
+                continue
+            if attempt["blocked"]:
+                attempts.append(attempt)
+                continue
+            break
+    if selected is None:
+        return {"ok": False, "error": last_error or "Unable to fetch webpage.", "url": url, "attempts": attempts}
+    return selected
+
+
+async def inspect_webpage_async(
+    url: str,
+    *,
+    max_bytes: Optional[int] = None,
+    timeout_sec: int = 20,
+    max_links: int = 20,
+    max_images: int = 20,
+) -> Dict[str, Any]:
+    """Async, cached counterpart of kernel_tools.inspect_webpage."""
+    normalized_url = kernel_tools._normalize_url_input(url)
+    err = await asyncio.to_thread(kernel_tools._validate_url, normalized_url)
+    if err:
+        return {"tool": "inspect_webpage", "ok": False, "error": err}
+    timeout_val = kernel_tools._coerce_int(timeout_sec, default=kernel_tools.WEBPAGE_TIMEOUT_SEC, min_value=3, max_value=60)
+    byte_limit = kernel_tools._coerce_int(
+        max_bytes if max_bytes is not None else kernel_tools.WEBPAGE_MAX_RESPONSE_BYTES,
+        default=kernel_tools.WEBPAGE_MAX_RESPONSE_BYTES,
+        min_value=65_536,
+        max_value=25_000_000,
+    )
+    view_key = f"{int(max_links)}:{int(max_images)}"
+    cached = await asyncio.to_thread(_read_cache, normalized_url)
+    fetched: Dict[str, Any] = {}
+    if not cached or float(cached.get("fresh_until") or 0) <= time.time():
+        fetched = await _fetch(normalized_url, timeout_sec=timeout_val, max_bytes=byte_limit, cached=cached)
+    if fetched and not fetched.get("not_modified"):
+        fetch_payload = fetched
+        cached = {}
+    else:
+        fetch_payload = dict(cached.get("fetch") or {})
+        if fetched:
+            cached["fresh_until"] = fetched.get("fresh_until") or 0.0
+        if fetched.get("no_store"):
+            await asyncio.to_thread(_drop_cache, normalized_url)
+        view = (cached.get("views") or {}).get(view_key)
+        if isinstance(view, dict):
+            if fetched and not fetched.get("no_store"):
+                await asyncio.to_thread(_write_cache, normalized_url, cached)
+            return {**view, "cache": "revalidated" if fetched else "fresh"}
+
+    page = await asyncio.to_thread(
+        kernel_tools._inspect_fetched_webpage,
+        normalized_url,
+        fetch_payload,
+        max_links=max_links,
+        max_images=max_images,
+    )
+    cacheable = (
+        bool(page.get("ok"))
+        and int(fetch_payload.get("status_code") or 0) == 200
+        and not fetch_payload.get("no_store")
+        and not fetched.get("no_store")
+    )
+    if cacheable and (fetch_payload.get("etag") or fetch_payload.get("last_modified") or fetch_payload.get("fresh_until")):
+        entry = {
+            "url": normalized_url,
+            "etag": fetch_payload.get("etag") or "",
+            "last_modified": fetch_payload.get("last_modified") or "",
+            "fresh_until": float(cached.get("fresh_until") or fetch_payload.get("fresh_until") or 0.0),
+            "fetch": fetch_payload,
+            "views": {**dict(cached.get("views") or {}), view_key: page},
+        }
+        await asyncio.to_thread(_write_cache, normalized_url, entry)
+    return page
@@ -1,7 +1,9 @@
+import asyncio
 import json
 from typing import Any, Dict, List
 
-from kernel_tools import inspect_webpage, search_web
+from kernel_tools import search_web
+from web_fetch import inspect_webpage_async
 from verba_result import action_failure, action_success
 
 
@@ -77,7 +79,8 @@ async def research_web(
 
     search_count = _int_bound(max_results, default=5, min_value=1, max_value=10)
     page_limit = _int_bound(max_pages, default=3, min_value=1, max_value=search_count)
-    search_result = search_web(
+    search_result = await asyncio.to_thread(
+        search_web,
         query_text,
         num_results=search_count,
         site=site,
@@ -117,54 +120,67 @@ async def research_web(
         "- Include the source URLs used in the answer text when useful.\n"
     )
 
-    for result in results[:page_limit]:
-        url = str(result.get("url") or "").strip()
-        if not url:
-            continue
-        inspected_page = inspect_webpage(url, timeout_sec=20, max_links=8, max_images=2)
-        compact_page = {
-            "search_title": str(result.get("title") or ""),
-            "search_snippet": str(result.get("snippet") or ""),
-            "search_url": url,
-            **_page_for_llm(inspected_page),
-        }
-        inspected.append(compact_page)
-
-        if llm_client is None or not hasattr(llm_client, "chat"):
-            if bool(inspected_page.get("ok")) and str(inspected_page.get("content") or inspected_page.get("text_preview") or "").strip():
-                enough = True
-                answer = _clip(str(inspected_page.get("content") or inspected_page.get("text_preview") or ""), 3000)
-                reason = "First readable page returned content; no LLM evaluator was available."
-                break
-            continue
-
-        payload = {
-            "question": question_text,
-            "query": query_text,
-            "inspected_pages": inspected,
-        }
-        try:
-            resp = await llm_client.chat(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": json.dumps(payload, ensure_ascii=False, default=str)},
-                ],
-                temperature=0.0,
-            )
-        except Exception as exc:
-            reason = f"Research evaluator failed: {exc}"
-            continue
-        decision = _strict_json(_messages_content(resp))
-        enough = bool(decision.get("enough"))
-        reason = str(decision.get("reason") or "").strip()
-        missing = str(decision.get("missing") or "").strip()
-        if enough:
-            answer = str(decision.get("answer") or "").strip()
-            if not answer:
-                enough = False
-                missing = "Evaluator marked enough=true but returned no answer."
-            else:
-                break
+    # Fetch every candidate page at once, then evaluate them in search order.
+    candidates = [result for result in results[:page_limit] if str(result.get("url") or "").strip()]
+    fetches = [
+        asyncio.ensure_future(
+            inspect_webpage_async(str(result.get("url") or "").strip(), timeout_sec=20, max_links=8, max_images=2)
+        )
+        for result in candidates
+    ]
+    try:
+        for result, fetch in zip(candidates, fetches):
+            url = str(result.get("url") or "").strip()
+            try:
+                inspected_page = await fetch
+            except Exception as exc:
+                inspected_page = {"tool": "inspect_webpage", "ok": False, "url": url, "error": str(exc)}
+            compact_page = {
+                "search_title": str(result.get("title") or ""),
+                "search_snippet": str(result.get("snippet") or ""),
+                "search_url": url,
+                **_page_for_llm(inspected_page),
+            }
+            inspected.append(compact_page)
+
+            if llm_client is None or not hasattr(llm_client, "chat"):
+                if bool(inspected_page.get("ok")) and str(inspected_page.get("content") or inspected_page.get("text_preview") or "").strip():
+                    enough = True
+                    answer = _clip(str(inspected_page.get("content") or inspected_page.get("text_preview") or ""), 3000)
+                    reason = "First readable page returned content; no LLM evaluator was available."
+                    break
+                continue
+
+            payload = {
+                "question": question_text,
+                "query": query_text,
+                "inspected_pages": inspected,
+            }
+            try:
+                resp = await llm_client.chat(
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": json.dumps(payload, ensure_ascii=False, default=str)},
+                    ],
+                    temperature=0.0,
+                )
+            except Exception as exc:
+                reason = f"Research evaluator failed: {exc}"
+                continue
+            decision = _strict_json(_messages_content(resp))
+            enough = bool(decision.get("enough"))
+            reason = str(decision.get("reason") or "").strip()
+            missing = str(decision.get("missing") or "").strip()
+            if enough:
+                answer = str(decision.get("answer") or "").strip()
+                if not answer:
+                    enough = False
+                    missing = "Evaluator marked enough=true but returned no answer."
+                else:
+                    break
+    finally:
+        for fetch in fetches:
+            fetch.cancel()
 
     sources = [
         {